@@ -0,0 +1,44 @@
+"""add workflow test submissions
+
+Revision ID: 4c2e8d7a1b90
+Revises: 980d1dbdd930
+Create Date: 2025-06-30 10:12:41.218406
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4c2e8d7a1b90"
+down_revision: Union[str, None] = "980d1dbdd930"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "workflow_test_submissions",
+        sa.Column("id", sa.String(), primary_key=True, nullable=False),
+        sa.Column("workflow_id", sa.String(), nullable=False),
+        sa.Column("priority", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("status", sa.String(), nullable=False, server_default="QUEUED"),
+        sa.Column("payload", sa.JSON(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("submitted_at", sa.Float(), nullable=False),
+        sa.Column("finished_at", sa.Float(), nullable=True),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_workflow_test_submissions_workflow_id", "workflow_test_submissions", ["workflow_id"], if_not_exists=True
+    )
+    op.create_index("ix_workflow_test_submissions_status", "workflow_test_submissions", ["status"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_workflow_test_submissions_status", table_name="workflow_test_submissions")
+    op.drop_index("ix_workflow_test_submissions_workflow_id", table_name="workflow_test_submissions")
+    op.drop_table("workflow_test_submissions")
@@ -0,0 +1,42 @@
+"""index workflow foreign keys
+
+Revision ID: 3a6c22046696
+Revises: 4c2e8d7a1b90
+Create Date: 2026-10-17 09:30:12.604117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3a6c22046696"
+down_revision: Union[str, None] = "4c2e8d7a1b90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column) pairs of every workflow and workflow template foreign key.
+FOREIGN_KEY_COLUMNS = [
+    ("tool_instances", "workflow_id"),
+    ("mcp_instances", "workflow_id"),
+    ("agents", "workflow_id"),
+    ("tasks", "workflow_id"),
+    ("deployed_workflow_instance", "workflow_id"),
+    ("tool_templates", "workflow_template_id"),
+    ("mcp_templates", "workflow_template_id"),
+    ("agent_templates", "workflow_template_id"),
+    ("task_templates", "workflow_template_id"),
+]
+
+
+def upgrade() -> None:
+    for table, column in FOREIGN_KEY_COLUMNS:
+        op.create_index(f"ix_{table}_{column}", table, [column], if_not_exists=True)
+
+
+def downgrade() -> None:
+    for table, column in reversed(FOREIGN_KEY_COLUMNS):
+        op.drop_index(f"ix_{table}_{column}", table_name=table)
@@ -1,5 +1,8 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { getCrewEvents } from '@/app/lib/ops';
+import { getCrewEvents, getCrewEventsAfter } from '@/app/lib/ops';
+
+// Upper bound on how long a long-poll may hold a request open, in seconds.
+const MAX_EVENTS_WAIT_SECONDS = 30;
 
 export async function GET(request: NextRequest) {
   const traceId = request.nextUrl.searchParams.get('traceId');
@@ -10,6 +13,17 @@ export async function GET(request: NextRequest) {
     });
   }
 
+  // With a cursor, block until new events arrive instead of returning immediately.
+  const cursor = request.nextUrl.searchParams.get('cursor');
+  if (cursor !== null) {
+    const requestedWait = Number(request.nextUrl.searchParams.get('wait') || '0');
+    const wait = Number.isFinite(requestedWait)
+      ? Math.min(Math.max(requestedWait, 0), MAX_EVENTS_WAIT_SECONDS)
+      : 0;
+    const page = await getCrewEventsAfter(traceId, Math.max(Math.floor(Number(cursor)) || 0, 0), wait);
+    return NextResponse.json(page);
+  }
+
   const events = await getCrewEvents(traceId);
   return NextResponse.json({
     events: events,
@@ -44,7 +44,7 @@ import {
 import WorkflowAppChatView from './WorkflowAppChatView';
 import { CloseOutlined, DashboardOutlined } from '@ant-design/icons';
 import { useGetDefaultModelQuery } from '@/app/models/modelsApi';
-import { useGetEventsMutation } from '@/app/ops/opsApi';
+import { useGetEventsAfterMutation } from '@/app/ops/opsApi';
 import { useUpdateWorkflowMutation } from '@/app/workflows/workflowsApi';
 import { useTestModelMutation } from '@/app/models/modelsApi';
 import { useGlobalNotification } from '../Notifications';
@@ -54,6 +54,11 @@ import { TOOL_PARAMS_ALERT } from '@/app/lib/constants';
 
 const { Title, Text } = Typography;
 
+// How long each events request waits for new events, and the pause before
+// retrying a failed one.
+const EVENTS_LONG_POLL_SECONDS = 20;
+const EVENTS_RETRY_DELAY_MS = 1000;
+
 export interface WorkflowAppProps {
   workflow: Workflow;
   refetchWorkflow: () => void;
@@ -75,12 +80,12 @@ const WorkflowApp: React.FC<WorkflowAppProps> = ({
 }) => {
   const isRunning = useAppSelector(selectWorkflowIsRunning);
   const currentTraceId = useAppSelector(selectWorkflowCurrentTraceId);
-  const intervalRef = useRef<NodeJS.Timeout | null>(null);
+  const eventPollingRef = useRef<{ stop: () => void } | null>(null);
   const workflowPollingRef = useRef<NodeJS.Timeout | null>(null);
   const dispatch = useAppDispatch();
   const currentEvents = useAppSelector(selectCurrentEvents);
 
-  const [getEvents] = useGetEventsMutation();
+  const [getEventsAfter] = useGetEventsAfterMutation();
 
   // NOTE: because we also run our workflow app in "standalone" mode, his
   // specific query may fail. Becuase of this, we also check our workflow
@@ -249,60 +254,92 @@ const WorkflowApp: React.FC<WorkflowAppProps> = ({
       return;
     }
 
-    // Set the interval function
-    const fetchEvents = async () => {
-      try {
-        const { events: newEvents } = await getEvents({
-          traceId: currentTraceId,
-        }).unwrap();
-        dispatch(addedCurrentEvents(newEvents));
-
-        if (newEvents && newEvents.length > 0) {
-          allEventsRef.current = [...allEventsRef.current, ...newEvents];
-
-          // Check for successful completion as before
-          const crewCompleteEvent = newEvents.find(
-            (event) =>
-              event.type === 'crew_kickoff_completed' || event.type === 'crew_kickoff_failed',
-          );
-          if (crewCompleteEvent) {
-            stopPolling();
-            dispatch(updatedCrewOutput(crewCompleteEvent.output || crewCompleteEvent.error));
-            dispatch(updatedIsRunning(false));
-            dispatch(addedCurrentEvents(newEvents));
-
-            if (workflow?.is_conversational) {
-              dispatch(
-                addedChatMessage({
-                  id: crewCompleteEvent.id,
-                  role: 'assistant',
-                  content: crewCompleteEvent.output || crewCompleteEvent.error,
-                  events: allEventsRef.current,
-                }),
-              );
+    let stopped = false;
+    let pendingRequest: { abort: () => void } | null = null;
+
+    const stopPolling = () => {
+      stopped = true;
+      pendingRequest?.abort();
+      pendingRequest = null;
+      eventPollingRef.current = null;
+    };
+
+    // Returns true once the kickoff completed or failed.
+    const handleEvents = (newEvents: any[]) => {
+      dispatch(addedCurrentEvents(newEvents));
+
+      if (newEvents && newEvents.length > 0) {
+        allEventsRef.current = [...allEventsRef.current, ...newEvents];
+
+        // Check for successful completion as before
+        const crewCompleteEvent = newEvents.find(
+          (event) =>
+            event.type === 'crew_kickoff_completed' || event.type === 'crew_kickoff_failed',
+        );
+        if (crewCompleteEvent) {
+          dispatch(updatedCrewOutput(crewCompleteEvent.output || crewCompleteEvent.error));
+          dispatch(updatedIsRunning(false));
+          dispatch(addedCurrentEvents(newEvents));
+
+          if (workflow?.is_conversational) {
+            dispatch(
+              addedChatMessage({
+                id: crewCompleteEvent.id,
+                role: 'assistant',
+                content: crewCompleteEvent.output || crewCompleteEvent.error,
+                events: allEventsRef.current,
+              }),
+            );
+          }
+          return true;
+        }
+      }
+      return false;
+    };
+
+    // Long-poll for the events after our cursor: each request returns as soon
+    // as new events arrive (or after EVENTS_LONG_POLL_SECONDS), and a failed
+    // request is retried with the same cursor so no events are lost.
+    const pollEvents = async () => {
+      let cursor = 0;
+      while (!stopped) {
+        try {
+          const request = getEventsAfter({
+            traceId: currentTraceId,
+            cursor,
+            wait: EVENTS_LONG_POLL_SECONDS,
+          });
+          pendingRequest = request;
+          const page = await request.unwrap();
+          if (stopped) return;
+          if (page.truncated) {
+            console.warn('Some workflow events expired before they could be displayed.');
+          }
+          cursor = page.cursor;
+          const completed = handleEvents(page.events);
+          if (completed || page.finished) {
+            if (!completed) {
+              dispatch(updatedIsRunning(false));
             }
+            stopPolling();
             return;
           }
+        } catch (error) {
+          if (stopped) return;
+          console.error('Error polling for events: ', error);
+          await new Promise((resolve) => setTimeout(resolve, EVENTS_RETRY_DELAY_MS));
         }
-      } catch (error) {
-        console.error('Error polling for events: ', error);
       }
     };
 
     const startPolling = () => {
-      if (intervalRef.current) return; // Prevent duplicate polling
-      intervalRef.current = setInterval(fetchEvents, 1000);
+      if (eventPollingRef.current) return; // Prevent duplicate polling
+      eventPollingRef.current = { stop: stopPolling };
       setSliderValue(0);
       dispatch(updatedCrewOutput(undefined));
       dispatch(updatedCurrentEvents([]));
       dispatch(updatedCurrentEventIndex(0));
-    };
-
-    const stopPolling = () => {
-      if (intervalRef.current) {
-        clearInterval(intervalRef.current);
-        intervalRef.current = null;
-      }
+      pollEvents();
     };
 
     startPolling();
@@ -341,10 +378,7 @@ const WorkflowApp: React.FC<WorkflowAppProps> = ({
     setSliderValue(0);
     setShowMonitoring(renderMode === 'studio');
 
-    if (intervalRef.current) {
-      clearInterval(intervalRef.current);
-      intervalRef.current = null;
-    }
+    eventPollingRef.current?.stop();
     if (workflowPollingRef.current) {
       clearInterval(workflowPollingRef.current);
       workflowPollingRef.current = null;
@@ -354,10 +388,7 @@ const WorkflowApp: React.FC<WorkflowAppProps> = ({
   // Keep the existing cleanup effect as well
   useEffect(() => {
     return () => {
-      if (intervalRef.current) {
-        clearInterval(intervalRef.current);
-        intervalRef.current = null;
-      }
+      eventPollingRef.current?.stop();
       if (workflowPollingRef.current) {
         clearInterval(workflowPollingRef.current);
         workflowPollingRef.current = null;
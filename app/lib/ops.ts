@@ -2,6 +2,8 @@ import { GraphQLClient } from 'graphql-request';
 import fetch from 'node-fetch';
 import https from 'https';
 import fs from 'fs';
+import type { CrewEventsPage } from './types';
+export type { CrewEventsPage };
 
 interface Application {
   name: string;
@@ -107,3 +109,30 @@ export const getCrewEvents = async (traceId: string) => {
   const events: any[] = (await response.json()) as any;
   return events;
 };
+
+/**
+ * Long-poll for the crew events published after `cursor`, waiting up to
+ * `wait` seconds for new events. Re-sending the same cursor after a failed
+ * request replays the events that were not received.
+ */
+export const getCrewEventsAfter = async (
+  traceId: string,
+  cursor: number,
+  wait: number,
+): Promise<CrewEventsPage> => {
+  const agent = new https.Agent({
+    ca: fs.readFileSync('/etc/ssl/certs/ca-certificates.crt'),
+  });
+  const opsUrl = await fetchOpsUrl();
+  const response = await fetch(
+    `${opsUrl}/events?trace_id=${traceId}&cursor=${cursor}&wait=${wait}`,
+    {
+      headers: {
+        authorization: `Bearer ${process.env.CDSW_APIV2_KEY}`,
+      },
+      agent,
+    },
+  );
+
+  return (await response.json()) as CrewEventsPage;
+};
@@ -12,6 +12,18 @@ export interface OpsData {
   ops_display_url: string;
 }
 
+/**
+ * A page of crew events read after a cursor. Passing `cursor` back continues
+ * the stream; `finished` is set once the kickoff completed or failed, and
+ * `truncated` when events after the requested cursor had already expired.
+ */
+export interface CrewEventsPage {
+  events: any[];
+  cursor: number;
+  finished: boolean;
+  truncated: boolean;
+}
+
 export interface WorkflowData {
   renderMode: 'studio' | 'workflow';
   deployedWorkflowId: string;
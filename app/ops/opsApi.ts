@@ -1,7 +1,7 @@
 import { apiSlice } from '../api/apiSlice';
 
-import type { OpsData } from '@/app/lib/types';
-export type { OpsData };
+import type { CrewEventsPage, OpsData } from '@/app/lib/types';
+export type { CrewEventsPage, OpsData };
 
 export interface KickoffCrewReponse {
   response: { trace_id: string };
@@ -21,6 +21,12 @@ export interface GetOpsEventsResponse {
   events: any[];
 }
 
+export interface GetOpsEventsAfterRequest {
+  traceId: string;
+  cursor: number;
+  wait: number;
+}
+
 export const opsApi = apiSlice.injectEndpoints({
   endpoints: (builder) => ({
     getOpsData: builder.query<OpsData, void>({
@@ -32,8 +38,14 @@ export const opsApi = apiSlice.injectEndpoints({
         method: 'GET',
       }),
     }),
+    getEventsAfter: builder.mutation<CrewEventsPage, GetOpsEventsAfterRequest>({
+      query: (request) => ({
+        url: `/ops/events?traceId=${request.traceId}&cursor=${request.cursor}&wait=${request.wait}`,
+        method: 'GET',
+      }),
+    }),
   }),
   overrideExisting: true,
 });
 
-export const { useGetOpsDataQuery, useGetEventsMutation } = opsApi;
+export const { useGetOpsDataQuery, useGetEventsMutation, useGetEventsAfterMutation } = opsApi;
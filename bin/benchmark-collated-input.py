@@ -0,0 +1,156 @@
+"""
+benchmark-collated-input.py
+Time create_collated_input for synthetic workflows of 10, 100 and 1000
+agents (one task and one tool each), counting the SQL statements issued.
+The first build parses every tool's code; later builds hit the per-tool
+metadata cache.
+
+Uses an in-memory database and temporary tool directories, so this runs anywhere:
+    uv run bin/benchmark-collated-input.py
+"""
+
+import json
+import os
+import tempfile
+from time import monotonic
+from typing import Dict
+
+from sqlalchemy import event
+
+from studio.db import model as db_model
+from studio.db.dao import AgentStudioDao
+from studio.deployments.package.collated_input import create_collated_input
+
+SIZES = (10, 100, 1000)  # agents, tasks and tools per workflow
+REPEATS = 5  # warm builds timed per size
+
+TOOL_CODE = """
+from pydantic import BaseModel
+from typing import Optional
+
+
+class UserParameters(BaseModel):
+    api_key: str
+    region: Optional[str] = None
+
+
+class Tool(StudioBaseTool):
+    class ToolParameters(BaseModel):
+        query: str
+
+    name: str = "tool"
+    description: str = "tool"
+    args_schema: type[BaseModel] = ToolParameters
+
+    def _run(self, query: str) -> str:
+        return query
+"""
+
+
+def create_workflow(dao: AgentStudioDao, tools_dir: str, size: int) -> str:
+    workflow_id = f"wf-{size}"
+    with dao.get_session() as session:
+        if not session.query(db_model.Model).filter_by(is_studio_default=True).first():
+            session.add(
+                db_model.Model(
+                    model_id="m-default",
+                    model_name="default",
+                    provider_model="gpt-4o",
+                    model_type="OPENAI",
+                    is_studio_default=True,
+                )
+            )
+        agent_ids, task_ids = [], []
+        for i in range(size):
+            tool_dir = os.path.join(tools_dir, workflow_id, f"tool_{i}")
+            os.makedirs(tool_dir)
+            with open(os.path.join(tool_dir, "tool.py"), "w") as f:
+                f.write(TOOL_CODE)
+            with open(os.path.join(tool_dir, "requirements.txt"), "w") as f:
+                f.write("requests\n")
+            session.add(
+                db_model.ToolInstance(
+                    id=f"{workflow_id}-tool-{i}",
+                    workflow_id=workflow_id,
+                    name=f"Tool {i}",
+                    python_code_file_name="tool.py",
+                    python_requirements_file_name="requirements.txt",
+                    source_folder_path=tool_dir,
+                    tool_image_path="",
+                )
+            )
+            session.add(
+                db_model.Agent(
+                    id=f"{workflow_id}-agent-{i}",
+                    workflow_id=workflow_id,
+                    name=f"Agent {i}",
+                    crew_ai_role="role",
+                    crew_ai_backstory="backstory",
+                    crew_ai_goal="goal",
+                    tool_ids=[f"{workflow_id}-tool-{i}"],
+                    mcp_instance_ids=[],
+                )
+            )
+            session.add(
+                db_model.Task(
+                    id=f"{workflow_id}-task-{i}",
+                    workflow_id=workflow_id,
+                    description="description",
+                    expected_output="output",
+                    assigned_agent_id=f"{workflow_id}-agent-{i}",
+                )
+            )
+            agent_ids.append(f"{workflow_id}-agent-{i}")
+            task_ids.append(f"{workflow_id}-task-{i}")
+        session.add(
+            db_model.Workflow(
+                id=workflow_id,
+                name=f"Workflow {size}",
+                crew_ai_process="sequential",
+                crew_ai_agents=agent_ids,
+                crew_ai_tasks=task_ids,
+                is_conversational=False,
+            )
+        )
+    return workflow_id
+
+
+def build(dao: AgentStudioDao, workflow_id: str) -> float:
+    with dao.get_session() as session:
+        workflow = session.query(db_model.Workflow).filter_by(id=workflow_id).one()
+        start = monotonic()
+        collated_input = create_collated_input(workflow, session)
+        elapsed = monotonic() - start
+    assert len(collated_input.agents) == len(collated_input.tool_instances)
+    return elapsed
+
+
+def main():
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    statements = {"count": 0}
+
+    @event.listens_for(dao.engine, "before_cursor_execute")
+    def count_statement(*args):
+        statements["count"] += 1
+
+    results = []
+    with tempfile.TemporaryDirectory() as tools_dir:
+        for size in SIZES:
+            workflow_id = create_workflow(dao, tools_dir, size)
+
+            statements["count"] = 0
+            cold = build(dao, workflow_id)
+            # Excludes the workflow lookup itself.
+            queries = statements["count"] - 1
+            warm = min(build(dao, workflow_id) for _ in range(REPEATS))
+            row: Dict = {"size": size, "cold_ms": cold * 1000, "warm_ms": warm * 1000, "queries": queries}
+            results.append(row)
+
+    print(f"{'size':>6}{'cold ms':>12}{'warm ms':>12}{'queries':>10}")
+    for row in results:
+        print(f"{row['size']:>6}{row['cold_ms']:>12.1f}{row['warm_ms']:>12.1f}{row['queries']:>10}")
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
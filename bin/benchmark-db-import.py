@@ -0,0 +1,105 @@
+"""
+benchmark-db-import.py
+Measure rows/sec of studio.db.utils.import_from_dict for a 10k-row import,
+against the per-row import it replaced (a session.get and a setattr per
+column for every row). Each implementation imports the rows into an empty
+database, then imports them again, which updates every row in place.
+
+Uses temporary database files, so this runs anywhere:
+    uv run bin/benchmark-db-import.py
+"""
+
+import json
+import tempfile
+from time import monotonic
+
+import sqlalchemy as sa
+
+from studio.db.dao import AgentStudioDao, dispose_engines
+from studio.db.model import TABLE_TO_MODEL_REGISTRY
+from studio.db.utils import import_from_dict
+
+NUM_ROWS = 10000  # rows per import, split between workflows and tasks
+
+
+def legacy_import_from_dict(db_dict: dict, dao: AgentStudioDao = None) -> None:
+    with dao.get_session() as session:
+        for table_name, table_rows in db_dict.items():
+            table_cls = TABLE_TO_MODEL_REGISTRY.get(table_name)
+            for table_row_dict in table_rows:
+                primary_keys = {col.name: table_row_dict.get(col.name) for col in sa.inspect(table_cls).primary_key}
+                existing_row = session.get(table_cls, primary_keys)
+                if existing_row:
+                    for key, value in table_row_dict.items():
+                        setattr(existing_row, key, value)
+                else:
+                    session.add(table_cls(**table_row_dict))
+
+
+def make_import_dict() -> dict:
+    num_workflows = NUM_ROWS // 5
+    return {
+        "workflows": [
+            {
+                "id": f"wf-{i}",
+                "name": f"Workflow {i}",
+                "description": "Research a topic and write a report",
+                "crew_ai_process": "sequential",
+                "crew_ai_agents": [f"agent-{i}-{j}" for j in range(4)],
+                "crew_ai_tasks": [f"task-{i}-{j}" for j in range(4)],
+                "is_conversational": False,
+            }
+            for i in range(num_workflows)
+        ],
+        "tasks": [
+            {
+                "id": f"task-{i}-{j}",
+                "workflow_id": f"wf-{i}",
+                "description": "Summarize {topic}",
+                "expected_output": "A summary in bullet points",
+                "assigned_agent_id": f"agent-{i}-{j}",
+            }
+            for i in range(num_workflows)
+            for j in range(4)
+        ],
+    }
+
+
+def run_scenario(name: str, import_fn, db_url: str) -> dict:
+    dao = AgentStudioDao(engine_url=db_url)
+    import_dict = make_import_dict()
+    num_rows = sum(len(rows) for rows in import_dict.values())
+
+    start = monotonic()
+    import_fn(import_dict, dao=dao)
+    insert_elapsed = monotonic() - start
+
+    start = monotonic()
+    import_fn(import_dict, dao=dao)
+    update_elapsed = monotonic() - start
+
+    return {
+        "scenario": name,
+        "rows": num_rows,
+        "insert_rows_per_sec": num_rows / insert_elapsed,
+        "update_rows_per_sec": num_rows / update_elapsed,
+    }
+
+
+def main():
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        results.append(run_scenario("per-row", legacy_import_from_dict, f"sqlite+pysqlite:///{tmp_dir}/legacy.db"))
+        results.append(run_scenario("bulk-upsert", import_from_dict, f"sqlite+pysqlite:///{tmp_dir}/bulk.db"))
+        dispose_engines()
+
+    print(f"{'scenario':<14}{'rows':>8}{'insert rows/s':>16}{'update rows/s':>16}")
+    for row in results:
+        print(
+            f"{row['scenario']:<14}{row['rows']:>8}{row['insert_rows_per_sec']:>16.0f}{row['update_rows_per_sec']:>16.0f}"
+        )
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
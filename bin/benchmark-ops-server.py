@@ -0,0 +1,180 @@
+"""
+benchmark-ops-server.py
+Compare sustained event throughput of the async ops server against the
+legacy single-threaded http.server proxy, with and without a slow trace
+upload being proxied to Phoenix at the same time.
+
+Note that the "legacy" server here is studio.ops_server.legacy, which keeps
+the original request handling but stores events through the same
+studio.ops_server.events layer as the async server. It is not the original
+Kombu-backed server, so the numbers isolate the cost of the single-threaded
+http.server front end, not of the old event queue.
+
+A stub Phoenix server stands in for the real one, so this runs anywhere:
+    uv run bin/benchmark-ops-server.py
+"""
+
+import asyncio
+import http.server
+import json
+import socket
+import threading
+import time
+from time import monotonic
+from typing import Tuple
+
+import aiohttp
+import uvicorn
+
+from studio.ops_server.app import create_ops_app
+from studio.ops_server.legacy import ProxyHandler
+
+CONCURRENCY = 32  # concurrent event posters
+DURATION_SECONDS = 5  # how long to sustain the load per scenario
+BATCH_SIZE = 50  # events per /events/batch request
+SLOW_UPLOAD_SECONDS = 0.5  # latency of each stubbed /v1/traces upload
+
+EVENT = {"type": "llm_call_completed", "timestamp": "2025-01-01T00:00:00", "response": "x" * 512}
+
+
+# ---------- stub phoenix ---------------------------------------------------
+
+
+class StubPhoenixHandler(http.server.BaseHTTPRequestHandler):
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path.startswith("/v1/traces"):
+            time.sleep(SLOW_UPLOAD_SECONDS)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_stub_phoenix() -> int:
+    port = free_port()
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", port), StubPhoenixHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return port
+
+
+def start_legacy_server(upstream_port: int) -> int:
+    class QuietProxyHandler(ProxyHandler):
+        upstream_host = "127.0.0.1"
+
+        def log_message(self, format, *args):
+            pass
+
+    QuietProxyHandler.upstream_port = upstream_port
+    port = free_port()
+    server = http.server.HTTPServer(("127.0.0.1", port), QuietProxyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return port
+
+
+def start_async_server(upstream_port: int) -> int:
+    port = free_port()
+    app = create_ops_app(upstream_url=f"http://127.0.0.1:{upstream_port}")
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, access_log=False, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return port
+
+
+# ---------- load -----------------------------------------------------------
+
+
+async def post_events(
+    session: aiohttp.ClientSession, base_url: str, batch: bool, deadline: float, worker: int
+) -> Tuple[int, int]:
+    sent, errors = 0, 0
+    trace_id = f"bench-{worker}"
+    if batch:
+        url, count = f"{base_url}/events/batch", BATCH_SIZE
+        body = {"trace_id": trace_id, "events": [EVENT] * BATCH_SIZE}
+    else:
+        url, body, count = f"{base_url}/events", {"trace_id": trace_id, "event": EVENT}, 1
+    while monotonic() < deadline:
+        try:
+            async with session.post(url, json=body) as r:
+                await r.read()
+                if r.status == 200:
+                    sent += count
+                else:
+                    errors += 1
+        except aiohttp.ClientError:
+            # The legacy server's listen backlog overflows under load and
+            # resets connections; count these rather than abort the run.
+            errors += 1
+    # Read the events back, as the UI does at the end of a run.
+    async with session.get(f"{base_url}/events", params={"trace_id": trace_id}) as r:
+        await r.read()
+    return sent, errors
+
+
+async def upload_traces(session: aiohttp.ClientSession, base_url: str, deadline: float) -> None:
+    while monotonic() < deadline:
+        try:
+            async with session.post(f"{base_url}/v1/traces", data=b"\0" * 65536) as r:
+                await r.read()
+        except aiohttp.ClientError:
+            pass
+
+
+async def run_scenario(base_url: str, batch: bool, slow_uploads: bool) -> Tuple[float, int]:
+    timeout = aiohttp.ClientTimeout(total=60)
+    connector = aiohttp.TCPConnector(limit=CONCURRENCY + 1)
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        start = monotonic()
+        deadline = start + DURATION_SECONDS
+        uploads = asyncio.create_task(upload_traces(session, base_url, deadline)) if slow_uploads else None
+        results = await asyncio.gather(
+            *[post_events(session, base_url, batch, deadline, i) for i in range(CONCURRENCY)]
+        )
+        elapsed = monotonic() - start
+        if uploads is not None:
+            await uploads
+        return sum(sent for sent, _ in results) / elapsed, sum(errors for _, errors in results)
+
+
+def main():
+    phoenix_port = start_stub_phoenix()
+    servers = {
+        "legacy": f"http://127.0.0.1:{start_legacy_server(phoenix_port)}",
+        "async": f"http://127.0.0.1:{start_async_server(phoenix_port)}",
+    }
+
+    results = []
+    for batch in (False, True):
+        for slow_uploads in (False, True):
+            row = {"endpoint": "/events/batch" if batch else "/events", "slow_uploads": slow_uploads}
+            for name, base_url in servers.items():
+                row[name], row[f"{name}_errors"] = asyncio.run(run_scenario(base_url, batch, slow_uploads))
+            results.append(row)
+
+    print(
+        f"{'endpoint':<15}{'slow uploads':<14}{'legacy ev/s':>14}{'errors':>8}"
+        f"{'async ev/s':>14}{'errors':>8}{'speedup':>10}"
+    )
+    for row in results:
+        speedup = row["async"] / row["legacy"] if row["legacy"] else float("inf")
+        print(
+            f"{row['endpoint']:<15}{str(row['slow_uploads']):<14}"
+            f"{row['legacy']:>14.0f}{row['legacy_errors']:>8}"
+            f"{row['async']:>14.0f}{row['async_errors']:>8}{speedup:>9.1f}x"
+        )
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+benchmark-sqlite-contention.py
+Compare write throughput of 10 concurrent gRPC-style handlers against the
+studio database, with the legacy setup (every DAO opens a private engine on
+a rollback-journal database) and the shared engine of AgentStudioDao, both
+with its default rollback journal and with the opt-in WAL journal mode.
+Each handler loops over a short read (listing a workflow's tasks) followed
+by a write transaction (adding a task), like add_task after list_tasks.
+
+Uses temporary database files, so this runs anywhere:
+    uv run bin/benchmark-sqlite-contention.py
+"""
+
+import json
+import tempfile
+import threading
+from time import monotonic
+from unittest.mock import patch
+from uuid import uuid4
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from studio.db import model as db_model
+from studio.db.dao import AgentStudioDao, dispose_engines
+from studio.db.model import Base
+
+HANDLERS = 10  # concurrent handler threads
+DURATION_SECONDS = 5  # how long to sustain the load per scenario
+
+
+class LegacyDao(AgentStudioDao):
+    """
+    AgentStudioDao as it was before engines were shared: a private engine
+    with SQLite's default pragmas, and create_all on every construction.
+    """
+
+    def __init__(self, engine_url: str):
+        self.engine = create_engine(engine_url)
+        self.Session = sessionmaker(bind=self.engine, autoflush=True, autocommit=False)
+        Base.metadata.create_all(self.engine)
+
+
+def handler(make_dao, deadline: float, counts: dict, lock: threading.Lock):
+    dao = make_dao()
+    reads, writes, errors = 0, 0, 0
+    while monotonic() < deadline:
+        try:
+            with dao.get_session() as session:
+                session.query(db_model.Task).filter_by(workflow_id="wf").limit(20).all()
+            reads += 1
+            with dao.get_session() as session:
+                session.add(db_model.Task(id=str(uuid4()), workflow_id="wf", description="Summarize {topic}"))
+            writes += 1
+        except Exception as e:
+            errors += 1
+            if "locked" not in str(e):
+                raise
+    with lock:
+        counts["reads"] += reads
+        counts["writes"] += writes
+        counts["errors"] += errors
+
+
+def run_scenario(name: str, make_dao) -> dict:
+    with make_dao().get_session() as session:
+        session.add(db_model.Workflow(id="wf", name="Workflow"))
+
+    counts, lock = {"reads": 0, "writes": 0, "errors": 0}, threading.Lock()
+    deadline = monotonic() + DURATION_SECONDS
+    threads = [threading.Thread(target=handler, args=(make_dao, deadline, counts, lock)) for _ in range(HANDLERS)]
+    start = monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = monotonic() - start
+    return {
+        "scenario": name,
+        "writes_per_sec": counts["writes"] / elapsed,
+        "reads_per_sec": counts["reads"] / elapsed,
+        "locked_errors": counts["errors"],
+    }
+
+
+def main():
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_url = f"sqlite+pysqlite:///{tmp_dir}/legacy.db"
+        results.append(run_scenario("legacy", lambda: LegacyDao(legacy_url)))
+
+        shared_url = f"sqlite+pysqlite:///{tmp_dir}/shared.db"
+        results.append(run_scenario("shared", lambda: AgentStudioDao(engine_url=shared_url)))
+        dispose_engines()
+
+        # Same as AGENT_STUDIO_SQLITE_JOURNAL_MODE=WAL, without a new process.
+        wal_url = f"sqlite+pysqlite:///{tmp_dir}/shared-wal.db"
+        with patch.multiple("studio.db.dao", SQLITE_JOURNAL_MODE="WAL", SQLITE_SYNCHRONOUS="NORMAL"):
+            results.append(run_scenario("shared-wal", lambda: AgentStudioDao(engine_url=wal_url)))
+            dispose_engines()
+
+    print(f"{'scenario':<12}{'writes/s':>12}{'reads/s':>12}{'locked':>10}")
+    for row in results:
+        print(
+            f"{row['scenario']:<12}{row['writes_per_sec']:>12.1f}{row['reads_per_sec']:>12.1f}{row['locked_errors']:>10}"
+        )
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,10 @@ export AGENT_STUDIO_OPS_PROVIDER=phoenix
 # Number of agent studio workflow runners to spin up for workflow testing purposes.
 export AGENT_STUDIO_NUM_WORKFLOW_RUNNERS=${AGENT_STUDIO_NUM_WORKFLOW_RUNNERS:-5}
 
+# Number of workflows each runner process may execute concurrently. Total
+# test capacity is AGENT_STUDIO_NUM_WORKFLOW_RUNNERS * this value.
+export AGENT_STUDIO_WORKFLOW_RUNNER_CONCURRENCY=${AGENT_STUDIO_WORKFLOW_RUNNER_CONCURRENCY:-1}
+
 # Array to hold runner process IDs.
 declare -a RUNNER_PIDS=()
 
@@ -1,14 +1,14 @@
 import os
 import shutil
 from uuid import uuid4
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from sqlalchemy.exc import SQLAlchemyError
 from studio import consts
 from studio.db.dao import AgentStudioDao
 from studio.db import model as db_model, DbSession
 from studio.api import *
 from studio.tools.tool_instance import get_tool_instance
-from studio.tools.tool_template import get_tool_template
+import studio.tools.utils as tool_utils
 from studio.as_mcp.mcp_instances import get_mcp_instance, create_mcp_instance
 from cmlapi import CMLServiceApi
 from studio.workflow.utils import invalidate_workflow
@@ -16,6 +16,50 @@ from studio.proto.utils import is_field_set
 from studio.tools.tool_instance import create_tool_instance, remove_tool_instance
 
 
+def _load_agents_dependencies(
+    agents: List[db_model.Agent], session: DbSession
+) -> Tuple[Set[str], List[db_model.ToolInstance]]:
+    """
+    Load the ids of the agents' language models that exist, and the agents'
+    tool instances, with one query each.
+    """
+    model_ids = {agent.llm_provider_model_id for agent in agents if agent.llm_provider_model_id}
+    tool_ids = {tool_id for agent in agents for tool_id in agent.tool_ids or []}
+
+    existing_model_ids = set()
+    if model_ids:
+        existing_model_ids = {
+            model_id
+            for (model_id,) in session.query(db_model.Model.model_id).filter(db_model.Model.model_id.in_(model_ids))
+        }
+    tool_instances = []
+    if tool_ids:
+        tool_instances = session.query(db_model.ToolInstance).filter(db_model.ToolInstance.id.in_(tool_ids)).all()
+    return existing_model_ids, tool_instances
+
+
+def _get_agents_validity(
+    agents: List[db_model.Agent], existing_model_ids: Set[str], tool_instances: List[db_model.ToolInstance]
+) -> Dict[str, bool]:
+    """
+    Validate agents in one pass. An agent is valid if its language model exists
+    and all of its tool instances exist with readable, parseable code. Tool code
+    is read through the shared tool metadata cache, so callers run this once
+    their session is closed rather than holding a read transaction open
+    during file I/O.
+    """
+    valid_tool_ids = {
+        tool_instance.id for tool_instance in tool_instances if tool_utils.is_tool_instance_valid(tool_instance)
+    }
+
+    # TODO: add MCP instance validation logic
+    return {
+        agent.id: agent.llm_provider_model_id in existing_model_ids
+        and all(tool_id in valid_tool_ids for tool_id in agent.tool_ids or [])
+        for agent in agents
+    }
+
+
 def list_agents(
     request: ListAgentsRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None
 ) -> ListAgentsResponse:
@@ -26,71 +70,49 @@ def list_agents(
         if not request.workflow_id:
             raise ValueError("Every ListAgents request must specify a workflow ID.")
 
-        with dao.get_session() as session:
+        with dao.get_session(read_only=True) as session:
             agents: List[db_model.Agent] = (
                 session.query(db_model.Agent).filter_by(workflow_id=request.workflow_id).all()
             )
             if not agents:
                 return ListAgentsResponse(agents=[])
 
-            agent_list = []
-            for agent in agents:
-                # Check if llm_provider_model_id exists in models table
-                is_valid = (
-                    session.query(db_model.Model).filter_by(model_id=agent.llm_provider_model_id).one_or_none()
-                    is not None
-                )
+            existing_model_ids, tool_instances = _load_agents_dependencies(agents, session)
 
-                # Validate tools associated with the agent
-                tools_valid = True
-                for tool_id in agent.tool_ids or []:
-                    try:
-                        tool_request = GetToolInstanceRequest(tool_instance_id=tool_id)
-                        tool_response = get_tool_instance(tool_request, cml, dao=None, preexisting_db_session=session)
-                        tool_template_id = tool_response.tool_instance.tool_template_id
-                        tool_template = get_tool_template(
-                            GetToolTemplateRequest(tool_template_id=tool_template_id), cml, dao
-                        ).template
-                        if not tool_template.is_valid:
-                            tools_valid = False
-                            break
-                    except Exception:
-                        tools_valid = False
-                        break
-
-                # Validate MCP instances associated with the agent
-                mcp_instances_valid = True  # TODO: add MCP instance validation logic
-
-                is_valid = is_valid and tools_valid and mcp_instances_valid
-
-                agent_image_uri = ""
-                if agent.agent_image_path:
-                    agent_image_uri = os.path.relpath(agent.agent_image_path, consts.DYNAMIC_ASSETS_LOCATION)
-
-                agent_list.append(
-                    AgentMetadata(
-                        id=agent.id,
-                        workflow_id=agent.workflow_id,
-                        name=agent.name,
-                        llm_provider_model_id=agent.llm_provider_model_id,
-                        tools_id=agent.tool_ids or [],
-                        mcp_instance_ids=agent.mcp_instance_ids or [],
-                        crew_ai_agent_metadata=CrewAIAgentMetadata(
-                            role=agent.crew_ai_role,
-                            backstory=agent.crew_ai_backstory,
-                            goal=agent.crew_ai_goal,
-                            allow_delegation=agent.crew_ai_allow_delegation,
-                            verbose=agent.crew_ai_verbose,
-                            cache=agent.crew_ai_cache,
-                            temperature=agent.crew_ai_temperature,
-                            max_iter=agent.crew_ai_max_iter,
-                        ),
-                        agent_image_uri=agent_image_uri,
-                        is_valid=is_valid,
-                    )
+        agents_validity = _get_agents_validity(agents, existing_model_ids, tool_instances)
+
+        agent_list = []
+        for agent in agents:
+            is_valid = agents_validity[agent.id]
+
+            agent_image_uri = ""
+            if agent.agent_image_path:
+                agent_image_uri = os.path.relpath(agent.agent_image_path, consts.DYNAMIC_ASSETS_LOCATION)
+
+            agent_list.append(
+                AgentMetadata(
+                    id=agent.id,
+                    workflow_id=agent.workflow_id,
+                    name=agent.name,
+                    llm_provider_model_id=agent.llm_provider_model_id,
+                    tools_id=agent.tool_ids or [],
+                    mcp_instance_ids=agent.mcp_instance_ids or [],
+                    crew_ai_agent_metadata=CrewAIAgentMetadata(
+                        role=agent.crew_ai_role,
+                        backstory=agent.crew_ai_backstory,
+                        goal=agent.crew_ai_goal,
+                        allow_delegation=agent.crew_ai_allow_delegation,
+                        verbose=agent.crew_ai_verbose,
+                        cache=agent.crew_ai_cache,
+                        temperature=agent.crew_ai_temperature,
+                        max_iter=agent.crew_ai_max_iter,
+                    ),
+                    agent_image_uri=agent_image_uri,
+                    is_valid=is_valid,
                 )
+            )
 
-            return ListAgentsResponse(agents=agent_list)
+        return ListAgentsResponse(agents=agent_list)
     except SQLAlchemyError as e:
         raise RuntimeError(f"Failed to list agents: {str(e)}")
 
@@ -103,63 +125,40 @@ def get_agent(request: GetAgentRequest, cml: CMLServiceApi = None, dao: AgentStu
         if not request.agent_id:
             raise ValueError("Agent ID is required.")
 
-        with dao.get_session() as session:
+        with dao.get_session(read_only=True) as session:
             agent = session.query(db_model.Agent).filter_by(id=request.agent_id).one_or_none()
             if not agent:
                 raise ValueError(f"Agent with ID '{request.agent_id}' not found.")
 
-            # Check if llm_provider_model_id exists in models table
-            is_valid = (
-                session.query(db_model.Model).filter_by(model_id=agent.llm_provider_model_id).one_or_none() is not None
-            )
-
-            # Validate tools associated with the agent
-            tools_valid = True
-            for tool_id in agent.tool_ids or []:
-                try:
-                    tool_request = GetToolInstanceRequest(tool_instance_id=tool_id)
-                    tool_response = get_tool_instance(tool_request, cml, dao=None, preexisting_db_session=session)
-                    tool_template_id = tool_response.tool_instance.tool_template_id
-                    tool_template = get_tool_template(
-                        GetToolTemplateRequest(tool_template_id=tool_template_id), cml, dao
-                    ).template
-                    if not tool_template.is_valid:
-                        tools_valid = False
-                        break
-                except Exception:
-                    tools_valid = False
-                    break
-
-            # Validate MCP instances associated with the agent
-            mcp_instances_valid = True  # TODO: add MCP instance validation logic
-
-            is_valid = is_valid and tools_valid and mcp_instances_valid
-
-            agent_image_uri = ""
-            if agent.agent_image_path:
-                agent_image_uri = os.path.relpath(agent.agent_image_path, consts.DYNAMIC_ASSETS_LOCATION)
-
-            agent_metadata = AgentMetadata(
-                id=agent.id,
-                workflow_id=agent.workflow_id,
-                name=agent.name,
-                llm_provider_model_id=agent.llm_provider_model_id,
-                tools_id=agent.tool_ids or [],
-                mcp_instance_ids=agent.mcp_instance_ids or [],
-                crew_ai_agent_metadata=CrewAIAgentMetadata(
-                    role=agent.crew_ai_role,
-                    backstory=agent.crew_ai_backstory,
-                    goal=agent.crew_ai_goal,
-                    allow_delegation=agent.crew_ai_allow_delegation,
-                    verbose=agent.crew_ai_verbose,
-                    cache=agent.crew_ai_cache,
-                    temperature=agent.crew_ai_temperature,
-                    max_iter=agent.crew_ai_max_iter,
-                ),
-                agent_image_uri=agent_image_uri,
-                is_valid=is_valid,
-            )
-            return GetAgentResponse(agent=agent_metadata)
+            existing_model_ids, tool_instances = _load_agents_dependencies([agent], session)
+
+        is_valid = _get_agents_validity([agent], existing_model_ids, tool_instances)[agent.id]
+
+        agent_image_uri = ""
+        if agent.agent_image_path:
+            agent_image_uri = os.path.relpath(agent.agent_image_path, consts.DYNAMIC_ASSETS_LOCATION)
+
+        agent_metadata = AgentMetadata(
+            id=agent.id,
+            workflow_id=agent.workflow_id,
+            name=agent.name,
+            llm_provider_model_id=agent.llm_provider_model_id,
+            tools_id=agent.tool_ids or [],
+            mcp_instance_ids=agent.mcp_instance_ids or [],
+            crew_ai_agent_metadata=CrewAIAgentMetadata(
+                role=agent.crew_ai_role,
+                backstory=agent.crew_ai_backstory,
+                goal=agent.crew_ai_goal,
+                allow_delegation=agent.crew_ai_allow_delegation,
+                verbose=agent.crew_ai_verbose,
+                cache=agent.crew_ai_cache,
+                temperature=agent.crew_ai_temperature,
+                max_iter=agent.crew_ai_max_iter,
+            ),
+            agent_image_uri=agent_image_uri,
+            is_valid=is_valid,
+        )
+        return GetAgentResponse(agent=agent_metadata)
     except SQLAlchemyError as e:
         raise RuntimeError(f"Failed to get agent: {str(e)}")
 
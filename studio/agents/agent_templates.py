@@ -16,14 +16,13 @@ from studio import consts
 def list_agent_templates(
     request: ListAgentTemplatesRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None
 ) -> ListAgentTemplatesResponse:
-    with dao.get_session() as session:
-        agent_templates: List[db_model.AgentTemplate] = session.query(db_model.AgentTemplate).all()
+    with dao.get_session(read_only=True) as session:
+        query = session.query(db_model.AgentTemplate)
 
         # Filter by specific agent template
         if is_field_set(request, "workflow_template_id"):
-            agent_templates = list(
-                filter(lambda x: x.workflow_template_id == request.workflow_template_id, agent_templates)
-            )
+            query = query.filter_by(workflow_template_id=request.workflow_template_id)
+        agent_templates: List[db_model.AgentTemplate] = query.all()
 
         return ListAgentTemplatesResponse(
             agent_templates=[agent_template.to_protobuf() for agent_template in agent_templates]
@@ -33,7 +32,7 @@ def list_agent_templates(
 def get_agent_template(
     request: GetAgentTemplateRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None
 ) -> GetAgentTemplateResponse:
-    with dao.get_session() as session:
+    with dao.get_session(read_only=True) as session:
         agent_template: db_model.AgentTemplate = (
             session.query(db_model.AgentTemplate).filter_by(id=request.id).one_or_none()
         )
@@ -151,7 +151,7 @@ def list_mcp_instances(
     """
     try:
         if dao is not None:
-            with dao.get_session() as session:
+            with dao.get_session(read_only=True) as session:
                 response = _list_mcp_instances_impl(request, session)
                 return response
         else:
@@ -192,7 +192,7 @@ def get_mcp_instance(
     """
     try:
         if dao is not None:
-            with dao.get_session() as session:
+            with dao.get_session(read_only=True) as session:
                 response = _get_mcp_instance_impl(request, session)
                 return response
         else:
@@ -157,7 +157,7 @@ def update_mcp_template(
 def list_mcp_templates(
     request: ListMcpTemplatesRequest, cml: CMLServiceApi, dao: AgentStudioDao
 ) -> ListMcpTemplatesResponse:
-    with dao.get_session() as session:
+    with dao.get_session(read_only=True) as session:
         if is_field_set(request, "workflow_template_id"):
             mcp_templates = (
                 session.query(db_model.MCPTemplate).filter_by(workflow_template_id=request.workflow_template_id).all()
@@ -185,7 +185,7 @@ def list_mcp_templates(
 
 
 def get_mcp_template(request: GetMcpTemplateRequest, cml: CMLServiceApi, dao: AgentStudioDao) -> GetMcpTemplateResponse:
-    with dao.get_session() as session:
+    with dao.get_session(read_only=True) as session:
         mcp_template = (
             session.query(db_model.MCPTemplate).filter(db_model.MCPTemplate.id == request.mcp_template_id).first()
         )
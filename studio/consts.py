@@ -41,6 +41,12 @@ TEMP_FILES_LOCATION = f"{ALL_STUDIO_DATA_LOCATION}/temp_files"
 DEPLOYABLE_WORKFLOWS_LOCATION = f"{ALL_STUDIO_DATA_LOCATION}/deployable_workflows"
 DEPLOYABLE_APPLICATIONS_LOCATION = f"{ALL_STUDIO_DATA_LOCATION}/deployable_applications"
 WORKFLOWS_LOCATION = f"{ALL_STUDIO_DATA_LOCATION}/workflows"
+# Content-addressed store of tool virtual environments shared between tool
+# instances with identical requirements.
+TOOL_VENV_STORE_LOCATION = f"{ALL_STUDIO_DATA_LOCATION}/tool_venvs"
+# Packaged deployment artifacts and packaged file hashes, kept on the project
+# filesystem so that later deployment jobs, each in a fresh engine, reuse them.
+DEPLOYMENT_ARTIFACT_CACHE_LOCATION = f"{ALL_STUDIO_DATA_LOCATION}/deployment_artifacts_cache"
 WORKFLOW_MODEL_FILE_PATH = f"./studio/workflow/deploy_workflow_model_v2.py"
 
 
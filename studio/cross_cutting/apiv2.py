@@ -293,7 +293,7 @@ def get_deployed_workflows(
 
     try:
         # Get list of deployed workflows from database
-        with dao.get_session() as session:
+        with dao.get_session(read_only=True) as session:
             deployed_workflows = session.query(db_model.DeployedWorkflowInstance).all()
             return [
                 DeployedWorkflow(
@@ -1,12 +1,44 @@
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from studio.db.model import Base
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 from contextlib import contextmanager
 from studio.consts import DEFAULT_SQLITE_DB_LOCATION
 import os
+import threading
+
+
+# Connection pool of the shared engine behind AgentStudioDao() and get_dao().
+DEFAULT_ENGINE_ARGS = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_timeout": 30,
+    "pool_recycle": 1800,
+}
+
+# Pragmas set on every new SQLite connection. The journal mode is stored in
+# the database file and applies to every process that opens it, including
+# deploy jobs, which run in their own CML engine and open the studio's
+# state.db through AgentStudioDao while the studio is serving. WAL's
+# shared-memory index only works when every connection is on the same host,
+# so the default is SQLite's rollback journal, which is safe across hosts.
+# Opt in with AGENT_STUDIO_SQLITE_JOURNAL_MODE=WAL only where the database is
+# never opened from another host: readers then proceed while a writer
+# commits, and synchronous defaults to NORMAL, which syncs only at WAL
+# checkpoints. A database left in WAL mode is switched back to the rollback
+# journal by the next connection that opens it with the default.
+SQLITE_JOURNAL_MODE = os.getenv("AGENT_STUDIO_SQLITE_JOURNAL_MODE", "DELETE")
+SQLITE_SYNCHRONOUS = os.getenv(
+    "AGENT_STUDIO_SQLITE_SYNCHRONOUS", "NORMAL" if SQLITE_JOURNAL_MODE.upper() == "WAL" else "FULL"
+)
+# Milliseconds a connection waits on a locked database before failing with "database is locked".
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("AGENT_STUDIO_SQLITE_BUSY_TIMEOUT_MS", "30000"))
+SQLITE_MMAP_SIZE = int(os.getenv("AGENT_STUDIO_SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+# Page cache per connection, in KiB when negative (SQLite's convention).
+SQLITE_CACHE_SIZE = int(os.getenv("AGENT_STUDIO_SQLITE_CACHE_SIZE", "-65536"))
 
 
 def get_sqlite_db_location():
@@ -28,10 +60,74 @@ def delete_database() -> None:
     """
 
     state_db = get_sqlite_db_location()
+    dispose_engines()
     os.remove(state_db)
+    # Write-ahead log and shared memory index of the database in WAL mode.
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(state_db + suffix):
+            os.remove(state_db + suffix)
     return
 
 
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA cache_size={SQLITE_CACHE_SIZE}")
+    finally:
+        cursor.close()
+
+
+def _is_in_memory_url(engine_url: str) -> bool:
+    return engine_url.startswith("sqlite") and (":memory:" in engine_url or engine_url.split("://", 1)[1] in ("", "/"))
+
+
+def _create_engine(engine_url: str, echo: bool, engine_args: dict) -> Engine:
+    engine = create_engine(engine_url, echo=echo, **engine_args)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", set_sqlite_pragmas)
+    # Create all of our required tables if they do not yet exist.
+    Base.metadata.create_all(engine)
+    return engine
+
+
+# Engines shared by every DAO of the process, keyed on URL and engine
+# arguments. In-memory databases are private to their DAO and never shared.
+_engines: Dict[Tuple, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(engine_url: str, echo: bool = False, engine_args: Optional[dict] = None) -> Engine:
+    """
+    Get the process-wide engine for a database, creating it and its tables
+    on first use. Every DAO of the same database then shares one connection
+    pool, instead of each opening its own connections and running
+    create_all again.
+    """
+    engine_args = engine_args or {}
+    if _is_in_memory_url(engine_url):
+        return _create_engine(engine_url, echo, engine_args)
+    key = (engine_url, echo, tuple(sorted(engine_args.items())))
+    with _engines_lock:
+        if key not in _engines:
+            _engines[key] = _create_engine(engine_url, echo, engine_args)
+        return _engines[key]
+
+
+def dispose_engines() -> None:
+    """
+    Close every shared engine's connections, so the next DAO opens the
+    database file afresh.
+    """
+    with _engines_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+
+
 class AgentStudioDao():
     """
     Data access layer for the Fine Tuning Studio application. In the future,
@@ -41,29 +137,39 @@ class AgentStudioDao():
     simplicity and not build the base class yet.
     """
 
-    def __init__(self, engine_url: Optional[str] = None, echo: bool = False, engine_args: dict = {}):
+    def __init__(self, engine_url: Optional[str] = None, echo: bool = False, engine_args: Optional[dict] = None):
         if engine_url is None:
             engine_url = f"sqlite+pysqlite:///{get_sqlite_db_location()}"
+            if engine_args is None:
+                engine_args = DEFAULT_ENGINE_ARGS
 
-        self.engine = create_engine(
-            engine_url,
-            echo=echo,
-            **engine_args,
-        )
+        # DAOs are cheap: every DAO of the same database shares one engine,
+        # whose tables are created once, when the engine is first created.
+        self.engine = get_engine(engine_url, echo=echo, engine_args=engine_args)
         self.Session = sessionmaker(
             bind=self.engine, autoflush=True, autocommit=False)
-
-        # Create all of our required tables if they do not yet exist.
-        Base.metadata.create_all(self.engine)
+        # Sessions of read endpoints: nothing is flushed or committed, and
+        # loaded objects stay usable after the session is closed.
+        self.ReadOnlySession = sessionmaker(bind=self.engine, autoflush=False, autocommit=False, expire_on_commit=False)
 
     @contextmanager
-    def get_session(self):
+    def get_session(self, read_only: bool = False):
         """
         Provides a context manager for a session that automatically
         attempts a session commit after completion of the context, and will
         automatically rollback if there are failures, and finally will close
         the session once complete, releasing the sesion back to the session pool.
+
+        With read_only=True the session never flushes or commits, and on SQLite
+        it runs in a deferred transaction with PRAGMA query_only, so a read
+        endpoint takes no write lock and any write fails instead of being
+        committed.
         """
+        if read_only:
+            with self._read_only_session() as session:
+                yield session
+            return
+
         session = self.Session()
         try:
             yield session
@@ -74,12 +180,28 @@ class AgentStudioDao():
         finally:
             session.close()
 
+    @contextmanager
+    def _read_only_session(self):
+        session = self.ReadOnlySession()
+        connection = None
+        try:
+            if self.engine.dialect.name == "sqlite":
+                connection = session.connection()
+                connection.exec_driver_sql("PRAGMA query_only = ON")
+                if not connection.connection.dbapi_connection.in_transaction:
+                    connection.exec_driver_sql("BEGIN DEFERRED")
+            yield session
+        finally:
+            try:
+                if connection is not None:
+                    # query_only sticks to the pooled connection; clear it before
+                    # the connection goes back to the pool.
+                    connection.exec_driver_sql("PRAGMA query_only = OFF")
+            finally:
+                # Closing rolls the transaction back as the connection returns
+                # to the pool, without expiring the objects read through it.
+                session.close()
+
+
 def get_dao():
-    return AgentStudioDao(
-        engine_args={
-            "pool_size": 5,
-            "max_overflow": 10,
-            "pool_timeout": 30,
-            "pool_recycle": 1800,
-        }
-    )
+    return AgentStudioDao()
@@ -98,7 +98,7 @@ class Model(Base, MappedProtobuf, MappedDict):
 class ToolInstance(Base, MappedProtobuf, MappedDict):
     __tablename__ = "tool_instances"
     id = Column(String, primary_key=True, nullable=False)
-    workflow_id = Column(String, ForeignKey("workflows.id"), nullable=False)
+    workflow_id = Column(String, ForeignKey("workflows.id"), nullable=False, index=True)
     name = Column(String, nullable=False)
     python_code_file_name = Column(Text, nullable=False)
     python_requirements_file_name = Column(Text, nullable=False)
@@ -114,7 +114,7 @@ class ToolTemplate(Base, MappedProtobuf, MappedDict):
 
     # Optional to hide agent template to a specific workflow
     workflow_template_id = Column(String, ForeignKey(
-        "workflow_templates.id"), nullable=True)
+        "workflow_templates.id"), nullable=True, index=True)
 
     name = Column(String, nullable=False)
     python_code_file_name = Column(Text, nullable=False)
@@ -130,7 +130,7 @@ class MCPTemplate(Base, MappedProtobuf, MappedDict):
 
     # Optional to hide agent template to a specific workflow
     workflow_template_id = Column(String, ForeignKey(
-        "workflow_templates.id"), nullable=True)
+        "workflow_templates.id"), nullable=True, index=True)
 
     id = Column(String, primary_key=True, nullable=False)
     name = Column(String, nullable=False)
@@ -145,7 +145,7 @@ class MCPInstance(Base, MappedProtobuf, MappedDict):
     __tablename__ = "mcp_instances"
 
     id = Column(String, primary_key=True, nullable=False)
-    workflow_id = Column(String, ForeignKey("workflows.id"), nullable=False)
+    workflow_id = Column(String, ForeignKey("workflows.id"), nullable=False, index=True)
     name = Column(String, nullable=False)
     type = Column(String, nullable=False)
     args = Column(JSON, nullable=False)
@@ -161,7 +161,7 @@ class Agent(Base, MappedProtobuf, MappedDict):
     # Primary Key
     # Unique ID for the agent
     id = Column(String, primary_key=True, nullable=False)
-    workflow_id = Column(String, ForeignKey("workflows.id"), nullable=False)
+    workflow_id = Column(String, ForeignKey("workflows.id"), nullable=False, index=True)
 
     # Basic Attributes
     name = Column(String, nullable=False)                 # Name of the agent
@@ -200,7 +200,7 @@ class Task(Base, MappedProtobuf, MappedDict):
 
     id = Column(String, primary_key=True, nullable=False)  # Task ID
     name = Column(String, nullable=True)  # Task name
-    workflow_id = Column(String, ForeignKey("workflows.id"), nullable=False)
+    workflow_id = Column(String, ForeignKey("workflows.id"), nullable=False, index=True)
     description = Column(Text, nullable=True)  # Task description
     expected_output = Column(Text, nullable=True)  # Expected output
     assigned_agent_id = Column(String, nullable=True)  # Assigned Agent ID
@@ -235,6 +235,24 @@ class Workflow(Base, MappedProtobuf, MappedDict):
 
 
 
+class WorkflowTestSubmission(Base, MappedDict):
+    __tablename__ = "workflow_test_submissions"
+
+    # Events trace ID of the test run, returned to the client on submission
+    id = Column(String, primary_key=True, nullable=False)
+    workflow_id = Column(String, nullable=False, index=True)
+    # Higher priority submissions are dispatched first
+    priority = Column(Integer, nullable=False, default=0)
+    # "QUEUED", "DISPATCHING", "DISPATCHED", "CANCELLED" or "FAILED"
+    status = Column(String, nullable=False, default="QUEUED", index=True)
+    # Kickoff payload without the LLM, tool and MCP configs, which hold
+    # secrets and are never stored. Cleared once the submission leaves the queue.
+    payload = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    submitted_at = Column(Float, nullable=False)
+    finished_at = Column(Float, nullable=True)
+
+
 class DeployedWorkflowInstance(Base, MappedProtobuf, MappedDict):
     __tablename__ = "deployed_workflow_instance"
 
@@ -248,7 +266,7 @@ class DeployedWorkflowInstance(Base, MappedProtobuf, MappedDict):
     # Status of the deployment.
     status = Column(String, nullable=True)
     workflow_id = Column(String, ForeignKey(
-        "workflows.id"), nullable=False)  # Workflow ID
+        "workflows.id"), nullable=False, index=True)  # Workflow ID
     cml_deployed_model_id = Column(
         String, nullable=True)  # CML Deployed Model ID. TODO: deprecate in favor of metadata
     # Staleness tracker comparing to the published workflow.
@@ -299,7 +317,7 @@ class AgentTemplate(Base, MappedProtobuf, MappedDict):
 
     # Optional to hide agent template to a specific workflow
     workflow_template_id = Column(String, ForeignKey(
-        "workflow_templates.id"), nullable=True)
+        "workflow_templates.id"), nullable=True, index=True)
 
     name = Column(String, nullable=False)  # Agent Template name
     description = Column(String, nullable=True)
@@ -352,7 +370,7 @@ class TaskTemplate(Base, MappedProtobuf, MappedDict):
 
     id = Column(String, primary_key=True, nullable=False)  # Task ID
     workflow_template_id = Column(String, ForeignKey(
-        "workflow_templates.id"), nullable=True)  # Task templates are all assigned to workflow templates
+        "workflow_templates.id"), nullable=True, index=True)  # Task templates are all assigned to workflow templates
     name = Column(String, nullable=True)  # Task name
     description = Column(Text, nullable=True)  # Task description
     expected_output = Column(Text, nullable=True)  # Expected output
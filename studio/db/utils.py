@@ -3,12 +3,17 @@ from studio.db.model import *
 from studio.db.dao import AgentStudioDao
 from studio.consts import DEFAULT_PROJECT_DEFAULTS_LOCATION
 from typing import List
-import sqlalchemy as sa
+from itertools import groupby
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 import json
 
 import os
 
 
+# Rows sent to the database per upsert statement when importing from a dict.
+IMPORT_BATCH_SIZE = int(os.getenv("AGENT_STUDIO_IMPORT_BATCH_SIZE", "1000"))
+
+
 def get_project_defaults_location():
     """
     Get the location of the currently loaded state file.
@@ -39,6 +44,10 @@ def import_from_dict(db_dict: dict, dao: AgentStudioDao = None) -> None:
     Import data from a dictionary into the database. Data must take the form of a
     JSON dict where each key is the table name, and each value is a list of dicts
     that represent the declarative base model table row.
+
+    Rows are upserted in batches, all in one transaction: a new row is inserted,
+    and an existing row (same primary key) has the columns present in its dict
+    updated, leaving its other columns as they are.
     """
 
     with dao.get_session() as session:
@@ -46,17 +55,29 @@ def import_from_dict(db_dict: dict, dao: AgentStudioDao = None) -> None:
             if table_name not in TABLE_TO_MODEL_REGISTRY.keys():
                 raise ValueError(
                     f"Error importing database from dict: '{table_name}' is not a valid table name.")
-            table_cls = TABLE_TO_MODEL_REGISTRY.get(table_name)
-            for table_row_dict in table_rows:
-                primary_keys = {col.name: table_row_dict.get(col.name) for col in sa.inspect(table_cls).primary_key}
-                existing_row = session.get(table_cls, primary_keys)
-                if existing_row:
-                    for key, value in table_row_dict.items():
-                        setattr(existing_row, key, value)
+            table = TABLE_TO_MODEL_REGISTRY.get(table_name).__table__
+
+            # One upsert statement serves each run of consecutive rows that set the
+            # same columns, so rows are still written in their order in the dict.
+            for columns, rows in groupby(table_rows, key=lambda row: tuple(sorted(row.keys()))):
+                rows = list(rows)
+                unknown_columns = [column for column in columns if column not in table.c]
+                if unknown_columns:
+                    raise ValueError(
+                        f"Error importing database from dict: {unknown_columns} are not columns of '{table_name}'."
+                    )
+                insert_stmt = sqlite_insert(table)
+                update_columns = {
+                    column: insert_stmt.excluded[column] for column in columns if not table.c[column].primary_key
+                }
+                if update_columns:
+                    upsert_stmt = insert_stmt.on_conflict_do_update(
+                        index_elements=table.primary_key.columns, set_=update_columns
+                    )
                 else:
-                    table_row = table_cls(**table_row_dict)
-                    session.add(table_row)
-        session.commit()
+                    upsert_stmt = insert_stmt.on_conflict_do_nothing(index_elements=table.primary_key.columns)
+                for i in range(0, len(rows), IMPORT_BATCH_SIZE):
+                    session.execute(upsert_stmt, rows[i:i + IMPORT_BATCH_SIZE])
     return
 
 
@@ -0,0 +1,224 @@
+import io
+import os
+import json
+import time
+import shutil
+import hashlib
+import tarfile
+from uuid import uuid4
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+# Import engine code manually. Eventually when this code becomes
+# a separate git repo, or a custom runtime image, this path call
+# will go away and workflow engine features will be available already.
+import sys
+
+sys.path.append("studio/workflow_engine/src")
+from engine.archive import ARTIFACT_MANIFEST_FILE_NAME, build_artifact_manifest
+
+from studio import consts
+
+
+# Staging directories of the deployment job, on the engine's local disk.
+DEPLOYMENT_ARTIFACTS_LOCATION = os.path.join("/tmp", "deployment_artifacts")
+# The artifact cache outlives the job's engine, so it lives on the project filesystem.
+DEPLOYMENT_ARTIFACT_CACHE_LOCATION = consts.DEPLOYMENT_ARTIFACT_CACHE_LOCATION
+
+# Artifact compression, "gz" or "zstd", and its level. zstd needs the optional
+# zstandard package wherever the artifact is packaged or extracted.
+DEPLOYMENT_ARTIFACT_COMPRESSION = os.getenv("AGENT_STUDIO_DEPLOYMENT_ARTIFACT_COMPRESSION", "gz")
+DEPLOYMENT_ARTIFACT_COMPRESSION_LEVEL = os.getenv("AGENT_STUDIO_DEPLOYMENT_ARTIFACT_COMPRESSION_LEVEL")
+# Number of packaged artifacts kept for reuse by later, unchanged deployments.
+DEPLOYMENT_ARTIFACT_CACHE_SIZE = int(os.getenv("AGENT_STUDIO_DEPLOYMENT_ARTIFACT_CACHE_SIZE", "10"))
+# Staging directories left behind by interrupted packaging runs are removed
+# once they are this old.
+DEPLOYMENT_ARTIFACT_STALE_STAGING_SECONDS = 24 * 60 * 60
+
+ARTIFACT_EXTENSIONS = {"gz": ".tar.gz", "zstd": ".tar.zst"}
+
+FILE_HASHES_FILE_NAME = "file_hashes.json"
+
+# (path inside the archive, path on disk)
+ArtifactEntry = Tuple[str, str]
+
+
+def collect_directory_entries(
+    directory: str, arcname_root: str, ignore: Optional[Callable[[str, List[str]], Set[str]]] = None
+) -> List[ArtifactEntry]:
+    """
+    List the files under `directory` as archive entries rooted at
+    `arcname_root`. `ignore` follows the shutil.copytree convention: it is
+    called with each directory and its entry names, and returns the names to
+    skip.
+    """
+    entries: List[ArtifactEntry] = []
+    for root, dirs, files in os.walk(directory):
+        ignored = ignore(root, dirs + files) if ignore else set()
+        dirs[:] = sorted(d for d in dirs if d not in ignored)
+        for file in sorted(files):
+            if file in ignored:
+                continue
+            full_path = os.path.join(root, file)
+            arcname = os.path.normpath(os.path.join(arcname_root, os.path.relpath(full_path, start=directory)))
+            entries.append((arcname, full_path))
+    return entries
+
+
+class FileHashCache:
+    """
+    Content hashes of packaged files, keyed on path, size and modification
+    time, so unchanged files are not read again on every redeploy.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.path = os.path.join(cache_dir, FILE_HASHES_FILE_NAME)
+        try:
+            with open(self.path, "r") as f:
+                self._hashes: Dict[str, List] = json.load(f)
+        except (OSError, ValueError):
+            self._hashes = {}
+
+    def get(self, path: str) -> str:
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        cached = self._hashes.get(path)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        hasher = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        self._hashes[path] = [stat.st_size, stat.st_mtime_ns, hasher.hexdigest()]
+        return self._hashes[path][2]
+
+    def save(self) -> None:
+        hashes = {path: cached for path, cached in self._hashes.items() if os.path.exists(path)}
+        tmp_path = f"{self.path}.{uuid4()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(hashes, f)
+        os.replace(tmp_path, self.path)
+
+
+def get_artifact_key(file_hashes: List[Tuple[str, str]], compression: str, level: Optional[int]) -> str:
+    hasher = hashlib.sha256()
+    hasher.update(f"{compression}:{level}\n".encode("utf-8"))
+    for arcname, file_hash in sorted(file_hashes):
+        hasher.update(f"{arcname}\0{file_hash}\n".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _add_entries(tar: tarfile.TarFile, entries: List[ArtifactEntry], manifest: Optional[Dict[str, Any]]) -> None:
+    # The manifest goes first so extraction can read it without decompressing
+    # the rest of the artifact.
+    if manifest is not None:
+        data = json.dumps(manifest).encode("utf-8")
+        info = tarfile.TarInfo(ARTIFACT_MANIFEST_FILE_NAME)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        info.mode = 0o644
+        tar.addfile(info, io.BytesIO(data))
+    for arcname, full_path in entries:
+        tar.add(full_path, arcname=arcname, recursive=False)
+
+
+def write_artifact(
+    path: str,
+    entries: List[ArtifactEntry],
+    compression: str,
+    level: Optional[int],
+    manifest: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Stream files straight from their location into a compressed tarball.
+    """
+    if compression == "gz":
+        with tarfile.open(path, "w:gz", compresslevel=9 if level is None else level, dereference=True) as tar:
+            _add_entries(tar, entries, manifest)
+    elif compression == "zstd":
+        import zstandard
+
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level, threads=-1)
+        with open(path, "wb") as f, compressor.stream_writer(f) as writer:
+            with tarfile.open(fileobj=writer, mode="w|", dereference=True) as tar:
+                _add_entries(tar, entries, manifest)
+    else:
+        raise ValueError(f'Unsupported deployment artifact compression "{compression}", expected one of: gz, zstd.')
+
+
+def prune_artifact_cache(cache_dir: str, keep: int) -> None:
+    artifacts = [
+        os.path.join(cache_dir, name)
+        for name in os.listdir(cache_dir)
+        if name.startswith("artifact-") and name.endswith(tuple(ARTIFACT_EXTENSIONS.values()))
+    ]
+    artifacts.sort(key=os.path.getmtime, reverse=True)
+    for path in artifacts[keep:]:
+        os.remove(path)
+
+
+def cleanup_stale_staging_directories(
+    root: Optional[str] = None, max_age_seconds: float = DEPLOYMENT_ARTIFACT_STALE_STAGING_SECONDS
+) -> None:
+    """
+    Remove staging directories that packaging runs (including those of older
+    studio versions, which never cleaned up) left behind.
+    """
+    root = root or DEPLOYMENT_ARTIFACTS_LOCATION
+    if not os.path.isdir(root):
+        return
+    now = time.time()
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        if os.path.isdir(path) and now - os.path.getmtime(path) > max_age_seconds:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def package_artifact(
+    entries: List[ArtifactEntry],
+    compression: Optional[str] = None,
+    level: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+) -> str:
+    """
+    Package files into a deployment artifact and return its path. Artifacts
+    are cached by the content of every file, so a redeploy without changes
+    reuses the previous artifact instead of compressing everything again, and
+    carry a manifest of those hashes that extraction verifies against.
+    """
+    cache_dir = cache_dir or DEPLOYMENT_ARTIFACT_CACHE_LOCATION
+    compression = compression or DEPLOYMENT_ARTIFACT_COMPRESSION
+    if level is None and DEPLOYMENT_ARTIFACT_COMPRESSION_LEVEL:
+        level = int(DEPLOYMENT_ARTIFACT_COMPRESSION_LEVEL)
+    if compression not in ARTIFACT_EXTENSIONS:
+        raise ValueError(f'Unsupported deployment artifact compression "{compression}", expected one of: gz, zstd.')
+    os.makedirs(cache_dir, exist_ok=True)
+
+    start = time.monotonic()
+    hash_cache = FileHashCache(cache_dir)
+    files = {
+        arcname: {"sha256": hash_cache.get(full_path), "size": os.path.getsize(full_path)}
+        for arcname, full_path in entries
+    }
+    hash_cache.save()
+    key = get_artifact_key([(arcname, info["sha256"]) for arcname, info in files.items()], compression, level)
+
+    artifact_path = os.path.join(cache_dir, f"artifact-{key[:32]}{ARTIFACT_EXTENSIONS[compression]}")
+    if os.path.exists(artifact_path):
+        # Mark as recently used so pruning keeps it.
+        os.utime(artifact_path)
+        print(f"Reusing unchanged deployment artifact {artifact_path}")
+        return artifact_path
+
+    tmp_path = f"{artifact_path}.{uuid4()}.tmp"
+    try:
+        write_artifact(tmp_path, entries, compression, level, build_artifact_manifest(files))
+        os.replace(tmp_path, artifact_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    print(
+        f"Packaged {len(entries)} files into {artifact_path} "
+        f"({os.path.getsize(artifact_path)} bytes, {compression}) in {time.monotonic() - start:.1f}s"
+    )
+    prune_artifact_cache(cache_dir, DEPLOYMENT_ARTIFACT_CACHE_SIZE)
+    return artifact_path
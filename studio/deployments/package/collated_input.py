@@ -1,10 +1,10 @@
 import json
-import json
+from typing import Dict
 
 from studio.db import model as db_model
 from studio.models.utils import get_studio_default_model_id
 import studio.consts as consts
-from studio.tools.utils import read_tool_instance_code, extract_user_params_from_code
+from studio.tools.utils import read_tool_instance_metadata
 
 from studio.db.model import Workflow
 from sqlalchemy.orm.session import Session
@@ -30,10 +30,12 @@ def get_tasks_for_workflow(workflow: Workflow, session: Session):
     task_ids = list(workflow.crew_ai_tasks or [])
     tasks = session.query(db_model.Task).filter(db_model.Task.id.in_(task_ids)).all()
 
+    tasks_by_id = {t.id: t for t in tasks}
+
     inputs = []
     agent_ids = set()
     for tid in task_ids:
-        task = next((t for t in tasks if t.id == tid), None)
+        task = tasks_by_id.get(tid)
         if not task:
             raise ValueError(f"Task with ID '{tid}' not found.")
         inputs.append(
@@ -57,13 +59,14 @@ def get_agents_for_workflow(workflow: Workflow, task_agent_ids: set, session: Se
     agent_ids.update(task_agent_ids)
 
     agents = session.query(db_model.Agent).filter(db_model.Agent.id.in_(agent_ids)).all()
+    agents_by_id = {a.id: a for a in agents}
     inputs, tool_ids, mcp_ids, model_ids = [], set(), set(), set()
 
     if workflow.crew_ai_llm_provider_model_id:
         model_ids.add(workflow.crew_ai_llm_provider_model_id)
 
     for aid in agent_ids:
-        agent = next((a for a in agents if a.id == aid), None)
+        agent = agents_by_id.get(aid)
         if not agent:
             raise ValueError(f"Agent with ID '{aid}' not found.")
         inputs.append(
@@ -91,17 +94,28 @@ def get_agents_for_workflow(workflow: Workflow, task_agent_ids: set, session: Se
     return inputs, tool_ids, mcp_ids, model_ids
 
 
+def get_tool_user_params(tool: db_model.ToolInstance) -> Dict[str, Dict[str, bool]]:
+    """
+    User parameters declared in a tool's code, parsed once per version of
+    the code file by the shared tool metadata cache.
+    """
+    tool_code_metadata, _ = read_tool_instance_metadata(tool)
+    if not tool_code_metadata.is_valid:
+        raise ValueError(tool_code_metadata.error)
+    return tool_code_metadata.user_params
+
+
 def get_tool_instances_for_agents(tool_ids: set, session: Session):
     tools = session.query(db_model.ToolInstance).filter(db_model.ToolInstance.id.in_(tool_ids)).all()
+    tools_by_id = {t.id: t for t in tools}
     inputs = []
     for tid in tool_ids:
-        tool = next((t for t in tools if t.id == tid), None)
+        tool = tools_by_id.get(tid)
         if not tool:
             raise ValueError(f"Tool Instance with ID '{tid}' not found.")
 
         try:
-            code, _ = read_tool_instance_code(tool)
-            params = extract_user_params_from_code(code)
+            params = get_tool_user_params(tool)
             status = ""
         except Exception as e:
             params, status = {}, f"Could not extract user param metadata from code: {str(e)}"
@@ -129,9 +143,10 @@ def get_tool_instances_for_agents(tool_ids: set, session: Session):
 
 def get_mcp_instances_for_agents(mcp_ids: set, session: Session):
     mcps = session.query(db_model.MCPInstance).filter(db_model.MCPInstance.id.in_(mcp_ids)).all()
+    mcps_by_id = {m.id: m for m in mcps}
     inputs = []
     for mid in mcp_ids:
-        mcp = next((m for m in mcps if m.id == mid), None)
+        mcp = mcps_by_id.get(mid)
         if not mcp:
             raise ValueError(f"MCP Instance with ID '{mid}' not found.")
         inputs.append(
@@ -150,9 +165,10 @@ def get_mcp_instances_for_agents(mcp_ids: set, session: Session):
 
 def get_language_models(model_ids: set, session: Session):
     models = session.query(db_model.Model).filter(db_model.Model.model_id.in_(model_ids)).all()
+    models_by_id = {m.model_id: m for m in models}
     inputs = []
     for mid in model_ids:
-        model = next((m for m in models if m.model_id == mid), None)
+        model = models_by_id.get(mid)
         if not model:
             raise ValueError(f"Language Model with ID '{mid}' not found.")
         inputs.append(
@@ -1,12 +1,17 @@
 import os
-from uuid import uuid4
-import tarfile
+import tempfile
 import subprocess
 from urllib.parse import urlparse
 
 from cmlapi import CMLServiceApi
 
 from studio.deployments.types import DeploymentArtifact, DeploymentPayload
+from studio.deployments.package.archive import (
+    DEPLOYMENT_ARTIFACTS_LOCATION,
+    cleanup_stale_staging_directories,
+    collect_directory_entries,
+    package_artifact,
+)
 
 from sqlalchemy.orm.session import Session
 from studio.db.model import DeployedWorkflowInstance
@@ -26,7 +31,7 @@ def package_github_for_deployment(
     """
     Packages a GitHub-hosted workflow template into an artifact for deployment.
     Clones the GitHub repo (accepts clean URLs), optionally checks out a specific ref,
-    and packages it into a .tar.gz archive.
+    and packages it into an artifact tarball.
     """
     print(f"Packaging GitHub for deployment. Deployment ID: {deployment.id}, Deployment Name: {deployment.name}")
 
@@ -41,45 +46,31 @@ def package_github_for_deployment(
 
     print("Github URL: ", github_url)
     print("Raw URL: ", raw_url)
-    packaging_directory = os.path.join("/tmp", "deployment_artifacts", str(uuid4()))
-    os.makedirs(packaging_directory, exist_ok=True)
-    print(f"Packaging directory: {packaging_directory}")
-
-    repo_name = os.path.basename(urlparse(raw_url).path)
-    repo_path = os.path.join(packaging_directory, repo_name)
-    print(f"Repo name: {repo_name}")
-    print(f"Repo path: {repo_path}")
-
-    try:
-        subprocess.run(
-            ["git", "clone", github_url, repo_path], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    cleanup_stale_staging_directories()
+    os.makedirs(DEPLOYMENT_ARTIFACTS_LOCATION, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=DEPLOYMENT_ARTIFACTS_LOCATION) as packaging_directory:
+        print(f"Packaging directory: {packaging_directory}")
+
+        repo_name = os.path.basename(urlparse(raw_url).path)
+        repo_path = os.path.join(packaging_directory, repo_name)
+        print(f"Repo name: {repo_name}")
+        print(f"Repo path: {repo_path}")
+
+        try:
+            subprocess.run(
+                ["git", "clone", github_url, repo_path], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to clone GitHub repository: {e.stderr.decode()}") from e
+
+        # Step 2: Add any additional packaging logic if needed
+        # For now we assume the repo structure is compatible and needs no modification.
+
+        # Step 3: Create the archive. For workbench model packaging reasons,
+        # the .git directory is left out.
+        entries = collect_directory_entries(
+            repo_path, ".", ignore=lambda src, names: {".git"} if src == repo_path else set()
         )
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Failed to clone GitHub repository: {e.stderr.decode()}") from e
-
-    # For workbench model packaging reasons, we remove the .git directory
-    try:
-        subprocess.run(
-            ["rm", "-rf", os.path.join(repo_path, ".git")],
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Failed to remove .git directory: {e.stderr.decode()}") from e
-
-    # Step 2: Add any additional packaging logic if needed
-    # For now we assume the repo structure is compatible and needs no modification.
-
-    # Step 3: Create the archive (excluding the archive itself)
-    deployment_artifact_path = os.path.join(packaging_directory, "artifact.tar.gz")
-    with tarfile.open(deployment_artifact_path, "w:gz") as tar:
-        for root, dirs, files in os.walk(repo_path):
-            for file in files:
-                full_path = os.path.join(root, file)
-                print(f"Adding file: {full_path} to archive")
-                arcname = os.path.relpath(full_path, start=repo_path)  # root-level in archive
-                print(f"arcname: {arcname}")
-                tar.add(full_path, arcname=arcname)
+        deployment_artifact_path = package_artifact(entries)
 
     return DeploymentArtifact(project_location=deployment_artifact_path)
@@ -1,14 +1,21 @@
 import os
-from uuid import uuid4
-import shutil
 import yaml
 import json
-import tarfile
+import importlib.util
+import subprocess
+import tempfile
+from typing import List
 
 from cmlapi import CMLServiceApi
 
 from studio.deployments.types import DeploymentArtifact, DeploymentPayload
 from studio.deployments.package.collated_input import create_collated_input
+from studio.deployments.package.archive import (
+    DEPLOYMENT_ARTIFACTS_LOCATION,
+    cleanup_stale_staging_directories,
+    collect_directory_entries,
+    package_artifact,
+)
 
 from sqlalchemy.orm.session import Session
 from studio.db.model import DeployedWorkflowInstance, Workflow
@@ -21,13 +28,14 @@ import sys
 
 sys.path.append("studio/workflow_engine/src")
 import engine.types as input_types
+from engine.consts import TOOL_WHEELHOUSE_LOCATION
 
 
 def studio_data_workflow_ignore_factory(workflow_directory_name: str):
     def ignore(src, names):
         base = os.path.basename(src)
         if base == "studio-data":
-            return {"deployable_workflows", "tool_templates", "temp_files"}
+            return {"deployable_workflows", "tool_templates", "temp_files", "tool_venvs", "deployment_artifacts_cache"}
         elif base == "workflows":
             return {name for name in names if name != workflow_directory_name}
         else:
@@ -36,6 +44,48 @@ def studio_data_workflow_ignore_factory(workflow_directory_name: str):
     return ignore
 
 
+def get_pip_command() -> List[str]:
+    """
+    Command that runs pip for the studio's interpreter. pip is not part of the
+    studio's uv-managed environment, so unless the interpreter happens to have
+    it, pip runs through uv in an ephemeral environment on the same
+    interpreter, which builds wheels for the same Python version and platform.
+    """
+    if importlib.util.find_spec("pip") is not None:
+        return [sys.executable, "-m", "pip"]
+    return ["uv", "run", "--no-project", "--with", "pip", "--python", sys.executable, "python", "-m", "pip"]
+
+
+def build_tool_wheelhouse(
+    staging_directory: str, collated_input: input_types.CollatedInput, source_directory: str = "."
+) -> str:
+    """
+    Build wheels for every tool's requirements into the artifact's wheelhouse,
+    so the deployed workflow can install its tools without network access.
+    Wheels are built for the studio's interpreter and platform, which the
+    workbench model runtime shares. Returns the wheelhouse path relative to
+    the artifact root.
+    """
+    wheelhouse_dir = os.path.join(staging_directory, TOOL_WHEELHOUSE_LOCATION)
+    os.makedirs(wheelhouse_dir, exist_ok=True)
+    pip_command = get_pip_command()
+    for tool_instance in collated_input.tool_instances:
+        tool_dir = os.path.join(source_directory, tool_instance.source_folder_path)
+        requirements_file_path = os.path.join(tool_dir, tool_instance.python_requirements_file_name)
+        if not os.path.isfile(requirements_file_path):
+            continue
+        print(f"Building wheels for tool {tool_instance.name}")
+        result = subprocess.run(
+            [*pip_command, "wheel", "--quiet", "-r", requirements_file_path, "-w", wheelhouse_dir],
+            cwd=tool_dir,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Could not build wheels for tool '{tool_instance.name}': {result.stderr}")
+    return TOOL_WHEELHOUSE_LOCATION
+
+
 def package_workflow_for_deployment(
     payload: DeploymentPayload, deployment: DeployedWorkflowInstance, session: Session, cml: CMLServiceApi
 ) -> DeploymentArtifact:
@@ -44,22 +94,9 @@ def package_workflow_for_deployment(
     type. In the future, we may want to support packaging into other types.
     """
 
-    # Create a temporary directory to package our artifact
-    packaging_directory = os.path.join("/tmp", "deployment_artifacts", str(uuid4()))
-    os.makedirs(packaging_directory, exist_ok=True)
-
-    # Create our base workflow.yaml
-    workflow_yaml_path = os.path.join(packaging_directory, "workflow.yaml")
-    with open(workflow_yaml_path, "w") as f:
-        yaml.dump({"type": "collated_input", "input": "collated_input.json"}, f, default_flow_style=False)
-
     # Grab the corresponding workflow for this deployed workflow instance
     workflow: Workflow = deployment.workflow
 
-    # Ignore logic for copying over our studio-data/ directory
-    ignore_fn = studio_data_workflow_ignore_factory(os.path.basename(workflow.directory))
-    shutil.copytree("studio-data", os.path.join(packaging_directory, "studio-data"), ignore=ignore_fn)
-
     # Create the collated input.
     collated_input: input_types.CollatedInput = create_collated_input(workflow, session)
 
@@ -70,23 +107,33 @@ def package_workflow_for_deployment(
     for lm in collated_input.language_models:
         lm.generation_config.update(payload.deployment_config.generation_config)
 
-    # Write collated input to our packaging directory.
-    collated_input_file_path = os.path.join(packaging_directory, "collated_input.json")
-    with open(collated_input_file_path, "w") as f:
-        json.dump(collated_input.model_dump(), f, indent=2)
-
-    # Package everything up into an archive.
-    deployment_artifact_path = os.path.join(packaging_directory, "artifact.tar.gz")
-    with tarfile.open(deployment_artifact_path, "w:gz") as tar:
-        for root, dirs, files in os.walk(packaging_directory):
-            for file in files:
-                full_path = os.path.join(root, file)
-                # Skip the archive itself
-                if os.path.abspath(full_path) == os.path.abspath(deployment_artifact_path):
-                    continue
-                # Compute relative path inside the archive
-                arcname = os.path.relpath(full_path, start=packaging_directory)
-                tar.add(full_path, arcname=arcname)
+    # Only files generated for this deployment are staged; everything from
+    # studio-data/ is streamed into the archive from where it lives. The
+    # staging directory is removed once the artifact is written.
+    cleanup_stale_staging_directories()
+    os.makedirs(DEPLOYMENT_ARTIFACTS_LOCATION, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=DEPLOYMENT_ARTIFACTS_LOCATION) as staging_directory:
+        # Write collated input to our staging directory.
+        collated_input_file_path = os.path.join(staging_directory, "collated_input.json")
+        with open(collated_input_file_path, "w") as f:
+            json.dump(collated_input.model_dump(), f, indent=2)
+
+        # Create our base workflow.yaml, pointing at pre-built tool wheels if requested.
+        workflow_yaml = {"type": "collated_input", "input": "collated_input.json"}
+        if payload.deployment_config.prebuild_tool_wheels:
+            workflow_yaml["wheelhouse"] = build_tool_wheelhouse(staging_directory, collated_input)
+        workflow_yaml_path = os.path.join(staging_directory, "workflow.yaml")
+        with open(workflow_yaml_path, "w") as f:
+            yaml.dump(workflow_yaml, f, default_flow_style=False)
+
+        # Ignore logic for packaging our studio-data/ directory
+        ignore_fn = studio_data_workflow_ignore_factory(os.path.basename(workflow.directory))
+        entries = collect_directory_entries(staging_directory, ".") + collect_directory_entries(
+            "studio-data", "studio-data", ignore=ignore_fn
+        )
+
+        # Package everything up into an archive.
+        deployment_artifact_path = package_artifact(entries)
 
     # Return the packaged artifact.
     return DeploymentArtifact(project_location=deployment_artifact_path)
@@ -5,12 +5,19 @@ from cmlapi import CMLServiceApi
 import os
 import shutil
 from studio import consts
-import tarfile
 import json
 import cmlapi
 from studio.deployments.applications import get_application_name_for_deployed_workflow
 import studio.cross_cutting.utils as cc_utils
 
+# Import engine code manually. Eventually when this code becomes
+# a separate git repo, or a custom runtime image, this path call
+# will go away and workflow engine features will be available already.
+import sys
+
+sys.path.append("studio/workflow_engine/src")
+from engine.archive import extract_artifact
+
 
 def deploy_artifact_to_langgraph_server(
     artifact: DeploymentArtifact,
@@ -29,9 +36,8 @@ def deploy_artifact_to_langgraph_server(
 
     shutil.copy(artifact.project_location, deployable_application_dir)
 
-    # Take the tar.gz and extract it into the deployable workflow directory
-    with tarfile.open(artifact.project_location, "r:gz") as tar:
-        tar.extractall(deployable_application_dir)
+    # Take the artifact tarball and extract it into the deployable workflow directory
+    extract_artifact(artifact.project_location, deployable_application_dir)
 
     deployment_metadata = json.loads(deployment.deployment_metadata)
 
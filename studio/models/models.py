@@ -29,7 +29,7 @@ def list_models(
     """
     List all models. Future extensions may include filtering based on request attributes.
     """
-    with dao.get_session() as session:
+    with dao.get_session(read_only=True) as session:
         models: List[db_model.Model] = session.query(db_model.Model).all()
         return ListModelsResponse(model_details=[model.to_protobuf(Model) for model in models])
 
@@ -38,7 +38,7 @@ def get_model(request: GetModelRequest, cml: CMLServiceApi = None, dao: AgentStu
     """
     Get details of a specific model by its ID.
     """
-    with dao.get_session() as session:
+    with dao.get_session(read_only=True) as session:
         model = session.query(db_model.Model).filter_by(model_id=request.model_id).one_or_none()
         if not model:
             raise ValueError(f"Model with ID '{request.model_id}' not found.")
@@ -226,7 +226,7 @@ def get_studio_default_model(
     """
     Get the default model for the Studio.
     """
-    with dao.get_session() as session:
+    with dao.get_session(read_only=True) as session:
         m_ = session.query(db_model.Model).filter_by(is_studio_default=True).one_or_none()
         if not m_:
             return GetStudioDefaultModelResponse(
@@ -7,8 +7,11 @@ from studio.consts import AGENT_STUDIO_OPS_APPLICATION_NAME
 from studio.cross_cutting.utils import get_application_by_name
 from cmlapi import Application
 from phoenix.otel import register
+from typing import Any, Dict
 import cmlapi
 import os
+import threading
+import time
 from gql import Client
 from gql.transport.requests import RequestsHTTPTransport
 from phoenix.otel import register
@@ -18,6 +21,15 @@ def get_ops_provider() -> str:
     return os.getenv("AGENT_STUDIO_OPS_PROVIDER", "phoenix")
 
 
+# Process-wide cache of the ops endpoint resolved through the CML API. See
+# engine.ops for the equivalent cache used inside the workflow engine.
+OPS_ENDPOINT_CACHE_TTL_SECONDS = float(os.getenv("AGENT_STUDIO_OPS_ENDPOINT_CACHE_TTL", "300"))
+
+_ops_endpoint_lock = threading.Lock()
+_ops_endpoint_cache: Dict[str, Any] = {"endpoint": None, "expires_at": 0.0}
+_ops_endpoint_stats: Dict[str, int] = {"hits": 0, "misses": 0, "overrides": 0, "invalidations": 0}
+
+
 def get_ops_endpoint() -> str:
     """
     Get the current operational endpoint of the
@@ -28,11 +40,43 @@ def get_ops_endpoint() -> str:
     option is to make sure CML models can also reach the ops endpoint.
     """
     if os.getenv("AGENT_STUDIO_OPS_ENDPOINT"):
+        with _ops_endpoint_lock:
+            _ops_endpoint_stats["overrides"] += 1
         return os.getenv("AGENT_STUDIO_OPS_ENDPOINT")
 
-    cml = cmlapi.default_client()
-    application: Application = get_application_by_name(cml, AGENT_STUDIO_OPS_APPLICATION_NAME)
-    return f"https://{application.subdomain}.{os.getenv('CDSW_DOMAIN')}"
+    with _ops_endpoint_lock:
+        now = time.monotonic()
+        if _ops_endpoint_cache["endpoint"] and now < _ops_endpoint_cache["expires_at"]:
+            _ops_endpoint_stats["hits"] += 1
+            return _ops_endpoint_cache["endpoint"]
+
+        _ops_endpoint_stats["misses"] += 1
+        cml = cmlapi.default_client()
+        application: Application = get_application_by_name(cml, AGENT_STUDIO_OPS_APPLICATION_NAME)
+        endpoint = f"https://{application.subdomain}.{os.getenv('CDSW_DOMAIN')}"
+        _ops_endpoint_cache["endpoint"] = endpoint
+        _ops_endpoint_cache["expires_at"] = now + OPS_ENDPOINT_CACHE_TTL_SECONDS
+        return endpoint
+
+
+def invalidate_ops_endpoint_cache() -> None:
+    """
+    Drop the cached ops endpoint so the next call re-resolves it
+    through the CML API.
+    """
+    with _ops_endpoint_lock:
+        if _ops_endpoint_cache["endpoint"] is not None:
+            _ops_endpoint_stats["invalidations"] += 1
+        _ops_endpoint_cache["endpoint"] = None
+        _ops_endpoint_cache["expires_at"] = 0.0
+
+
+def get_ops_endpoint_cache_stats() -> Dict[str, int]:
+    """
+    Return a snapshot of the ops endpoint cache counters.
+    """
+    with _ops_endpoint_lock:
+        return dict(_ops_endpoint_stats)
 
 
 def get_ops_iframe_url() -> str:
@@ -0,0 +1,274 @@
+import asyncio
+import json
+import os
+from contextlib import asynccontextmanager
+from typing import Any, Optional, Tuple
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+
+from studio.consts import DEFAULT_AS_PHOENIX_OPS_PLATFORM_PORT
+from studio.ops_server.events import (
+    DEFAULT_EVENT_CONSUMER,
+    add_event_listener,
+    consume_events,
+    get_event_stats,
+    get_trace_status,
+    publish_events,
+    read_events,
+    remove_event_listener,
+)
+
+# Define the target server to forward requests to
+TARGET_SERVER = "0.0.0.0"
+DEFAULT_UPSTREAM_URL = f"http://{TARGET_SERVER}:{DEFAULT_AS_PHOENIX_OPS_PLATFORM_PORT}"
+
+# Upstream connection pool to the Phoenix server. Trace exports and UI
+# (graphql) traffic share the pool, so it is sized well above what a single
+# studio generates.
+OPS_PROXY_MAX_CONNECTIONS = int(os.getenv("AGENT_STUDIO_OPS_PROXY_MAX_CONNECTIONS", "100"))
+OPS_PROXY_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("AGENT_STUDIO_OPS_PROXY_MAX_KEEPALIVE_CONNECTIONS", "20"))
+OPS_PROXY_CONNECT_TIMEOUT_SECONDS = float(os.getenv("AGENT_STUDIO_OPS_PROXY_CONNECT_TIMEOUT", "10"))
+
+# Upper bound on how long a long-poll read may block waiting for new events.
+OPS_EVENTS_MAX_WAIT_SECONDS = float(os.getenv("AGENT_STUDIO_OPS_EVENTS_MAX_WAIT", "60"))
+# Interval between keep-alive comments on idle event streams.
+OPS_EVENTS_STREAM_KEEPALIVE_SECONDS = 15.0
+
+# Headers that describe a single connection and must not be forwarded by a proxy.
+HOP_BY_HOP_HEADERS = frozenset(
+    [
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+        "host",
+    ]
+)
+
+
+def create_upstream_client(upstream_url: str = DEFAULT_UPSTREAM_URL) -> httpx.AsyncClient:
+    """
+    Pooled client used for every proxied request. Reads are not timed out
+    since Phoenix may stream large responses back to the UI.
+    """
+    return httpx.AsyncClient(
+        base_url=upstream_url,
+        limits=httpx.Limits(
+            max_connections=OPS_PROXY_MAX_CONNECTIONS,
+            max_keepalive_connections=OPS_PROXY_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+        timeout=httpx.Timeout(None, connect=OPS_PROXY_CONNECT_TIMEOUT_SECONDS),
+        follow_redirects=False,
+    )
+
+
+def _filter_headers(raw_headers) -> list:
+    return [(k, v) for k, v in raw_headers if k.decode("latin-1").lower() not in HOP_BY_HOP_HEADERS]
+
+
+async def _read_json_body(request: Request) -> Tuple[Optional[Any], Optional[Response]]:
+    body = await request.body()
+    try:
+        data = json.loads(body)
+    except json.JSONDecodeError:
+        return None, PlainTextResponse("Invalid JSON", status_code=400)
+    if not isinstance(data, dict):
+        return None, PlainTextResponse("Invalid JSON", status_code=400)
+    return data, None
+
+
+async def _wait_for_events(trace_id: str, cursor: int, wait: float) -> dict:
+    """
+    Read a trace's events after the cursor, blocking for up to `wait` seconds
+    until at least one arrives or the trace finishes.
+    """
+    loop = asyncio.get_running_loop()
+    notified = asyncio.Event()
+
+    def notify():
+        loop.call_soon_threadsafe(notified.set)
+
+    add_event_listener(trace_id, notify)
+    try:
+        deadline = loop.time() + wait
+        while True:
+            # Clear before reading so a publish racing the read still wakes us.
+            notified.clear()
+            result = read_events(trace_id, cursor)
+            remaining = deadline - loop.time()
+            if result["events"] or result["finished"] or remaining <= 0:
+                return result
+            try:
+                await asyncio.wait_for(notified.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        remove_event_listener(trace_id, notify)
+
+
+def _format_sse(result: dict) -> str:
+    first_seq = result["cursor"] - len(result["events"]) + 1
+    return "".join(f"id: {first_seq + i}\ndata: {json.dumps(event)}\n\n" for i, event in enumerate(result["events"]))
+
+
+def create_ops_app(
+    upstream_url: str = DEFAULT_UPSTREAM_URL, upstream_client: Optional[httpx.AsyncClient] = None
+) -> FastAPI:
+    """
+    Build the ops server application. We do not inherently serve the ops
+    platform on $CDSW_APP_PORT because this port is gated with authentication,
+    which affects both our /v1/trace calls and the /graphql calls to this
+    endpoint. Instead, Phoenix serves on a dedicated port in the container and
+    this app forwards all non-/events traffic to it, streaming bodies in both
+    directions over pooled upstream connections. Requests are handled
+    concurrently, so a slow trace upload no longer stalls event traffic.
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        owns_client = app.state.upstream_client is None
+        if owns_client:
+            app.state.upstream_client = create_upstream_client(upstream_url)
+        try:
+            yield
+        finally:
+            if owns_client:
+                await app.state.upstream_client.aclose()
+                app.state.upstream_client = None
+
+    app = FastAPI(lifespan=lifespan, docs_url=None, redoc_url=None, openapi_url=None)
+    app.state.upstream_client = upstream_client
+
+    @app.post("/events/batch")
+    async def handle_events_batch_post(request: Request):
+        """
+        Accept a batch of events for a single trace, as shipped by the
+        workflow engine's EventShipper: {"trace_id": ..., "events": [...]}.
+        Events are published to the trace queue in order.
+        """
+        data, error = await _read_json_body(request)
+        if error is not None:
+            return error
+
+        trace_id = data.get("trace_id")
+        events = data.get("events")
+        if not trace_id or not isinstance(events, list):
+            return PlainTextResponse("Missing trace_id or events", status_code=400)
+
+        publish_events(trace_id, events)
+        return JSONResponse({"status": "200", "accepted": len(events)})
+
+    @app.post("/events")
+    async def handle_events_post(request: Request):
+        data, error = await _read_json_body(request)
+        if error is not None:
+            return error
+
+        trace_id = data.get("trace_id")
+        event_content = data.get("event")
+        if not trace_id or not event_content:
+            return PlainTextResponse("Missing trace_id or event", status_code=400)
+
+        publish_events(trace_id, [event_content])
+        return Response(content=b'{"status": "200"}', media_type="application/json")
+
+    @app.get("/events/stats")
+    async def handle_events_stats_get(trace_id: Optional[str] = None):
+        return JSONResponse(get_event_stats(trace_id))
+
+    @app.get("/events/stream")
+    async def handle_events_stream(request: Request, trace_id: Optional[str] = None, cursor: Optional[int] = None):
+        """
+        Server-sent events stream of a trace. Each event's id is its sequence
+        number, so a reconnecting EventSource resumes through Last-Event-ID
+        (or an explicit cursor). The stream ends after the terminal kickoff event.
+        """
+        if not trace_id:
+            return PlainTextResponse("Missing trace_id", status_code=400)
+        if cursor is None:
+            last_event_id = request.headers.get("last-event-id", "")
+            cursor = int(last_event_id) if last_event_id.isdigit() else 0
+
+        async def stream():
+            position = cursor
+            while not await request.is_disconnected():
+                result = await _wait_for_events(trace_id, position, OPS_EVENTS_STREAM_KEEPALIVE_SECONDS)
+                if result["events"]:
+                    yield _format_sse(result)
+                    position = result["cursor"]
+                else:
+                    yield ": keep-alive\n\n"
+                if result["finished"]:
+                    yield "event: end\ndata: {}\n\n"
+                    return
+
+        return StreamingResponse(
+            stream(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @app.get("/events/status")
+    async def handle_events_status_get(trace_id: Optional[str] = None):
+        if not trace_id:
+            return PlainTextResponse("Missing trace_id", status_code=400)
+        return JSONResponse(get_trace_status(trace_id))
+
+    @app.get("/events")
+    async def handle_events_get(
+        trace_id: Optional[str] = None,
+        cursor: Optional[int] = None,
+        wait: float = 0,
+        consumer: str = DEFAULT_EVENT_CONSUMER,
+    ):
+        """
+        Without a cursor, return the list of events the named consumer has not
+        seen yet and advance its offset. With a cursor (and optionally `wait`
+        seconds to long-poll), return {"events", "cursor", "finished",
+        "truncated"} for events after it. Reads never remove events.
+        """
+        if not trace_id:
+            return PlainTextResponse("Missing trace_id", status_code=400)
+        if cursor is None and wait <= 0:
+            return JSONResponse(consume_events(trace_id, consumer))
+        wait = min(max(wait, 0.0), OPS_EVENTS_MAX_WAIT_SECONDS)
+        return JSONResponse(await _wait_for_events(trace_id, cursor or 0, wait))
+
+    @app.api_route("/{path:path}", methods=["GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"])
+    async def forward_request(request: Request, path: str):
+        client: httpx.AsyncClient = request.app.state.upstream_client
+
+        target = request.scope.get("raw_path", b"").decode("latin-1") or request.url.path
+        if request.url.query:
+            target += "?" + request.url.query
+
+        has_body = "content-length" in request.headers or "transfer-encoding" in request.headers
+        upstream_request = client.build_request(
+            request.method,
+            target,
+            headers=_filter_headers(request.headers.raw),
+            content=request.stream() if has_body else None,
+        )
+        try:
+            upstream_response = await client.send(upstream_request, stream=True)
+        except httpx.RequestError as e:
+            return PlainTextResponse(f"Ops platform unavailable: {e}", status_code=502)
+
+        response = StreamingResponse(
+            upstream_response.aiter_raw(),
+            status_code=upstream_response.status_code,
+            background=BackgroundTask(upstream_response.aclose),
+        )
+        # Forward the raw (still encoded) body along with the upstream's
+        # content-length/content-encoding, keeping repeated headers intact.
+        response.raw_headers = _filter_headers(upstream_response.headers.raw)
+        return response
+
+    return app
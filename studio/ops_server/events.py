@@ -0,0 +1,397 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+# ---------------------------
+# Retention limits
+# ---------------------------
+
+# How long a trace's log is kept after its terminal kickoff event.
+TRACE_QUEUE_TTL_SECONDS = float(os.getenv("AGENT_STUDIO_OPS_TRACE_TTL", "600"))
+# How long a trace's log is kept after its last activity when the run never
+# reports a terminal event (crashed or abandoned runs).
+TRACE_QUEUE_IDLE_TTL_SECONDS = float(os.getenv("AGENT_STUDIO_OPS_TRACE_IDLE_TTL", "3600"))
+# Maximum bytes of events held in memory per trace. The log is a ring buffer:
+# the oldest events are spilled (or dropped, without a spill file) first.
+TRACE_QUEUE_MAX_BYTES = int(os.getenv("AGENT_STUDIO_OPS_TRACE_MAX_BYTES", str(32 * 1024 * 1024)))
+# Maximum bytes of events held in memory across all traces. Finished traces
+# shed their events before running ones, least recently active first.
+EVENTS_MEMORY_BUDGET_BYTES = int(os.getenv("AGENT_STUDIO_OPS_EVENTS_MEMORY_BUDGET", str(512 * 1024 * 1024)))
+# Optional SQLite file that receives events pushed out of memory, so they can
+# still be read from their offset. Unset to drop them instead.
+EVENTS_SPILL_PATH = os.getenv("AGENT_STUDIO_OPS_EVENTS_SPILL_PATH")
+# Minimum interval between expiry sweeps.
+TRACE_QUEUE_SWEEP_INTERVAL_SECONDS = 30.0
+
+TERMINAL_EVENT_TYPES = ("crew_kickoff_completed", "crew_kickoff_failed")
+DEFAULT_EVENT_CONSUMER = "default"
+
+# (sequence number, serialized size, event)
+LoggedEvent = Tuple[int, int, Any]
+
+
+class EventSpillStore:
+    """
+    SQLite-backed overflow for trace logs. This is a cache of events that no
+    longer fit in memory, not durable storage, so writes are not synced.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS trace_events ("
+            "trace_id TEXT NOT NULL, seq INTEGER NOT NULL, event TEXT NOT NULL, "
+            "PRIMARY KEY (trace_id, seq)) WITHOUT ROWID"
+        )
+        # Spilled events belong to a previous server process's traces.
+        self._conn.execute("DELETE FROM trace_events")
+
+    def append(self, trace_id: str, events: List[LoggedEvent]) -> None:
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO trace_events (trace_id, seq, event) VALUES (?, ?, ?)",
+            [(trace_id, seq, json.dumps(event, default=str)) for seq, _, event in events],
+        )
+
+    def read(self, trace_id: str, after_seq: int, through_seq: int) -> List[Tuple[int, Any]]:
+        rows = self._conn.execute(
+            "SELECT seq, event FROM trace_events WHERE trace_id = ? AND seq > ? AND seq <= ? ORDER BY seq",
+            (trace_id, after_seq, through_seq),
+        ).fetchall()
+        return [(seq, json.loads(event)) for seq, event in rows]
+
+    def delete(self, trace_id: str) -> None:
+        self._conn.execute("DELETE FROM trace_events WHERE trace_id = ?", (trace_id,))
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class TraceEventLog:
+    """
+    Append-only event log of a single trace. Every event gets a per-trace
+    sequence number; reads start from any offset and never consume events, so
+    any number of consumers can follow a trace independently. Recent events
+    live in an in-memory ring buffer, older ones in the spill store (when
+    configured). A compact status projection is maintained as events arrive.
+    """
+
+    def __init__(self, trace_id: str):
+        self.trace_id = trace_id
+        self.events: Deque[LoggedEvent] = deque()
+        self.next_seq = 1
+        # Events at or below this sequence number are no longer readable.
+        self.dropped_through = 0
+        # Events at or below this sequence number (and above dropped_through)
+        # have been moved to the spill store.
+        self.spilled_through = 0
+        self.retained_bytes = 0
+        self.last_activity = time.monotonic()
+        self.terminal_at: Optional[float] = None
+        self.terminal_seq: Optional[int] = None
+        self.dropped_events = 0
+        self.dropped_bytes = 0
+        self.spilled_events = 0
+        self.consumer_offsets: Dict[str, int] = {}
+        self.status: Dict[str, Any] = {
+            "trace_id": trace_id,
+            "status": "running",
+            "output": None,
+            "error": None,
+            "last_event_type": None,
+            "last_seq": 0,
+            "event_count": 0,
+        }
+
+    def append(self, event_content: Any, size: int) -> int:
+        seq = self.next_seq
+        self.next_seq += 1
+        self.events.append((seq, size, event_content))
+        self.retained_bytes += size
+        self.last_activity = time.monotonic()
+        self._project_status(seq, event_content)
+        return seq
+
+    def _project_status(self, seq: int, event_content: Any) -> None:
+        event_type = event_content.get("type") if isinstance(event_content, dict) else None
+        self.status["last_event_type"] = event_type
+        self.status["last_seq"] = seq
+        self.status["event_count"] += 1
+        if self.terminal_seq is not None or event_type not in TERMINAL_EVENT_TYPES:
+            return
+        self.terminal_at = self.last_activity
+        self.terminal_seq = seq
+        if event_type == "crew_kickoff_completed":
+            self.status.update(status="completed", output=event_content.get("output"))
+        else:
+            self.status.update(status="failed", error=event_content.get("error"))
+
+    def read_after(self, cursor: int, spill_store: Optional[EventSpillStore]) -> List[Tuple[int, Any]]:
+        events: List[Tuple[int, Any]] = []
+        if cursor < self.spilled_through and spill_store is not None:
+            events.extend(spill_store.read(self.trace_id, max(cursor, self.dropped_through), self.spilled_through))
+        events.extend((seq, event) for seq, _, event in self.events if seq > cursor)
+        return events
+
+    def is_finished(self, cursor: int) -> bool:
+        return self.terminal_seq is not None and cursor >= self.terminal_seq
+
+    def shed_oldest(self, spill_store: Optional[EventSpillStore], target_bytes: int) -> Tuple[int, int]:
+        """
+        Move the oldest in-memory events out of memory until at most
+        target_bytes remain. Returns (bytes released, events dropped).
+        """
+        shed: List[LoggedEvent] = []
+        released = 0
+        while self.events and self.retained_bytes - released > target_bytes:
+            event = self.events.popleft()
+            shed.append(event)
+            released += event[1]
+        if not shed:
+            return 0, 0
+        self.retained_bytes -= released
+        last_seq = shed[-1][0]
+        if spill_store is not None:
+            spill_store.append(self.trace_id, shed)
+            self.spilled_through = last_seq
+            self.spilled_events += len(shed)
+            return released, 0
+        self.dropped_through = last_seq
+        self.dropped_events += len(shed)
+        self.dropped_bytes += released
+        return released, len(shed)
+
+    def is_expired(self, now: float) -> bool:
+        if self.terminal_at is not None:
+            return now - self.terminal_at > TRACE_QUEUE_TTL_SECONDS
+        return now - self.last_activity > TRACE_QUEUE_IDLE_TTL_SECONDS
+
+
+# Global dictionary to store per-trace event logs
+trace_logs: Dict[str, TraceEventLog] = {}
+_trace_logs_lock = threading.RLock()
+_last_sweep = time.monotonic()
+_event_listeners: Dict[str, Set[Callable[[], None]]] = {}
+_spill_store: Optional[EventSpillStore] = None
+_event_stats: Dict[str, int] = {
+    "retained_bytes": 0,
+    "published_events": 0,
+    "dropped_events": 0,
+    "dropped_bytes": 0,
+    "spilled_events": 0,
+    "expired_traces": 0,
+}
+
+
+def get_event_spill_store() -> Optional[EventSpillStore]:
+    global _spill_store
+    with _trace_logs_lock:
+        if _spill_store is None and EVENTS_SPILL_PATH:
+            _spill_store = EventSpillStore(EVENTS_SPILL_PATH)
+        return _spill_store
+
+
+def get_or_create_log(trace_id: str) -> TraceEventLog:
+    """
+    Retrieve or create the TraceEventLog for a given trace_id.
+    """
+    with _trace_logs_lock:
+        if trace_id not in trace_logs:
+            trace_logs[trace_id] = TraceEventLog(trace_id)
+        return trace_logs[trace_id]
+
+
+def _shed(trace_log: TraceEventLog, target_bytes: int) -> None:
+    spill_store = get_event_spill_store()
+    spilled_before = trace_log.spilled_events
+    released, dropped = trace_log.shed_oldest(spill_store, target_bytes)
+    _event_stats["retained_bytes"] -= released
+    _event_stats["spilled_events"] += trace_log.spilled_events - spilled_before
+    if dropped:
+        _event_stats["dropped_events"] += dropped
+        _event_stats["dropped_bytes"] += released
+
+
+def _remove_trace(trace_log: TraceEventLog) -> None:
+    del trace_logs[trace_log.trace_id]
+    _event_stats["retained_bytes"] -= trace_log.retained_bytes
+    _event_stats["expired_traces"] += 1
+    if trace_log.spilled_events and _spill_store is not None:
+        _spill_store.delete(trace_log.trace_id)
+
+
+def _sweep_expired_traces(force: bool = False) -> None:
+    global _last_sweep
+    now = time.monotonic()
+    if not force and now - _last_sweep < TRACE_QUEUE_SWEEP_INTERVAL_SECONDS:
+        return
+    _last_sweep = now
+    for trace_log in [log for log in trace_logs.values() if log.is_expired(now)]:
+        _remove_trace(trace_log)
+
+
+def _enforce_memory_budget(active: TraceEventLog) -> None:
+    if _event_stats["retained_bytes"] <= EVENTS_MEMORY_BUDGET_BYTES:
+        return
+    # Finished traces go first, then the least recently active running ones.
+    # Traces keep their status projection and offsets; only events are shed.
+    candidates = sorted(
+        (log for log in trace_logs.values() if log is not active and log.events),
+        key=lambda log: (log.terminal_at is None, log.last_activity),
+    )
+    for trace_log in candidates:
+        excess = _event_stats["retained_bytes"] - EVENTS_MEMORY_BUDGET_BYTES
+        if excess <= 0:
+            return
+        _shed(trace_log, max(0, trace_log.retained_bytes - excess))
+    excess = _event_stats["retained_bytes"] - EVENTS_MEMORY_BUDGET_BYTES
+    if excess > 0:
+        _shed(active, max(0, active.retained_bytes - excess))
+
+
+def add_event_listener(trace_id: str, callback: Callable[[], None]) -> None:
+    """
+    Register a callback invoked (from the publishing thread) whenever events
+    are published to a trace. Callbacks must not block.
+    """
+    with _trace_logs_lock:
+        _event_listeners.setdefault(trace_id, set()).add(callback)
+
+
+def remove_event_listener(trace_id: str, callback: Callable[[], None]) -> None:
+    with _trace_logs_lock:
+        listeners = _event_listeners.get(trace_id)
+        if listeners is not None:
+            listeners.discard(callback)
+            if not listeners:
+                del _event_listeners[trace_id]
+
+
+def publish_events(trace_id: str, events: List[Any]) -> int:
+    """
+    Append events to a trace's log in order, skipping empty events.
+    Returns the number of events published.
+    """
+    published = 0
+    with _trace_logs_lock:
+        _sweep_expired_traces()
+        trace_log = get_or_create_log(trace_id)
+        for event_content in events:
+            if not event_content:
+                continue
+            size = len(json.dumps(event_content, default=str))
+            trace_log.append(event_content, size)
+            _event_stats["retained_bytes"] += size
+            _event_stats["published_events"] += 1
+            published += 1
+        if trace_log.retained_bytes > TRACE_QUEUE_MAX_BYTES:
+            _shed(trace_log, TRACE_QUEUE_MAX_BYTES)
+        _enforce_memory_budget(trace_log)
+        listeners = list(_event_listeners.get(trace_id, ())) if published else []
+    for callback in listeners:
+        callback()
+    return published
+
+
+def read_events(trace_id: str, cursor: int) -> Dict[str, Any]:
+    """
+    Return a trace's events published after the cursor. Reads never consume
+    events: the returned cursor is the sequence number of the last event
+    returned, and passing it back continues the stream. "truncated" is set
+    when events after the given cursor were dropped before being read.
+    """
+    with _trace_logs_lock:
+        _sweep_expired_traces()
+        trace_log = trace_logs.get(trace_id)
+        if trace_log is None:
+            return {"events": [], "cursor": cursor, "finished": False, "truncated": False}
+        trace_log.last_activity = time.monotonic()
+        events = trace_log.read_after(cursor, get_event_spill_store())
+        next_cursor = events[-1][0] if events else cursor
+        return {
+            "events": [event for _, event in events],
+            "cursor": next_cursor,
+            "finished": trace_log.is_finished(next_cursor),
+            "truncated": cursor < trace_log.dropped_through,
+        }
+
+
+def consume_events(trace_id: str, consumer: str = DEFAULT_EVENT_CONSUMER) -> List[Any]:
+    """
+    Return the events a named consumer has not seen yet and advance its
+    offset. Consumers are independent: one consumer's reads never hide
+    events from another. Unknown (or expired) traces return no events
+    without creating a log.
+    """
+    with _trace_logs_lock:
+        trace_log = trace_logs.get(trace_id)
+        cursor = trace_log.consumer_offsets.get(consumer, 0) if trace_log is not None else 0
+        result = read_events(trace_id, cursor)
+        if trace_log is not None and trace_id in trace_logs:
+            trace_log.consumer_offsets[consumer] = result["cursor"]
+        return result["events"]
+
+
+def get_trace_status(trace_id: str) -> Dict[str, Any]:
+    """
+    Latest status projection of a trace, without replaying its events.
+    """
+    with _trace_logs_lock:
+        trace_log = trace_logs.get(trace_id)
+        if trace_log is None:
+            return {
+                "trace_id": trace_id,
+                "status": "unknown",
+                "output": None,
+                "error": None,
+                "last_event_type": None,
+                "last_seq": 0,
+                "event_count": 0,
+            }
+        return dict(trace_log.status)
+
+
+def get_event_stats(trace_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Retention metrics for the ops server's event logs, plus the overflow
+    accounting of a single trace when trace_id is given.
+    """
+    with _trace_logs_lock:
+        stats = dict(
+            _event_stats,
+            live_traces=len(trace_logs),
+            finished_traces=sum(1 for log in trace_logs.values() if log.terminal_at is not None),
+            retained_events=sum(len(log.events) for log in trace_logs.values()),
+            memory_budget_bytes=EVENTS_MEMORY_BUDGET_BYTES,
+            trace_max_bytes=TRACE_QUEUE_MAX_BYTES,
+            spill_enabled=bool(EVENTS_SPILL_PATH),
+            listeners=sum(len(listeners) for listeners in _event_listeners.values()),
+        )
+        trace_log = trace_logs.get(trace_id) if trace_id else None
+        if trace_log is not None:
+            stats["trace"] = {
+                "trace_id": trace_id,
+                "retained_events": len(trace_log.events),
+                "retained_bytes": trace_log.retained_bytes,
+                "dropped_events": trace_log.dropped_events,
+                "dropped_bytes": trace_log.dropped_bytes,
+                "spilled_events": trace_log.spilled_events,
+                "consumers": dict(trace_log.consumer_offsets),
+                "finished": trace_log.terminal_at is not None,
+            }
+        return stats
+
+
+def clear_trace_logs() -> None:
+    with _trace_logs_lock:
+        for trace_log in list(trace_logs.values()):
+            if trace_log.spilled_events and _spill_store is not None:
+                _spill_store.delete(trace_log.trace_id)
+        trace_logs.clear()
+        _event_stats["retained_bytes"] = 0
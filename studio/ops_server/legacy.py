@@ -0,0 +1,169 @@
+import http.client
+import http.server
+import json
+import urllib.parse
+
+from studio.consts import DEFAULT_AS_PHOENIX_OPS_PLATFORM_PORT
+from studio.ops_server.events import (
+    DEFAULT_EVENT_CONSUMER,
+    consume_events,
+    get_event_stats,
+    get_trace_status,
+    publish_events,
+    read_events,
+)
+
+# Define the target server to forward requests to
+TARGET_SERVER = "0.0.0.0"
+
+
+class ProxyHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Single-threaded ops proxy with the original request handling, on top of
+    the shared studio.ops_server.events store. Kept as a fallback
+    (AGENT_STUDIO_OPS_SERVER_MODE=legacy) and as the baseline for
+    bin/benchmark-ops-server.py; the default server is studio.ops_server.app.
+    """
+
+    upstream_host = TARGET_SERVER
+    upstream_port = int(DEFAULT_AS_PHOENIX_OPS_PLATFORM_PORT)
+
+    def do_POST(self):
+        if self.path.startswith("/events/batch"):
+            self.handle_events_batch_post()
+        elif self.path.startswith("/events"):
+            self.handle_events_post()
+        else:
+            self.forward_request()
+
+    def do_GET(self):
+        if self.path.startswith("/events/stats"):
+            self.handle_events_stats_get()
+        elif self.path.startswith("/events/status"):
+            self.handle_events_status_get()
+        elif self.path.startswith("/events"):
+            self.handle_events_get()
+        else:
+            self.forward_request()
+
+    def _read_json_body(self):
+        content_length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(content_length)
+        try:
+            return json.loads(body)
+        except json.JSONDecodeError:
+            self.send_response(400)
+            self.end_headers()
+            self.wfile.write(b"Invalid JSON")
+            return None
+
+    def handle_events_post(self):
+        data = self._read_json_body()
+        if data is None:
+            return
+
+        trace_id = data.get("trace_id")
+        event_content = data.get("event")
+        if not trace_id or not event_content:
+            self.send_response(400)
+            self.end_headers()
+            self.wfile.write(b"Missing trace_id or event")
+            return
+
+        publish_events(trace_id, [event_content])
+
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(b'{"status": "200"}')
+
+    def handle_events_batch_post(self):
+        data = self._read_json_body()
+        if data is None:
+            return
+
+        trace_id = data.get("trace_id")
+        events = data.get("events")
+        if not trace_id or not isinstance(events, list):
+            self.send_response(400)
+            self.end_headers()
+            self.wfile.write(b"Missing trace_id or events")
+            return
+
+        publish_events(trace_id, events)
+
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(json.dumps({"status": "200", "accepted": len(events)}).encode("utf-8"))
+
+    def handle_events_get(self):
+        parsed_url = urllib.parse.urlparse(self.path)
+        params = urllib.parse.parse_qs(parsed_url.query)
+        trace_id = params.get("trace_id", [None])[0]
+
+        if not trace_id:
+            self.send_response(400)
+            self.end_headers()
+            self.wfile.write(b"Missing trace_id")
+            return
+
+        # Cursor reads are supported, but never block: this server is single-threaded.
+        cursor = params.get("cursor", [None])[0]
+        if cursor is not None and cursor.isdigit():
+            messages = read_events(trace_id, int(cursor))
+        else:
+            messages = consume_events(trace_id, params.get("consumer", [DEFAULT_EVENT_CONSUMER])[0])
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(json.dumps(messages).encode("utf-8"))
+
+    def handle_events_stats_get(self):
+        params = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+        self._send_json(get_event_stats(params.get("trace_id", [None])[0]))
+
+    def handle_events_status_get(self):
+        params = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+        trace_id = params.get("trace_id", [None])[0]
+        if not trace_id:
+            self.send_response(400)
+            self.end_headers()
+            self.wfile.write(b"Missing trace_id")
+            return
+        self._send_json(get_trace_status(trace_id))
+
+    def _send_json(self, data):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(json.dumps(data).encode("utf-8"))
+
+    def forward_request(self):
+        conn = http.client.HTTPConnection(self.upstream_host, self.upstream_port)
+
+        # Forward the headers
+        headers = {key: value for key, value in self.headers.items()}
+
+        # Read the body (for POST requests)
+        body = None
+        if self.command == "POST":
+            content_length = self.headers.get("Content-Length")
+            if content_length:
+                body = self.rfile.read(int(content_length))
+
+        # Send the request to the target server
+        conn.request(self.command, self.path, body, headers)
+        response = conn.getresponse()
+
+        # Send the response back to the client
+        self.send_response(response.status)
+        for key, value in response.getheaders():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(response.read())
+
+
+def run_legacy_proxy_server(host: str, port: int):
+    print(f"Starting legacy proxy server on {host}:{port}, forwarding to {TARGET_SERVER}")
+    httpd = http.server.HTTPServer((host, port), ProxyHandler)
+    httpd.serve_forever()
@@ -685,6 +685,11 @@ export interface TestWorkflowRequest {
    * In the future, users may want to customize temperatures/max_new_tokens for each agent.
    */
   generation_config: string;
+  /**
+   * Scheduling priority of the test run. Queued test runs with a higher
+   * priority are dispatched to workflow runners first.
+   */
+  priority: number;
 }
 
 export interface TestWorkflowRequest_InputsEntry {
@@ -707,6 +712,21 @@ export interface TestWorkflowResponse {
   message: string;
   /** Trace ID of the test */
   trace_id: string;
+  /** Position of the test run in the test queue at submission time (1 is next). */
+  queue_position: number;
+}
+
+export interface CancelWorkflowTestRequest {
+  /** Trace ID of the queued test run */
+  trace_id: string;
+}
+
+export interface CancelWorkflowTestResponse {
+  /**
+   * Whether the test run was cancelled. Test runs that were already
+   * dispatched to a workflow runner cannot be cancelled.
+   */
+  cancelled: boolean;
 }
 
 /** Messages for deploying workflows */
@@ -8513,7 +8533,14 @@ export const TestWorkflowMCPInstanceEnvVars_EnvVarsEntry: MessageFns<TestWorkflo
 };
 
 function createBaseTestWorkflowRequest(): TestWorkflowRequest {
-  return { workflow_id: "", inputs: {}, tool_user_parameters: {}, mcp_instance_env_vars: {}, generation_config: "" };
+  return {
+    workflow_id: "",
+    inputs: {},
+    tool_user_parameters: {},
+    mcp_instance_env_vars: {},
+    generation_config: "",
+    priority: 0,
+  };
 }
 
 export const TestWorkflowRequest: MessageFns<TestWorkflowRequest> = {
@@ -8533,6 +8560,9 @@ export const TestWorkflowRequest: MessageFns<TestWorkflowRequest> = {
     if (message.generation_config !== "") {
       writer.uint32(42).string(message.generation_config);
     }
+    if (message.priority !== 0) {
+      writer.uint32(48).int32(message.priority);
+    }
     return writer;
   },
 
@@ -8592,6 +8622,14 @@ export const TestWorkflowRequest: MessageFns<TestWorkflowRequest> = {
           message.generation_config = reader.string();
           continue;
         }
+        case 6: {
+          if (tag !== 48) {
+            break;
+          }
+
+          message.priority = reader.int32();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -8629,6 +8667,7 @@ export const TestWorkflowRequest: MessageFns<TestWorkflowRequest> = {
         )
         : {},
       generation_config: isSet(object.generation_config) ? globalThis.String(object.generation_config) : "",
+      priority: isSet(object.priority) ? globalThis.Number(object.priority) : 0,
     };
   },
 
@@ -8667,6 +8706,9 @@ export const TestWorkflowRequest: MessageFns<TestWorkflowRequest> = {
     if (message.generation_config !== "") {
       obj.generation_config = message.generation_config;
     }
+    if (message.priority !== 0) {
+      obj.priority = Math.round(message.priority);
+    }
     return obj;
   },
 
@@ -8699,6 +8741,7 @@ export const TestWorkflowRequest: MessageFns<TestWorkflowRequest> = {
       return acc;
     }, {});
     message.generation_config = object.generation_config ?? "";
+    message.priority = object.priority ?? 0;
     return message;
   },
 };
@@ -8946,7 +8989,7 @@ export const TestWorkflowRequest_McpInstanceEnvVarsEntry: MessageFns<TestWorkflo
 };
 
 function createBaseTestWorkflowResponse(): TestWorkflowResponse {
-  return { message: "", trace_id: "" };
+  return { message: "", trace_id: "", queue_position: 0 };
 }
 
 export const TestWorkflowResponse: MessageFns<TestWorkflowResponse> = {
@@ -8957,6 +9000,9 @@ export const TestWorkflowResponse: MessageFns<TestWorkflowResponse> = {
     if (message.trace_id !== "") {
       writer.uint32(18).string(message.trace_id);
     }
+    if (message.queue_position !== 0) {
+      writer.uint32(24).int32(message.queue_position);
+    }
     return writer;
   },
 
@@ -8983,6 +9029,14 @@ export const TestWorkflowResponse: MessageFns<TestWorkflowResponse> = {
           message.trace_id = reader.string();
           continue;
         }
+        case 3: {
+          if (tag !== 24) {
+            break;
+          }
+
+          message.queue_position = reader.int32();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -8996,6 +9050,7 @@ export const TestWorkflowResponse: MessageFns<TestWorkflowResponse> = {
     return {
       message: isSet(object.message) ? globalThis.String(object.message) : "",
       trace_id: isSet(object.trace_id) ? globalThis.String(object.trace_id) : "",
+      queue_position: isSet(object.queue_position) ? globalThis.Number(object.queue_position) : 0,
     };
   },
 
@@ -9007,6 +9062,9 @@ export const TestWorkflowResponse: MessageFns<TestWorkflowResponse> = {
     if (message.trace_id !== "") {
       obj.trace_id = message.trace_id;
     }
+    if (message.queue_position !== 0) {
+      obj.queue_position = Math.round(message.queue_position);
+    }
     return obj;
   },
 
@@ -9017,6 +9075,123 @@ export const TestWorkflowResponse: MessageFns<TestWorkflowResponse> = {
     const message = createBaseTestWorkflowResponse();
     message.message = object.message ?? "";
     message.trace_id = object.trace_id ?? "";
+    message.queue_position = object.queue_position ?? 0;
+    return message;
+  },
+};
+
+function createBaseCancelWorkflowTestRequest(): CancelWorkflowTestRequest {
+  return { trace_id: "" };
+}
+
+export const CancelWorkflowTestRequest: MessageFns<CancelWorkflowTestRequest> = {
+  encode(message: CancelWorkflowTestRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.trace_id !== "") {
+      writer.uint32(10).string(message.trace_id);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): CancelWorkflowTestRequest {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    let end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseCancelWorkflowTestRequest();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.trace_id = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): CancelWorkflowTestRequest {
+    return { trace_id: isSet(object.trace_id) ? globalThis.String(object.trace_id) : "" };
+  },
+
+  toJSON(message: CancelWorkflowTestRequest): unknown {
+    const obj: any = {};
+    if (message.trace_id !== "") {
+      obj.trace_id = message.trace_id;
+    }
+    return obj;
+  },
+
+  create(base?: DeepPartial<CancelWorkflowTestRequest>): CancelWorkflowTestRequest {
+    return CancelWorkflowTestRequest.fromPartial(base ?? {});
+  },
+  fromPartial(object: DeepPartial<CancelWorkflowTestRequest>): CancelWorkflowTestRequest {
+    const message = createBaseCancelWorkflowTestRequest();
+    message.trace_id = object.trace_id ?? "";
+    return message;
+  },
+};
+
+function createBaseCancelWorkflowTestResponse(): CancelWorkflowTestResponse {
+  return { cancelled: false };
+}
+
+export const CancelWorkflowTestResponse: MessageFns<CancelWorkflowTestResponse> = {
+  encode(message: CancelWorkflowTestResponse, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.cancelled !== false) {
+      writer.uint32(8).bool(message.cancelled);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): CancelWorkflowTestResponse {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    let end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseCancelWorkflowTestResponse();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 8) {
+            break;
+          }
+
+          message.cancelled = reader.bool();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): CancelWorkflowTestResponse {
+    return { cancelled: isSet(object.cancelled) ? globalThis.Boolean(object.cancelled) : false };
+  },
+
+  toJSON(message: CancelWorkflowTestResponse): unknown {
+    const obj: any = {};
+    if (message.cancelled !== false) {
+      obj.cancelled = message.cancelled;
+    }
+    return obj;
+  },
+
+  create(base?: DeepPartial<CancelWorkflowTestResponse>): CancelWorkflowTestResponse {
+    return CancelWorkflowTestResponse.fromPartial(base ?? {});
+  },
+  fromPartial(object: DeepPartial<CancelWorkflowTestResponse>): CancelWorkflowTestResponse {
+    const message = createBaseCancelWorkflowTestResponse();
+    message.cancelled = object.cancelled ?? false;
     return message;
   },
 };
@@ -16475,6 +16650,17 @@ export const AgentStudioService = {
     responseSerialize: (value: TestWorkflowResponse) => Buffer.from(TestWorkflowResponse.encode(value).finish()),
     responseDeserialize: (value: Buffer) => TestWorkflowResponse.decode(value),
   },
+  cancelWorkflowTest: {
+    path: "/agent_studio.AgentStudio/CancelWorkflowTest",
+    requestStream: false,
+    responseStream: false,
+    requestSerialize: (value: CancelWorkflowTestRequest) =>
+      Buffer.from(CancelWorkflowTestRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer) => CancelWorkflowTestRequest.decode(value),
+    responseSerialize: (value: CancelWorkflowTestResponse) =>
+      Buffer.from(CancelWorkflowTestResponse.encode(value).finish()),
+    responseDeserialize: (value: Buffer) => CancelWorkflowTestResponse.decode(value),
+  },
   removeWorkflow: {
     path: "/agent_studio.AgentStudio/RemoveWorkflow",
     requestStream: false,
@@ -16830,6 +17016,7 @@ export interface AgentStudioServer extends UntypedServiceImplementation {
   addWorkflow: handleUnaryCall<AddWorkflowRequest, AddWorkflowResponse>;
   updateWorkflow: handleUnaryCall<UpdateWorkflowRequest, UpdateWorkflowResponse>;
   testWorkflow: handleUnaryCall<TestWorkflowRequest, TestWorkflowResponse>;
+  cancelWorkflowTest: handleUnaryCall<CancelWorkflowTestRequest, CancelWorkflowTestResponse>;
   removeWorkflow: handleUnaryCall<RemoveWorkflowRequest, RemoveWorkflowResponse>;
   /** Deployed Workflow Operations */
   deployWorkflow: handleUnaryCall<DeployWorkflowRequest, DeployWorkflowResponse>;
@@ -17551,6 +17738,21 @@ export interface AgentStudioClient extends Client {
     options: Partial<CallOptions>,
     callback: (error: ServiceError | null, response: TestWorkflowResponse) => void,
   ): ClientUnaryCall;
+  cancelWorkflowTest(
+    request: CancelWorkflowTestRequest,
+    callback: (error: ServiceError | null, response: CancelWorkflowTestResponse) => void,
+  ): ClientUnaryCall;
+  cancelWorkflowTest(
+    request: CancelWorkflowTestRequest,
+    metadata: Metadata,
+    callback: (error: ServiceError | null, response: CancelWorkflowTestResponse) => void,
+  ): ClientUnaryCall;
+  cancelWorkflowTest(
+    request: CancelWorkflowTestRequest,
+    metadata: Metadata,
+    options: Partial<CallOptions>,
+    callback: (error: ServiceError | null, response: CancelWorkflowTestResponse) => void,
+  ): ClientUnaryCall;
   removeWorkflow(
     request: RemoveWorkflowRequest,
     callback: (error: ServiceError | null, response: RemoveWorkflowResponse) => void,
@@ -20,7 +20,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\x1fstudio/proto/agent_studio.proto\x12\x0c\x61gent_studio"\x86\x01\n\x05Model\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x12\n\nmodel_name\x18\x02 \x01(\t\x12\x16\n\x0eprovider_model\x18\x03 \x01(\t\x12\x12\n\nmodel_type\x18\x04 \x01(\t\x12\x10\n\x08\x61pi_base\x18\x05 \x01(\t\x12\x19\n\x11is_studio_default\x18\x06 \x01(\x08"\x13\n\x11ListModelsRequest"@\n\x12ListModelsResponse\x12*\n\rmodel_details\x18\x01 \x03(\x0b\x32\x13.agent_studio.Model"#\n\x0fGetModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t">\n\x10GetModelResponse\x12*\n\rmodel_details\x18\x01 \x01(\x0b\x32\x13.agent_studio.Model"t\n\x0f\x41\x64\x64ModelRequest\x12\x12\n\nmodel_name\x18\x01 \x01(\t\x12\x16\n\x0eprovider_model\x18\x02 \x01(\t\x12\x12\n\nmodel_type\x18\x03 \x01(\t\x12\x10\n\x08\x61pi_base\x18\x04 \x01(\t\x12\x0f\n\x07\x61pi_key\x18\x05 \x01(\t"$\n\x10\x41\x64\x64ModelResponse\x12\x10\n\x08model_id\x18\x01 \x01(\t"&\n\x12RemoveModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t"\x15\n\x13RemoveModelResponse"u\n\x12UpdateModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x12\n\nmodel_name\x18\x02 \x01(\t\x12\x16\n\x0eprovider_model\x18\x03 \x01(\t\x12\x10\n\x08\x61pi_base\x18\x04 \x01(\t\x12\x0f\n\x07\x61pi_key\x18\x05 \x01(\t"\'\n\x13UpdateModelResponse\x12\x10\n\x08model_id\x18\x01 \x01(\t"\x93\x01\n\x10TestModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x17\n\x0f\x63ompletion_role\x18\x02 \x01(\t\x12\x1a\n\x12\x63ompletion_content\x18\x03 \x01(\t\x12\x13\n\x0btemperature\x18\x04 \x01(\x02\x12\x12\n\nmax_tokens\x18\x05 \x01(\x05\x12\x0f\n\x07timeout\x18\x06 \x01(\x05"%\n\x11TestModelResponse\x12\x10\n\x08response\x18\x01 \x01(\t"0\n\x1cSetStudioDefaultModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t"\x1f\n\x1dSetStudioDefaultModelResponse"\x1e\n\x1cGetStudioDefaultModelRequest"p\n\x1dGetStudioDefaultModelResponse\x12#\n\x1bis_default_model_configured\x18\x01 \x01(\x08\x12*\n\rmodel_details\x18\x02 \x01(\x0b\x32\x13.agent_studio.Model"V\n\x18ListToolTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"J\n\x19ListToolTemplatesResponse\x12-\n\ttemplates\x18\x01 \x03(\x0b\x32\x1a.agent_studio.ToolTemplate"2\n\x16GetToolTemplateRequest\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"G\n\x17GetToolTemplateResponse\x12,\n\x08template\x18\x01 \x01(\x0b\x32\x1a.agent_studio.ToolTemplate"\x8d\x01\n\x16\x41\x64\x64ToolTemplateRequest\x12\x1a\n\x12tool_template_name\x18\x01 \x01(\t\x12\x1b\n\x13tmp_tool_image_path\x18\x02 \x01(\t\x12!\n\x14workflow_template_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"3\n\x17\x41\x64\x64ToolTemplateResponse\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"n\n\x19UpdateToolTemplateRequest\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t\x12\x1a\n\x12tool_template_name\x18\x02 \x01(\t\x12\x1b\n\x13tmp_tool_image_path\x18\x03 \x01(\t"6\n\x1aUpdateToolTemplateResponse\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"5\n\x19RemoveToolTemplateRequest\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"\x1c\n\x1aRemoveToolTemplateResponse"/\n\x18ListToolInstancesRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"O\n\x19ListToolInstancesResponse\x12\x32\n\x0etool_instances\x18\x01 \x03(\x0b\x32\x1a.agent_studio.ToolInstance"2\n\x16GetToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t"L\n\x17GetToolInstanceResponse\x12\x31\n\rtool_instance\x18\x01 \x01(\x0b\x32\x1a.agent_studio.ToolInstance"r\n\x19\x43reateToolInstanceRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x10tool_template_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x13\n\x11_tool_template_id"R\n\x1a\x43reateToolInstanceResponse\x12\x1a\n\x12tool_instance_name\x18\x01 \x01(\t\x12\x18\n\x10tool_instance_id\x18\x02 \x01(\t"u\n\x19UpdateToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x1b\n\x13tmp_tool_image_path\x18\x04 \x01(\t"6\n\x1aUpdateToolInstanceResponse\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t"5\n\x19RemoveToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t"\x1c\n\x1aRemoveToolInstanceResponse"\xb6\x02\n\x0cToolTemplate\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0bpython_code\x18\x03 \x01(\t\x12\x1b\n\x13python_requirements\x18\x04 \x01(\t\x12\x1a\n\x12source_folder_path\x18\x05 \x01(\t\x12\x15\n\rtool_metadata\x18\x06 \x01(\t\x12\x10\n\x08is_valid\x18\x07 \x01(\x08\x12\x11\n\tpre_built\x18\x08 \x01(\x08\x12\x16\n\x0etool_image_uri\x18\t \x01(\t\x12\x18\n\x10tool_description\x18\n \x01(\t\x12!\n\x14workflow_template_id\x18\x0b \x01(\tH\x00\x88\x01\x01\x12\x14\n\x0cis_venv_tool\x18\x0c \x01(\x08\x42\x17\n\x15_workflow_template_id"\x8c\x02\n\x0cToolInstance\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0bworkflow_id\x18\x03 \x01(\t\x12\x13\n\x0bpython_code\x18\x04 \x01(\t\x12\x1b\n\x13python_requirements\x18\x05 \x01(\t\x12\x1a\n\x12source_folder_path\x18\x06 \x01(\t\x12\x15\n\rtool_metadata\x18\x07 \x01(\t\x12\x10\n\x08is_valid\x18\x08 \x01(\x08\x12\x16\n\x0etool_image_uri\x18\t \x01(\t\x12\x18\n\x10tool_description\x18\n \x01(\t\x12\x14\n\x0cis_venv_tool\x18\x0b \x01(\x08\x12\x0e\n\x06status\x18\x0c \x01(\t"\xac\x01\n\x15\x41\x64\x64McpTemplateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x0c\n\x04\x61rgs\x18\x03 \x03(\t\x12\x11\n\tenv_names\x18\x04 \x03(\t\x12\x1a\n\x12tmp_mcp_image_path\x18\x05 \x01(\t\x12!\n\x14workflow_template_id\x18\x06 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"1\n\x16\x41\x64\x64McpTemplateResponse\x12\x17\n\x0fmcp_template_id\x18\x01 \x01(\t"\x8c\x01\n\x18UpdateMcpTemplateRequest\x12\x17\n\x0fmcp_template_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x0c\n\x04\x61rgs\x18\x04 \x03(\t\x12\x11\n\tenv_names\x18\x05 \x03(\t\x12\x1a\n\x12tmp_mcp_image_path\x18\x06 \x01(\t"4\n\x19UpdateMcpTemplateResponse\x12\x17\n\x0fmcp_template_id\x18\x01 \x01(\t"3\n\x18RemoveMcpTemplateRequest\x12\x17\n\x0fmcp_template_id\x18\x01 \x01(\t"\x1b\n\x19RemoveMcpTemplateResponse"\xc4\x01\n\x0bMCPTemplate\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x0c\n\x04\x61rgs\x18\x04 \x03(\t\x12\x11\n\tenv_names\x18\x05 \x03(\t\x12\r\n\x05tools\x18\x06 \x01(\t\x12\x11\n\timage_uri\x18\x07 \x01(\t\x12\x0e\n\x06status\x18\x08 \x01(\t\x12!\n\x14workflow_template_id\x18\t \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"U\n\x17ListMcpTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"L\n\x18ListMcpTemplatesResponse\x12\x30\n\rmcp_templates\x18\x01 \x03(\x0b\x32\x19.agent_studio.MCPTemplate"0\n\x15GetMcpTemplateRequest\x12\x17\n\x0fmcp_template_id\x18\x01 \x01(\t"I\n\x16GetMcpTemplateResponse\x12/\n\x0cmcp_template\x18\x01 \x01(\x0b\x32\x19.agent_studio.MCPTemplate"\xb6\x01\n\x0bMcpInstance\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x0c\n\x04\x61rgs\x18\x04 \x03(\t\x12\x11\n\tenv_names\x18\x05 \x03(\t\x12\r\n\x05tools\x18\x06 \x01(\t\x12\x11\n\timage_uri\x18\x07 \x01(\t\x12\x0e\n\x06status\x18\x08 \x01(\t\x12\x17\n\x0f\x61\x63tivated_tools\x18\t \x03(\t\x12\x13\n\x0bworkflow_id\x18\n \x01(\t"C\n\x17ListMcpInstancesRequest\x12\x18\n\x0bworkflow_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_workflow_id"L\n\x18ListMcpInstancesResponse\x12\x30\n\rmcp_instances\x18\x01 \x03(\x0b\x32\x19.agent_studio.McpInstance"0\n\x15GetMcpInstanceRequest\x12\x17\n\x0fmcp_instance_id\x18\x01 \x01(\t"I\n\x16GetMcpInstanceResponse\x12/\n\x0cmcp_instance\x18\x01 \x01(\x0b\x32\x19.agent_studio.McpInstance"o\n\x18\x43reateMcpInstanceRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x17\n\x0fmcp_template_id\x18\x03 \x01(\t\x12\x17\n\x0f\x61\x63tivated_tools\x18\x04 \x03(\t"O\n\x19\x43reateMcpInstanceResponse\x12\x19\n\x11mcp_instance_name\x18\x01 \x01(\t\x12\x17\n\x0fmcp_instance_id\x18\x02 \x01(\t"v\n\x18UpdateMcpInstanceRequest\x12\x17\n\x0fmcp_instance_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1a\n\x12tmp_mcp_image_path\x18\x03 \x01(\t\x12\x17\n\x0f\x61\x63tivated_tools\x18\x04 \x03(\t"4\n\x19UpdateMcpInstanceResponse\x12\x17\n\x0fmcp_instance_id\x18\x01 \x01(\t"3\n\x18RemoveMcpInstanceRequest\x12\x17\n\x0fmcp_instance_id\x18\x01 \x01(\t"\x1b\n\x19RemoveMcpInstanceResponse"(\n\x11ListAgentsRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"A\n\x12ListAgentsResponse\x12+\n\x06\x61gents\x18\x01 \x03(\x0b\x32\x1b.agent_studio.AgentMetadata"#\n\x0fGetAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t">\n\x10GetAgentResponse\x12*\n\x05\x61gent\x18\x01 \x01(\x0b\x32\x1b.agent_studio.AgentMetadata"\xa5\x02\n\x0f\x41\x64\x64\x41gentRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x1d\n\x15llm_provider_model_id\x18\x02 \x01(\t\x12\x10\n\x08tools_id\x18\x03 \x03(\t\x12\x18\n\x10mcp_instance_ids\x18\x04 \x03(\t\x12\x41\n\x16\x63rew_ai_agent_metadata\x18\x05 \x01(\x0b\x32!.agent_studio.CrewAIAgentMetadata\x12\x18\n\x0btemplate_id\x18\x06 \x01(\tH\x00\x88\x01\x01\x12\x13\n\x0bworkflow_id\x18\x07 \x01(\t\x12\x1c\n\x14tmp_agent_image_path\x18\x08 \x01(\t\x12\x19\n\x11tool_template_ids\x18\t \x03(\tB\x0e\n\x0c_template_id"$\n\x10\x41\x64\x64\x41gentResponse\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t"\xfb\x01\n\x12UpdateAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x15llm_provider_model_id\x18\x03 \x01(\t\x12\x10\n\x08tools_id\x18\x04 \x03(\t\x12\x18\n\x10mcp_instance_ids\x18\x05 \x03(\t\x12\x41\n\x16\x63rew_ai_agent_metadata\x18\x06 \x01(\x0b\x32!.agent_studio.CrewAIAgentMetadata\x12\x1c\n\x14tmp_agent_image_path\x18\x07 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x08 \x03(\t"\x15\n\x13UpdateAgentResponse"&\n\x12RemoveAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t"\x15\n\x13RemoveAgentResponse"\xf7\x01\n\rAgentMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x15llm_provider_model_id\x18\x03 \x01(\t\x12\x10\n\x08tools_id\x18\x04 \x03(\t\x12\x18\n\x10mcp_instance_ids\x18\x05 \x03(\t\x12\x41\n\x16\x63rew_ai_agent_metadata\x18\x06 \x01(\x0b\x32!.agent_studio.CrewAIAgentMetadata\x12\x17\n\x0f\x61gent_image_uri\x18\x07 \x01(\t\x12\x10\n\x08is_valid\x18\x08 \x01(\x08\x12\x13\n\x0bworkflow_id\x18\t \x01(\t"\xa5\x01\n\x13\x43rewAIAgentMetadata\x12\x0c\n\x04role\x18\x01 \x01(\t\x12\x11\n\tbackstory\x18\x02 \x01(\t\x12\x0c\n\x04goal\x18\x03 \x01(\t\x12\x18\n\x10\x61llow_delegation\x18\x04 \x01(\x08\x12\x0f\n\x07verbose\x18\x05 \x01(\x08\x12\r\n\x05\x63\x61\x63he\x18\x06 \x01(\x08\x12\x13\n\x0btemperature\x18\x07 \x01(\x02\x12\x10\n\x08max_iter\x18\x08 \x01(\x05"I\n\x10TestAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t\x12\x12\n\nuser_input\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontext\x18\x03 \x01(\t"%\n\x11TestAgentResponse\x12\x10\n\x08response\x18\x01 \x01(\t"\xb8\x02\n\x12\x41\x64\x64WorkflowRequest\x12\x11\n\x04name\x18\x01 \x01(\tH\x00\x88\x01\x01\x12L\n\x19\x63rew_ai_workflow_metadata\x18\x02 \x01(\x0b\x32$.agent_studio.CrewAIWorkflowMetadataH\x01\x88\x01\x01\x12\x1e\n\x11is_conversational\x18\x03 \x01(\x08H\x02\x88\x01\x01\x12!\n\x14workflow_template_id\x18\x04 \x01(\tH\x03\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x05 \x01(\tH\x04\x88\x01\x01\x42\x07\n\x05_nameB\x1c\n\x1a_crew_ai_workflow_metadataB\x14\n\x12_is_conversationalB\x17\n\x15_workflow_template_idB\x0e\n\x0c_description"*\n\x13\x41\x64\x64WorkflowResponse\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"\x16\n\x14ListWorkflowsRequest"B\n\x15ListWorkflowsResponse\x12)\n\tworkflows\x18\x01 \x03(\x0b\x32\x16.agent_studio.Workflow")\n\x12GetWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"?\n\x13GetWorkflowResponse\x12(\n\x08workflow\x18\x01 \x01(\x0b\x32\x16.agent_studio.Workflow"\xb3\x01\n\x15UpdateWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12G\n\x19\x63rew_ai_workflow_metadata\x18\x03 \x01(\x0b\x32$.agent_studio.CrewAIWorkflowMetadata\x12\x19\n\x11is_conversational\x18\x04 \x01(\x08\x12\x13\n\x0b\x64\x65scription\x18\x05 \x01(\t"\x18\n\x16UpdateWorkflowResponse"\xa5\x01\n\x1eTestWorkflowToolUserParameters\x12P\n\nparameters\x18\x01 \x03(\x0b\x32<.agent_studio.TestWorkflowToolUserParameters.ParametersEntry\x1a\x31\n\x0fParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01"\x9d\x01\n\x1eTestWorkflowMCPInstanceEnvVars\x12K\n\x08\x65nv_vars\x18\x01 \x03(\x0b\x32\x39.agent_studio.TestWorkflowMCPInstanceEnvVars.EnvVarsEntry\x1a.\n\x0c\x45nvVarsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01"\xb8\x04\n\x13TestWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12=\n\x06inputs\x18\x02 \x03(\x0b\x32-.agent_studio.TestWorkflowRequest.InputsEntry\x12W\n\x14tool_user_parameters\x18\x03 \x03(\x0b\x32\x39.agent_studio.TestWorkflowRequest.ToolUserParametersEntry\x12X\n\x15mcp_instance_env_vars\x18\x04 \x03(\x0b\x32\x39.agent_studio.TestWorkflowRequest.McpInstanceEnvVarsEntry\x12\x19\n\x11generation_config\x18\x05 \x01(\t\x1a-\n\x0bInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1ag\n\x17ToolUserParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.agent_studio.TestWorkflowToolUserParameters:\x02\x38\x01\x1ag\n\x17McpInstanceEnvVarsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.agent_studio.TestWorkflowMCPInstanceEnvVars:\x02\x38\x01"9\n\x14TestWorkflowResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x10\n\x08trace_id\x18\x02 \x01(\t"\xc3\x05\n\x15\x44\x65ployWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12]\n\x16\x65nv_variable_overrides\x18\x02 \x03(\x0b\x32=.agent_studio.DeployWorkflowRequest.EnvVariableOverridesEntry\x12Y\n\x14tool_user_parameters\x18\x03 \x03(\x0b\x32;.agent_studio.DeployWorkflowRequest.ToolUserParametersEntry\x12Z\n\x15mcp_instance_env_vars\x18\x04 \x03(\x0b\x32;.agent_studio.DeployWorkflowRequest.McpInstanceEnvVarsEntry\x12\x1d\n\x15\x62ypass_authentication\x18\x05 \x01(\x08\x12\x19\n\x11generation_config\x18\x06 \x01(\t\x12\x1f\n\x12\x64\x65ployment_payload\x18\x07 \x01(\tH\x00\x88\x01\x01\x1a;\n\x19\x45nvVariableOverridesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1ag\n\x17ToolUserParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.agent_studio.TestWorkflowToolUserParameters:\x02\x38\x01\x1ag\n\x17McpInstanceEnvVarsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.agent_studio.TestWorkflowMCPInstanceEnvVars:\x02\x38\x01\x42\x15\n\x13_deployment_payload"u\n\x16\x44\x65ployWorkflowResponse\x12\x1e\n\x16\x64\x65ployed_workflow_name\x18\x01 \x01(\t\x12\x1c\n\x14\x64\x65ployed_workflow_id\x18\x02 \x01(\t\x12\x1d\n\x15\x63ml_deployed_model_id\x18\x03 \x01(\t"7\n\x17UndeployWorkflowRequest\x12\x1c\n\x14\x64\x65ployed_workflow_id\x18\x01 \x01(\t"\x1a\n\x18UndeployWorkflowResponse"\x1e\n\x1cListDeployedWorkflowsRequest"[\n\x1dListDeployedWorkflowsResponse\x12:\n\x12\x64\x65ployed_workflows\x18\x01 \x03(\x0b\x32\x1e.agent_studio.DeployedWorkflow",\n\x15RemoveWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"\x18\n\x16RemoveWorkflowResponse"\xd4\x02\n\x10\x44\x65ployedWorkflow\x12\x1c\n\x14\x64\x65ployed_workflow_id\x18\x01 \x01(\t\x12\x13\n\x0bworkflow_id\x18\x02 \x01(\t\x12\x15\n\rworkflow_name\x18\x03 \x01(\t\x12\x1e\n\x16\x64\x65ployed_workflow_name\x18\x04 \x01(\t\x12\x1d\n\x15\x63ml_deployed_model_id\x18\x05 \x01(\t\x12\x10\n\x08is_stale\x18\x06 \x01(\x08\x12\x17\n\x0f\x61pplication_url\x18\x07 \x01(\t\x12\x1a\n\x12\x61pplication_status\x18\x08 \x01(\t\x12\x1d\n\x15\x61pplication_deep_link\x18\t \x01(\t\x12\x17\n\x0fmodel_deep_link\x18\n \x01(\t\x12 \n\x13\x64\x65ployment_metadata\x18\x0b \x01(\tH\x00\x88\x01\x01\x42\x16\n\x14_deployment_metadata"\x82\x02\n\x08Workflow\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12G\n\x19\x63rew_ai_workflow_metadata\x18\x03 \x01(\x0b\x32$.agent_studio.CrewAIWorkflowMetadata\x12\x10\n\x08is_valid\x18\x04 \x01(\x08\x12\x10\n\x08is_ready\x18\x05 \x01(\x08\x12\x19\n\x11is_conversational\x18\x06 \x01(\x08\x12\x10\n\x08is_draft\x18\x07 \x01(\x08\x12\x13\n\x0b\x64\x65scription\x18\x08 \x01(\t\x12\x16\n\tdirectory\x18\t \x01(\tH\x00\x88\x01\x01\x42\x0c\n\n_directory"\xb4\x01\n\x16\x43rewAIWorkflowMetadata\x12\x10\n\x08\x61gent_id\x18\x01 \x03(\t\x12\x0f\n\x07task_id\x18\x02 \x03(\t\x12\x18\n\x10manager_agent_id\x18\x03 \x01(\t\x12\x0f\n\x07process\x18\x04 \x01(\t\x12*\n\x1dmanager_llm_model_provider_id\x18\x05 \x01(\tH\x00\x88\x01\x01\x42 \n\x1e_manager_llm_model_provider_id"\xa3\x01\n\x0e\x41\x64\x64TaskRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x44\n\x18\x61\x64\x64_crew_ai_task_request\x18\x02 \x01(\x0b\x32".agent_studio.AddCrewAITaskRequest\x12\x13\n\x0bworkflow_id\x18\x03 \x01(\t\x12\x18\n\x0btemplate_id\x18\x04 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_template_id""\n\x0f\x41\x64\x64TaskResponse\x12\x0f\n\x07task_id\x18\x01 \x01(\t"\'\n\x10ListTasksRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"D\n\x11ListTasksResponse\x12/\n\x05tasks\x18\x01 \x03(\x0b\x32 .agent_studio.CrewAITaskMetadata"!\n\x0eGetTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t"A\n\x0fGetTaskResponse\x12.\n\x04task\x18\x01 \x01(\x0b\x32 .agent_studio.CrewAITaskMetadata"l\n\x11UpdateTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x46\n\x17UpdateCrewAITaskRequest\x18\x02 \x01(\x0b\x32%.agent_studio.UpdateCrewAITaskRequest"\x14\n\x12UpdateTaskResponse"$\n\x11RemoveTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t"\x14\n\x12RemoveTaskResponse"\xa5\x01\n\x12\x43rewAITaskMetadata\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x03 \x01(\t\x12\x19\n\x11\x61ssigned_agent_id\x18\x04 \x01(\t\x12\x10\n\x08is_valid\x18\x05 \x01(\x08\x12\x0e\n\x06inputs\x18\x06 \x03(\t\x12\x13\n\x0bworkflow_id\x18\x07 \x01(\t"b\n\x17UpdateCrewAITaskRequest\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x02 \x01(\t\x12\x19\n\x11\x61ssigned_agent_id\x18\x03 \x01(\t"_\n\x14\x41\x64\x64\x43rewAITaskRequest\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x02 \x01(\t\x12\x19\n\x11\x61ssigned_agent_id\x18\x03 \x01(\t"-\n\x13GetAssetDataRequest\x12\x16\n\x0e\x61sset_uri_list\x18\x01 \x03(\t"\xab\x01\n\x14GetAssetDataResponse\x12\x45\n\nasset_data\x18\x01 \x03(\x0b\x32\x31.agent_studio.GetAssetDataResponse.AssetDataEntry\x12\x1a\n\x12unavailable_assets\x18\x02 \x03(\t\x1a\x30\n\x0e\x41ssetDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01"F\n\tFileChunk\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\x12\x15\n\ris_last_chunk\x18\x03 \x01(\x08"Q\n&NonStreamingTemporaryFileUploadRequest\x12\x14\n\x0c\x66ull_content\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t"8\n\x12\x46ileUploadResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x11\n\tfile_path\x18\x02 \x01(\t"1\n\x1c\x44ownloadTemporaryFileRequest\x12\x11\n\tfile_path\x18\x01 \x01(\t" \n\x1eGetParentProjectDetailsRequest"T\n\x1fGetParentProjectDetailsResponse\x12\x14\n\x0cproject_base\x18\x01 \x01(\t\x12\x1b\n\x13studio_subdirectory\x18\x02 \x01(\t"W\n\x19ListAgentTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"Z\n\x1aListAgentTemplatesResponse\x12<\n\x0f\x61gent_templates\x18\x01 \x03(\x0b\x32#.agent_studio.AgentTemplateMetadata"%\n\x17GetAgentTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"W\n\x18GetAgentTemplateResponse\x12;\n\x0e\x61gent_template\x18\x01 \x01(\x0b\x32#.agent_studio.AgentTemplateMetadata"\xc1\x02\n\x17\x41\x64\x64\x41gentTemplateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x03 \x03(\t\x12\x0c\n\x04role\x18\x04 \x01(\t\x12\x11\n\tbackstory\x18\x05 \x01(\t\x12\x0c\n\x04goal\x18\x06 \x01(\t\x12\x18\n\x10\x61llow_delegation\x18\x07 \x01(\x08\x12\x0f\n\x07verbose\x18\x08 \x01(\x08\x12\r\n\x05\x63\x61\x63he\x18\t \x01(\x08\x12\x13\n\x0btemperature\x18\n \x01(\x02\x12\x10\n\x08max_iter\x18\x0b \x01(\x05\x12\x1c\n\x14tmp_agent_image_path\x18\x0c \x01(\t\x12!\n\x14workflow_template_id\x18\r \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"&\n\x18\x41\x64\x64\x41gentTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"\xf4\x03\n\x1aUpdateAgentTemplateRequest\x12\x19\n\x11\x61gent_template_id\x18\x01 \x01(\t\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x19\n\x11tool_template_ids\x18\x04 \x03(\t\x12\x11\n\x04role\x18\x05 \x01(\tH\x02\x88\x01\x01\x12\x16\n\tbackstory\x18\x06 \x01(\tH\x03\x88\x01\x01\x12\x11\n\x04goal\x18\x07 \x01(\tH\x04\x88\x01\x01\x12\x1d\n\x10\x61llow_delegation\x18\x08 \x01(\x08H\x05\x88\x01\x01\x12\x14\n\x07verbose\x18\t \x01(\x08H\x06\x88\x01\x01\x12\x12\n\x05\x63\x61\x63he\x18\n \x01(\x08H\x07\x88\x01\x01\x12\x18\n\x0btemperature\x18\x0b \x01(\x02H\x08\x88\x01\x01\x12\x15\n\x08max_iter\x18\x0c \x01(\x05H\t\x88\x01\x01\x12!\n\x14tmp_agent_image_path\x18\r \x01(\tH\n\x88\x01\x01\x42\x07\n\x05_nameB\x0e\n\x0c_descriptionB\x07\n\x05_roleB\x0c\n\n_backstoryB\x07\n\x05_goalB\x13\n\x11_allow_delegationB\n\n\x08_verboseB\x08\n\x06_cacheB\x0e\n\x0c_temperatureB\x0b\n\t_max_iterB\x17\n\x15_tmp_agent_image_path")\n\x1bUpdateAgentTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"(\n\x1aRemoveAgentTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"\x1d\n\x1bRemoveAgentTemplateResponse"\xf6\x02\n\x15\x41gentTemplateMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x04 \x03(\t\x12\x18\n\x10mcp_template_ids\x18\x05 \x03(\t\x12\x0c\n\x04role\x18\x06 \x01(\t\x12\x11\n\tbackstory\x18\x07 \x01(\t\x12\x0c\n\x04goal\x18\x08 \x01(\t\x12\x18\n\x10\x61llow_delegation\x18\t \x01(\x08\x12\x0f\n\x07verbose\x18\n \x01(\x08\x12\r\n\x05\x63\x61\x63he\x18\x0b \x01(\x08\x12\x13\n\x0btemperature\x18\x0c \x01(\x02\x12\x10\n\x08max_iter\x18\r \x01(\x05\x12\x17\n\x0f\x61gent_image_uri\x18\x0e \x01(\t\x12!\n\x14workflow_template_id\x18\x0f \x01(\tH\x00\x88\x01\x01\x12\x14\n\x0cpre_packaged\x18\x10 \x01(\x08\x42\x17\n\x15_workflow_template_id"\x1e\n\x1cListWorkflowTemplatesRequest"c\n\x1dListWorkflowTemplatesResponse\x12\x42\n\x12workflow_templates\x18\x01 \x03(\x0b\x32&.agent_studio.WorkflowTemplateMetadata"(\n\x1aGetWorkflowTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"`\n\x1bGetWorkflowTemplateResponse\x12\x41\n\x11workflow_template\x18\x01 \x01(\x0b\x32&.agent_studio.WorkflowTemplateMetadata"\x9b\x03\n\x1a\x41\x64\x64WorkflowTemplateRequest\x12\x11\n\x04name\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07process\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x1a\n\x12\x61gent_template_ids\x18\x04 \x03(\t\x12\x19\n\x11task_template_ids\x18\x05 \x03(\t\x12&\n\x19manager_agent_template_id\x18\x06 \x01(\tH\x03\x88\x01\x01\x12 \n\x13use_default_manager\x18\x07 \x01(\x08H\x04\x88\x01\x01\x12\x1e\n\x11is_conversational\x18\x08 \x01(\x08H\x05\x88\x01\x01\x12\x18\n\x0bworkflow_id\x18\t \x01(\tH\x06\x88\x01\x01\x42\x07\n\x05_nameB\x0e\n\x0c_descriptionB\n\n\x08_processB\x1c\n\x1a_manager_agent_template_idB\x16\n\x14_use_default_managerB\x14\n\x12_is_conversationalB\x0e\n\x0c_workflow_id")\n\x1b\x41\x64\x64WorkflowTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"+\n\x1dRemoveWorkflowTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t" \n\x1eRemoveWorkflowTemplateResponse"\x82\x02\n\x18WorkflowTemplateMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0f\n\x07process\x18\x04 \x01(\t\x12\x1a\n\x12\x61gent_template_ids\x18\x05 \x03(\t\x12\x19\n\x11task_template_ids\x18\x06 \x03(\t\x12!\n\x19manager_agent_template_id\x18\x07 \x01(\t\x12\x1b\n\x13use_default_manager\x18\x08 \x01(\x08\x12\x19\n\x11is_conversational\x18\t \x01(\x08\x12\x14\n\x0cpre_packaged\x18\n \x01(\x08"+\n\x1d\x45xportWorkflowTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"3\n\x1e\x45xportWorkflowTemplateResponse\x12\x11\n\tfile_path\x18\x01 \x01(\t"2\n\x1dImportWorkflowTemplateRequest\x12\x11\n\tfile_path\x18\x01 \x01(\t",\n\x1eImportWorkflowTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"V\n\x18ListTaskTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"W\n\x19ListTaskTemplatesResponse\x12:\n\x0etask_templates\x18\x01 \x03(\x0b\x32".agent_studio.TaskTemplateMetadata"$\n\x16GetTaskTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"T\n\x17GetTaskTemplateResponse\x12\x39\n\rtask_template\x18\x01 \x01(\x0b\x32".agent_studio.TaskTemplateMetadata"\xb4\x01\n\x16\x41\x64\x64TaskTemplateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x03 \x01(\t\x12"\n\x1a\x61ssigned_agent_template_id\x18\x04 \x01(\t\x12!\n\x14workflow_template_id\x18\x05 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"%\n\x17\x41\x64\x64TaskTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"\'\n\x19RemoveTaskTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"\x1c\n\x1aRemoveTaskTemplateResponse"\xbe\x01\n\x14TaskTemplateMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x04 \x01(\t\x12"\n\x1a\x61ssigned_agent_template_id\x18\x05 \x01(\t\x12!\n\x14workflow_template_id\x18\x06 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"!\n\x1f\x43heckStudioUpgradeStatusRequest"Q\n CheckStudioUpgradeStatusResponse\x12\x15\n\rlocal_version\x18\x01 \x01(\t\x12\x16\n\x0enewest_version\x18\x02 \x01(\t"\x16\n\x14UpgradeStudioRequest"\x17\n\x15UpgradeStudioResponse"\x14\n\x12HealthCheckRequest"&\n\x13HealthCheckResponse\x12\x0f\n\x07message\x18\x01 \x01(\t"\x14\n\x12\x43mlApiCheckRequest"&\n\x13\x43mlApiCheckResponse\x12\x0f\n\x07message\x18\x01 \x01(\t"\x15\n\x13RotateCmlApiRequest"\'\n\x14RotateCmlApiResponse\x12\x0f\n\x07message\x18\x01 \x01(\t"\xb1\x02\n\x17TestToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t\x12J\n\x0buser_params\x18\x02 \x03(\x0b\x32\x35.agent_studio.TestToolInstanceRequest.UserParamsEntry\x12J\n\x0btool_params\x18\x03 \x03(\x0b\x32\x35.agent_studio.TestToolInstanceRequest.ToolParamsEntry\x1a\x31\n\x0fUserParamsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x31\n\x0fToolParamsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01",\n\x18TestToolInstanceResponse\x12\x10\n\x08trace_id\x18\x01 \x01(\t2\xcc\x38\n\x0b\x41gentStudio\x12Q\n\nListModels\x12\x1f.agent_studio.ListModelsRequest\x1a .agent_studio.ListModelsResponse"\x00\x12K\n\x08GetModel\x12\x1d.agent_studio.GetModelRequest\x1a\x1e.agent_studio.GetModelResponse"\x00\x12K\n\x08\x41\x64\x64Model\x12\x1d.agent_studio.AddModelRequest\x1a\x1e.agent_studio.AddModelResponse"\x00\x12T\n\x0bRemoveModel\x12 .agent_studio.RemoveModelRequest\x1a!.agent_studio.RemoveModelResponse"\x00\x12T\n\x0bUpdateModel\x12 .agent_studio.UpdateModelRequest\x1a!.agent_studio.UpdateModelResponse"\x00\x12N\n\tTestModel\x12\x1e.agent_studio.TestModelRequest\x1a\x1f.agent_studio.TestModelResponse"\x00\x12r\n\x15SetStudioDefaultModel\x12*.agent_studio.SetStudioDefaultModelRequest\x1a+.agent_studio.SetStudioDefaultModelResponse"\x00\x12r\n\x15GetStudioDefaultModel\x12*.agent_studio.GetStudioDefaultModelRequest\x1a+.agent_studio.GetStudioDefaultModelResponse"\x00\x12\x66\n\x11ListToolTemplates\x12&.agent_studio.ListToolTemplatesRequest\x1a\'.agent_studio.ListToolTemplatesResponse"\x00\x12`\n\x0fGetToolTemplate\x12$.agent_studio.GetToolTemplateRequest\x1a%.agent_studio.GetToolTemplateResponse"\x00\x12`\n\x0f\x41\x64\x64ToolTemplate\x12$.agent_studio.AddToolTemplateRequest\x1a%.agent_studio.AddToolTemplateResponse"\x00\x12i\n\x12UpdateToolTemplate\x12\'.agent_studio.UpdateToolTemplateRequest\x1a(.agent_studio.UpdateToolTemplateResponse"\x00\x12i\n\x12RemoveToolTemplate\x12\'.agent_studio.RemoveToolTemplateRequest\x1a(.agent_studio.RemoveToolTemplateResponse"\x00\x12\x63\n\x10ListMcpTemplates\x12%.agent_studio.ListMcpTemplatesRequest\x1a&.agent_studio.ListMcpTemplatesResponse"\x00\x12]\n\x0eGetMcpTemplate\x12#.agent_studio.GetMcpTemplateRequest\x1a$.agent_studio.GetMcpTemplateResponse"\x00\x12]\n\x0e\x41\x64\x64McpTemplate\x12#.agent_studio.AddMcpTemplateRequest\x1a$.agent_studio.AddMcpTemplateResponse"\x00\x12\x66\n\x11UpdateMcpTemplate\x12&.agent_studio.UpdateMcpTemplateRequest\x1a\'.agent_studio.UpdateMcpTemplateResponse"\x00\x12\x66\n\x11RemoveMcpTemplate\x12&.agent_studio.RemoveMcpTemplateRequest\x1a\'.agent_studio.RemoveMcpTemplateResponse"\x00\x12\x63\n\x10ListMcpInstances\x12%.agent_studio.ListMcpInstancesRequest\x1a&.agent_studio.ListMcpInstancesResponse"\x00\x12]\n\x0eGetMcpInstance\x12#.agent_studio.GetMcpInstanceRequest\x1a$.agent_studio.GetMcpInstanceResponse"\x00\x12\x66\n\x11\x43reateMcpInstance\x12&.agent_studio.CreateMcpInstanceRequest\x1a\'.agent_studio.CreateMcpInstanceResponse"\x00\x12\x66\n\x11UpdateMcpInstance\x12&.agent_studio.UpdateMcpInstanceRequest\x1a\'.agent_studio.UpdateMcpInstanceResponse"\x00\x12\x66\n\x11RemoveMcpInstance\x12&.agent_studio.RemoveMcpInstanceRequest\x1a\'.agent_studio.RemoveMcpInstanceResponse"\x00\x12\x66\n\x11ListToolInstances\x12&.agent_studio.ListToolInstancesRequest\x1a\'.agent_studio.ListToolInstancesResponse"\x00\x12`\n\x0fGetToolInstance\x12$.agent_studio.GetToolInstanceRequest\x1a%.agent_studio.GetToolInstanceResponse"\x00\x12i\n\x12\x43reateToolInstance\x12\'.agent_studio.CreateToolInstanceRequest\x1a(.agent_studio.CreateToolInstanceResponse"\x00\x12i\n\x12UpdateToolInstance\x12\'.agent_studio.UpdateToolInstanceRequest\x1a(.agent_studio.UpdateToolInstanceResponse"\x00\x12i\n\x12RemoveToolInstance\x12\'.agent_studio.RemoveToolInstanceRequest\x1a(.agent_studio.RemoveToolInstanceResponse"\x00\x12\x63\n\x10TestToolInstance\x12%.agent_studio.TestToolInstanceRequest\x1a&.agent_studio.TestToolInstanceResponse"\x00\x12Q\n\nListAgents\x12\x1f.agent_studio.ListAgentsRequest\x1a .agent_studio.ListAgentsResponse"\x00\x12K\n\x08GetAgent\x12\x1d.agent_studio.GetAgentRequest\x1a\x1e.agent_studio.GetAgentResponse"\x00\x12K\n\x08\x41\x64\x64\x41gent\x12\x1d.agent_studio.AddAgentRequest\x1a\x1e.agent_studio.AddAgentResponse"\x00\x12T\n\x0bUpdateAgent\x12 .agent_studio.UpdateAgentRequest\x1a!.agent_studio.UpdateAgentResponse"\x00\x12T\n\x0bRemoveAgent\x12 .agent_studio.RemoveAgentRequest\x1a!.agent_studio.RemoveAgentResponse"\x00\x12N\n\tTestAgent\x12\x1e.agent_studio.TestAgentRequest\x1a\x1f.agent_studio.TestAgentResponse"\x00\x12H\n\x07\x41\x64\x64Task\x12\x1c.agent_studio.AddTaskRequest\x1a\x1d.agent_studio.AddTaskResponse"\x00\x12N\n\tListTasks\x12\x1e.agent_studio.ListTasksRequest\x1a\x1f.agent_studio.ListTasksResponse"\x00\x12H\n\x07GetTask\x12\x1c.agent_studio.GetTaskRequest\x1a\x1d.agent_studio.GetTaskResponse"\x00\x12Q\n\nUpdateTask\x12\x1f.agent_studio.UpdateTaskRequest\x1a .agent_studio.UpdateTaskResponse"\x00\x12Q\n\nRemoveTask\x12\x1f.agent_studio.RemoveTaskRequest\x1a .agent_studio.RemoveTaskResponse"\x00\x12Z\n\rListWorkflows\x12".agent_studio.ListWorkflowsRequest\x1a#.agent_studio.ListWorkflowsResponse"\x00\x12T\n\x0bGetWorkflow\x12 .agent_studio.GetWorkflowRequest\x1a!.agent_studio.GetWorkflowResponse"\x00\x12T\n\x0b\x41\x64\x64Workflow\x12 .agent_studio.AddWorkflowRequest\x1a!.agent_studio.AddWorkflowResponse"\x00\x12]\n\x0eUpdateWorkflow\x12#.agent_studio.UpdateWorkflowRequest\x1a$.agent_studio.UpdateWorkflowResponse"\x00\x12W\n\x0cTestWorkflow\x12!.agent_studio.TestWorkflowRequest\x1a".agent_studio.TestWorkflowResponse"\x00\x12]\n\x0eRemoveWorkflow\x12#.agent_studio.RemoveWorkflowRequest\x1a$.agent_studio.RemoveWorkflowResponse"\x00\x12]\n\x0e\x44\x65ployWorkflow\x12#.agent_studio.DeployWorkflowRequest\x1a$.agent_studio.DeployWorkflowResponse"\x00\x12\x63\n\x10UndeployWorkflow\x12%.agent_studio.UndeployWorkflowRequest\x1a&.agent_studio.UndeployWorkflowResponse"\x00\x12r\n\x15ListDeployedWorkflows\x12*.agent_studio.ListDeployedWorkflowsRequest\x1a+.agent_studio.ListDeployedWorkflowsResponse"\x00\x12T\n\x13TemporaryFileUpload\x12\x17.agent_studio.FileChunk\x1a .agent_studio.FileUploadResponse"\x00(\x01\x12{\n\x1fNonStreamingTemporaryFileUpload\x12\x34.agent_studio.NonStreamingTemporaryFileUploadRequest\x1a .agent_studio.FileUploadResponse"\x00\x12`\n\x15\x44ownloadTemporaryFile\x12*.agent_studio.DownloadTemporaryFileRequest\x1a\x17.agent_studio.FileChunk"\x00\x30\x01\x12W\n\x0cGetAssetData\x12!.agent_studio.GetAssetDataRequest\x1a".agent_studio.GetAssetDataResponse"\x00\x12x\n\x17GetParentProjectDetails\x12,.agent_studio.GetParentProjectDetailsRequest\x1a-.agent_studio.GetParentProjectDetailsResponse"\x00\x12{\n\x18\x43heckStudioUpgradeStatus\x12-.agent_studio.CheckStudioUpgradeStatusRequest\x1a..agent_studio.CheckStudioUpgradeStatusResponse"\x00\x12Z\n\rUpgradeStudio\x12".agent_studio.UpgradeStudioRequest\x1a#.agent_studio.UpgradeStudioResponse"\x00\x12T\n\x0bHealthCheck\x12 .agent_studio.HealthCheckRequest\x1a!.agent_studio.HealthCheckResponse"\x00\x12T\n\x0b\x43mlApiCheck\x12 .agent_studio.CmlApiCheckRequest\x1a!.agent_studio.CmlApiCheckResponse"\x00\x12W\n\x0cRotateCmlApi\x12!.agent_studio.RotateCmlApiRequest\x1a".agent_studio.RotateCmlApiResponse"\x00\x12i\n\x12ListAgentTemplates\x12\'.agent_studio.ListAgentTemplatesRequest\x1a(.agent_studio.ListAgentTemplatesResponse"\x00\x12\x63\n\x10GetAgentTemplate\x12%.agent_studio.GetAgentTemplateRequest\x1a&.agent_studio.GetAgentTemplateResponse"\x00\x12\x63\n\x10\x41\x64\x64\x41gentTemplate\x12%.agent_studio.AddAgentTemplateRequest\x1a&.agent_studio.AddAgentTemplateResponse"\x00\x12l\n\x13UpdateAgentTemplate\x12(.agent_studio.UpdateAgentTemplateRequest\x1a).agent_studio.UpdateAgentTemplateResponse"\x00\x12l\n\x13RemoveAgentTemplate\x12(.agent_studio.RemoveAgentTemplateRequest\x1a).agent_studio.RemoveAgentTemplateResponse"\x00\x12r\n\x15ListWorkflowTemplates\x12*.agent_studio.ListWorkflowTemplatesRequest\x1a+.agent_studio.ListWorkflowTemplatesResponse"\x00\x12l\n\x13GetWorkflowTemplate\x12(.agent_studio.GetWorkflowTemplateRequest\x1a).agent_studio.GetWorkflowTemplateResponse"\x00\x12l\n\x13\x41\x64\x64WorkflowTemplate\x12(.agent_studio.AddWorkflowTemplateRequest\x1a).agent_studio.AddWorkflowTemplateResponse"\x00\x12u\n\x16RemoveWorkflowTemplate\x12+.agent_studio.RemoveWorkflowTemplateRequest\x1a,.agent_studio.RemoveWorkflowTemplateResponse"\x00\x12u\n\x16\x45xportWorkflowTemplate\x12+.agent_studio.ExportWorkflowTemplateRequest\x1a,.agent_studio.ExportWorkflowTemplateResponse"\x00\x12u\n\x16ImportWorkflowTemplate\x12+.agent_studio.ImportWorkflowTemplateRequest\x1a,.agent_studio.ImportWorkflowTemplateResponse"\x00\x12\x66\n\x11ListTaskTemplates\x12&.agent_studio.ListTaskTemplatesRequest\x1a\'.agent_studio.ListTaskTemplatesResponse"\x00\x12`\n\x0fGetTaskTemplate\x12$.agent_studio.GetTaskTemplateRequest\x1a%.agent_studio.GetTaskTemplateResponse"\x00\x12`\n\x0f\x41\x64\x64TaskTemplate\x12$.agent_studio.AddTaskTemplateRequest\x1a%.agent_studio.AddTaskTemplateResponse"\x00\x12i\n\x12RemoveTaskTemplate\x12\'.agent_studio.RemoveTaskTemplateRequest\x1a(.agent_studio.RemoveTaskTemplateResponse"\x00\x62\x06proto3'
+    b'\n\x1fstudio/proto/agent_studio.proto\x12\x0c\x61gent_studio"\x86\x01\n\x05Model\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x12\n\nmodel_name\x18\x02 \x01(\t\x12\x16\n\x0eprovider_model\x18\x03 \x01(\t\x12\x12\n\nmodel_type\x18\x04 \x01(\t\x12\x10\n\x08\x61pi_base\x18\x05 \x01(\t\x12\x19\n\x11is_studio_default\x18\x06 \x01(\x08"\x13\n\x11ListModelsRequest"@\n\x12ListModelsResponse\x12*\n\rmodel_details\x18\x01 \x03(\x0b\x32\x13.agent_studio.Model"#\n\x0fGetModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t">\n\x10GetModelResponse\x12*\n\rmodel_details\x18\x01 \x01(\x0b\x32\x13.agent_studio.Model"t\n\x0f\x41\x64\x64ModelRequest\x12\x12\n\nmodel_name\x18\x01 \x01(\t\x12\x16\n\x0eprovider_model\x18\x02 \x01(\t\x12\x12\n\nmodel_type\x18\x03 \x01(\t\x12\x10\n\x08\x61pi_base\x18\x04 \x01(\t\x12\x0f\n\x07\x61pi_key\x18\x05 \x01(\t"$\n\x10\x41\x64\x64ModelResponse\x12\x10\n\x08model_id\x18\x01 \x01(\t"&\n\x12RemoveModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t"\x15\n\x13RemoveModelResponse"u\n\x12UpdateModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x12\n\nmodel_name\x18\x02 \x01(\t\x12\x16\n\x0eprovider_model\x18\x03 \x01(\t\x12\x10\n\x08\x61pi_base\x18\x04 \x01(\t\x12\x0f\n\x07\x61pi_key\x18\x05 \x01(\t"\'\n\x13UpdateModelResponse\x12\x10\n\x08model_id\x18\x01 \x01(\t"\x93\x01\n\x10TestModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x17\n\x0f\x63ompletion_role\x18\x02 \x01(\t\x12\x1a\n\x12\x63ompletion_content\x18\x03 \x01(\t\x12\x13\n\x0btemperature\x18\x04 \x01(\x02\x12\x12\n\nmax_tokens\x18\x05 \x01(\x05\x12\x0f\n\x07timeout\x18\x06 \x01(\x05"%\n\x11TestModelResponse\x12\x10\n\x08response\x18\x01 \x01(\t"0\n\x1cSetStudioDefaultModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t"\x1f\n\x1dSetStudioDefaultModelResponse"\x1e\n\x1cGetStudioDefaultModelRequest"p\n\x1dGetStudioDefaultModelResponse\x12#\n\x1bis_default_model_configured\x18\x01 \x01(\x08\x12*\n\rmodel_details\x18\x02 \x01(\x0b\x32\x13.agent_studio.Model"V\n\x18ListToolTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"J\n\x19ListToolTemplatesResponse\x12-\n\ttemplates\x18\x01 \x03(\x0b\x32\x1a.agent_studio.ToolTemplate"2\n\x16GetToolTemplateRequest\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"G\n\x17GetToolTemplateResponse\x12,\n\x08template\x18\x01 \x01(\x0b\x32\x1a.agent_studio.ToolTemplate"\x8d\x01\n\x16\x41\x64\x64ToolTemplateRequest\x12\x1a\n\x12tool_template_name\x18\x01 \x01(\t\x12\x1b\n\x13tmp_tool_image_path\x18\x02 \x01(\t\x12!\n\x14workflow_template_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"3\n\x17\x41\x64\x64ToolTemplateResponse\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"n\n\x19UpdateToolTemplateRequest\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t\x12\x1a\n\x12tool_template_name\x18\x02 \x01(\t\x12\x1b\n\x13tmp_tool_image_path\x18\x03 \x01(\t"6\n\x1aUpdateToolTemplateResponse\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"5\n\x19RemoveToolTemplateRequest\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"\x1c\n\x1aRemoveToolTemplateResponse"/\n\x18ListToolInstancesRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"O\n\x19ListToolInstancesResponse\x12\x32\n\x0etool_instances\x18\x01 \x03(\x0b\x32\x1a.agent_studio.ToolInstance"2\n\x16GetToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t"L\n\x17GetToolInstanceResponse\x12\x31\n\rtool_instance\x18\x01 \x01(\x0b\x32\x1a.agent_studio.ToolInstance"r\n\x19\x43reateToolInstanceRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x10tool_template_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x13\n\x11_tool_template_id"R\n\x1a\x43reateToolInstanceResponse\x12\x1a\n\x12tool_instance_name\x18\x01 \x01(\t\x12\x18\n\x10tool_instance_id\x18\x02 \x01(\t"u\n\x19UpdateToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x1b\n\x13tmp_tool_image_path\x18\x04 \x01(\t"6\n\x1aUpdateToolInstanceResponse\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t"5\n\x19RemoveToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t"\x1c\n\x1aRemoveToolInstanceResponse"\xb6\x02\n\x0cToolTemplate\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0bpython_code\x18\x03 \x01(\t\x12\x1b\n\x13python_requirements\x18\x04 \x01(\t\x12\x1a\n\x12source_folder_path\x18\x05 \x01(\t\x12\x15\n\rtool_metadata\x18\x06 \x01(\t\x12\x10\n\x08is_valid\x18\x07 \x01(\x08\x12\x11\n\tpre_built\x18\x08 \x01(\x08\x12\x16\n\x0etool_image_uri\x18\t \x01(\t\x12\x18\n\x10tool_description\x18\n \x01(\t\x12!\n\x14workflow_template_id\x18\x0b \x01(\tH\x00\x88\x01\x01\x12\x14\n\x0cis_venv_tool\x18\x0c \x01(\x08\x42\x17\n\x15_workflow_template_id"\x8c\x02\n\x0cToolInstance\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0bworkflow_id\x18\x03 \x01(\t\x12\x13\n\x0bpython_code\x18\x04 \x01(\t\x12\x1b\n\x13python_requirements\x18\x05 \x01(\t\x12\x1a\n\x12source_folder_path\x18\x06 \x01(\t\x12\x15\n\rtool_metadata\x18\x07 \x01(\t\x12\x10\n\x08is_valid\x18\x08 \x01(\x08\x12\x16\n\x0etool_image_uri\x18\t \x01(\t\x12\x18\n\x10tool_description\x18\n \x01(\t\x12\x14\n\x0cis_venv_tool\x18\x0b \x01(\x08\x12\x0e\n\x06status\x18\x0c \x01(\t"\xac\x01\n\x15\x41\x64\x64McpTemplateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x0c\n\x04\x61rgs\x18\x03 \x03(\t\x12\x11\n\tenv_names\x18\x04 \x03(\t\x12\x1a\n\x12tmp_mcp_image_path\x18\x05 \x01(\t\x12!\n\x14workflow_template_id\x18\x06 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"1\n\x16\x41\x64\x64McpTemplateResponse\x12\x17\n\x0fmcp_template_id\x18\x01 \x01(\t"\x8c\x01\n\x18UpdateMcpTemplateRequest\x12\x17\n\x0fmcp_template_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x0c\n\x04\x61rgs\x18\x04 \x03(\t\x12\x11\n\tenv_names\x18\x05 \x03(\t\x12\x1a\n\x12tmp_mcp_image_path\x18\x06 \x01(\t"4\n\x19UpdateMcpTemplateResponse\x12\x17\n\x0fmcp_template_id\x18\x01 \x01(\t"3\n\x18RemoveMcpTemplateRequest\x12\x17\n\x0fmcp_template_id\x18\x01 \x01(\t"\x1b\n\x19RemoveMcpTemplateResponse"\xc4\x01\n\x0bMCPTemplate\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x0c\n\x04\x61rgs\x18\x04 \x03(\t\x12\x11\n\tenv_names\x18\x05 \x03(\t\x12\r\n\x05tools\x18\x06 \x01(\t\x12\x11\n\timage_uri\x18\x07 \x01(\t\x12\x0e\n\x06status\x18\x08 \x01(\t\x12!\n\x14workflow_template_id\x18\t \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"U\n\x17ListMcpTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"L\n\x18ListMcpTemplatesResponse\x12\x30\n\rmcp_templates\x18\x01 \x03(\x0b\x32\x19.agent_studio.MCPTemplate"0\n\x15GetMcpTemplateRequest\x12\x17\n\x0fmcp_template_id\x18\x01 \x01(\t"I\n\x16GetMcpTemplateResponse\x12/\n\x0cmcp_template\x18\x01 \x01(\x0b\x32\x19.agent_studio.MCPTemplate"\xb6\x01\n\x0bMcpInstance\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x0c\n\x04\x61rgs\x18\x04 \x03(\t\x12\x11\n\tenv_names\x18\x05 \x03(\t\x12\r\n\x05tools\x18\x06 \x01(\t\x12\x11\n\timage_uri\x18\x07 \x01(\t\x12\x0e\n\x06status\x18\x08 \x01(\t\x12\x17\n\x0f\x61\x63tivated_tools\x18\t \x03(\t\x12\x13\n\x0bworkflow_id\x18\n \x01(\t"C\n\x17ListMcpInstancesRequest\x12\x18\n\x0bworkflow_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_workflow_id"L\n\x18ListMcpInstancesResponse\x12\x30\n\rmcp_instances\x18\x01 \x03(\x0b\x32\x19.agent_studio.McpInstance"0\n\x15GetMcpInstanceRequest\x12\x17\n\x0fmcp_instance_id\x18\x01 \x01(\t"I\n\x16GetMcpInstanceResponse\x12/\n\x0cmcp_instance\x18\x01 \x01(\x0b\x32\x19.agent_studio.McpInstance"o\n\x18\x43reateMcpInstanceRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x17\n\x0fmcp_template_id\x18\x03 \x01(\t\x12\x17\n\x0f\x61\x63tivated_tools\x18\x04 \x03(\t"O\n\x19\x43reateMcpInstanceResponse\x12\x19\n\x11mcp_instance_name\x18\x01 \x01(\t\x12\x17\n\x0fmcp_instance_id\x18\x02 \x01(\t"v\n\x18UpdateMcpInstanceRequest\x12\x17\n\x0fmcp_instance_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1a\n\x12tmp_mcp_image_path\x18\x03 \x01(\t\x12\x17\n\x0f\x61\x63tivated_tools\x18\x04 \x03(\t"4\n\x19UpdateMcpInstanceResponse\x12\x17\n\x0fmcp_instance_id\x18\x01 \x01(\t"3\n\x18RemoveMcpInstanceRequest\x12\x17\n\x0fmcp_instance_id\x18\x01 \x01(\t"\x1b\n\x19RemoveMcpInstanceResponse"(\n\x11ListAgentsRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"A\n\x12ListAgentsResponse\x12+\n\x06\x61gents\x18\x01 \x03(\x0b\x32\x1b.agent_studio.AgentMetadata"#\n\x0fGetAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t">\n\x10GetAgentResponse\x12*\n\x05\x61gent\x18\x01 \x01(\x0b\x32\x1b.agent_studio.AgentMetadata"\xa5\x02\n\x0f\x41\x64\x64\x41gentRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x1d\n\x15llm_provider_model_id\x18\x02 \x01(\t\x12\x10\n\x08tools_id\x18\x03 \x03(\t\x12\x18\n\x10mcp_instance_ids\x18\x04 \x03(\t\x12\x41\n\x16\x63rew_ai_agent_metadata\x18\x05 \x01(\x0b\x32!.agent_studio.CrewAIAgentMetadata\x12\x18\n\x0btemplate_id\x18\x06 \x01(\tH\x00\x88\x01\x01\x12\x13\n\x0bworkflow_id\x18\x07 \x01(\t\x12\x1c\n\x14tmp_agent_image_path\x18\x08 \x01(\t\x12\x19\n\x11tool_template_ids\x18\t \x03(\tB\x0e\n\x0c_template_id"$\n\x10\x41\x64\x64\x41gentResponse\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t"\xfb\x01\n\x12UpdateAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x15llm_provider_model_id\x18\x03 \x01(\t\x12\x10\n\x08tools_id\x18\x04 \x03(\t\x12\x18\n\x10mcp_instance_ids\x18\x05 \x03(\t\x12\x41\n\x16\x63rew_ai_agent_metadata\x18\x06 \x01(\x0b\x32!.agent_studio.CrewAIAgentMetadata\x12\x1c\n\x14tmp_agent_image_path\x18\x07 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x08 \x03(\t"\x15\n\x13UpdateAgentResponse"&\n\x12RemoveAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t"\x15\n\x13RemoveAgentResponse"\xf7\x01\n\rAgentMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x15llm_provider_model_id\x18\x03 \x01(\t\x12\x10\n\x08tools_id\x18\x04 \x03(\t\x12\x18\n\x10mcp_instance_ids\x18\x05 \x03(\t\x12\x41\n\x16\x63rew_ai_agent_metadata\x18\x06 \x01(\x0b\x32!.agent_studio.CrewAIAgentMetadata\x12\x17\n\x0f\x61gent_image_uri\x18\x07 \x01(\t\x12\x10\n\x08is_valid\x18\x08 \x01(\x08\x12\x13\n\x0bworkflow_id\x18\t \x01(\t"\xa5\x01\n\x13\x43rewAIAgentMetadata\x12\x0c\n\x04role\x18\x01 \x01(\t\x12\x11\n\tbackstory\x18\x02 \x01(\t\x12\x0c\n\x04goal\x18\x03 \x01(\t\x12\x18\n\x10\x61llow_delegation\x18\x04 \x01(\x08\x12\x0f\n\x07verbose\x18\x05 \x01(\x08\x12\r\n\x05\x63\x61\x63he\x18\x06 \x01(\x08\x12\x13\n\x0btemperature\x18\x07 \x01(\x02\x12\x10\n\x08max_iter\x18\x08 \x01(\x05"I\n\x10TestAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t\x12\x12\n\nuser_input\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontext\x18\x03 \x01(\t"%\n\x11TestAgentResponse\x12\x10\n\x08response\x18\x01 \x01(\t"\xb8\x02\n\x12\x41\x64\x64WorkflowRequest\x12\x11\n\x04name\x18\x01 \x01(\tH\x00\x88\x01\x01\x12L\n\x19\x63rew_ai_workflow_metadata\x18\x02 \x01(\x0b\x32$.agent_studio.CrewAIWorkflowMetadataH\x01\x88\x01\x01\x12\x1e\n\x11is_conversational\x18\x03 \x01(\x08H\x02\x88\x01\x01\x12!\n\x14workflow_template_id\x18\x04 \x01(\tH\x03\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x05 \x01(\tH\x04\x88\x01\x01\x42\x07\n\x05_nameB\x1c\n\x1a_crew_ai_workflow_metadataB\x14\n\x12_is_conversationalB\x17\n\x15_workflow_template_idB\x0e\n\x0c_description"*\n\x13\x41\x64\x64WorkflowResponse\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"\x16\n\x14ListWorkflowsRequest"B\n\x15ListWorkflowsResponse\x12)\n\tworkflows\x18\x01 \x03(\x0b\x32\x16.agent_studio.Workflow")\n\x12GetWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"?\n\x13GetWorkflowResponse\x12(\n\x08workflow\x18\x01 \x01(\x0b\x32\x16.agent_studio.Workflow"\xb3\x01\n\x15UpdateWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12G\n\x19\x63rew_ai_workflow_metadata\x18\x03 \x01(\x0b\x32$.agent_studio.CrewAIWorkflowMetadata\x12\x19\n\x11is_conversational\x18\x04 \x01(\x08\x12\x13\n\x0b\x64\x65scription\x18\x05 \x01(\t"\x18\n\x16UpdateWorkflowResponse"\xa5\x01\n\x1eTestWorkflowToolUserParameters\x12P\n\nparameters\x18\x01 \x03(\x0b\x32<.agent_studio.TestWorkflowToolUserParameters.ParametersEntry\x1a\x31\n\x0fParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01"\x9d\x01\n\x1eTestWorkflowMCPInstanceEnvVars\x12K\n\x08\x65nv_vars\x18\x01 \x03(\x0b\x32\x39.agent_studio.TestWorkflowMCPInstanceEnvVars.EnvVarsEntry\x1a.\n\x0c\x45nvVarsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01"\xca\x04\n\x13TestWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12=\n\x06inputs\x18\x02 \x03(\x0b\x32-.agent_studio.TestWorkflowRequest.InputsEntry\x12W\n\x14tool_user_parameters\x18\x03 \x03(\x0b\x32\x39.agent_studio.TestWorkflowRequest.ToolUserParametersEntry\x12X\n\x15mcp_instance_env_vars\x18\x04 \x03(\x0b\x32\x39.agent_studio.TestWorkflowRequest.McpInstanceEnvVarsEntry\x12\x19\n\x11generation_config\x18\x05 \x01(\t\x12\x10\n\x08priority\x18\x06 \x01(\x05\x1a-\n\x0bInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1ag\n\x17ToolUserParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.agent_studio.TestWorkflowToolUserParameters:\x02\x38\x01\x1ag\n\x17McpInstanceEnvVarsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.agent_studio.TestWorkflowMCPInstanceEnvVars:\x02\x38\x01"Q\n\x14TestWorkflowResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x10\n\x08trace_id\x18\x02 \x01(\t\x12\x16\n\x0equeue_position\x18\x03 \x01(\x05"-\n\x19\x43\x61ncelWorkflowTestRequest\x12\x10\n\x08trace_id\x18\x01 \x01(\t"/\n\x1a\x43\x61ncelWorkflowTestResponse\x12\x11\n\tcancelled\x18\x01 \x01(\x08"\xc3\x05\n\x15\x44\x65ployWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12]\n\x16\x65nv_variable_overrides\x18\x02 \x03(\x0b\x32=.agent_studio.DeployWorkflowRequest.EnvVariableOverridesEntry\x12Y\n\x14tool_user_parameters\x18\x03 \x03(\x0b\x32;.agent_studio.DeployWorkflowRequest.ToolUserParametersEntry\x12Z\n\x15mcp_instance_env_vars\x18\x04 \x03(\x0b\x32;.agent_studio.DeployWorkflowRequest.McpInstanceEnvVarsEntry\x12\x1d\n\x15\x62ypass_authentication\x18\x05 \x01(\x08\x12\x19\n\x11generation_config\x18\x06 \x01(\t\x12\x1f\n\x12\x64\x65ployment_payload\x18\x07 \x01(\tH\x00\x88\x01\x01\x1a;\n\x19\x45nvVariableOverridesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1ag\n\x17ToolUserParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.agent_studio.TestWorkflowToolUserParameters:\x02\x38\x01\x1ag\n\x17McpInstanceEnvVarsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.agent_studio.TestWorkflowMCPInstanceEnvVars:\x02\x38\x01\x42\x15\n\x13_deployment_payload"u\n\x16\x44\x65ployWorkflowResponse\x12\x1e\n\x16\x64\x65ployed_workflow_name\x18\x01 \x01(\t\x12\x1c\n\x14\x64\x65ployed_workflow_id\x18\x02 \x01(\t\x12\x1d\n\x15\x63ml_deployed_model_id\x18\x03 \x01(\t"7\n\x17UndeployWorkflowRequest\x12\x1c\n\x14\x64\x65ployed_workflow_id\x18\x01 \x01(\t"\x1a\n\x18UndeployWorkflowResponse"\x1e\n\x1cListDeployedWorkflowsRequest"[\n\x1dListDeployedWorkflowsResponse\x12:\n\x12\x64\x65ployed_workflows\x18\x01 \x03(\x0b\x32\x1e.agent_studio.DeployedWorkflow",\n\x15RemoveWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"\x18\n\x16RemoveWorkflowResponse"\xd4\x02\n\x10\x44\x65ployedWorkflow\x12\x1c\n\x14\x64\x65ployed_workflow_id\x18\x01 \x01(\t\x12\x13\n\x0bworkflow_id\x18\x02 \x01(\t\x12\x15\n\rworkflow_name\x18\x03 \x01(\t\x12\x1e\n\x16\x64\x65ployed_workflow_name\x18\x04 \x01(\t\x12\x1d\n\x15\x63ml_deployed_model_id\x18\x05 \x01(\t\x12\x10\n\x08is_stale\x18\x06 \x01(\x08\x12\x17\n\x0f\x61pplication_url\x18\x07 \x01(\t\x12\x1a\n\x12\x61pplication_status\x18\x08 \x01(\t\x12\x1d\n\x15\x61pplication_deep_link\x18\t \x01(\t\x12\x17\n\x0fmodel_deep_link\x18\n \x01(\t\x12 \n\x13\x64\x65ployment_metadata\x18\x0b \x01(\tH\x00\x88\x01\x01\x42\x16\n\x14_deployment_metadata"\x82\x02\n\x08Workflow\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12G\n\x19\x63rew_ai_workflow_metadata\x18\x03 \x01(\x0b\x32$.agent_studio.CrewAIWorkflowMetadata\x12\x10\n\x08is_valid\x18\x04 \x01(\x08\x12\x10\n\x08is_ready\x18\x05 \x01(\x08\x12\x19\n\x11is_conversational\x18\x06 \x01(\x08\x12\x10\n\x08is_draft\x18\x07 \x01(\x08\x12\x13\n\x0b\x64\x65scription\x18\x08 \x01(\t\x12\x16\n\tdirectory\x18\t \x01(\tH\x00\x88\x01\x01\x42\x0c\n\n_directory"\xb4\x01\n\x16\x43rewAIWorkflowMetadata\x12\x10\n\x08\x61gent_id\x18\x01 \x03(\t\x12\x0f\n\x07task_id\x18\x02 \x03(\t\x12\x18\n\x10manager_agent_id\x18\x03 \x01(\t\x12\x0f\n\x07process\x18\x04 \x01(\t\x12*\n\x1dmanager_llm_model_provider_id\x18\x05 \x01(\tH\x00\x88\x01\x01\x42 \n\x1e_manager_llm_model_provider_id"\xa3\x01\n\x0e\x41\x64\x64TaskRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x44\n\x18\x61\x64\x64_crew_ai_task_request\x18\x02 \x01(\x0b\x32".agent_studio.AddCrewAITaskRequest\x12\x13\n\x0bworkflow_id\x18\x03 \x01(\t\x12\x18\n\x0btemplate_id\x18\x04 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_template_id""\n\x0f\x41\x64\x64TaskResponse\x12\x0f\n\x07task_id\x18\x01 \x01(\t"\'\n\x10ListTasksRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"D\n\x11ListTasksResponse\x12/\n\x05tasks\x18\x01 \x03(\x0b\x32 .agent_studio.CrewAITaskMetadata"!\n\x0eGetTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t"A\n\x0fGetTaskResponse\x12.\n\x04task\x18\x01 \x01(\x0b\x32 .agent_studio.CrewAITaskMetadata"l\n\x11UpdateTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x46\n\x17UpdateCrewAITaskRequest\x18\x02 \x01(\x0b\x32%.agent_studio.UpdateCrewAITaskRequest"\x14\n\x12UpdateTaskResponse"$\n\x11RemoveTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t"\x14\n\x12RemoveTaskResponse"\xa5\x01\n\x12\x43rewAITaskMetadata\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x03 \x01(\t\x12\x19\n\x11\x61ssigned_agent_id\x18\x04 \x01(\t\x12\x10\n\x08is_valid\x18\x05 \x01(\x08\x12\x0e\n\x06inputs\x18\x06 \x03(\t\x12\x13\n\x0bworkflow_id\x18\x07 \x01(\t"b\n\x17UpdateCrewAITaskRequest\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x02 \x01(\t\x12\x19\n\x11\x61ssigned_agent_id\x18\x03 \x01(\t"_\n\x14\x41\x64\x64\x43rewAITaskRequest\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x02 \x01(\t\x12\x19\n\x11\x61ssigned_agent_id\x18\x03 \x01(\t"-\n\x13GetAssetDataRequest\x12\x16\n\x0e\x61sset_uri_list\x18\x01 \x03(\t"\xab\x01\n\x14GetAssetDataResponse\x12\x45\n\nasset_data\x18\x01 \x03(\x0b\x32\x31.agent_studio.GetAssetDataResponse.AssetDataEntry\x12\x1a\n\x12unavailable_assets\x18\x02 \x03(\t\x1a\x30\n\x0e\x41ssetDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01"F\n\tFileChunk\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\x12\x15\n\ris_last_chunk\x18\x03 \x01(\x08"Q\n&NonStreamingTemporaryFileUploadRequest\x12\x14\n\x0c\x66ull_content\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t"8\n\x12\x46ileUploadResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x11\n\tfile_path\x18\x02 \x01(\t"1\n\x1c\x44ownloadTemporaryFileRequest\x12\x11\n\tfile_path\x18\x01 \x01(\t" \n\x1eGetParentProjectDetailsRequest"T\n\x1fGetParentProjectDetailsResponse\x12\x14\n\x0cproject_base\x18\x01 \x01(\t\x12\x1b\n\x13studio_subdirectory\x18\x02 \x01(\t"W\n\x19ListAgentTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"Z\n\x1aListAgentTemplatesResponse\x12<\n\x0f\x61gent_templates\x18\x01 \x03(\x0b\x32#.agent_studio.AgentTemplateMetadata"%\n\x17GetAgentTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"W\n\x18GetAgentTemplateResponse\x12;\n\x0e\x61gent_template\x18\x01 \x01(\x0b\x32#.agent_studio.AgentTemplateMetadata"\xc1\x02\n\x17\x41\x64\x64\x41gentTemplateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x03 \x03(\t\x12\x0c\n\x04role\x18\x04 \x01(\t\x12\x11\n\tbackstory\x18\x05 \x01(\t\x12\x0c\n\x04goal\x18\x06 \x01(\t\x12\x18\n\x10\x61llow_delegation\x18\x07 \x01(\x08\x12\x0f\n\x07verbose\x18\x08 \x01(\x08\x12\r\n\x05\x63\x61\x63he\x18\t \x01(\x08\x12\x13\n\x0btemperature\x18\n \x01(\x02\x12\x10\n\x08max_iter\x18\x0b \x01(\x05\x12\x1c\n\x14tmp_agent_image_path\x18\x0c \x01(\t\x12!\n\x14workflow_template_id\x18\r \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"&\n\x18\x41\x64\x64\x41gentTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"\xf4\x03\n\x1aUpdateAgentTemplateRequest\x12\x19\n\x11\x61gent_template_id\x18\x01 \x01(\t\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x19\n\x11tool_template_ids\x18\x04 \x03(\t\x12\x11\n\x04role\x18\x05 \x01(\tH\x02\x88\x01\x01\x12\x16\n\tbackstory\x18\x06 \x01(\tH\x03\x88\x01\x01\x12\x11\n\x04goal\x18\x07 \x01(\tH\x04\x88\x01\x01\x12\x1d\n\x10\x61llow_delegation\x18\x08 \x01(\x08H\x05\x88\x01\x01\x12\x14\n\x07verbose\x18\t \x01(\x08H\x06\x88\x01\x01\x12\x12\n\x05\x63\x61\x63he\x18\n \x01(\x08H\x07\x88\x01\x01\x12\x18\n\x0btemperature\x18\x0b \x01(\x02H\x08\x88\x01\x01\x12\x15\n\x08max_iter\x18\x0c \x01(\x05H\t\x88\x01\x01\x12!\n\x14tmp_agent_image_path\x18\r \x01(\tH\n\x88\x01\x01\x42\x07\n\x05_nameB\x0e\n\x0c_descriptionB\x07\n\x05_roleB\x0c\n\n_backstoryB\x07\n\x05_goalB\x13\n\x11_allow_delegationB\n\n\x08_verboseB\x08\n\x06_cacheB\x0e\n\x0c_temperatureB\x0b\n\t_max_iterB\x17\n\x15_tmp_agent_image_path")\n\x1bUpdateAgentTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"(\n\x1aRemoveAgentTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"\x1d\n\x1bRemoveAgentTemplateResponse"\xf6\x02\n\x15\x41gentTemplateMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x04 \x03(\t\x12\x18\n\x10mcp_template_ids\x18\x05 \x03(\t\x12\x0c\n\x04role\x18\x06 \x01(\t\x12\x11\n\tbackstory\x18\x07 \x01(\t\x12\x0c\n\x04goal\x18\x08 \x01(\t\x12\x18\n\x10\x61llow_delegation\x18\t \x01(\x08\x12\x0f\n\x07verbose\x18\n \x01(\x08\x12\r\n\x05\x63\x61\x63he\x18\x0b \x01(\x08\x12\x13\n\x0btemperature\x18\x0c \x01(\x02\x12\x10\n\x08max_iter\x18\r \x01(\x05\x12\x17\n\x0f\x61gent_image_uri\x18\x0e \x01(\t\x12!\n\x14workflow_template_id\x18\x0f \x01(\tH\x00\x88\x01\x01\x12\x14\n\x0cpre_packaged\x18\x10 \x01(\x08\x42\x17\n\x15_workflow_template_id"\x1e\n\x1cListWorkflowTemplatesRequest"c\n\x1dListWorkflowTemplatesResponse\x12\x42\n\x12workflow_templates\x18\x01 \x03(\x0b\x32&.agent_studio.WorkflowTemplateMetadata"(\n\x1aGetWorkflowTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"`\n\x1bGetWorkflowTemplateResponse\x12\x41\n\x11workflow_template\x18\x01 \x01(\x0b\x32&.agent_studio.WorkflowTemplateMetadata"\x9b\x03\n\x1a\x41\x64\x64WorkflowTemplateRequest\x12\x11\n\x04name\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07process\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x1a\n\x12\x61gent_template_ids\x18\x04 \x03(\t\x12\x19\n\x11task_template_ids\x18\x05 \x03(\t\x12&\n\x19manager_agent_template_id\x18\x06 \x01(\tH\x03\x88\x01\x01\x12 \n\x13use_default_manager\x18\x07 \x01(\x08H\x04\x88\x01\x01\x12\x1e\n\x11is_conversational\x18\x08 \x01(\x08H\x05\x88\x01\x01\x12\x18\n\x0bworkflow_id\x18\t \x01(\tH\x06\x88\x01\x01\x42\x07\n\x05_nameB\x0e\n\x0c_descriptionB\n\n\x08_processB\x1c\n\x1a_manager_agent_template_idB\x16\n\x14_use_default_managerB\x14\n\x12_is_conversationalB\x0e\n\x0c_workflow_id")\n\x1b\x41\x64\x64WorkflowTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"+\n\x1dRemoveWorkflowTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t" \n\x1eRemoveWorkflowTemplateResponse"\x82\x02\n\x18WorkflowTemplateMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0f\n\x07process\x18\x04 \x01(\t\x12\x1a\n\x12\x61gent_template_ids\x18\x05 \x03(\t\x12\x19\n\x11task_template_ids\x18\x06 \x03(\t\x12!\n\x19manager_agent_template_id\x18\x07 \x01(\t\x12\x1b\n\x13use_default_manager\x18\x08 \x01(\x08\x12\x19\n\x11is_conversational\x18\t \x01(\x08\x12\x14\n\x0cpre_packaged\x18\n \x01(\x08"+\n\x1d\x45xportWorkflowTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"3\n\x1e\x45xportWorkflowTemplateResponse\x12\x11\n\tfile_path\x18\x01 \x01(\t"2\n\x1dImportWorkflowTemplateRequest\x12\x11\n\tfile_path\x18\x01 \x01(\t",\n\x1eImportWorkflowTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"V\n\x18ListTaskTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"W\n\x19ListTaskTemplatesResponse\x12:\n\x0etask_templates\x18\x01 \x03(\x0b\x32".agent_studio.TaskTemplateMetadata"$\n\x16GetTaskTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"T\n\x17GetTaskTemplateResponse\x12\x39\n\rtask_template\x18\x01 \x01(\x0b\x32".agent_studio.TaskTemplateMetadata"\xb4\x01\n\x16\x41\x64\x64TaskTemplateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x03 \x01(\t\x12"\n\x1a\x61ssigned_agent_template_id\x18\x04 \x01(\t\x12!\n\x14workflow_template_id\x18\x05 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"%\n\x17\x41\x64\x64TaskTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"\'\n\x19RemoveTaskTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"\x1c\n\x1aRemoveTaskTemplateResponse"\xbe\x01\n\x14TaskTemplateMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x04 \x01(\t\x12"\n\x1a\x61ssigned_agent_template_id\x18\x05 \x01(\t\x12!\n\x14workflow_template_id\x18\x06 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"!\n\x1f\x43heckStudioUpgradeStatusRequest"Q\n CheckStudioUpgradeStatusResponse\x12\x15\n\rlocal_version\x18\x01 \x01(\t\x12\x16\n\x0enewest_version\x18\x02 \x01(\t"\x16\n\x14UpgradeStudioRequest"\x17\n\x15UpgradeStudioResponse"\x14\n\x12HealthCheckRequest"&\n\x13HealthCheckResponse\x12\x0f\n\x07message\x18\x01 \x01(\t"\x14\n\x12\x43mlApiCheckRequest"&\n\x13\x43mlApiCheckResponse\x12\x0f\n\x07message\x18\x01 \x01(\t"\x15\n\x13RotateCmlApiRequest"\'\n\x14RotateCmlApiResponse\x12\x0f\n\x07message\x18\x01 \x01(\t"\xb1\x02\n\x17TestToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t\x12J\n\x0buser_params\x18\x02 \x03(\x0b\x32\x35.agent_studio.TestToolInstanceRequest.UserParamsEntry\x12J\n\x0btool_params\x18\x03 \x03(\x0b\x32\x35.agent_studio.TestToolInstanceRequest.ToolParamsEntry\x1a\x31\n\x0fUserParamsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x31\n\x0fToolParamsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01",\n\x18TestToolInstanceResponse\x12\x10\n\x08trace_id\x18\x01 \x01(\t2\xb7\x39\n\x0b\x41gentStudio\x12Q\n\nListModels\x12\x1f.agent_studio.ListModelsRequest\x1a .agent_studio.ListModelsResponse"\x00\x12K\n\x08GetModel\x12\x1d.agent_studio.GetModelRequest\x1a\x1e.agent_studio.GetModelResponse"\x00\x12K\n\x08\x41\x64\x64Model\x12\x1d.agent_studio.AddModelRequest\x1a\x1e.agent_studio.AddModelResponse"\x00\x12T\n\x0bRemoveModel\x12 .agent_studio.RemoveModelRequest\x1a!.agent_studio.RemoveModelResponse"\x00\x12T\n\x0bUpdateModel\x12 .agent_studio.UpdateModelRequest\x1a!.agent_studio.UpdateModelResponse"\x00\x12N\n\tTestModel\x12\x1e.agent_studio.TestModelRequest\x1a\x1f.agent_studio.TestModelResponse"\x00\x12r\n\x15SetStudioDefaultModel\x12*.agent_studio.SetStudioDefaultModelRequest\x1a+.agent_studio.SetStudioDefaultModelResponse"\x00\x12r\n\x15GetStudioDefaultModel\x12*.agent_studio.GetStudioDefaultModelRequest\x1a+.agent_studio.GetStudioDefaultModelResponse"\x00\x12\x66\n\x11ListToolTemplates\x12&.agent_studio.ListToolTemplatesRequest\x1a\'.agent_studio.ListToolTemplatesResponse"\x00\x12`\n\x0fGetToolTemplate\x12$.agent_studio.GetToolTemplateRequest\x1a%.agent_studio.GetToolTemplateResponse"\x00\x12`\n\x0f\x41\x64\x64ToolTemplate\x12$.agent_studio.AddToolTemplateRequest\x1a%.agent_studio.AddToolTemplateResponse"\x00\x12i\n\x12UpdateToolTemplate\x12\'.agent_studio.UpdateToolTemplateRequest\x1a(.agent_studio.UpdateToolTemplateResponse"\x00\x12i\n\x12RemoveToolTemplate\x12\'.agent_studio.RemoveToolTemplateRequest\x1a(.agent_studio.RemoveToolTemplateResponse"\x00\x12\x63\n\x10ListMcpTemplates\x12%.agent_studio.ListMcpTemplatesRequest\x1a&.agent_studio.ListMcpTemplatesResponse"\x00\x12]\n\x0eGetMcpTemplate\x12#.agent_studio.GetMcpTemplateRequest\x1a$.agent_studio.GetMcpTemplateResponse"\x00\x12]\n\x0e\x41\x64\x64McpTemplate\x12#.agent_studio.AddMcpTemplateRequest\x1a$.agent_studio.AddMcpTemplateResponse"\x00\x12\x66\n\x11UpdateMcpTemplate\x12&.agent_studio.UpdateMcpTemplateRequest\x1a\'.agent_studio.UpdateMcpTemplateResponse"\x00\x12\x66\n\x11RemoveMcpTemplate\x12&.agent_studio.RemoveMcpTemplateRequest\x1a\'.agent_studio.RemoveMcpTemplateResponse"\x00\x12\x63\n\x10ListMcpInstances\x12%.agent_studio.ListMcpInstancesRequest\x1a&.agent_studio.ListMcpInstancesResponse"\x00\x12]\n\x0eGetMcpInstance\x12#.agent_studio.GetMcpInstanceRequest\x1a$.agent_studio.GetMcpInstanceResponse"\x00\x12\x66\n\x11\x43reateMcpInstance\x12&.agent_studio.CreateMcpInstanceRequest\x1a\'.agent_studio.CreateMcpInstanceResponse"\x00\x12\x66\n\x11UpdateMcpInstance\x12&.agent_studio.UpdateMcpInstanceRequest\x1a\'.agent_studio.UpdateMcpInstanceResponse"\x00\x12\x66\n\x11RemoveMcpInstance\x12&.agent_studio.RemoveMcpInstanceRequest\x1a\'.agent_studio.RemoveMcpInstanceResponse"\x00\x12\x66\n\x11ListToolInstances\x12&.agent_studio.ListToolInstancesRequest\x1a\'.agent_studio.ListToolInstancesResponse"\x00\x12`\n\x0fGetToolInstance\x12$.agent_studio.GetToolInstanceRequest\x1a%.agent_studio.GetToolInstanceResponse"\x00\x12i\n\x12\x43reateToolInstance\x12\'.agent_studio.CreateToolInstanceRequest\x1a(.agent_studio.CreateToolInstanceResponse"\x00\x12i\n\x12UpdateToolInstance\x12\'.agent_studio.UpdateToolInstanceRequest\x1a(.agent_studio.UpdateToolInstanceResponse"\x00\x12i\n\x12RemoveToolInstance\x12\'.agent_studio.RemoveToolInstanceRequest\x1a(.agent_studio.RemoveToolInstanceResponse"\x00\x12\x63\n\x10TestToolInstance\x12%.agent_studio.TestToolInstanceRequest\x1a&.agent_studio.TestToolInstanceResponse"\x00\x12Q\n\nListAgents\x12\x1f.agent_studio.ListAgentsRequest\x1a .agent_studio.ListAgentsResponse"\x00\x12K\n\x08GetAgent\x12\x1d.agent_studio.GetAgentRequest\x1a\x1e.agent_studio.GetAgentResponse"\x00\x12K\n\x08\x41\x64\x64\x41gent\x12\x1d.agent_studio.AddAgentRequest\x1a\x1e.agent_studio.AddAgentResponse"\x00\x12T\n\x0bUpdateAgent\x12 .agent_studio.UpdateAgentRequest\x1a!.agent_studio.UpdateAgentResponse"\x00\x12T\n\x0bRemoveAgent\x12 .agent_studio.RemoveAgentRequest\x1a!.agent_studio.RemoveAgentResponse"\x00\x12N\n\tTestAgent\x12\x1e.agent_studio.TestAgentRequest\x1a\x1f.agent_studio.TestAgentResponse"\x00\x12H\n\x07\x41\x64\x64Task\x12\x1c.agent_studio.AddTaskRequest\x1a\x1d.agent_studio.AddTaskResponse"\x00\x12N\n\tListTasks\x12\x1e.agent_studio.ListTasksRequest\x1a\x1f.agent_studio.ListTasksResponse"\x00\x12H\n\x07GetTask\x12\x1c.agent_studio.GetTaskRequest\x1a\x1d.agent_studio.GetTaskResponse"\x00\x12Q\n\nUpdateTask\x12\x1f.agent_studio.UpdateTaskRequest\x1a .agent_studio.UpdateTaskResponse"\x00\x12Q\n\nRemoveTask\x12\x1f.agent_studio.RemoveTaskRequest\x1a .agent_studio.RemoveTaskResponse"\x00\x12Z\n\rListWorkflows\x12".agent_studio.ListWorkflowsRequest\x1a#.agent_studio.ListWorkflowsResponse"\x00\x12T\n\x0bGetWorkflow\x12 .agent_studio.GetWorkflowRequest\x1a!.agent_studio.GetWorkflowResponse"\x00\x12T\n\x0b\x41\x64\x64Workflow\x12 .agent_studio.AddWorkflowRequest\x1a!.agent_studio.AddWorkflowResponse"\x00\x12]\n\x0eUpdateWorkflow\x12#.agent_studio.UpdateWorkflowRequest\x1a$.agent_studio.UpdateWorkflowResponse"\x00\x12W\n\x0cTestWorkflow\x12!.agent_studio.TestWorkflowRequest\x1a".agent_studio.TestWorkflowResponse"\x00\x12i\n\x12\x43\x61ncelWorkflowTest\x12\'.agent_studio.CancelWorkflowTestRequest\x1a(.agent_studio.CancelWorkflowTestResponse"\x00\x12]\n\x0eRemoveWorkflow\x12#.agent_studio.RemoveWorkflowRequest\x1a$.agent_studio.RemoveWorkflowResponse"\x00\x12]\n\x0e\x44\x65ployWorkflow\x12#.agent_studio.DeployWorkflowRequest\x1a$.agent_studio.DeployWorkflowResponse"\x00\x12\x63\n\x10UndeployWorkflow\x12%.agent_studio.UndeployWorkflowRequest\x1a&.agent_studio.UndeployWorkflowResponse"\x00\x12r\n\x15ListDeployedWorkflows\x12*.agent_studio.ListDeployedWorkflowsRequest\x1a+.agent_studio.ListDeployedWorkflowsResponse"\x00\x12T\n\x13TemporaryFileUpload\x12\x17.agent_studio.FileChunk\x1a .agent_studio.FileUploadResponse"\x00(\x01\x12{\n\x1fNonStreamingTemporaryFileUpload\x12\x34.agent_studio.NonStreamingTemporaryFileUploadRequest\x1a .agent_studio.FileUploadResponse"\x00\x12`\n\x15\x44ownloadTemporaryFile\x12*.agent_studio.DownloadTemporaryFileRequest\x1a\x17.agent_studio.FileChunk"\x00\x30\x01\x12W\n\x0cGetAssetData\x12!.agent_studio.GetAssetDataRequest\x1a".agent_studio.GetAssetDataResponse"\x00\x12x\n\x17GetParentProjectDetails\x12,.agent_studio.GetParentProjectDetailsRequest\x1a-.agent_studio.GetParentProjectDetailsResponse"\x00\x12{\n\x18\x43heckStudioUpgradeStatus\x12-.agent_studio.CheckStudioUpgradeStatusRequest\x1a..agent_studio.CheckStudioUpgradeStatusResponse"\x00\x12Z\n\rUpgradeStudio\x12".agent_studio.UpgradeStudioRequest\x1a#.agent_studio.UpgradeStudioResponse"\x00\x12T\n\x0bHealthCheck\x12 .agent_studio.HealthCheckRequest\x1a!.agent_studio.HealthCheckResponse"\x00\x12T\n\x0b\x43mlApiCheck\x12 .agent_studio.CmlApiCheckRequest\x1a!.agent_studio.CmlApiCheckResponse"\x00\x12W\n\x0cRotateCmlApi\x12!.agent_studio.RotateCmlApiRequest\x1a".agent_studio.RotateCmlApiResponse"\x00\x12i\n\x12ListAgentTemplates\x12\'.agent_studio.ListAgentTemplatesRequest\x1a(.agent_studio.ListAgentTemplatesResponse"\x00\x12\x63\n\x10GetAgentTemplate\x12%.agent_studio.GetAgentTemplateRequest\x1a&.agent_studio.GetAgentTemplateResponse"\x00\x12\x63\n\x10\x41\x64\x64\x41gentTemplate\x12%.agent_studio.AddAgentTemplateRequest\x1a&.agent_studio.AddAgentTemplateResponse"\x00\x12l\n\x13UpdateAgentTemplate\x12(.agent_studio.UpdateAgentTemplateRequest\x1a).agent_studio.UpdateAgentTemplateResponse"\x00\x12l\n\x13RemoveAgentTemplate\x12(.agent_studio.RemoveAgentTemplateRequest\x1a).agent_studio.RemoveAgentTemplateResponse"\x00\x12r\n\x15ListWorkflowTemplates\x12*.agent_studio.ListWorkflowTemplatesRequest\x1a+.agent_studio.ListWorkflowTemplatesResponse"\x00\x12l\n\x13GetWorkflowTemplate\x12(.agent_studio.GetWorkflowTemplateRequest\x1a).agent_studio.GetWorkflowTemplateResponse"\x00\x12l\n\x13\x41\x64\x64WorkflowTemplate\x12(.agent_studio.AddWorkflowTemplateRequest\x1a).agent_studio.AddWorkflowTemplateResponse"\x00\x12u\n\x16RemoveWorkflowTemplate\x12+.agent_studio.RemoveWorkflowTemplateRequest\x1a,.agent_studio.RemoveWorkflowTemplateResponse"\x00\x12u\n\x16\x45xportWorkflowTemplate\x12+.agent_studio.ExportWorkflowTemplateRequest\x1a,.agent_studio.ExportWorkflowTemplateResponse"\x00\x12u\n\x16ImportWorkflowTemplate\x12+.agent_studio.ImportWorkflowTemplateRequest\x1a,.agent_studio.ImportWorkflowTemplateResponse"\x00\x12\x66\n\x11ListTaskTemplates\x12&.agent_studio.ListTaskTemplatesRequest\x1a\'.agent_studio.ListTaskTemplatesResponse"\x00\x12`\n\x0fGetTaskTemplate\x12$.agent_studio.GetTaskTemplateRequest\x1a%.agent_studio.GetTaskTemplateResponse"\x00\x12`\n\x0f\x41\x64\x64TaskTemplate\x12$.agent_studio.AddTaskTemplateRequest\x1a%.agent_studio.AddTaskTemplateResponse"\x00\x12i\n\x12RemoveTaskTemplate\x12\'.agent_studio.RemoveTaskTemplateRequest\x1a(.agent_studio.RemoveTaskTemplateResponse"\x00\x62\x06proto3'
 )
 
 _globals = globals()
@@ -225,181 +225,185 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals["_TESTWORKFLOWMCPINSTANCEENVVARS_ENVVARSENTRY"]._serialized_start = 7578
     _globals["_TESTWORKFLOWMCPINSTANCEENVVARS_ENVVARSENTRY"]._serialized_end = 7624
     _globals["_TESTWORKFLOWREQUEST"]._serialized_start = 7627
-    _globals["_TESTWORKFLOWREQUEST"]._serialized_end = 8195
-    _globals["_TESTWORKFLOWREQUEST_INPUTSENTRY"]._serialized_start = 7940
-    _globals["_TESTWORKFLOWREQUEST_INPUTSENTRY"]._serialized_end = 7985
-    _globals["_TESTWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_start = 7987
-    _globals["_TESTWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_end = 8090
-    _globals["_TESTWORKFLOWREQUEST_MCPINSTANCEENVVARSENTRY"]._serialized_start = 8092
-    _globals["_TESTWORKFLOWREQUEST_MCPINSTANCEENVVARSENTRY"]._serialized_end = 8195
-    _globals["_TESTWORKFLOWRESPONSE"]._serialized_start = 8197
-    _globals["_TESTWORKFLOWRESPONSE"]._serialized_end = 8254
-    _globals["_DEPLOYWORKFLOWREQUEST"]._serialized_start = 8257
-    _globals["_DEPLOYWORKFLOWREQUEST"]._serialized_end = 8964
-    _globals["_DEPLOYWORKFLOWREQUEST_ENVVARIABLEOVERRIDESENTRY"]._serialized_start = 8672
-    _globals["_DEPLOYWORKFLOWREQUEST_ENVVARIABLEOVERRIDESENTRY"]._serialized_end = 8731
-    _globals["_DEPLOYWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_start = 7987
-    _globals["_DEPLOYWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_end = 8090
-    _globals["_DEPLOYWORKFLOWREQUEST_MCPINSTANCEENVVARSENTRY"]._serialized_start = 8092
-    _globals["_DEPLOYWORKFLOWREQUEST_MCPINSTANCEENVVARSENTRY"]._serialized_end = 8195
-    _globals["_DEPLOYWORKFLOWRESPONSE"]._serialized_start = 8966
-    _globals["_DEPLOYWORKFLOWRESPONSE"]._serialized_end = 9083
-    _globals["_UNDEPLOYWORKFLOWREQUEST"]._serialized_start = 9085
-    _globals["_UNDEPLOYWORKFLOWREQUEST"]._serialized_end = 9140
-    _globals["_UNDEPLOYWORKFLOWRESPONSE"]._serialized_start = 9142
-    _globals["_UNDEPLOYWORKFLOWRESPONSE"]._serialized_end = 9168
-    _globals["_LISTDEPLOYEDWORKFLOWSREQUEST"]._serialized_start = 9170
-    _globals["_LISTDEPLOYEDWORKFLOWSREQUEST"]._serialized_end = 9200
-    _globals["_LISTDEPLOYEDWORKFLOWSRESPONSE"]._serialized_start = 9202
-    _globals["_LISTDEPLOYEDWORKFLOWSRESPONSE"]._serialized_end = 9293
-    _globals["_REMOVEWORKFLOWREQUEST"]._serialized_start = 9295
-    _globals["_REMOVEWORKFLOWREQUEST"]._serialized_end = 9339
-    _globals["_REMOVEWORKFLOWRESPONSE"]._serialized_start = 9341
-    _globals["_REMOVEWORKFLOWRESPONSE"]._serialized_end = 9365
-    _globals["_DEPLOYEDWORKFLOW"]._serialized_start = 9368
-    _globals["_DEPLOYEDWORKFLOW"]._serialized_end = 9708
-    _globals["_WORKFLOW"]._serialized_start = 9711
-    _globals["_WORKFLOW"]._serialized_end = 9969
-    _globals["_CREWAIWORKFLOWMETADATA"]._serialized_start = 9972
-    _globals["_CREWAIWORKFLOWMETADATA"]._serialized_end = 10152
-    _globals["_ADDTASKREQUEST"]._serialized_start = 10155
-    _globals["_ADDTASKREQUEST"]._serialized_end = 10318
-    _globals["_ADDTASKRESPONSE"]._serialized_start = 10320
-    _globals["_ADDTASKRESPONSE"]._serialized_end = 10354
-    _globals["_LISTTASKSREQUEST"]._serialized_start = 10356
-    _globals["_LISTTASKSREQUEST"]._serialized_end = 10395
-    _globals["_LISTTASKSRESPONSE"]._serialized_start = 10397
-    _globals["_LISTTASKSRESPONSE"]._serialized_end = 10465
-    _globals["_GETTASKREQUEST"]._serialized_start = 10467
-    _globals["_GETTASKREQUEST"]._serialized_end = 10500
-    _globals["_GETTASKRESPONSE"]._serialized_start = 10502
-    _globals["_GETTASKRESPONSE"]._serialized_end = 10567
-    _globals["_UPDATETASKREQUEST"]._serialized_start = 10569
-    _globals["_UPDATETASKREQUEST"]._serialized_end = 10677
-    _globals["_UPDATETASKRESPONSE"]._serialized_start = 10679
-    _globals["_UPDATETASKRESPONSE"]._serialized_end = 10699
-    _globals["_REMOVETASKREQUEST"]._serialized_start = 10701
-    _globals["_REMOVETASKREQUEST"]._serialized_end = 10737
-    _globals["_REMOVETASKRESPONSE"]._serialized_start = 10739
-    _globals["_REMOVETASKRESPONSE"]._serialized_end = 10759
-    _globals["_CREWAITASKMETADATA"]._serialized_start = 10762
-    _globals["_CREWAITASKMETADATA"]._serialized_end = 10927
-    _globals["_UPDATECREWAITASKREQUEST"]._serialized_start = 10929
-    _globals["_UPDATECREWAITASKREQUEST"]._serialized_end = 11027
-    _globals["_ADDCREWAITASKREQUEST"]._serialized_start = 11029
-    _globals["_ADDCREWAITASKREQUEST"]._serialized_end = 11124
-    _globals["_GETASSETDATAREQUEST"]._serialized_start = 11126
-    _globals["_GETASSETDATAREQUEST"]._serialized_end = 11171
-    _globals["_GETASSETDATARESPONSE"]._serialized_start = 11174
-    _globals["_GETASSETDATARESPONSE"]._serialized_end = 11345
-    _globals["_GETASSETDATARESPONSE_ASSETDATAENTRY"]._serialized_start = 11297
-    _globals["_GETASSETDATARESPONSE_ASSETDATAENTRY"]._serialized_end = 11345
-    _globals["_FILECHUNK"]._serialized_start = 11347
-    _globals["_FILECHUNK"]._serialized_end = 11417
-    _globals["_NONSTREAMINGTEMPORARYFILEUPLOADREQUEST"]._serialized_start = 11419
-    _globals["_NONSTREAMINGTEMPORARYFILEUPLOADREQUEST"]._serialized_end = 11500
-    _globals["_FILEUPLOADRESPONSE"]._serialized_start = 11502
-    _globals["_FILEUPLOADRESPONSE"]._serialized_end = 11558
-    _globals["_DOWNLOADTEMPORARYFILEREQUEST"]._serialized_start = 11560
-    _globals["_DOWNLOADTEMPORARYFILEREQUEST"]._serialized_end = 11609
-    _globals["_GETPARENTPROJECTDETAILSREQUEST"]._serialized_start = 11611
-    _globals["_GETPARENTPROJECTDETAILSREQUEST"]._serialized_end = 11643
-    _globals["_GETPARENTPROJECTDETAILSRESPONSE"]._serialized_start = 11645
-    _globals["_GETPARENTPROJECTDETAILSRESPONSE"]._serialized_end = 11729
-    _globals["_LISTAGENTTEMPLATESREQUEST"]._serialized_start = 11731
-    _globals["_LISTAGENTTEMPLATESREQUEST"]._serialized_end = 11818
-    _globals["_LISTAGENTTEMPLATESRESPONSE"]._serialized_start = 11820
-    _globals["_LISTAGENTTEMPLATESRESPONSE"]._serialized_end = 11910
-    _globals["_GETAGENTTEMPLATEREQUEST"]._serialized_start = 11912
-    _globals["_GETAGENTTEMPLATEREQUEST"]._serialized_end = 11949
-    _globals["_GETAGENTTEMPLATERESPONSE"]._serialized_start = 11951
-    _globals["_GETAGENTTEMPLATERESPONSE"]._serialized_end = 12038
-    _globals["_ADDAGENTTEMPLATEREQUEST"]._serialized_start = 12041
-    _globals["_ADDAGENTTEMPLATEREQUEST"]._serialized_end = 12362
-    _globals["_ADDAGENTTEMPLATERESPONSE"]._serialized_start = 12364
-    _globals["_ADDAGENTTEMPLATERESPONSE"]._serialized_end = 12402
-    _globals["_UPDATEAGENTTEMPLATEREQUEST"]._serialized_start = 12405
-    _globals["_UPDATEAGENTTEMPLATEREQUEST"]._serialized_end = 12905
-    _globals["_UPDATEAGENTTEMPLATERESPONSE"]._serialized_start = 12907
-    _globals["_UPDATEAGENTTEMPLATERESPONSE"]._serialized_end = 12948
-    _globals["_REMOVEAGENTTEMPLATEREQUEST"]._serialized_start = 12950
-    _globals["_REMOVEAGENTTEMPLATEREQUEST"]._serialized_end = 12990
-    _globals["_REMOVEAGENTTEMPLATERESPONSE"]._serialized_start = 12992
-    _globals["_REMOVEAGENTTEMPLATERESPONSE"]._serialized_end = 13021
-    _globals["_AGENTTEMPLATEMETADATA"]._serialized_start = 13024
-    _globals["_AGENTTEMPLATEMETADATA"]._serialized_end = 13398
-    _globals["_LISTWORKFLOWTEMPLATESREQUEST"]._serialized_start = 13400
-    _globals["_LISTWORKFLOWTEMPLATESREQUEST"]._serialized_end = 13430
-    _globals["_LISTWORKFLOWTEMPLATESRESPONSE"]._serialized_start = 13432
-    _globals["_LISTWORKFLOWTEMPLATESRESPONSE"]._serialized_end = 13531
-    _globals["_GETWORKFLOWTEMPLATEREQUEST"]._serialized_start = 13533
-    _globals["_GETWORKFLOWTEMPLATEREQUEST"]._serialized_end = 13573
-    _globals["_GETWORKFLOWTEMPLATERESPONSE"]._serialized_start = 13575
-    _globals["_GETWORKFLOWTEMPLATERESPONSE"]._serialized_end = 13671
-    _globals["_ADDWORKFLOWTEMPLATEREQUEST"]._serialized_start = 13674
-    _globals["_ADDWORKFLOWTEMPLATEREQUEST"]._serialized_end = 14085
-    _globals["_ADDWORKFLOWTEMPLATERESPONSE"]._serialized_start = 14087
-    _globals["_ADDWORKFLOWTEMPLATERESPONSE"]._serialized_end = 14128
-    _globals["_REMOVEWORKFLOWTEMPLATEREQUEST"]._serialized_start = 14130
-    _globals["_REMOVEWORKFLOWTEMPLATEREQUEST"]._serialized_end = 14173
-    _globals["_REMOVEWORKFLOWTEMPLATERESPONSE"]._serialized_start = 14175
-    _globals["_REMOVEWORKFLOWTEMPLATERESPONSE"]._serialized_end = 14207
-    _globals["_WORKFLOWTEMPLATEMETADATA"]._serialized_start = 14210
-    _globals["_WORKFLOWTEMPLATEMETADATA"]._serialized_end = 14468
-    _globals["_EXPORTWORKFLOWTEMPLATEREQUEST"]._serialized_start = 14470
-    _globals["_EXPORTWORKFLOWTEMPLATEREQUEST"]._serialized_end = 14513
-    _globals["_EXPORTWORKFLOWTEMPLATERESPONSE"]._serialized_start = 14515
-    _globals["_EXPORTWORKFLOWTEMPLATERESPONSE"]._serialized_end = 14566
-    _globals["_IMPORTWORKFLOWTEMPLATEREQUEST"]._serialized_start = 14568
-    _globals["_IMPORTWORKFLOWTEMPLATEREQUEST"]._serialized_end = 14618
-    _globals["_IMPORTWORKFLOWTEMPLATERESPONSE"]._serialized_start = 14620
-    _globals["_IMPORTWORKFLOWTEMPLATERESPONSE"]._serialized_end = 14664
-    _globals["_LISTTASKTEMPLATESREQUEST"]._serialized_start = 14666
-    _globals["_LISTTASKTEMPLATESREQUEST"]._serialized_end = 14752
-    _globals["_LISTTASKTEMPLATESRESPONSE"]._serialized_start = 14754
-    _globals["_LISTTASKTEMPLATESRESPONSE"]._serialized_end = 14841
-    _globals["_GETTASKTEMPLATEREQUEST"]._serialized_start = 14843
-    _globals["_GETTASKTEMPLATEREQUEST"]._serialized_end = 14879
-    _globals["_GETTASKTEMPLATERESPONSE"]._serialized_start = 14881
-    _globals["_GETTASKTEMPLATERESPONSE"]._serialized_end = 14965
-    _globals["_ADDTASKTEMPLATEREQUEST"]._serialized_start = 14968
-    _globals["_ADDTASKTEMPLATEREQUEST"]._serialized_end = 15148
-    _globals["_ADDTASKTEMPLATERESPONSE"]._serialized_start = 15150
-    _globals["_ADDTASKTEMPLATERESPONSE"]._serialized_end = 15187
-    _globals["_REMOVETASKTEMPLATEREQUEST"]._serialized_start = 15189
-    _globals["_REMOVETASKTEMPLATEREQUEST"]._serialized_end = 15228
-    _globals["_REMOVETASKTEMPLATERESPONSE"]._serialized_start = 15230
-    _globals["_REMOVETASKTEMPLATERESPONSE"]._serialized_end = 15258
-    _globals["_TASKTEMPLATEMETADATA"]._serialized_start = 15261
-    _globals["_TASKTEMPLATEMETADATA"]._serialized_end = 15451
-    _globals["_CHECKSTUDIOUPGRADESTATUSREQUEST"]._serialized_start = 15453
-    _globals["_CHECKSTUDIOUPGRADESTATUSREQUEST"]._serialized_end = 15486
-    _globals["_CHECKSTUDIOUPGRADESTATUSRESPONSE"]._serialized_start = 15488
-    _globals["_CHECKSTUDIOUPGRADESTATUSRESPONSE"]._serialized_end = 15569
-    _globals["_UPGRADESTUDIOREQUEST"]._serialized_start = 15571
-    _globals["_UPGRADESTUDIOREQUEST"]._serialized_end = 15593
-    _globals["_UPGRADESTUDIORESPONSE"]._serialized_start = 15595
-    _globals["_UPGRADESTUDIORESPONSE"]._serialized_end = 15618
-    _globals["_HEALTHCHECKREQUEST"]._serialized_start = 15620
-    _globals["_HEALTHCHECKREQUEST"]._serialized_end = 15640
-    _globals["_HEALTHCHECKRESPONSE"]._serialized_start = 15642
-    _globals["_HEALTHCHECKRESPONSE"]._serialized_end = 15680
-    _globals["_CMLAPICHECKREQUEST"]._serialized_start = 15682
-    _globals["_CMLAPICHECKREQUEST"]._serialized_end = 15702
-    _globals["_CMLAPICHECKRESPONSE"]._serialized_start = 15704
-    _globals["_CMLAPICHECKRESPONSE"]._serialized_end = 15742
-    _globals["_ROTATECMLAPIREQUEST"]._serialized_start = 15744
-    _globals["_ROTATECMLAPIREQUEST"]._serialized_end = 15765
-    _globals["_ROTATECMLAPIRESPONSE"]._serialized_start = 15767
-    _globals["_ROTATECMLAPIRESPONSE"]._serialized_end = 15806
-    _globals["_TESTTOOLINSTANCEREQUEST"]._serialized_start = 15809
-    _globals["_TESTTOOLINSTANCEREQUEST"]._serialized_end = 16114
-    _globals["_TESTTOOLINSTANCEREQUEST_USERPARAMSENTRY"]._serialized_start = 16014
-    _globals["_TESTTOOLINSTANCEREQUEST_USERPARAMSENTRY"]._serialized_end = 16063
-    _globals["_TESTTOOLINSTANCEREQUEST_TOOLPARAMSENTRY"]._serialized_start = 16065
-    _globals["_TESTTOOLINSTANCEREQUEST_TOOLPARAMSENTRY"]._serialized_end = 16114
-    _globals["_TESTTOOLINSTANCERESPONSE"]._serialized_start = 16116
-    _globals["_TESTTOOLINSTANCERESPONSE"]._serialized_end = 16160
-    _globals["_AGENTSTUDIO"]._serialized_start = 16163
-    _globals["_AGENTSTUDIO"]._serialized_end = 23407
+    _globals["_TESTWORKFLOWREQUEST"]._serialized_end = 8213
+    _globals["_TESTWORKFLOWREQUEST_INPUTSENTRY"]._serialized_start = 7958
+    _globals["_TESTWORKFLOWREQUEST_INPUTSENTRY"]._serialized_end = 8003
+    _globals["_TESTWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_start = 8005
+    _globals["_TESTWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_end = 8108
+    _globals["_TESTWORKFLOWREQUEST_MCPINSTANCEENVVARSENTRY"]._serialized_start = 8110
+    _globals["_TESTWORKFLOWREQUEST_MCPINSTANCEENVVARSENTRY"]._serialized_end = 8213
+    _globals["_TESTWORKFLOWRESPONSE"]._serialized_start = 8215
+    _globals["_TESTWORKFLOWRESPONSE"]._serialized_end = 8296
+    _globals["_CANCELWORKFLOWTESTREQUEST"]._serialized_start = 8298
+    _globals["_CANCELWORKFLOWTESTREQUEST"]._serialized_end = 8343
+    _globals["_CANCELWORKFLOWTESTRESPONSE"]._serialized_start = 8345
+    _globals["_CANCELWORKFLOWTESTRESPONSE"]._serialized_end = 8392
+    _globals["_DEPLOYWORKFLOWREQUEST"]._serialized_start = 8395
+    _globals["_DEPLOYWORKFLOWREQUEST"]._serialized_end = 9102
+    _globals["_DEPLOYWORKFLOWREQUEST_ENVVARIABLEOVERRIDESENTRY"]._serialized_start = 8810
+    _globals["_DEPLOYWORKFLOWREQUEST_ENVVARIABLEOVERRIDESENTRY"]._serialized_end = 8869
+    _globals["_DEPLOYWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_start = 8005
+    _globals["_DEPLOYWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_end = 8108
+    _globals["_DEPLOYWORKFLOWREQUEST_MCPINSTANCEENVVARSENTRY"]._serialized_start = 8110
+    _globals["_DEPLOYWORKFLOWREQUEST_MCPINSTANCEENVVARSENTRY"]._serialized_end = 8213
+    _globals["_DEPLOYWORKFLOWRESPONSE"]._serialized_start = 9104
+    _globals["_DEPLOYWORKFLOWRESPONSE"]._serialized_end = 9221
+    _globals["_UNDEPLOYWORKFLOWREQUEST"]._serialized_start = 9223
+    _globals["_UNDEPLOYWORKFLOWREQUEST"]._serialized_end = 9278
+    _globals["_UNDEPLOYWORKFLOWRESPONSE"]._serialized_start = 9280
+    _globals["_UNDEPLOYWORKFLOWRESPONSE"]._serialized_end = 9306
+    _globals["_LISTDEPLOYEDWORKFLOWSREQUEST"]._serialized_start = 9308
+    _globals["_LISTDEPLOYEDWORKFLOWSREQUEST"]._serialized_end = 9338
+    _globals["_LISTDEPLOYEDWORKFLOWSRESPONSE"]._serialized_start = 9340
+    _globals["_LISTDEPLOYEDWORKFLOWSRESPONSE"]._serialized_end = 9431
+    _globals["_REMOVEWORKFLOWREQUEST"]._serialized_start = 9433
+    _globals["_REMOVEWORKFLOWREQUEST"]._serialized_end = 9477
+    _globals["_REMOVEWORKFLOWRESPONSE"]._serialized_start = 9479
+    _globals["_REMOVEWORKFLOWRESPONSE"]._serialized_end = 9503
+    _globals["_DEPLOYEDWORKFLOW"]._serialized_start = 9506
+    _globals["_DEPLOYEDWORKFLOW"]._serialized_end = 9846
+    _globals["_WORKFLOW"]._serialized_start = 9849
+    _globals["_WORKFLOW"]._serialized_end = 10107
+    _globals["_CREWAIWORKFLOWMETADATA"]._serialized_start = 10110
+    _globals["_CREWAIWORKFLOWMETADATA"]._serialized_end = 10290
+    _globals["_ADDTASKREQUEST"]._serialized_start = 10293
+    _globals["_ADDTASKREQUEST"]._serialized_end = 10456
+    _globals["_ADDTASKRESPONSE"]._serialized_start = 10458
+    _globals["_ADDTASKRESPONSE"]._serialized_end = 10492
+    _globals["_LISTTASKSREQUEST"]._serialized_start = 10494
+    _globals["_LISTTASKSREQUEST"]._serialized_end = 10533
+    _globals["_LISTTASKSRESPONSE"]._serialized_start = 10535
+    _globals["_LISTTASKSRESPONSE"]._serialized_end = 10603
+    _globals["_GETTASKREQUEST"]._serialized_start = 10605
+    _globals["_GETTASKREQUEST"]._serialized_end = 10638
+    _globals["_GETTASKRESPONSE"]._serialized_start = 10640
+    _globals["_GETTASKRESPONSE"]._serialized_end = 10705
+    _globals["_UPDATETASKREQUEST"]._serialized_start = 10707
+    _globals["_UPDATETASKREQUEST"]._serialized_end = 10815
+    _globals["_UPDATETASKRESPONSE"]._serialized_start = 10817
+    _globals["_UPDATETASKRESPONSE"]._serialized_end = 10837
+    _globals["_REMOVETASKREQUEST"]._serialized_start = 10839
+    _globals["_REMOVETASKREQUEST"]._serialized_end = 10875
+    _globals["_REMOVETASKRESPONSE"]._serialized_start = 10877
+    _globals["_REMOVETASKRESPONSE"]._serialized_end = 10897
+    _globals["_CREWAITASKMETADATA"]._serialized_start = 10900
+    _globals["_CREWAITASKMETADATA"]._serialized_end = 11065
+    _globals["_UPDATECREWAITASKREQUEST"]._serialized_start = 11067
+    _globals["_UPDATECREWAITASKREQUEST"]._serialized_end = 11165
+    _globals["_ADDCREWAITASKREQUEST"]._serialized_start = 11167
+    _globals["_ADDCREWAITASKREQUEST"]._serialized_end = 11262
+    _globals["_GETASSETDATAREQUEST"]._serialized_start = 11264
+    _globals["_GETASSETDATAREQUEST"]._serialized_end = 11309
+    _globals["_GETASSETDATARESPONSE"]._serialized_start = 11312
+    _globals["_GETASSETDATARESPONSE"]._serialized_end = 11483
+    _globals["_GETASSETDATARESPONSE_ASSETDATAENTRY"]._serialized_start = 11435
+    _globals["_GETASSETDATARESPONSE_ASSETDATAENTRY"]._serialized_end = 11483
+    _globals["_FILECHUNK"]._serialized_start = 11485
+    _globals["_FILECHUNK"]._serialized_end = 11555
+    _globals["_NONSTREAMINGTEMPORARYFILEUPLOADREQUEST"]._serialized_start = 11557
+    _globals["_NONSTREAMINGTEMPORARYFILEUPLOADREQUEST"]._serialized_end = 11638
+    _globals["_FILEUPLOADRESPONSE"]._serialized_start = 11640
+    _globals["_FILEUPLOADRESPONSE"]._serialized_end = 11696
+    _globals["_DOWNLOADTEMPORARYFILEREQUEST"]._serialized_start = 11698
+    _globals["_DOWNLOADTEMPORARYFILEREQUEST"]._serialized_end = 11747
+    _globals["_GETPARENTPROJECTDETAILSREQUEST"]._serialized_start = 11749
+    _globals["_GETPARENTPROJECTDETAILSREQUEST"]._serialized_end = 11781
+    _globals["_GETPARENTPROJECTDETAILSRESPONSE"]._serialized_start = 11783
+    _globals["_GETPARENTPROJECTDETAILSRESPONSE"]._serialized_end = 11867
+    _globals["_LISTAGENTTEMPLATESREQUEST"]._serialized_start = 11869
+    _globals["_LISTAGENTTEMPLATESREQUEST"]._serialized_end = 11956
+    _globals["_LISTAGENTTEMPLATESRESPONSE"]._serialized_start = 11958
+    _globals["_LISTAGENTTEMPLATESRESPONSE"]._serialized_end = 12048
+    _globals["_GETAGENTTEMPLATEREQUEST"]._serialized_start = 12050
+    _globals["_GETAGENTTEMPLATEREQUEST"]._serialized_end = 12087
+    _globals["_GETAGENTTEMPLATERESPONSE"]._serialized_start = 12089
+    _globals["_GETAGENTTEMPLATERESPONSE"]._serialized_end = 12176
+    _globals["_ADDAGENTTEMPLATEREQUEST"]._serialized_start = 12179
+    _globals["_ADDAGENTTEMPLATEREQUEST"]._serialized_end = 12500
+    _globals["_ADDAGENTTEMPLATERESPONSE"]._serialized_start = 12502
+    _globals["_ADDAGENTTEMPLATERESPONSE"]._serialized_end = 12540
+    _globals["_UPDATEAGENTTEMPLATEREQUEST"]._serialized_start = 12543
+    _globals["_UPDATEAGENTTEMPLATEREQUEST"]._serialized_end = 13043
+    _globals["_UPDATEAGENTTEMPLATERESPONSE"]._serialized_start = 13045
+    _globals["_UPDATEAGENTTEMPLATERESPONSE"]._serialized_end = 13086
+    _globals["_REMOVEAGENTTEMPLATEREQUEST"]._serialized_start = 13088
+    _globals["_REMOVEAGENTTEMPLATEREQUEST"]._serialized_end = 13128
+    _globals["_REMOVEAGENTTEMPLATERESPONSE"]._serialized_start = 13130
+    _globals["_REMOVEAGENTTEMPLATERESPONSE"]._serialized_end = 13159
+    _globals["_AGENTTEMPLATEMETADATA"]._serialized_start = 13162
+    _globals["_AGENTTEMPLATEMETADATA"]._serialized_end = 13536
+    _globals["_LISTWORKFLOWTEMPLATESREQUEST"]._serialized_start = 13538
+    _globals["_LISTWORKFLOWTEMPLATESREQUEST"]._serialized_end = 13568
+    _globals["_LISTWORKFLOWTEMPLATESRESPONSE"]._serialized_start = 13570
+    _globals["_LISTWORKFLOWTEMPLATESRESPONSE"]._serialized_end = 13669
+    _globals["_GETWORKFLOWTEMPLATEREQUEST"]._serialized_start = 13671
+    _globals["_GETWORKFLOWTEMPLATEREQUEST"]._serialized_end = 13711
+    _globals["_GETWORKFLOWTEMPLATERESPONSE"]._serialized_start = 13713
+    _globals["_GETWORKFLOWTEMPLATERESPONSE"]._serialized_end = 13809
+    _globals["_ADDWORKFLOWTEMPLATEREQUEST"]._serialized_start = 13812
+    _globals["_ADDWORKFLOWTEMPLATEREQUEST"]._serialized_end = 14223
+    _globals["_ADDWORKFLOWTEMPLATERESPONSE"]._serialized_start = 14225
+    _globals["_ADDWORKFLOWTEMPLATERESPONSE"]._serialized_end = 14266
+    _globals["_REMOVEWORKFLOWTEMPLATEREQUEST"]._serialized_start = 14268
+    _globals["_REMOVEWORKFLOWTEMPLATEREQUEST"]._serialized_end = 14311
+    _globals["_REMOVEWORKFLOWTEMPLATERESPONSE"]._serialized_start = 14313
+    _globals["_REMOVEWORKFLOWTEMPLATERESPONSE"]._serialized_end = 14345
+    _globals["_WORKFLOWTEMPLATEMETADATA"]._serialized_start = 14348
+    _globals["_WORKFLOWTEMPLATEMETADATA"]._serialized_end = 14606
+    _globals["_EXPORTWORKFLOWTEMPLATEREQUEST"]._serialized_start = 14608
+    _globals["_EXPORTWORKFLOWTEMPLATEREQUEST"]._serialized_end = 14651
+    _globals["_EXPORTWORKFLOWTEMPLATERESPONSE"]._serialized_start = 14653
+    _globals["_EXPORTWORKFLOWTEMPLATERESPONSE"]._serialized_end = 14704
+    _globals["_IMPORTWORKFLOWTEMPLATEREQUEST"]._serialized_start = 14706
+    _globals["_IMPORTWORKFLOWTEMPLATEREQUEST"]._serialized_end = 14756
+    _globals["_IMPORTWORKFLOWTEMPLATERESPONSE"]._serialized_start = 14758
+    _globals["_IMPORTWORKFLOWTEMPLATERESPONSE"]._serialized_end = 14802
+    _globals["_LISTTASKTEMPLATESREQUEST"]._serialized_start = 14804
+    _globals["_LISTTASKTEMPLATESREQUEST"]._serialized_end = 14890
+    _globals["_LISTTASKTEMPLATESRESPONSE"]._serialized_start = 14892
+    _globals["_LISTTASKTEMPLATESRESPONSE"]._serialized_end = 14979
+    _globals["_GETTASKTEMPLATEREQUEST"]._serialized_start = 14981
+    _globals["_GETTASKTEMPLATEREQUEST"]._serialized_end = 15017
+    _globals["_GETTASKTEMPLATERESPONSE"]._serialized_start = 15019
+    _globals["_GETTASKTEMPLATERESPONSE"]._serialized_end = 15103
+    _globals["_ADDTASKTEMPLATEREQUEST"]._serialized_start = 15106
+    _globals["_ADDTASKTEMPLATEREQUEST"]._serialized_end = 15286
+    _globals["_ADDTASKTEMPLATERESPONSE"]._serialized_start = 15288
+    _globals["_ADDTASKTEMPLATERESPONSE"]._serialized_end = 15325
+    _globals["_REMOVETASKTEMPLATEREQUEST"]._serialized_start = 15327
+    _globals["_REMOVETASKTEMPLATEREQUEST"]._serialized_end = 15366
+    _globals["_REMOVETASKTEMPLATERESPONSE"]._serialized_start = 15368
+    _globals["_REMOVETASKTEMPLATERESPONSE"]._serialized_end = 15396
+    _globals["_TASKTEMPLATEMETADATA"]._serialized_start = 15399
+    _globals["_TASKTEMPLATEMETADATA"]._serialized_end = 15589
+    _globals["_CHECKSTUDIOUPGRADESTATUSREQUEST"]._serialized_start = 15591
+    _globals["_CHECKSTUDIOUPGRADESTATUSREQUEST"]._serialized_end = 15624
+    _globals["_CHECKSTUDIOUPGRADESTATUSRESPONSE"]._serialized_start = 15626
+    _globals["_CHECKSTUDIOUPGRADESTATUSRESPONSE"]._serialized_end = 15707
+    _globals["_UPGRADESTUDIOREQUEST"]._serialized_start = 15709
+    _globals["_UPGRADESTUDIOREQUEST"]._serialized_end = 15731
+    _globals["_UPGRADESTUDIORESPONSE"]._serialized_start = 15733
+    _globals["_UPGRADESTUDIORESPONSE"]._serialized_end = 15756
+    _globals["_HEALTHCHECKREQUEST"]._serialized_start = 15758
+    _globals["_HEALTHCHECKREQUEST"]._serialized_end = 15778
+    _globals["_HEALTHCHECKRESPONSE"]._serialized_start = 15780
+    _globals["_HEALTHCHECKRESPONSE"]._serialized_end = 15818
+    _globals["_CMLAPICHECKREQUEST"]._serialized_start = 15820
+    _globals["_CMLAPICHECKREQUEST"]._serialized_end = 15840
+    _globals["_CMLAPICHECKRESPONSE"]._serialized_start = 15842
+    _globals["_CMLAPICHECKRESPONSE"]._serialized_end = 15880
+    _globals["_ROTATECMLAPIREQUEST"]._serialized_start = 15882
+    _globals["_ROTATECMLAPIREQUEST"]._serialized_end = 15903
+    _globals["_ROTATECMLAPIRESPONSE"]._serialized_start = 15905
+    _globals["_ROTATECMLAPIRESPONSE"]._serialized_end = 15944
+    _globals["_TESTTOOLINSTANCEREQUEST"]._serialized_start = 15947
+    _globals["_TESTTOOLINSTANCEREQUEST"]._serialized_end = 16252
+    _globals["_TESTTOOLINSTANCEREQUEST_USERPARAMSENTRY"]._serialized_start = 16152
+    _globals["_TESTTOOLINSTANCEREQUEST_USERPARAMSENTRY"]._serialized_end = 16201
+    _globals["_TESTTOOLINSTANCEREQUEST_TOOLPARAMSENTRY"]._serialized_start = 16203
+    _globals["_TESTTOOLINSTANCEREQUEST_TOOLPARAMSENTRY"]._serialized_end = 16252
+    _globals["_TESTTOOLINSTANCERESPONSE"]._serialized_start = 16254
+    _globals["_TESTTOOLINSTANCERESPONSE"]._serialized_end = 16298
+    _globals["_AGENTSTUDIO"]._serialized_start = 16301
+    _globals["_AGENTSTUDIO"]._serialized_end = 23652
 # @@protoc_insertion_point(module_scope)
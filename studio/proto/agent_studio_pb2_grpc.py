@@ -312,6 +312,12 @@ class AgentStudioStub(object):
             response_deserializer=studio_dot_proto_dot_agent__studio__pb2.TestWorkflowResponse.FromString,
             _registered_method=True,
         )
+        self.CancelWorkflowTest = channel.unary_unary(
+            "/agent_studio.AgentStudio/CancelWorkflowTest",
+            request_serializer=studio_dot_proto_dot_agent__studio__pb2.CancelWorkflowTestRequest.SerializeToString,
+            response_deserializer=studio_dot_proto_dot_agent__studio__pb2.CancelWorkflowTestResponse.FromString,
+            _registered_method=True,
+        )
         self.RemoveWorkflow = channel.unary_unary(
             "/agent_studio.AgentStudio/RemoveWorkflow",
             request_serializer=studio_dot_proto_dot_agent__studio__pb2.RemoveWorkflowRequest.SerializeToString,
@@ -767,6 +773,12 @@ class AgentStudioServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def CancelWorkflowTest(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def RemoveWorkflow(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -1169,6 +1181,11 @@ def add_AgentStudioServicer_to_server(servicer, server):
             request_deserializer=studio_dot_proto_dot_agent__studio__pb2.TestWorkflowRequest.FromString,
             response_serializer=studio_dot_proto_dot_agent__studio__pb2.TestWorkflowResponse.SerializeToString,
         ),
+        "CancelWorkflowTest": grpc.unary_unary_rpc_method_handler(
+            servicer.CancelWorkflowTest,
+            request_deserializer=studio_dot_proto_dot_agent__studio__pb2.CancelWorkflowTestRequest.FromString,
+            response_serializer=studio_dot_proto_dot_agent__studio__pb2.CancelWorkflowTestResponse.SerializeToString,
+        ),
         "RemoveWorkflow": grpc.unary_unary_rpc_method_handler(
             servicer.RemoveWorkflow,
             request_deserializer=studio_dot_proto_dot_agent__studio__pb2.RemoveWorkflowRequest.FromString,
@@ -2680,6 +2697,36 @@ class AgentStudio(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def CancelWorkflowTest(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/agent_studio.AgentStudio/CancelWorkflowTest",
+            studio_dot_proto_dot_agent__studio__pb2.CancelWorkflowTestRequest.SerializeToString,
+            studio_dot_proto_dot_agent__studio__pb2.CancelWorkflowTestResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def RemoveWorkflow(
         request,
@@ -1,16 +1,72 @@
-from studio.ops import get_ops_endpoint
+from studio.ops import get_ops_endpoint, invalidate_ops_endpoint_cache
+from typing import Iterator, Optional
 import requests
 import os
 
 
-def get_crew_events(trace_id: str) -> dict:
+def get_crew_events(
+    trace_id: str, cursor: Optional[int] = None, wait: Optional[float] = None, consumer: Optional[str] = None
+):
     """
     Get all "descendants" spanning events for the global trace that corresponds
-    to a local trace ID. Returns a dict with keys "projectId" and "events".
+    to a local trace ID. Without a cursor, returns the list of events that
+    `consumer` (the server's default consumer if unset) has not seen yet.
+    With a cursor, returns a dict with keys "events", "cursor", "finished" and
+    "truncated" for the events after that cursor, blocking up to `wait`
+    seconds for new events to arrive. Reads never remove events for other
+    consumers.
     """
-    ops_endpoint = f"{get_ops_endpoint()}/events?trace_id={trace_id}"
+    ops_endpoint = f"{get_ops_endpoint()}/events"
+    params = {"trace_id": trace_id}
+    if consumer:
+        params["consumer"] = consumer
+    if cursor is not None:
+        params["cursor"] = cursor
+    if wait:
+        params["wait"] = wait
 
-    response = requests.get(ops_endpoint, headers={"Authorization": f"Bearer {os.getenv('CDSW_APIV2_KEY')}"})
+    try:
+        response = requests.get(
+            ops_endpoint,
+            params=params,
+            headers={"Authorization": f"Bearer {os.getenv('CDSW_APIV2_KEY')}"},
+            timeout=None if not wait else wait + 30,
+        )
+    except requests.exceptions.ConnectionError:
+        invalidate_ops_endpoint_cache()
+        raise
     events = response.json()
 
     return events
+
+
+def stream_crew_events(trace_id: str, cursor: int = 0, wait: float = 30) -> Iterator[dict]:
+    """
+    Yield a trace's events as they are published, long-polling the ops server
+    instead of polling on a timer. Stops after the terminal kickoff event.
+    Pass the cursor of the last event seen to resume an interrupted stream.
+    """
+    while True:
+        result = get_crew_events(trace_id, cursor=cursor, wait=wait)
+        yield from result["events"]
+        cursor = result["cursor"]
+        if result["finished"]:
+            return
+
+
+def get_crew_status(trace_id: str) -> dict:
+    """
+    Get the latest status projection of a trace: "status" (running, completed,
+    failed or unknown), "output", "error", "last_event_type", "last_seq" and
+    "event_count".
+    """
+    try:
+        response = requests.get(
+            f"{get_ops_endpoint()}/events/status",
+            params={"trace_id": trace_id},
+            headers={"Authorization": f"Bearer {os.getenv('CDSW_APIV2_KEY')}"},
+        )
+    except requests.exceptions.ConnectionError:
+        invalidate_ops_endpoint_cache()
+        raise
+    return response.json()
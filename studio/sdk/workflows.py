@@ -1,7 +1,7 @@
 from studio.client import AgentStudioClient
 from studio.api import *
 from studio.sdk.utils import get_deployed_workflow_endpoint
-from studio.sdk.ops import get_crew_events
+from studio.sdk.ops import get_crew_status
 
 
 from cmlapi import CMLServiceApi, default_client
@@ -115,7 +115,7 @@ def get_workflow_status(run_id: str) -> dict:
     """
 
     try:
-        crew_events = get_crew_events(run_id)
+        crew_status = get_crew_status(run_id)
     except Exception as e:
         raise ValueError(f"There was an issue with trying to get events from workflow id '{run_id}'", str(e))
 
@@ -125,12 +125,12 @@ def get_workflow_status(run_id: str) -> dict:
         "output": None,
         "error": None,
     }
-    if len(crew_events) > 0 and crew_events[-1]["type"] == "crew_kickoff_completed":
+    if crew_status["status"] == "completed":
         out_dict["complete"] = True
-        out_dict["output"] = crew_events[-1]["output"]
-    if len(crew_events) > 0 and crew_events[-1]["type"] == "crew_kickoff_failed":
+        out_dict["output"] = crew_status["output"]
+    if crew_status["status"] == "failed":
         out_dict["complete"] = True
-        out_dict["error"] = crew_events[-1]["error"]
+        out_dict["error"] = crew_status["error"]
 
     return out_dict
 
@@ -17,10 +17,12 @@ from studio.agents.agent_templates import (
 )
 from studio.workflow.test_and_deploy_workflow import (
     test_workflow,
+    cancel_workflow_test,
     deploy_workflow,
     undeploy_workflow,
     list_deployed_workflows,
 )
+from studio.workflow.test_queue import get_workflow_test_queue
 from studio.workflow.workflow import (
     list_workflows,
     add_workflow,
@@ -142,6 +144,9 @@ class AgentStudioApp(AgentStudioServicer):
 
             initialize_thread_pool()
 
+            # Start dispatching any test runs queued before a restart.
+            get_workflow_test_queue(self.dao, self.cml)
+
             # Load environment variables
             self.project_id = os.getenv("CDSW_PROJECT_ID")
             self.engine_id = os.getenv("CDSW_ENGINE_ID")
@@ -483,6 +488,12 @@ class AgentStudioApp(AgentStudioServicer):
         """
         return test_workflow(request, self.cml, dao=self.dao)
 
+    def CancelWorkflowTest(self, request, context):
+        """
+        Cancel a queued workflow test run by its trace ID.
+        """
+        return cancel_workflow_test(request, self.cml, dao=self.dao)
+
     def DeployWorkflow(self, request, context):
         """
         Deploy an existing workflow by its ID.
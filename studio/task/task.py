@@ -92,22 +92,20 @@ def list_tasks(request: ListTasksRequest, cml: CMLServiceApi, dao: AgentStudioDa
     List all tasks with metadata, ensuring assigned agent IDs exist or are empty.
     """
     try:
-        with dao.get_session() as session:
-            tasks: List[db_model.Task] = session.query(db_model.Task).all()
-            if not tasks:
-                return ListTasksResponse(tasks=[])
+        with dao.get_session(read_only=True) as session:
+            # Join each task with its assigned agent, if that agent exists
+            query = session.query(db_model.Task, db_model.Agent.id).outerjoin(
+                db_model.Agent, db_model.Agent.id == db_model.Task.assigned_agent_id
+            )
 
             # Filter by workflow id
             if is_field_set(request, "workflow_id"):
-                tasks = list(filter(lambda x: x.workflow_id == request.workflow_id, tasks))
+                query = query.filter(db_model.Task.workflow_id == request.workflow_id)
 
             task_list = []
-            for task in tasks:
-                is_valid = True  # Default to true if assigned_agent_id is empty
-                # Validate assigned agent ID only if it's not an empty string
-                if task.assigned_agent_id:
-                    agent_exists = session.query(db_model.Agent).filter_by(id=task.assigned_agent_id).one_or_none()
-                    is_valid = bool(agent_exists)
+            for task, assigned_agent_id in query.all():
+                # Default to true if assigned_agent_id is empty, otherwise the assigned agent must exist
+                is_valid = not task.assigned_agent_id or assigned_agent_id is not None
 
                 task_list.append(
                     CrewAITaskMetadata(
@@ -134,7 +132,7 @@ def get_task(request: GetTaskRequest, cml: CMLServiceApi, dao: AgentStudioDao =
         if not request.task_id:
             raise ValueError("Task ID is required.")
 
-        with dao.get_session() as session:
+        with dao.get_session(read_only=True) as session:
             task = session.query(db_model.Task).filter_by(id=request.task_id).one_or_none()
             if not task:
                 raise ValueError(f"Task with ID '{request.task_id}' not found.")
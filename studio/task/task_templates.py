@@ -13,14 +13,13 @@ from studio.proto.utils import is_field_set
 def list_task_templates(
     request: ListTaskTemplatesRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None
 ) -> ListTaskTemplatesResponse:
-    with dao.get_session() as session:
-        task_templates: List[db_model.TaskTemplate] = session.query(db_model.TaskTemplate).all()
+    with dao.get_session(read_only=True) as session:
+        query = session.query(db_model.TaskTemplate)
 
         # Filter by workflow template
         if is_field_set(request, "workflow_template_id"):
-            task_templates = list(
-                filter(lambda x: x.workflow_template_id == request.workflow_template_id, task_templates)
-            )
+            query = query.filter_by(workflow_template_id=request.workflow_template_id)
+        task_templates: List[db_model.TaskTemplate] = query.all()
 
         return ListTaskTemplatesResponse(
             task_templates=[task_template.to_protobuf() for task_template in task_templates]
@@ -30,7 +29,7 @@ def list_task_templates(
 def get_task_template(
     request: GetTaskTemplateRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None
 ) -> GetTaskTemplateResponse:
-    with dao.get_session() as session:
+    with dao.get_session(read_only=True) as session:
         task_template: db_model.TaskTemplate = (
             session.query(db_model.TaskTemplate).filter_by(id=request.id).one_or_none()
         )
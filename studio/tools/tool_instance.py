@@ -8,16 +8,13 @@ from studio.api.types import ToolInstanceStatus
 from cmlapi import CMLServiceApi
 import json
 import os
-import ast
 import studio.tools.utils as tool_utils
 from studio.cross_cutting.global_thread_pool import get_thread_pool
 import studio.consts as consts
 import studio.cross_cutting.utils as cc_utils
-from studio.tools.utils import read_tool_instance_code, extract_tool_params_from_code
-from studio.workflow.runners import get_workflow_runners
+from studio.workflow.runners import NoWorkflowRunnersAvailable, dispatch_to_workflow_runner
 from studio.proto import agent_studio_pb2
 import time
-import requests
 
 # Import engine code manually. Eventually when this code becomes
 # a separate git repo, or a custom runtime image, this path call
@@ -25,7 +22,7 @@ import requests
 import sys
 
 sys.path.append("studio/workflow_engine/src/")
-from engine.crewai.tools import prepare_virtual_env_for_tool
+from engine.crewai.tools import prepare_virtual_env_for_tool, remove_virtual_env_for_tool
 
 
 def prepare_tool_instance(tool_instance_id: str):
@@ -54,9 +51,9 @@ def prepare_tool_instance(tool_instance_id: str):
             # If tool is in FAILED state, remove .venv directory entirely
             if current_status == ToolInstanceStatus.FAILED.value:
                 venv_dir = os.path.join(source_folder_path, ".venv")
-                if os.path.exists(venv_dir):
+                if os.path.lexists(venv_dir):
                     try:
-                        shutil.rmtree(venv_dir)
+                        remove_virtual_env_for_tool(source_folder_path, consts.TOOL_VENV_STORE_LOCATION)
                         print(f"Removed existing .venv directory for failed tool instance {tool_instance_id}")
                     except Exception as e:
                         print(f"Error removing .venv directory for tool instance {tool_instance_id}: {e}")
@@ -66,7 +63,7 @@ def prepare_tool_instance(tool_instance_id: str):
             session.commit()
 
             # Prepare the virtual environment
-            prepare_virtual_env_for_tool(source_folder_path, requirements_file_name)
+            prepare_virtual_env_for_tool(source_folder_path, requirements_file_name, consts.TOOL_VENV_STORE_LOCATION)
 
             tool_instance.status = ToolInstanceStatus.READY.value
             session.commit()
@@ -258,8 +255,11 @@ def get_tool_instance(
     """
     try:
         if dao is not None:
-            with dao.get_session() as session:
-                return _get_tool_instance_impl(request, session)
+            with dao.get_session(read_only=True) as session:
+                tool_instance = _load_tool_instance(request, session)
+            # The tool files are read after the session is closed, so that no
+            # read transaction stays open during file I/O.
+            return _get_tool_instance_response(tool_instance)
         else:
             session = preexisting_db_session
             return _get_tool_instance_impl(request, session)
@@ -271,19 +271,42 @@ def _get_tool_instance_impl(request: GetToolInstanceRequest, session: DbSession)
     """
     Implementation of get tool instance logic
     """
-    tool_instance: ToolInstance = session.query(db_model.ToolInstance).filter_by(id=request.tool_instance_id).first()
+    return _get_tool_instance_response(_load_tool_instance(request, session))
+
+
+def _load_tool_instance(request: GetToolInstanceRequest, session: DbSession) -> db_model.ToolInstance:
+    tool_instance: db_model.ToolInstance = (
+        session.query(db_model.ToolInstance).filter_by(id=request.tool_instance_id).first()
+    )
     if not tool_instance:
         raise ValueError(f"Tool Instance with id '{request.tool_instance_id}' not found")
+    return tool_instance
+
 
+def _get_tool_instance_response(tool_instance: db_model.ToolInstance) -> GetToolInstanceResponse:
+    """
+    Build the response for a tool instance, reading its code and requirements.
+    """
     tool_instance_dir = tool_instance.source_folder_path
     tool_code = ""
     tool_requirements = ""
     status_message = ""
     is_valid = True
+    tool_description = ""
+    user_params_dict = {}
+    tool_params_dict = {}
 
-    # Try to read tool code and requirements
+    # Try to read tool code and requirements, parsed once per version of the files
     try:
-        tool_code, tool_requirements = read_tool_instance_code(tool_instance)
+        tool_code_metadata, tool_requirements = tool_utils.read_tool_instance_metadata(tool_instance)
+        tool_code = tool_code_metadata.code
+        tool_description = tool_code_metadata.description
+        if tool_code_metadata.is_valid:
+            user_params_dict = tool_code_metadata.user_params
+            tool_params_dict = tool_code_metadata.tool_params
+        else:
+            status_message = f"Error extracting user/tool params: {tool_code_metadata.error}"
+            is_valid = False
     except FileNotFoundError as e:
         status_message = f"Tool instance files not found: {str(e)}"
         is_valid = False
@@ -291,25 +314,10 @@ def _get_tool_instance_impl(request: GetToolInstanceRequest, session: DbSession)
         status_message = f"Error reading tool instance files: {str(e)}"
         is_valid = False
 
-    user_params_dict = {}
-    tool_params_dict = {}
-    try:
-        if tool_code:
-            user_params_dict = tool_utils.extract_user_params_from_code(tool_code)
-            tool_params_dict = extract_tool_params_from_code(tool_code)
-    except Exception as e:
-        status_message = f"Error extracting user/tool params: {str(e)}"
-        is_valid = False
-
     tool_image_uri = ""
     if tool_instance.tool_image_path:
         tool_image_uri = os.path.relpath(tool_instance.tool_image_path, consts.DYNAMIC_ASSETS_LOCATION)
 
-    try:
-        tool_description = ast.get_docstring(ast.parse(tool_code)) if tool_code else ""
-    except Exception:
-        tool_description = "Unable to read tool description"
-
     return GetToolInstanceResponse(
         tool_instance=ToolInstance(
             id=tool_instance.id,
@@ -346,8 +354,11 @@ def list_tool_instances(
     """
     try:
         if dao is not None:
-            with dao.get_session() as session:
-                return _list_tool_instances_impl(request, session)
+            with dao.get_session(read_only=True) as session:
+                tool_instances = _load_tool_instances(request, session)
+            # The tool files are read after the session is closed, so that no
+            # read transaction stays open during file I/O.
+            return _list_tool_instances_response(tool_instances)
         else:
             session = preexisting_db_session
             return _list_tool_instances_impl(request, session)
@@ -359,21 +370,41 @@ def _list_tool_instances_impl(request: ListToolInstancesRequest, session: DbSess
     """
     Implementation of list tool instances logic
     """
+    return _list_tool_instances_response(_load_tool_instances(request, session))
+
+
+def _load_tool_instances(request: ListToolInstancesRequest, session: DbSession) -> list[db_model.ToolInstance]:
     if not request.workflow_id:
         raise ValueError("Every ListToolInstances request must specify a workflow ID.")
 
-    tool_instances = session.query(db_model.ToolInstance).filter_by(workflow_id=request.workflow_id).all()
+    return session.query(db_model.ToolInstance).filter_by(workflow_id=request.workflow_id).all()
+
 
+def _list_tool_instances_response(tool_instances: list[db_model.ToolInstance]) -> ListToolInstancesResponse:
+    """
+    Build the response for a list of tool instances, reading their code and requirements.
+    """
     tool_instances_response = []
     for tool_instance in tool_instances:
         tool_code = ""
         tool_requirements = ""
         status_message = ""
         is_valid = True
+        tool_description = ""
+        user_params_dict = {}
+        tool_params_dict = {}
 
-        # Try to read tool code and requirements
+        # Try to read tool code and requirements, parsed once per version of the files
         try:
-            tool_code, tool_requirements = read_tool_instance_code(tool_instance)
+            tool_code_metadata, tool_requirements = tool_utils.read_tool_instance_metadata(tool_instance)
+            tool_code = tool_code_metadata.code
+            tool_description = tool_code_metadata.description
+            if tool_code_metadata.is_valid:
+                user_params_dict = tool_code_metadata.user_params
+                tool_params_dict = tool_code_metadata.tool_params
+            else:
+                status_message = f"Error extracting user/tool params: {tool_code_metadata.error}"
+                is_valid = False
         except FileNotFoundError as e:
             status_message = f"Tool instance files not found: {str(e)}"
             is_valid = False
@@ -381,25 +412,10 @@ def _list_tool_instances_impl(request: ListToolInstancesRequest, session: DbSess
             status_message = f"Error reading tool instance files: {str(e)}"
             is_valid = False
 
-        user_params_dict = {}
-        tool_params_dict = {}
-        try:
-            if tool_code:
-                user_params_dict = tool_utils.extract_user_params_from_code(tool_code)
-                tool_params_dict = extract_tool_params_from_code(tool_code)
-        except Exception as e:
-            status_message = f"Error extracting user/tool params: {str(e)}"
-            is_valid = False
-
         tool_image_uri = ""
         if tool_instance.tool_image_path:
             tool_image_uri = os.path.relpath(tool_instance.tool_image_path, consts.DYNAMIC_ASSETS_LOCATION)
 
-        try:
-            tool_description = ast.get_docstring(ast.parse(tool_code)) if tool_code else ""
-        except Exception:
-            tool_description = "Unable to read tool description"
-
         tool_instances_response.append(
             ToolInstance(
                 id=tool_instance.id,
@@ -429,6 +445,7 @@ def _list_tool_instances_impl(request: ListToolInstancesRequest, session: DbSess
 def _delete_tool_instance_directory(source_folder_path: str):
     try:
         if os.path.exists(source_folder_path):
+            remove_virtual_env_for_tool(source_folder_path, consts.TOOL_VENV_STORE_LOCATION)
             shutil.rmtree(source_folder_path)
             print(f"Deleted tool instance directory: {source_folder_path}")
         else:
@@ -511,15 +528,7 @@ def test_tool_instance(request, cml: CMLServiceApi = None, dao: AgentStudioDao =
         # 2. Check validity and status
         if not tool.is_valid:
             raise RuntimeError("Tool instance is not valid. Please check the code and requirements.")
-        # 3. Select available runner
-        workflow_runners = get_workflow_runners()
-        available_runners = [r for r in workflow_runners if not r["busy"]]
-        if not available_runners:
-            raise RuntimeError("No workflow runners currently available to test tool instance!")
-        runner = available_runners[0]
-        runner_url = f"{runner['endpoint']}/test_tool_instance"
-
-        # 4. Prepare payload
+        # 3. Prepare payload
         trace_id = str(uuid4())
         payload = {
             "tool_instance_id": tool.id,
@@ -528,9 +537,12 @@ def test_tool_instance(request, cml: CMLServiceApi = None, dao: AgentStudioDao =
             "tool_params": dict(request.tool_params),
             "trace_id": trace_id,
         }
+        # 4. Dispatch to the least-loaded runner, retrying other runners if busy
         try:
-            resp = requests.post(runner_url, json=payload)
+            resp = dispatch_to_workflow_runner("/test_tool_instance", payload)
             resp.raise_for_status()
+        except NoWorkflowRunnersAvailable:
+            raise RuntimeError("No workflow runners currently available to test tool instance!")
         except Exception as e:
             raise RuntimeError(f"Failed to send test request to runner: {e}")
 
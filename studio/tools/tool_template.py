@@ -13,7 +13,6 @@ from studio.proto.utils import is_field_set
 from cmlapi import CMLServiceApi
 import json
 import shutil
-import ast
 
 
 def list_tool_templates(
@@ -23,107 +22,30 @@ def list_tool_templates(
     List all tool templates, including reading Python code and requirements from file paths.
     """
     try:
-        with dao.get_session() as session:
-            templates: List[db_model.ToolTemplate] = session.query(db_model.ToolTemplate).all()
+        with dao.get_session(read_only=True) as session:
+            query = session.query(db_model.ToolTemplate)
 
             # Filter by workflow template
             if is_field_set(request, "workflow_template_id"):
-                templates = list(filter(lambda x: x.workflow_template_id == request.workflow_template_id, templates))
-
-            response_templates = []
-            for template in templates:
-                # Initialize variables
-                python_code = ""
-                python_requirements = ""
-                is_valid = True
-                status_message = ""
-
-                # Attempt to read the Python code
-                try:
-                    python_code_file_path = os.path.join(template.source_folder_path, template.python_code_file_name)
-                    with open(python_code_file_path, "r") as file:
-                        python_code = file.read()
-                except FileNotFoundError as e:
-                    status_message = f"Tool template files not found: {str(e)}"
-                    is_valid = False
-                except Exception as e:
-                    status_message = f"Error reading tool template files: {str(e)}"
-                    is_valid = False
-
-                # Attempt to read the Python requirements
-                try:
-                    python_requirements_file_path = os.path.join(
-                        template.source_folder_path, template.python_requirements_file_name
-                    )
-                    with open(python_requirements_file_path, "r") as file:
-                        python_requirements = file.read()
-                except FileNotFoundError as e:
-                    if not status_message:
-                        status_message = f"Tool template requirements not found: {str(e)}"
-                    is_valid = False
-                except Exception as e:
-                    if not status_message:
-                        status_message = f"Error reading tool template requirements: {str(e)}"
-                    is_valid = False
-
-                tool_image_uri = ""
-                if template.tool_image_path:
-                    tool_image_uri = os.path.relpath(template.tool_image_path, consts.DYNAMIC_ASSETS_LOCATION)
-
-                try:
-                    tool_description = ast.get_docstring(ast.parse(python_code)) if python_code else ""
-                except Exception:
-                    tool_description = "Unable to read tool description"
-
-                response_templates.append(
-                    ToolTemplate(
-                        id=template.id,
-                        name=template.name,
-                        python_code=python_code,
-                        python_requirements=python_requirements,
-                        source_folder_path=template.source_folder_path,
-                        tool_metadata=json.dumps({"status": status_message}),
-                        is_valid=is_valid,
-                        pre_built=template.pre_built,
-                        tool_image_uri=tool_image_uri,
-                        tool_description=tool_description,
-                        workflow_template_id=template.workflow_template_id,
-                        is_venv_tool=template.is_venv_tool,
-                    )
-                )
-
-            return ListToolTemplatesResponse(templates=response_templates)
-
-    except SQLAlchemyError as e:
-        raise RuntimeError(f"Database error while listing tool templates: {e}")
-
-
-def get_tool_template(
-    request: GetToolTemplateRequest, cml: CMLServiceApi, dao: AgentStudioDao
-) -> GetToolTemplateResponse:
-    """
-    Get details of a specific tool template, including reading Python code, requirements,
-    and extracting user parameters from the wrapper function.
-    """
-    try:
-        with dao.get_session() as session:
-            template: db_model.ToolTemplate = (
-                session.query(db_model.ToolTemplate).filter_by(id=request.tool_template_id).one_or_none()
-            )
-            if not template:
-                raise ValueError(f"Tool template with ID '{request.tool_template_id}' not found.")
+                query = query.filter_by(workflow_template_id=request.workflow_template_id)
+            templates: List[db_model.ToolTemplate] = query.all()
 
+        # The tool files are read after the session is closed, so that no
+        # read transaction stays open during file I/O.
+        response_templates = []
+        for template in templates:
             # Initialize variables
             python_code = ""
+            python_code_metadata = None
             python_requirements = ""
             is_valid = True
             status_message = ""
 
-            # Attempt to read the Python code
+            # Attempt to read the Python code, parsed once per version of the file
             try:
                 python_code_file_path = os.path.join(template.source_folder_path, template.python_code_file_name)
-                with open(python_code_file_path, "r") as file:
-                    python_code = file.read()
+                python_code_metadata = tool_utils.get_tool_code_metadata(python_code_file_path)
+                python_code = python_code_metadata.code
             except FileNotFoundError as e:
                 status_message = f"Tool template files not found: {str(e)}"
                 is_valid = False
@@ -136,8 +58,7 @@ def get_tool_template(
                 python_requirements_file_path = os.path.join(
                     template.source_folder_path, template.python_requirements_file_name
                 )
-                with open(python_requirements_file_path, "r") as file:
-                    python_requirements = file.read()
+                python_requirements = tool_utils.read_tool_file(python_requirements_file_path)
             except FileNotFoundError as e:
                 if not status_message:
                     status_message = f"Tool template requirements not found: {str(e)}"
@@ -147,41 +68,20 @@ def get_tool_template(
                     status_message = f"Error reading tool template requirements: {str(e)}"
                 is_valid = False
 
-            # Extract user parameters from the Python code
-            user_params_dict = {}
-            if python_code:
-                try:
-                    user_params_dict = tool_utils.extract_user_params_from_code(python_code)
-                except ValueError as e:
-                    status_message = f"Error parsing Python code: {str(e)}"
-                    is_valid = False
-
             tool_image_uri = ""
             if template.tool_image_path:
                 tool_image_uri = os.path.relpath(template.tool_image_path, consts.DYNAMIC_ASSETS_LOCATION)
 
-            try:
-                tool_description = ast.get_docstring(ast.parse(python_code)) if python_code else ""
-            except Exception:
-                tool_description = "Unable to read tool description"
-
-            # Create tool_metadata as a JSON string
-            tool_metadata = json.dumps(
-                {
-                    "user_params": list(user_params_dict.keys()),
-                    "user_params_metadata": user_params_dict,
-                    "status": status_message,
-                }
-            )
+            tool_description = python_code_metadata.description if python_code_metadata else ""
 
-            return GetToolTemplateResponse(
-                template=ToolTemplate(
+            response_templates.append(
+                ToolTemplate(
                     id=template.id,
                     name=template.name,
                     python_code=python_code,
                     python_requirements=python_requirements,
                     source_folder_path=template.source_folder_path,
-                    tool_metadata=tool_metadata,
+                    tool_metadata=json.dumps({"status": status_message}),
                     is_valid=is_valid,
                     pre_built=template.pre_built,
                     tool_image_uri=tool_image_uri,
@@ -191,6 +91,104 @@ def get_tool_template(
                 )
             )
 
+        return ListToolTemplatesResponse(templates=response_templates)
+
+    except SQLAlchemyError as e:
+        raise RuntimeError(f"Database error while listing tool templates: {e}")
+
+
+def get_tool_template(
+    request: GetToolTemplateRequest, cml: CMLServiceApi, dao: AgentStudioDao
+) -> GetToolTemplateResponse:
+    """
+    Get details of a specific tool template, including reading Python code, requirements,
+    and extracting user parameters from the wrapper function.
+    """
+    try:
+        with dao.get_session(read_only=True) as session:
+            template: db_model.ToolTemplate = (
+                session.query(db_model.ToolTemplate).filter_by(id=request.tool_template_id).one_or_none()
+            )
+            if not template:
+                raise ValueError(f"Tool template with ID '{request.tool_template_id}' not found.")
+
+        # The tool files are read after the session is closed, so that no
+        # read transaction stays open during file I/O.
+        # Initialize variables
+        python_code = ""
+        python_code_metadata = None
+        python_requirements = ""
+        is_valid = True
+        status_message = ""
+
+        # Attempt to read the Python code, parsed once per version of the file
+        try:
+            python_code_file_path = os.path.join(template.source_folder_path, template.python_code_file_name)
+            python_code_metadata = tool_utils.get_tool_code_metadata(python_code_file_path)
+            python_code = python_code_metadata.code
+        except FileNotFoundError as e:
+            status_message = f"Tool template files not found: {str(e)}"
+            is_valid = False
+        except Exception as e:
+            status_message = f"Error reading tool template files: {str(e)}"
+            is_valid = False
+
+        # Attempt to read the Python requirements
+        try:
+            python_requirements_file_path = os.path.join(
+                template.source_folder_path, template.python_requirements_file_name
+            )
+            python_requirements = tool_utils.read_tool_file(python_requirements_file_path)
+        except FileNotFoundError as e:
+            if not status_message:
+                status_message = f"Tool template requirements not found: {str(e)}"
+            is_valid = False
+        except Exception as e:
+            if not status_message:
+                status_message = f"Error reading tool template requirements: {str(e)}"
+            is_valid = False
+
+        # Extract user parameters from the Python code
+        user_params_dict = {}
+        if python_code_metadata is not None:
+            if python_code_metadata.is_valid:
+                user_params_dict = python_code_metadata.user_params
+            else:
+                status_message = f"Error parsing Python code: {python_code_metadata.error}"
+                is_valid = False
+
+        tool_image_uri = ""
+        if template.tool_image_path:
+            tool_image_uri = os.path.relpath(template.tool_image_path, consts.DYNAMIC_ASSETS_LOCATION)
+
+        tool_description = python_code_metadata.description if python_code_metadata else ""
+
+        # Create tool_metadata as a JSON string
+        tool_metadata = json.dumps(
+            {
+                "user_params": list(user_params_dict.keys()),
+                "user_params_metadata": user_params_dict,
+                "status": status_message,
+            }
+        )
+
+        return GetToolTemplateResponse(
+            template=ToolTemplate(
+                id=template.id,
+                name=template.name,
+                python_code=python_code,
+                python_requirements=python_requirements,
+                source_folder_path=template.source_folder_path,
+                tool_metadata=tool_metadata,
+                is_valid=is_valid,
+                pre_built=template.pre_built,
+                tool_image_uri=tool_image_uri,
+                tool_description=tool_description,
+                workflow_template_id=template.workflow_template_id,
+                is_venv_tool=template.is_venv_tool,
+            )
+        )
+
     except SQLAlchemyError as e:
         raise RuntimeError(f"Database error while retrieving tool template: {e}")
 
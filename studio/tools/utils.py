@@ -1,6 +1,9 @@
 import ast
 import os
-from typing import Optional, Dict
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Dict, Tuple
 
 from studio.db.model import ToolInstance
 
@@ -12,17 +15,75 @@ import sys
 sys.path.append("studio/workflow_engine/src/")
 
 
+# Maximum number of tool files kept read and parsed in memory.
+TOOL_METADATA_CACHE_SIZE = int(os.getenv("AGENT_STUDIO_TOOL_METADATA_CACHE_SIZE", "4096"))
+
+
 def read_tool_instance_code(tool_instance: ToolInstance) -> tuple[str, str]:
     """
     Reads the Python code and requirements from a given tool instance.
     """
+    tool_code_metadata, tool_requirements = read_tool_instance_metadata(tool_instance)
+    return tool_code_metadata.code, tool_requirements
+
 
+def read_tool_instance_metadata(tool_instance: ToolInstance) -> tuple["ToolCodeMetadata", str]:
+    """
+    Reads the parsed Python code and the requirements of a given tool instance.
+    """
     tool_instance_dir = tool_instance.source_folder_path
-    with open(os.path.join(tool_instance_dir, tool_instance.python_code_file_name), "r") as f:
-        tool_code = f.read()
-    with open(os.path.join(tool_instance_dir, tool_instance.python_requirements_file_name), "r") as f:
-        tool_requirements = f.read()
-    return tool_code, tool_requirements
+    tool_code_metadata = get_tool_code_metadata(os.path.join(tool_instance_dir, tool_instance.python_code_file_name))
+    tool_requirements = read_tool_file(os.path.join(tool_instance_dir, tool_instance.python_requirements_file_name))
+    return tool_code_metadata, tool_requirements
+
+
+def is_tool_instance_valid(tool_instance: ToolInstance) -> bool:
+    """
+    Whether a tool instance's code and requirements can be read and its code parsed.
+    """
+    try:
+        tool_code_metadata, _ = read_tool_instance_metadata(tool_instance)
+    except Exception:
+        return False
+    return tool_code_metadata.is_valid
+
+
+def _extract_class_params(parsed_ast: ast.AST, class_name: str) -> Dict[str, Dict[str, bool]]:
+    """
+    Extract the fields of a Pydantic BaseModel style class from parsed Python code.
+    """
+    # Search for the parameters class
+    parameter_class_node: Optional[ast.ClassDef] = None
+    for node in ast.walk(parsed_ast):
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            parameter_class_node = node
+            break
+
+    if parameter_class_node is None:
+        return {}
+
+    params: Dict[str, Dict[str, bool]] = {}
+
+    for field in parameter_class_node.body:
+        if isinstance(field, ast.AnnAssign):
+            param_name = field.target.id
+
+            # Check if type is Optional by looking for Optional[] syntax
+            is_optional = False
+            if isinstance(field.annotation, ast.Subscript):
+                if isinstance(field.annotation.value, ast.Name):
+                    if field.annotation.value.id == "Optional":
+                        is_optional = True
+
+            # Also check if there's a default value
+            has_default = field.value is not None
+
+            # Parameter is required if it's not Optional and has no default
+            is_required = not (is_optional or has_default)
+
+            params[param_name] = {"required": is_required}
+
+    return params
 
 
 def extract_user_params_from_code(code: str) -> Dict[str, Dict[str, bool]]:
@@ -39,40 +100,9 @@ def extract_user_params_from_code(code: str) -> Dict[str, Dict[str, bool]]:
     """
     try:
         parsed_ast = ast.parse(code)
-        # Search for UserParameters class
-        user_parameter_class_node: Optional[ast.ClassDef] = None
-        for node in ast.walk(parsed_ast):
-            if isinstance(node, ast.ClassDef) and node.name == "UserParameters":
-                user_parameter_class_node = node
-                break
-
-        if user_parameter_class_node is None:
-            return {}
-
-        user_params: Dict[str, Dict[str, bool]] = {}
-
-        for field in user_parameter_class_node.body:
-            if isinstance(field, ast.AnnAssign):
-                param_name = field.target.id
-
-                # Check if type is Optional by looking for Optional[] syntax
-                is_optional = False
-                if isinstance(field.annotation, ast.Subscript):
-                    if isinstance(field.annotation.value, ast.Name):
-                        if field.annotation.value.id == "Optional":
-                            is_optional = True
-
-                # Also check if there's a default value
-                has_default = field.value is not None
-
-                # Parameter is required if it's not Optional and has no default
-                is_required = not (is_optional or has_default)
-
-                user_params[param_name] = {"required": is_required}
-
-        return user_params
     except SyntaxError as e:
         raise ValueError(f"Error parsing Python code: {e}")
+    return _extract_class_params(parsed_ast, "UserParameters")
 
 
 def extract_tool_params_from_code(code: str) -> Dict[str, Dict[str, bool]]:
@@ -89,37 +119,146 @@ def extract_tool_params_from_code(code: str) -> Dict[str, Dict[str, bool]]:
     """
     try:
         parsed_ast = ast.parse(code)
-        # Search for ToolParameters class
-        tool_parameter_class_node: Optional[ast.ClassDef] = None
-        for node in ast.walk(parsed_ast):
-            if isinstance(node, ast.ClassDef) and node.name == "ToolParameters":
-                tool_parameter_class_node = node
-                break
+    except SyntaxError as e:
+        raise ValueError(f"Error parsing Python code: {e}")
+    return _extract_class_params(parsed_ast, "ToolParameters")
+
+
+@dataclass(frozen=True)
+class ToolCodeMetadata:
+    """
+    Everything the studio reads out of a tool's Python code, parsed once.
+    `error` is set, and both parameter dicts are empty, if the code could not
+    be parsed. Shared between callers, so treat the dicts as read-only.
+    """
+
+    code: str
+    user_params: Dict[str, Dict[str, bool]]
+    tool_params: Dict[str, Dict[str, bool]]
+    description: Optional[str]
+    error: str = ""
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.error
+
+
+def parse_tool_code(code: str) -> ToolCodeMetadata:
+    """
+    Parse tool code once for its user parameters, tool parameters and docstring.
+    """
+    if not code:
+        return ToolCodeMetadata(code=code, user_params={}, tool_params={}, description="")
+    try:
+        parsed_ast = ast.parse(code)
+    except SyntaxError as e:
+        return ToolCodeMetadata(
+            code=code,
+            user_params={},
+            tool_params={},
+            description="Unable to read tool description",
+            error=f"Error parsing Python code: {e}",
+        )
+    description = ast.get_docstring(parsed_ast)
+    try:
+        user_params = _extract_class_params(parsed_ast, "UserParameters")
+        tool_params = _extract_class_params(parsed_ast, "ToolParameters")
+    except Exception as e:
+        return ToolCodeMetadata(code=code, user_params={}, tool_params={}, description=description, error=str(e))
+    return ToolCodeMetadata(code=code, user_params=user_params, tool_params=tool_params, description=description)
+
 
-        if tool_parameter_class_node is None:
-            return {}
+class ToolMetadataCache:
+    """
+    Process-wide LRU cache of tool files read from disk, keyed on path,
+    modification time and size so edits to a file are picked up on the next
+    read. Tool code is cached parsed, as ToolCodeMetadata; other files, like
+    requirements, as text.
+    """
 
-        tool_params: Dict[str, Dict[str, bool]] = {}
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[int, int, Any]]" = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
 
-        for field in tool_parameter_class_node.body:
-            if isinstance(field, ast.AnnAssign):
-                param_name = field.target.id
+    def _get(self, kind: str, path: str, load: Callable[[str], Any]) -> Any:
+        key = (kind, os.path.abspath(path))
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError, ValueError):
+            # Let the uncached read surface the error.
+            return load(path)
+        version = (stat.st_mtime_ns, stat.st_size)
 
-                # Check if type is Optional by looking for Optional[] syntax
-                is_optional = False
-                if isinstance(field.annotation, ast.Subscript):
-                    if isinstance(field.annotation.value, ast.Name):
-                        if field.annotation.value.id == "Optional":
-                            is_optional = True
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[:2] == version:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return cached[2]
+            self._stats["misses"] += 1
 
-                # Also check if there's a default value
-                has_default = field.value is not None
+        value = load(path)
+        with self._lock:
+            self._entries[key] = (*version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+        return value
 
-                # Parameter is required if it's not Optional and has no default
-                is_required = not (is_optional or has_default)
+    def get_code_metadata(self, path: str) -> ToolCodeMetadata:
+        return self._get("code", path, lambda p: parse_tool_code(_read_file(p)))
 
-                tool_params[param_name] = {"required": is_required}
+    def get_text(self, path: str) -> str:
+        return self._get("text", path, _read_file)
 
-        return tool_params
-    except SyntaxError as e:
-        raise ValueError(f"Error parsing Python code: {e}")
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+
+def _read_file(path: str) -> str:
+    with open(path, "r") as f:
+        return f.read()
+
+
+_tool_metadata_cache: Optional[ToolMetadataCache] = None
+_tool_metadata_cache_lock = threading.Lock()
+
+
+def get_tool_metadata_cache() -> ToolMetadataCache:
+    """
+    Get the process-wide tool metadata cache, holding up to
+    AGENT_STUDIO_TOOL_METADATA_CACHE_SIZE files (default 4096).
+    """
+    global _tool_metadata_cache
+    with _tool_metadata_cache_lock:
+        if _tool_metadata_cache is None:
+            _tool_metadata_cache = ToolMetadataCache(TOOL_METADATA_CACHE_SIZE)
+        return _tool_metadata_cache
+
+
+def get_tool_code_metadata(path: str) -> ToolCodeMetadata:
+    """
+    Parsed metadata of the tool code at `path`, from the process-wide cache.
+    Raises the same errors as opening the file if it cannot be read.
+    """
+    return get_tool_metadata_cache().get_code_metadata(path)
+
+
+def read_tool_file(path: str) -> str:
+    """
+    Contents of a tool file such as its requirements, from the process-wide cache.
+    """
+    return get_tool_metadata_cache().get_text(path)
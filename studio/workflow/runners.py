@@ -1,9 +1,33 @@
 import requests
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 from studio.consts import DEFAULT_AS_WORKFLOW_RUNNER_STARTING_PORT
 
 
+# Timeout for a single runner /status probe. A hung runner is reported busy
+# rather than stalling every test request.
+WORKFLOW_RUNNER_STATUS_TIMEOUT_SECONDS = float(os.getenv("AGENT_STUDIO_WORKFLOW_RUNNER_STATUS_TIMEOUT", "2"))
+# How long probed runner status is reused before probing again.
+WORKFLOW_RUNNER_STATUS_CACHE_TTL_SECONDS = float(os.getenv("AGENT_STUDIO_WORKFLOW_RUNNER_STATUS_CACHE_TTL", "1"))
+# Timeout for a dispatch (/kickoff, /test_tool_instance) request. Runners
+# respond as soon as the execution is scheduled.
+WORKFLOW_RUNNER_DISPATCH_TIMEOUT_SECONDS = float(os.getenv("AGENT_STUDIO_WORKFLOW_RUNNER_DISPATCH_TIMEOUT", "30"))
+# Number of passes over the runners before giving up when every runner
+# answers 409 (busy), with a short backoff between passes.
+WORKFLOW_RUNNER_DISPATCH_ROUNDS = int(os.getenv("AGENT_STUDIO_WORKFLOW_RUNNER_DISPATCH_ROUNDS", "3"))
+WORKFLOW_RUNNER_DISPATCH_BACKOFF_SECONDS = 0.5
+# Smoothing factor of the per-runner latency moving average.
+WORKFLOW_RUNNER_LATENCY_ALPHA = 0.3
+
+
+class NoWorkflowRunnersAvailable(RuntimeError):
+    pass
+
+
 def get_num_workfow_runners() -> int:
     return int(os.getenv("AGENT_STUDIO_NUM_WORKFLOW_RUNNERS", 0))
 
@@ -17,13 +41,194 @@ def get_workflow_runner_endpoints() -> list[str]:
     return runner_endpoints
 
 
-def get_workflow_runners() -> list[dict]:
-    endpoints = get_workflow_runner_endpoints()
-    workflow_runners = []
-    for endpoint in endpoints:
+class WorkflowRunnerState:
+    """
+    Last known state of a single workflow runner. `slots_busy` comes from the
+    runner's /status; `dispatched` counts executions this studio has handed
+    the runner since that probe, and `in_flight` the dispatch requests still
+    awaiting a response, so selection accounts for load the probe has not
+    seen yet.
+    """
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.reachable = True
+        self.slots_total = 1
+        self.slots_busy = 0
+        self.dispatched = 0
+        self.in_flight = 0
+        self.latency: Optional[float] = None
+        self.checked_at = 0.0
+
+    @property
+    def load(self) -> int:
+        return self.slots_busy + self.dispatched + self.in_flight
+
+    @property
+    def busy(self) -> bool:
+        return not self.reachable or self.load >= self.slots_total
+
+    def record_latency(self, seconds: float) -> None:
+        if self.latency is None:
+            self.latency = seconds
+        else:
+            self.latency += WORKFLOW_RUNNER_LATENCY_ALPHA * (seconds - self.latency)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "endpoint": self.endpoint,
+            "busy": self.busy,
+            "reachable": self.reachable,
+            "slots_total": self.slots_total,
+            "slots_busy": self.slots_busy,
+            "dispatched": self.dispatched,
+            "in_flight": self.in_flight,
+            "latency": self.latency,
+        }
+
+
+class WorkflowRunnerRegistry:
+    """
+    Tracks the studio's workflow runners and dispatches executions to them.
+    Status probes run concurrently with a short timeout and are cached
+    briefly; dispatch picks the least-loaded runner (lowest latency on ties)
+    and moves on to the next runner when one answers 409 or is unreachable.
+    """
+
+    def __init__(self, endpoints: List[str]):
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._runners: Dict[str, WorkflowRunnerState] = {e: WorkflowRunnerState(e) for e in endpoints}
+        self._session = requests.Session()
+        self._probe_pool = ThreadPoolExecutor(
+            max_workers=max(1, min(len(endpoints), 16)), thread_name_prefix="workflow-runner-probe"
+        )
+        self._last_refresh = 0.0
+        self._stats = {"probes": 0, "probe_failures": 0, "dispatches": 0, "busy_retries": 0, "unavailable": 0}
+
+    def _probe(self, runner: WorkflowRunnerState) -> None:
+        start = time.monotonic()
         try:
-            busy = requests.get(url=f"{endpoint}/status").json().get("busy", True)
-        except Exception as e:
-            busy = True
-        workflow_runners.append({"endpoint": endpoint, "busy": busy})
-    return workflow_runners
+            status = self._session.get(
+                url=f"{runner.endpoint}/status", timeout=WORKFLOW_RUNNER_STATUS_TIMEOUT_SECONDS
+            ).json()
+            elapsed = time.monotonic() - start
+            with self._lock:
+                self._stats["probes"] += 1
+                runner.reachable = True
+                runner.slots_total = int(status.get("slots_total", 1))
+                # Older runners only report "busy".
+                runner.slots_busy = int(status.get("slots_busy", runner.slots_total if status.get("busy", True) else 0))
+                runner.dispatched = 0
+                runner.checked_at = time.monotonic()
+                runner.record_latency(elapsed)
+        except Exception:
+            with self._lock:
+                self._stats["probes"] += 1
+                self._stats["probe_failures"] += 1
+                runner.reachable = False
+                runner.checked_at = time.monotonic()
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Probe every runner concurrently, unless the cached status is still fresh.
+        """
+        with self._refresh_lock:
+            if not force and time.monotonic() - self._last_refresh < WORKFLOW_RUNNER_STATUS_CACHE_TTL_SECONDS:
+                return
+            list(self._probe_pool.map(self._probe, list(self._runners.values())))
+            self._last_refresh = time.monotonic()
+
+    def get_runners(self) -> List[Dict[str, Any]]:
+        self.refresh()
+        with self._lock:
+            return [runner.to_dict() for runner in self._runners.values()]
+
+    def _select(self, exclude: set) -> Optional[WorkflowRunnerState]:
+        with self._lock:
+            candidates = [r for r in self._runners.values() if r.endpoint not in exclude and not r.busy]
+            if not candidates:
+                return None
+            runner = min(
+                candidates,
+                key=lambda r: (r.load / max(1, r.slots_total), r.latency if r.latency is not None else 0.0),
+            )
+            runner.in_flight += 1
+            return runner
+
+    def dispatch(self, path: str, payload: Dict[str, Any]) -> requests.Response:
+        """
+        POST an execution to the least-loaded available runner. Returns the
+        runner's response, or raises NoWorkflowRunnersAvailable when every
+        runner stays busy or unreachable for all dispatch rounds.
+        """
+        for round_index in range(max(1, WORKFLOW_RUNNER_DISPATCH_ROUNDS)):
+            if round_index > 0:
+                time.sleep(WORKFLOW_RUNNER_DISPATCH_BACKOFF_SECONDS * round_index)
+            self.refresh(force=round_index > 0)
+            tried: set = set()
+            while True:
+                runner = self._select(tried)
+                if runner is None:
+                    break
+                tried.add(runner.endpoint)
+                start = time.monotonic()
+                try:
+                    resp = self._session.post(
+                        url=f"{runner.endpoint}{path}", json=payload, timeout=WORKFLOW_RUNNER_DISPATCH_TIMEOUT_SECONDS
+                    )
+                except requests.exceptions.RequestException as e:
+                    print(f"Workflow runner {runner.endpoint} unreachable: {e}")
+                    with self._lock:
+                        runner.in_flight -= 1
+                        runner.reachable = False
+                    continue
+
+                with self._lock:
+                    runner.in_flight -= 1
+                    runner.record_latency(time.monotonic() - start)
+                    if resp.status_code == 409:
+                        # The runner filled up since it was last probed.
+                        runner.slots_busy = runner.slots_total
+                        self._stats["busy_retries"] += 1
+                        continue
+                    self._stats["dispatches"] += 1
+                    if resp.ok:
+                        runner.dispatched += 1
+                return resp
+
+        with self._lock:
+            self._stats["unavailable"] += 1
+        raise NoWorkflowRunnersAvailable("No workflow runners currently available!")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, runners=[runner.to_dict() for runner in self._runners.values()])
+
+
+_registry: Optional[WorkflowRunnerRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_workflow_runner_registry() -> WorkflowRunnerRegistry:
+    """
+    Get the process-wide runner registry. Tuned with:
+
+      AGENT_STUDIO_WORKFLOW_RUNNER_STATUS_TIMEOUT     seconds per /status probe (default 2)
+      AGENT_STUDIO_WORKFLOW_RUNNER_STATUS_CACHE_TTL   seconds probed status is reused (default 1)
+      AGENT_STUDIO_WORKFLOW_RUNNER_DISPATCH_TIMEOUT   seconds per dispatch request (default 30)
+      AGENT_STUDIO_WORKFLOW_RUNNER_DISPATCH_ROUNDS    passes over busy runners before giving up (default 3)
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = WorkflowRunnerRegistry(get_workflow_runner_endpoints())
+        return _registry
+
+
+def get_workflow_runners() -> list[dict]:
+    return get_workflow_runner_registry().get_runners()
+
+
+def dispatch_to_workflow_runner(path: str, payload: Dict[str, Any]) -> requests.Response:
+    return get_workflow_runner_registry().dispatch(path, payload)
@@ -1,10 +1,10 @@
 import json
 import os
 import shutil
-from uuid import uuid4
 import cmlapi
 from typing import List, Optional
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload
 import requests
 from google.protobuf.json_format import MessageToDict
 import json
@@ -21,7 +21,8 @@ from studio.workflow.utils import (
     get_llm_config_for_workflow,
     is_workflow_ready,
 )
-from studio.workflow.runners import get_workflow_runners
+from studio.workflow.runners import NoWorkflowRunnersAvailable
+from studio.workflow.test_queue import get_workflow_test_queue
 from studio.deployments.entry import deploy_from_payload
 from studio.deployments.types import *
 from studio.deployments.package.collated_input import create_collated_input
@@ -56,7 +57,6 @@ def test_workflow(
         generation_config = json.loads(request_dict["generation_config"])
 
         collated_input = None
-        llm_config = {}
         with dao.get_session() as session:
             workflow: db_model.Workflow = session.query(db_model.Workflow).filter_by(id=request.workflow_id).one()
 
@@ -65,9 +65,6 @@ def test_workflow(
 
             collated_input: input_types.CollatedInput = create_collated_input(workflow, session)
 
-            # Model config is already created as part of creating collated input.
-            llm_config = get_llm_config_for_workflow(workflow, session, cml)
-
         # For now, force generation config for each of our LLM completions
         # based on the generation config in the request
         for lm in collated_input.language_models:
@@ -81,33 +78,30 @@ def test_workflow(
             mcp_instance_id: {k: v for k, v in env_vars.env_vars.items()}
             for mcp_instance_id, env_vars in request.mcp_instance_env_vars.items()
         }
-        events_trace_id = str(uuid4())
-
-        workflow_runners = get_workflow_runners()
-        available_workflow_runners = list(filter(lambda x: not x["busy"], workflow_runners))
-        if not available_workflow_runners:
+        # Queue the test run; the scheduler dispatches it to the least-loaded
+        # runner as soon as one has capacity. Only non-secret fields are stored
+        # with the submission: the tool and MCP configs (API keys, tokens) stay
+        # in memory, and the LLM config is resolved at dispatch time.
+        try:
+            events_trace_id, queue_position = get_workflow_test_queue(dao, cml).submit(
+                workflow_id=request.workflow_id,
+                payload={
+                    "workflow_directory": os.path.abspath(os.curdir),  # for testing, everything is in studio-data/
+                    "workflow_name": f"Test Workflow - {collated_input.workflow.name}",
+                    "collated_input": collated_input.model_dump(),
+                    "inputs": dict(request.inputs),
+                },
+                priority=request.priority,
+                tool_config=tool_user_params_kv,
+                mcp_config=mcp_instance_env_vars_kv,
+            )
+        except NoWorkflowRunnersAvailable:
             raise RuntimeError("No workflow runners currently available to test workflow!")
 
-        # Use the first available runner
-        workflow_runner = available_workflow_runners[0]
-
-        resp = requests.post(
-            url=f"{workflow_runner['endpoint']}/kickoff",
-            json={
-                "workflow_directory": os.path.abspath(os.curdir),  # for testing, everything is in studio-data/
-                "workflow_name": f"Test Workflow - {collated_input.workflow.name}",
-                "collated_input": collated_input.model_dump(),
-                "tool_config": tool_user_params_kv,
-                "mcp_config": mcp_instance_env_vars_kv,
-                "llm_config": llm_config,
-                "inputs": dict(request.inputs),
-                "events_trace_id": events_trace_id,
-            },
-        )
-
         return TestWorkflowResponse(
             message="",  # Return empty message since execution is async
             trace_id=events_trace_id,
+            queue_position=queue_position,
         )
 
     except ValueError as e:
@@ -120,6 +114,19 @@ def test_workflow(
     return
 
 
+def cancel_workflow_test(
+    request: CancelWorkflowTestRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None
+) -> CancelWorkflowTestResponse:
+    """
+    Cancel a test run that is still waiting in the test queue.
+    """
+    try:
+        cancelled = get_workflow_test_queue(dao, cml).cancel(request.trace_id)
+        return CancelWorkflowTestResponse(cancelled=cancelled)
+    except SQLAlchemyError as e:
+        raise RuntimeError(f"Database error while cancelling workflow test: {e}")
+
+
 def deploy_workflow(request: DeployWorkflowRequest, cml: CMLServiceApi, dao: AgentStudioDao) -> DeployWorkflowResponse:
     """Deploy a workflow."""
 
@@ -267,119 +274,124 @@ def list_deployed_workflows(
 
         applications = apps_resp.json()
 
-        with dao.get_session() as session:
-            deployed_workflows: List[db_model.DeployedWorkflowInstance] = session.query(
-                db_model.DeployedWorkflowInstance
-            ).all()
-            deployed_workflow_instances = []
+        with dao.get_session(read_only=True) as session:
+            deployed_workflows: List[db_model.DeployedWorkflowInstance] = (
+                session.query(db_model.DeployedWorkflowInstance)
+                .options(joinedload(db_model.DeployedWorkflowInstance.workflow))
+                .all()
+            )
 
-            for deployed_workflow in deployed_workflows:
-                workflow: db_model.Workflow = deployed_workflow.workflow
+        # The CML calls below are made after the session is closed, so that no
+        # read transaction stays open while waiting on the network.
+        deployed_workflow_instances = []
 
-                # Initialize variables with default values
-                application_url = ""
-                application_status = "stopped"
-                application_deep_link = ""
+        for deployed_workflow in deployed_workflows:
+            workflow: db_model.Workflow = deployed_workflow.workflow
 
-                # First check CML model status
-                model_status = "stopped"
-                try:
-                    if not deployed_workflow.cml_deployed_model_id:
-                        model_status = "stopped"
-                    else:
-                        # Fetch model builds
-                        model_builds = cml.list_model_builds(
-                            project_id=os.getenv("CDSW_PROJECT_ID"), model_id=deployed_workflow.cml_deployed_model_id
-                        ).model_builds
-
-                        for build in model_builds:
-                            # Fetch model deployments for each build
-                            model_deployments = cml.list_model_deployments(
-                                project_id=os.getenv("CDSW_PROJECT_ID"),
-                                model_id=deployed_workflow.cml_deployed_model_id,
-                                build_id=build.id,
-                            ).model_deployments
-
-                            # Check each deployment's status
-                            for deployment in model_deployments:
-                                deployment_status = deployment.status.lower()
-                                if deployment_status not in ["stopped", "failed"]:
-                                    model_status = deployment_status
-                                    break
-                            if model_status != "stopped":
-                                break
+            # Initialize variables with default values
+            application_url = ""
+            application_status = "stopped"
+            application_deep_link = ""
 
-                except Exception as e:
-                    print(f"Failed to get model status for workflow {deployed_workflow.id}: {str(e)}")
-                    model_status = "error"
-
-                # Only check application status if model is running
-                if model_status == "deployed":
-                    try:
-                        workflow_app_name = get_application_name_for_deployed_workflow(deployed_workflow)
-                        matching_app = next((app for app in applications if app["name"] == workflow_app_name), None)
-
-                        if matching_app:
-                            application_url = matching_app.get("url", "")
-                            application_status = matching_app.get("status", "stopped")
-                    except Exception as e:
-                        print(f"Failed to get application details for workflow {deployed_workflow.id}: {str(e)}")
-                        application_status = "error"
+            # First check CML model status
+            model_status = "stopped"
+            try:
+                if not deployed_workflow.cml_deployed_model_id:
+                    model_status = "stopped"
                 else:
-                    application_status = model_status
+                    # Fetch model builds
+                    model_builds = cml.list_model_builds(
+                        project_id=os.getenv("CDSW_PROJECT_ID"), model_id=deployed_workflow.cml_deployed_model_id
+                    ).model_builds
+
+                    for build in model_builds:
+                        # Fetch model deployments for each build
+                        model_deployments = cml.list_model_deployments(
+                            project_id=os.getenv("CDSW_PROJECT_ID"),
+                            model_id=deployed_workflow.cml_deployed_model_id,
+                            build_id=build.id,
+                        ).model_deployments
+
+                        # Check each deployment's status
+                        for deployment in model_deployments:
+                            deployment_status = deployment.status.lower()
+                            if deployment_status not in ["stopped", "failed"]:
+                                model_status = deployment_status
+                                break
+                        if model_status != "stopped":
+                            break
 
-                # Get deep links separately - regardless of status
-                # Initialize deep links with empty strings
-                application_deep_link = ""
-                model_deep_link = ""
+            except Exception as e:
+                print(f"Failed to get model status for workflow {deployed_workflow.id}: {str(e)}")
+                model_status = "error"
 
+            # Only check application status if model is running
+            if model_status == "deployed":
                 try:
-                    # Get application deep link
                     workflow_app_name = get_application_name_for_deployed_workflow(deployed_workflow)
                     matching_app = next((app for app in applications if app["name"] == workflow_app_name), None)
-                    if matching_app and "projectHtmlUrl" in matching_app and "id" in matching_app:
-                        application_deep_link = f"{matching_app['projectHtmlUrl']}/applications/{matching_app['id']}"
-                except Exception as e:
-                    print(f"Failed to get application deep link for workflow {deployed_workflow.id}: {str(e)}")
-                    application_deep_link = ""
 
-                try:
-                    # Get model deep link
-                    model_deep_link = model_urls.get(deployed_workflow.cml_deployed_model_id, "")
+                    if matching_app:
+                        application_url = matching_app.get("url", "")
+                        application_status = matching_app.get("status", "stopped")
                 except Exception as e:
-                    print(f"Failed to get model deep link for workflow {deployed_workflow.id}: {str(e)}")
-                    model_deep_link = ""
-
-                # TODO: migrate all statuses and application URLs to use deployment_metadata
-                if deployed_workflow.status in [
-                    DeploymentStatus.INITIALIZED,
-                    DeploymentStatus.PACKAGING,
-                    DeploymentStatus.PACKAGED,
-                    DeploymentStatus.DEPLOYING,
-                ]:
-                    application_status = "start"
+                    print(f"Failed to get application details for workflow {deployed_workflow.id}: {str(e)}")
+                    application_status = "error"
+            else:
+                application_status = model_status
 
-                try:
-                    deployed_workflow_instances.append(
-                        DeployedWorkflow(
-                            deployed_workflow_id=deployed_workflow.id,
-                            workflow_id=workflow.id,
-                            deployed_workflow_name=deployed_workflow.name,
-                            workflow_name=workflow.name,
-                            cml_deployed_model_id=deployed_workflow.cml_deployed_model_id,
-                            is_stale=deployed_workflow.is_stale,
-                            application_url=application_url,
-                            application_status=application_status,
-                            application_deep_link=application_deep_link,
-                            model_deep_link=model_deep_link,
-                            deployment_metadata=deployed_workflow.deployment_metadata or "{}",
-                        )
+            # Get deep links separately - regardless of status
+            # Initialize deep links with empty strings
+            application_deep_link = ""
+            model_deep_link = ""
+
+            try:
+                # Get application deep link
+                workflow_app_name = get_application_name_for_deployed_workflow(deployed_workflow)
+                matching_app = next((app for app in applications if app["name"] == workflow_app_name), None)
+                if matching_app and "projectHtmlUrl" in matching_app and "id" in matching_app:
+                    application_deep_link = f"{matching_app['projectHtmlUrl']}/applications/{matching_app['id']}"
+            except Exception as e:
+                print(f"Failed to get application deep link for workflow {deployed_workflow.id}: {str(e)}")
+                application_deep_link = ""
+
+            try:
+                # Get model deep link
+                model_deep_link = model_urls.get(deployed_workflow.cml_deployed_model_id, "")
+            except Exception as e:
+                print(f"Failed to get model deep link for workflow {deployed_workflow.id}: {str(e)}")
+                model_deep_link = ""
+
+            # TODO: migrate all statuses and application URLs to use deployment_metadata
+            if deployed_workflow.status in [
+                DeploymentStatus.INITIALIZED,
+                DeploymentStatus.PACKAGING,
+                DeploymentStatus.PACKAGED,
+                DeploymentStatus.DEPLOYING,
+            ]:
+                application_status = "start"
+
+            try:
+                deployed_workflow_instances.append(
+                    DeployedWorkflow(
+                        deployed_workflow_id=deployed_workflow.id,
+                        workflow_id=workflow.id,
+                        deployed_workflow_name=deployed_workflow.name,
+                        workflow_name=workflow.name,
+                        cml_deployed_model_id=deployed_workflow.cml_deployed_model_id,
+                        is_stale=deployed_workflow.is_stale,
+                        application_url=application_url,
+                        application_status=application_status,
+                        application_deep_link=application_deep_link,
+                        model_deep_link=model_deep_link,
+                        deployment_metadata=deployed_workflow.deployment_metadata or "{}",
                     )
-                except Exception as e:
-                    print(f"Error creating DeployedWorkflow object for workflow {deployed_workflow.id}: {str(e)}")
-                    continue
+                )
+            except Exception as e:
+                print(f"Error creating DeployedWorkflow object for workflow {deployed_workflow.id}: {str(e)}")
+                continue
 
-            return ListDeployedWorkflowsResponse(deployed_workflows=deployed_workflow_instances)
+        return ListDeployedWorkflowsResponse(deployed_workflows=deployed_workflow_instances)
     except SQLAlchemyError as e:
         raise RuntimeError(f"Database error occurred while listing deployed workflows: {str(e)}")
     except Exception as e:
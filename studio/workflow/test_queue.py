@@ -0,0 +1,324 @@
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import requests
+from cmlapi import CMLServiceApi
+
+from studio.db import model as db_model
+from studio.db.dao import AgentStudioDao
+from studio.workflow.runners import (
+    NoWorkflowRunnersAvailable,
+    WorkflowRunnerRegistry,
+    get_workflow_runner_registry,
+)
+from studio.workflow.utils import get_llm_config_for_workflow
+
+
+# Maximum number of test runs waiting for a runner. Submissions beyond this
+# are rejected so a runaway client cannot grow the queue without bound.
+WORKFLOW_TEST_QUEUE_MAX_DEPTH = int(os.getenv("AGENT_STUDIO_WORKFLOW_TEST_QUEUE_MAX_DEPTH", "50"))
+# How often the scheduler retries dispatching while test runs are waiting.
+WORKFLOW_TEST_QUEUE_POLL_INTERVAL_SECONDS = float(os.getenv("AGENT_STUDIO_WORKFLOW_TEST_QUEUE_POLL_INTERVAL", "2"))
+# How long dispatched, cancelled and failed submissions are kept before pruning.
+WORKFLOW_TEST_QUEUE_RETENTION_SECONDS = float(os.getenv("AGENT_STUDIO_WORKFLOW_TEST_QUEUE_RETENTION", "86400"))
+
+SUBMISSION_QUEUED = "QUEUED"
+SUBMISSION_DISPATCHING = "DISPATCHING"
+SUBMISSION_DISPATCHED = "DISPATCHED"
+SUBMISSION_CANCELLED = "CANCELLED"
+SUBMISSION_FAILED = "FAILED"
+
+# Event published on a test run's trace while it waits for a runner.
+WORKFLOW_TEST_QUEUED_EVENT = "workflow_test_queued"
+
+# Payload key recording that a submission came with tool/MCP parameters,
+# which are held in memory only.
+HAS_RUN_PARAMETERS_KEY = "has_run_parameters"
+
+
+class WorkflowTestQueueFull(RuntimeError):
+    pass
+
+
+def post_trace_event(trace_id: str, event: Dict[str, Any]) -> None:
+    """
+    Publish an event on a test run's trace, alongside the events the
+    workflow engine sends once the run starts.
+    """
+    # Imported here so the gRPC service only loads the ops client when a
+    # test run is actually queued.
+    from studio.ops import get_ops_endpoint
+
+    try:
+        requests.post(
+            url=f"{get_ops_endpoint()}/events",
+            headers={"Authorization": f"Bearer {os.getenv('CDSW_APIV2_KEY')}"},
+            json={"trace_id": trace_id, "event": event},
+            timeout=10,
+        )
+    except Exception as e:
+        print(f"Failed to publish {event.get('type')} event for trace {trace_id}: {e}")
+
+
+class WorkflowTestQueue:
+    """
+    Durable FIFO/priority queue of workflow test runs. Submissions are stored
+    in the studio database so bursts of test runs wait for a free workflow
+    runner instead of being rejected, and survive a studio restart. A
+    scheduler thread dispatches the highest priority, oldest submission
+    whenever a runner has capacity, and publishes each waiting run's queue
+    position on its trace.
+
+    Tool user parameters and MCP environment variables (API keys, tokens) are
+    never written to the database: they are kept in memory until the run is
+    dispatched, and the LLM config is resolved from the database at dispatch.
+    A run recovered after a restart that had such parameters fails and has
+    to be submitted again.
+    """
+
+    def __init__(
+        self,
+        dao: AgentStudioDao,
+        cml: Optional[CMLServiceApi] = None,
+        registry: Optional[WorkflowRunnerRegistry] = None,
+        max_depth: int = WORKFLOW_TEST_QUEUE_MAX_DEPTH,
+    ):
+        self.dao = dao
+        self.cml = cml
+        self.registry = registry or get_workflow_runner_registry()
+        self.max_depth = max_depth
+        # Serializes status transitions between submit/cancel and the scheduler.
+        self._lock = threading.Lock()
+        self._schedule_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._reported_positions: Dict[str, Tuple[int, int]] = {}
+        # Tool and MCP configs of waiting runs, keyed on trace ID.
+        self._run_parameters: Dict[str, Dict[str, Any]] = {}
+        self._last_prune = 0.0
+
+    def _queued(self, session) -> List[db_model.WorkflowTestSubmission]:
+        return (
+            session.query(db_model.WorkflowTestSubmission)
+            .filter_by(status=SUBMISSION_QUEUED)
+            .order_by(
+                db_model.WorkflowTestSubmission.priority.desc(),
+                db_model.WorkflowTestSubmission.submitted_at.asc(),
+            )
+            .all()
+        )
+
+    def submit(
+        self,
+        workflow_id: str,
+        payload: Dict[str, Any],
+        priority: int = 0,
+        tool_config: Optional[Dict[str, Any]] = None,
+        mcp_config: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[str, int]:
+        """
+        Queue a test run and wake the scheduler. The payload is the /kickoff
+        payload without "llm_config", "tool_config", "mcp_config" and
+        "events_trace_id"; the tool and MCP configs are passed separately and
+        only held in memory. Returns the trace ID of the run and its queue
+        position (1 is next).
+        """
+        if not self.registry.get_runners():
+            raise NoWorkflowRunnersAvailable("No workflow runners currently available!")
+
+        trace_id = str(uuid4())
+        with self._lock, self.dao.get_session() as session:
+            queued = self._queued(session)
+            if len(queued) >= self.max_depth:
+                raise WorkflowTestQueueFull(f"Workflow test queue is full ({self.max_depth} test runs waiting).")
+            session.add(
+                db_model.WorkflowTestSubmission(
+                    id=trace_id,
+                    workflow_id=workflow_id,
+                    priority=priority,
+                    status=SUBMISSION_QUEUED,
+                    payload=dict(
+                        payload, events_trace_id=trace_id, **{HAS_RUN_PARAMETERS_KEY: bool(tool_config or mcp_config)}
+                    ),
+                    submitted_at=time.time(),
+                )
+            )
+            self._run_parameters[trace_id] = {"tool_config": tool_config or {}, "mcp_config": mcp_config or {}}
+            position = 1 + sum(1 for submission in queued if submission.priority >= priority)
+
+        self._wakeup.set()
+        return trace_id, position
+
+    def cancel(self, trace_id: str) -> bool:
+        """
+        Cancel a test run that is still waiting for a runner. Returns False if
+        it was already dispatched or is unknown.
+        """
+        with self._lock, self.dao.get_session() as session:
+            submission = session.get(db_model.WorkflowTestSubmission, trace_id)
+            if submission is None or submission.status != SUBMISSION_QUEUED:
+                return False
+            submission.status = SUBMISSION_CANCELLED
+            submission.payload = None
+            submission.finished_at = time.time()
+
+        self._reported_positions.pop(trace_id, None)
+        self._run_parameters.pop(trace_id, None)
+        post_trace_event(trace_id, {"type": "crew_kickoff_failed", "error": "Workflow test was cancelled."})
+        self._wakeup.set()
+        return True
+
+    def get_position(self, trace_id: str) -> Optional[int]:
+        """
+        Current queue position of a waiting test run, or None if it is not queued.
+        """
+        with self.dao.get_session() as session:
+            for position, submission in enumerate(self._queued(session), start=1):
+                if submission.id == trace_id:
+                    return position
+        return None
+
+    def _claim_next(self) -> Optional[Tuple[str, str, Dict[str, Any]]]:
+        with self._lock, self.dao.get_session() as session:
+            queued = self._queued(session)
+            if not queued:
+                return None
+            submission = queued[0]
+            submission.status = SUBMISSION_DISPATCHING
+            return submission.id, submission.workflow_id, dict(submission.payload)
+
+    def _finish(self, trace_id: str, status: str, error: Optional[str] = None) -> None:
+        with self._lock, self.dao.get_session() as session:
+            submission = session.get(db_model.WorkflowTestSubmission, trace_id)
+            submission.status = status
+            submission.error = error
+            if status == SUBMISSION_QUEUED:
+                return
+            submission.payload = None
+            submission.finished_at = time.time()
+        self._reported_positions.pop(trace_id, None)
+        self._run_parameters.pop(trace_id, None)
+
+    def _dispatch(self, trace_id: str, workflow_id: str, payload: Dict[str, Any]) -> None:
+        # Secrets are never stored in the queue: the LLM config (with API keys)
+        # is resolved from the database at dispatch time, and the tool and MCP
+        # configs were held in memory since submission.
+        had_run_parameters = payload.pop(HAS_RUN_PARAMETERS_KEY, False)
+        run_parameters = self._run_parameters.get(trace_id)
+        if run_parameters is None:
+            if had_run_parameters:
+                raise RuntimeError(
+                    "The tool and MCP parameters of this test run are not persisted and were lost "
+                    "when the studio restarted. Please run the test again."
+                )
+            run_parameters = {"tool_config": {}, "mcp_config": {}}
+        with self.dao.get_session() as session:
+            workflow = session.query(db_model.Workflow).filter_by(id=workflow_id).one()
+            llm_config = get_llm_config_for_workflow(workflow, session, self.cml)
+        resp = self.registry.dispatch("/kickoff", dict(payload, llm_config=llm_config, **run_parameters))
+        if not resp.ok:
+            raise RuntimeError(f"Workflow runner rejected the test run: {resp.status_code} {resp.text}")
+
+    def schedule(self) -> int:
+        """
+        Dispatch waiting test runs, highest priority and oldest first, until
+        the queue is empty or every runner is busy. Returns the number of
+        test runs dispatched.
+        """
+        dispatched = 0
+        with self._schedule_lock:
+            while True:
+                claimed = self._claim_next()
+                if claimed is None:
+                    break
+                trace_id, workflow_id, payload = claimed
+                try:
+                    self._dispatch(trace_id, workflow_id, payload)
+                except NoWorkflowRunnersAvailable:
+                    self._finish(trace_id, SUBMISSION_QUEUED)
+                    break
+                except Exception as e:
+                    print(f"Failed to dispatch queued workflow test {trace_id}: {e}")
+                    self._finish(trace_id, SUBMISSION_FAILED, error=str(e))
+                    post_trace_event(trace_id, {"type": "crew_kickoff_failed", "error": str(e)})
+                    continue
+                self._finish(trace_id, SUBMISSION_DISPATCHED)
+                dispatched += 1
+            self._report_positions()
+            self._prune()
+        return dispatched
+
+    def _report_positions(self) -> None:
+        """
+        Publish the queue position of every waiting test run whose position
+        or the queue depth changed since it was last reported.
+        """
+        with self.dao.get_session() as session:
+            queued_ids = [submission.id for submission in self._queued(session)]
+        depth = len(queued_ids)
+        for position, trace_id in enumerate(queued_ids, start=1):
+            if self._reported_positions.get(trace_id) == (position, depth):
+                continue
+            self._reported_positions[trace_id] = (position, depth)
+            post_trace_event(trace_id, {"type": WORKFLOW_TEST_QUEUED_EVENT, "position": position, "queue_depth": depth})
+
+    def _prune(self) -> None:
+        now = time.time()
+        if now - self._last_prune < WORKFLOW_TEST_QUEUE_POLL_INTERVAL_SECONDS * 30:
+            return
+        self._last_prune = now
+        with self._lock, self.dao.get_session() as session:
+            session.query(db_model.WorkflowTestSubmission).filter(
+                db_model.WorkflowTestSubmission.status.in_(
+                    [SUBMISSION_DISPATCHED, SUBMISSION_CANCELLED, SUBMISSION_FAILED]
+                ),
+                db_model.WorkflowTestSubmission.finished_at < now - WORKFLOW_TEST_QUEUE_RETENTION_SECONDS,
+            ).delete(synchronize_session=False)
+
+    def _recover(self) -> None:
+        # A submission left mid-dispatch by a previous process may or may not
+        # have reached a runner; queue it again rather than lose it.
+        with self._lock, self.dao.get_session() as session:
+            session.query(db_model.WorkflowTestSubmission).filter_by(status=SUBMISSION_DISPATCHING).update(
+                {"status": SUBMISSION_QUEUED}, synchronize_session=False
+            )
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self.schedule()
+            except Exception as e:
+                print(f"Workflow test scheduler error: {e}")
+            self._wakeup.wait(WORKFLOW_TEST_QUEUE_POLL_INTERVAL_SECONDS)
+            self._wakeup.clear()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._recover()
+        self._thread = threading.Thread(target=self._run, name="workflow-test-scheduler", daemon=True)
+        self._thread.start()
+
+
+_queue: Optional[WorkflowTestQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_workflow_test_queue(dao: AgentStudioDao, cml: Optional[CMLServiceApi] = None) -> WorkflowTestQueue:
+    """
+    Get the process-wide test queue, starting its scheduler on first use.
+    Tuned with:
+
+      AGENT_STUDIO_WORKFLOW_TEST_QUEUE_MAX_DEPTH       test runs allowed to wait (default 50)
+      AGENT_STUDIO_WORKFLOW_TEST_QUEUE_POLL_INTERVAL   seconds between dispatch retries (default 2)
+      AGENT_STUDIO_WORKFLOW_TEST_QUEUE_RETENTION       seconds finished submissions are kept (default 86400)
+    """
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = WorkflowTestQueue(dao, cml)
+            _queue.start()
+        return _queue
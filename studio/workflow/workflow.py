@@ -23,6 +23,15 @@ from studio.proto.agent_studio_pb2 import (
     ListWorkflowsResponse,
     GetWorkflowResponse,
 )
+import studio.consts as consts
+
+# Import engine code manually. Eventually when this code becomes
+# a separate git repo, or a custom runtime image, this path call
+# will go away and workflow engine features will be available already.
+import sys
+
+sys.path.append("studio/workflow_engine/src/")
+from engine.crewai.venv_store import get_tool_venv_store
 
 
 def _validate_agents(metadata: CrewAIWorkflowMetadata, cml: CMLServiceApi, dao: AgentStudioDao = None) -> None:
@@ -282,7 +291,7 @@ def list_workflows(
     and extract unique placeholders from task descriptions.
     """
     try:
-        with dao.get_session() as session:
+        with dao.get_session(read_only=True) as session:
             workflows: List[db_model.Workflow] = session.query(db_model.Workflow).all()
             if not workflows:
                 return ListWorkflowsResponse(workflows=[])
@@ -322,7 +331,7 @@ def get_workflow(request: GetWorkflowRequest, cml: CMLServiceApi, dao: AgentStud
         if not request.workflow_id:
             raise ValueError("Workflow ID is required.")
 
-        with dao.get_session() as session:
+        with dao.get_session(read_only=True) as session:
             workflow = session.query(db_model.Workflow).filter_by(id=request.workflow_id).one_or_none()
             if not workflow:
                 raise ValueError(f"Workflow with ID '{request.workflow_id}' not found.")
@@ -446,6 +455,8 @@ def _delete_workflow_directory(directory: str):
         if os.path.exists(directory):
             shutil.rmtree(directory)
             print(f"Deleted workflow directory: {directory}")
+        # Reclaim shared tool environments only the deleted tools were using.
+        get_tool_venv_store(consts.TOOL_VENV_STORE_LOCATION).collect_garbage()
     except Exception as e:
         print(f"Failed to delete workflow directory: {e}")
 
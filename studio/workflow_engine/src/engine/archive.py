@@ -0,0 +1,195 @@
+# No top level studio.db imports allowed to support wokrflow model deployment
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+
+# Leading bytes of a zstd frame, used to tell zstd artifacts from gzip ones.
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# First member of artifacts packaged by the studio: every other file in the
+# artifact with its size and sha256. It is written into the destination last,
+# once all files are extracted and verified, so an extraction can be skipped
+# while the destination still matches it.
+ARTIFACT_MANIFEST_FILE_NAME = ".artifact_manifest.json"
+ARTIFACT_MANIFEST_VERSION = 1
+
+
+def is_zstd_archive(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(ZSTD_MAGIC)) == ZSTD_MAGIC
+
+
+def hash_file(path: str) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def build_artifact_manifest(files: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Manifest of an artifact, given {arcname: {"sha256": ..., "size": ...}}.
+    """
+    return {"version": ARTIFACT_MANIFEST_VERSION, "files": dict(sorted(files.items()))}
+
+
+@contextmanager
+def open_artifact_archive(path: str, stream: bool = False):
+    """
+    Open a packaged deployment artifact for reading. Artifacts are tarballs
+    compressed with gzip, or with zstd when the studio packaged them with
+    AGENT_STUDIO_DEPLOYMENT_ARTIFACT_COMPRESSION=zstd. zstd artifacts are always
+    read as a stream and need the optional zstandard package. Streamed gzip
+    artifacts are decompressed by pigz, on a separate core, when available.
+    """
+    if is_zstd_archive(path):
+        import zstandard
+
+        with open(path, "rb") as f, zstandard.ZstdDecompressor().stream_reader(f) as reader:
+            with tarfile.open(fileobj=reader, mode="r|") as tar:
+                yield tar
+    elif stream and shutil.which("pigz"):
+        proc = subprocess.Popen([shutil.which("pigz"), "-dc", path], stdout=subprocess.PIPE)
+        try:
+            with tarfile.open(fileobj=proc.stdout, mode="r|") as tar:
+                yield tar
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+    elif stream:
+        with tarfile.open(path, "r|*") as tar:
+            yield tar
+    else:
+        with tarfile.open(path, "r:*") as tar:
+            yield tar
+
+
+def read_artifact_manifest(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the manifest of an artifact without decompressing the rest of it.
+    Returns None for artifacts packaged without one.
+    """
+    with open_artifact_archive(path, stream=True) as tar:
+        member = tar.next()
+        if member is None or member.name != ARTIFACT_MANIFEST_FILE_NAME or not member.isfile():
+            return None
+        try:
+            return json.load(tar.extractfile(member))
+        except ValueError:
+            return None
+
+
+def is_artifact_extracted(destination_path: str, manifest: Dict[str, Any]) -> bool:
+    """
+    Whether a destination already holds an artifact's files: the manifest
+    written after its last extraction matches, and every file is still there
+    with its recorded size.
+    """
+    try:
+        with open(os.path.join(destination_path, ARTIFACT_MANIFEST_FILE_NAME), "r") as f:
+            if json.load(f) != manifest:
+                return False
+    except (OSError, ValueError):
+        return False
+    for arcname, info in manifest["files"].items():
+        try:
+            if os.path.getsize(os.path.join(destination_path, arcname)) != info["size"]:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _is_within(directory: str, path: str) -> bool:
+    return os.path.commonpath([directory, path]) == directory
+
+
+def safe_members(tar: tarfile.TarFile, destination_path: str) -> Iterator[tarfile.TarInfo]:
+    """
+    Members of an archive that stay inside the destination. Absolute paths,
+    paths escaping through "..", links pointing outside the destination and
+    device files are skipped. The manifest is skipped too; it is written once
+    extraction is verified.
+    """
+    destination_path = os.path.realpath(destination_path)
+    for member in tar:
+        if member.name == ARTIFACT_MANIFEST_FILE_NAME:
+            continue
+        target = os.path.realpath(os.path.join(destination_path, member.name))
+        unsafe = os.path.isabs(member.name) or not _is_within(destination_path, target)
+        if member.issym():
+            link_target = os.path.join(os.path.dirname(target), member.linkname)
+            unsafe = unsafe or os.path.isabs(member.linkname)
+            unsafe = unsafe or not _is_within(destination_path, os.path.realpath(link_target))
+        elif member.islnk():
+            link_target = os.path.join(destination_path, member.linkname)
+            unsafe = unsafe or not _is_within(destination_path, os.path.realpath(link_target))
+        elif not (member.isfile() or member.isdir()):
+            unsafe = True
+        if unsafe:
+            print(f"Skipping unsafe artifact member {member.name}")
+            continue
+        yield member
+
+
+def verify_artifact_files(destination_path: str, manifest: Dict[str, Any]) -> None:
+    """
+    Check every extracted file against the manifest's hashes.
+    """
+    files = manifest["files"]
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        hashes = dict(
+            zip(files, executor.map(lambda arcname: hash_file(os.path.join(destination_path, arcname)), files))
+        )
+    mismatched = [arcname for arcname, info in files.items() if hashes[arcname] != info["sha256"]]
+    if mismatched:
+        raise RuntimeError(f"Artifact integrity check failed for {len(mismatched)} files: {', '.join(mismatched[:5])}")
+
+
+def extract_artifact(artifact_location: str, destination_path: str) -> Dict[str, Any]:
+    """
+    Extract a packaged artifact into a directory, skipping the extraction
+    when the directory already matches the artifact's manifest. Returns
+    whether it was skipped, the number of files and the time taken.
+    """
+    start = time.monotonic()
+    os.makedirs(destination_path, exist_ok=True)
+
+    manifest = read_artifact_manifest(artifact_location)
+    if manifest is not None and is_artifact_extracted(destination_path, manifest):
+        seconds = time.monotonic() - start
+        print(
+            f"{os.path.basename(artifact_location)} already extracted to {destination_path}, skipped ({seconds:.2f}s)"
+        )
+        return {"skipped": True, "files": len(manifest["files"]), "seconds": seconds}
+
+    # Drop a stale manifest first so an interrupted extraction is never skipped.
+    manifest_path = os.path.join(destination_path, ARTIFACT_MANIFEST_FILE_NAME)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+    with open_artifact_archive(artifact_location, stream=True) as tar:
+        tar.extractall(path=destination_path, members=safe_members(tar, destination_path), **extract_kwargs)
+
+    if manifest is not None:
+        verify_artifact_files(destination_path, manifest)
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f)
+
+    seconds = time.monotonic() - start
+    files = len(manifest["files"]) if manifest is not None else None
+    print(f"Extracted {os.path.basename(artifact_location)} to {destination_path} in {seconds:.2f}s")
+    return {"skipped": False, "files": files, "seconds": seconds}
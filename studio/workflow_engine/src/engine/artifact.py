@@ -1,26 +1,15 @@
-import os
-import tarfile
-
+from engine.archive import extract_artifact
 from engine.crewai.artifact import is_crewai_workflow, get_crewai_workflow_name
 from engine.langgraph.artifact import is_langgraph_workflow, get_langgraph_workflow_name
 
 
 def extract_artifact_to_location(artifact_location: str, destination_path: str):
     """
-    Extract a packaged workflow artifact to a specified directory.
+    Extract a packaged workflow artifact to a specified directory. Extraction
+    is skipped when the directory already holds this artifact's files, and
+    returns the time it took so cold starts can be tracked.
     """
-
-    tarball_path = os.path.join(artifact_location)
-    extract_path = os.path.join(destination_path)
-
-    # Ensure destination directory exists
-    os.makedirs(extract_path, exist_ok=True)
-
-    # Extract the tarball
-    with tarfile.open(tarball_path, "r:gz") as tar:
-        tar.extractall(path=extract_path)
-
-    print(f"Extracted {os.path.basename(artifact_location)} to {extract_path}")
+    return extract_artifact(artifact_location, destination_path)
 
 
 def get_workflow_name(workflow_dir: str) -> str:
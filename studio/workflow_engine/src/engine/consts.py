@@ -16,3 +16,7 @@ AGENT_STUDIO_OPS_APPLICATION_NAME = "Agent Studio - Agent Ops & Metrics"
 
 START_TRACE_ID_KEY = "<start_trace_id>"
 END_TRACE_ID_KEY = "<end_trace_id>"
+
+# Directory inside a deployment artifact holding pre-built wheels for every
+# tool's requirements, referenced by the "wheelhouse" key of workflow.yaml.
+TOOL_WHEELHOUSE_LOCATION = "wheelhouse"
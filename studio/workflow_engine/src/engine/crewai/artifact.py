@@ -1,23 +1,198 @@
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 import os
+import threading
+import time
 import yaml
 import json
 
-from engine.types import CollatedInput
+from engine.types import CollatedInput, Input__ToolInstance
 from engine.crewai.tracing import reset_crewai_instrumentation, instrument_crewai_workflow
 from engine.crewai.events import register_global_handlers
-from engine.crewai.tools import prepare_virtual_env_for_tool
+from engine.crewai.tools import get_uv_cache_dir, prepare_virtual_env_for_tool
+
+
+# Number of tool virtual environments prepared concurrently when a workflow
+# is loaded. Installs are mostly network and disk bound, so a few in flight
+# cut warm-up time without starving the model of CPU.
+TOOL_VENV_PREPARATION_WORKERS = int(os.getenv("AGENT_STUDIO_TOOL_VENV_PREPARATION_WORKERS", "4"))
+
+TOOL_VENV_PENDING = "pending"
+TOOL_VENV_PREPARING = "preparing"
+TOOL_VENV_READY = "ready"
+TOOL_VENV_FAILED = "failed"
+
+
+class ToolVenvWarmup:
+    """
+    Readiness of a loaded workflow's tool virtual environments. Preparation
+    runs in the background so the model can serve (and report its warm-up
+    progress) while requirements install; kickoffs wait on it instead.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._tools: Dict[str, Dict[str, Any]] = {}
+        self._error: Optional[str] = None
+        self._wheelhouse_dir: Optional[str] = None
+
+    def _set(self, tool_id: str, **status) -> None:
+        with self._lock:
+            self._tools[tool_id].update(status)
+
+    def _prepare(self, directory: str, tool_instance: Input__ToolInstance) -> float:
+        self._set(tool_instance.id, status=TOOL_VENV_PREPARING)
+        print(f"PREPARING VIRTUAL ENV FOR {tool_instance.name}")
+        start = time.monotonic()
+        try:
+            prepare_virtual_env_for_tool(
+                os.path.join(directory, tool_instance.source_folder_path),
+                tool_instance.python_requirements_file_name,
+                wheelhouse_dir=self._wheelhouse_dir,
+            )
+        except Exception as e:
+            elapsed = time.monotonic() - start
+            print(f"FAILED TO PREPARE VIRTUAL ENV FOR {tool_instance.name} after {elapsed:.1f}s: {e}")
+            self._set(tool_instance.id, status=TOOL_VENV_FAILED, seconds=elapsed, error=str(e))
+            raise
+        elapsed = time.monotonic() - start
+        print(f"PREPARED VIRTUAL ENV FOR {tool_instance.name} in {elapsed:.1f}s")
+        self._set(tool_instance.id, status=TOOL_VENV_READY, seconds=elapsed)
+        return elapsed
+
+    def run(
+        self,
+        directory: str,
+        collated_input: CollatedInput,
+        max_workers: Optional[int] = None,
+        wheelhouse_dir: Optional[str] = None,
+    ) -> None:
+        """
+        Prepare every tool's virtual environment, at most `max_workers` at a
+        time, installing from `wheelhouse_dir` if the artifact ships pre-built
+        wheels. Raises the first failure once all preparations have finished.
+        """
+        with self._lock:
+            self._done.clear()
+            self._error = None
+            self._wheelhouse_dir = wheelhouse_dir
+            self._tools = {
+                tool_instance.id: {"name": tool_instance.name, "status": TOOL_VENV_PENDING}
+                for tool_instance in collated_input.tool_instances
+            }
+        # Every tool installs through the same uv cache so packages shared
+        # between tools are downloaded and built once.
+        os.environ.setdefault("UV_CACHE_DIR", get_uv_cache_dir())
+
+        start = time.monotonic()
+        errors: List[Exception] = []
+        try:
+            if collated_input.tool_instances:
+                workers = max(1, min(max_workers or TOOL_VENV_PREPARATION_WORKERS, len(collated_input.tool_instances)))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tool-venv") as executor:
+                    futures = [
+                        executor.submit(self._prepare, directory, tool_instance)
+                        for tool_instance in collated_input.tool_instances
+                    ]
+                    for future in futures:
+                        try:
+                            future.result()
+                        except Exception as e:
+                            errors.append(e)
+            print(
+                f"PREPARED {len(collated_input.tool_instances) - len(errors)}/{len(collated_input.tool_instances)} "
+                f"TOOL VIRTUAL ENVS in {time.monotonic() - start:.1f}s"
+            )
+        except Exception as e:
+            errors.append(e)
+        finally:
+            with self._lock:
+                self._error = str(errors[0]) if errors else None
+            self._done.set()
+        if errors:
+            raise errors[0]
+
+    def start(
+        self,
+        directory: str,
+        collated_input: CollatedInput,
+        max_workers: Optional[int] = None,
+        wheelhouse_dir: Optional[str] = None,
+    ) -> None:
+        """
+        Prepare the tool virtual environments on a background thread.
+        """
+
+        def run():
+            try:
+                self.run(directory, collated_input, max_workers, wheelhouse_dir)
+            except Exception:
+                # Already recorded in the readiness state and logged per tool.
+                pass
+
+        self._done.clear()
+        self._thread = threading.Thread(target=run, name="tool-venv-warmup", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for preparation to finish. Returns False on timeout.
+        """
+        return self._done.wait(timeout)
+
+    def get_failure(self) -> Optional[str]:
+        """
+        Once preparation has finished with a failure, a message naming each
+        tool whose virtual environment could not be prepared and why.
+        None while preparation is running or after it succeeded.
+        """
+        with self._lock:
+            if not self._done.is_set() or self._error is None:
+                return None
+            failures = [
+                f"{status['name']}: {status['error']}"
+                for status in self._tools.values()
+                if status["status"] == TOOL_VENV_FAILED
+            ]
+            return "Tool virtual environments failed to prepare: " + "; ".join(failures or [self._error])
+
+    def get_readiness(self) -> Dict[str, Any]:
+        with self._lock:
+            done = self._done.is_set()
+            return {
+                "ready": done and self._error is None,
+                "failed": done and self._error is not None,
+                "error": self._error,
+                "tool_virtual_envs": {tool_id: dict(status) for tool_id, status in self._tools.items()},
+            }
+
+
+_tool_venv_warmup = ToolVenvWarmup()
+
+
+def get_tool_venv_warmup() -> ToolVenvWarmup:
+    return _tool_venv_warmup
 
 
 # Currently the only artifact type supported for import is directory.
 # the collated input requirements are all relative to the workflow import path.
-def install_tool_virtual_envs(directory, collated_input: CollatedInput):
-    for tool_instance in collated_input.tool_instances:
-        print(f"PREPARING VIRTUAL ENV FOR {tool_instance.name}")
-        prepare_virtual_env_for_tool(
-            os.path.join(directory, tool_instance.source_folder_path),
-            tool_instance.python_requirements_file_name,
-        )
+def install_tool_virtual_envs(
+    directory, collated_input: CollatedInput, max_workers: Optional[int] = None, wheelhouse_dir: Optional[str] = None
+):
+    get_tool_venv_warmup().run(directory, collated_input, max_workers, wheelhouse_dir)
+
+
+def get_artifact_wheelhouse(workflow_dir: str, workflow_data: Any) -> Optional[str]:
+    """
+    Directory of pre-built tool wheels shipped with the artifact, if any.
+    """
+    wheelhouse = workflow_data.get("wheelhouse")
+    if not wheelhouse:
+        return None
+    wheelhouse_dir = os.path.join(workflow_dir, wheelhouse)
+    return wheelhouse_dir if os.path.isdir(wheelhouse_dir) else None
 
 
 def get_artifact_yaml_member(root_dir: str, member: str) -> Any:
@@ -95,10 +270,19 @@ def is_crewai_workflow(directory: str) -> bool:
         return False
 
 
-def load_crewai_workflow(directory: str) -> Any:
+def load_crewai_workflow(directory: str, wait_for_tool_venvs: bool = True) -> Any:
+    """
+    Load a CrewAI workflow artifact and prepare its tool virtual environments.
+    With `wait_for_tool_venvs` unset the environments are prepared in the
+    background; see get_tool_venv_warmup() for their readiness.
+    """
     workflow_data = get_artifact_workflow(directory)
     collated_input = get_collated_input(os.path.join(directory), workflow_data)
-    install_tool_virtual_envs(directory, collated_input)
+    wheelhouse_dir = get_artifact_wheelhouse(directory, workflow_data)
+    if wait_for_tool_venvs:
+        install_tool_virtual_envs(directory, collated_input, wheelhouse_dir=wheelhouse_dir)
+    else:
+        get_tool_venv_warmup().start(directory, collated_input, wheelhouse_dir=wheelhouse_dir)
 
     # Instrument our workflow given a specific workflow name and
     # set up the instrumentation. Also register our handlers.
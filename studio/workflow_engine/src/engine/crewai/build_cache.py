@@ -0,0 +1,112 @@
+# No top level studio.db imports allowed to support wokrflow model deployment
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict
+
+import engine.types as input_types
+from engine.crewai.llms import get_crewai_llm_kwargs
+from engine.crewai.tools import get_crewai_tool_factory
+
+
+# Maximum number of distinct workflow builds kept in memory. A deployed
+# workflow only ever needs one entry; workflow runners cycle through the
+# workflows being tested in the studio.
+CREWAI_BUILD_CACHE_SIZE = int(os.getenv("AGENT_STUDIO_CREWAI_BUILD_CACHE_SIZE", "16"))
+
+_build_cache: "OrderedDict[str, input_types.CrewAIBuildArtifacts]" = OrderedDict()
+_build_cache_lock = threading.Lock()
+_build_cache_stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def compute_crewai_build_key(
+    workflow_directory: str,
+    collated_input: input_types.CollatedInput,
+    tool_config: Dict[str, Dict[str, str]],
+    llm_config: Dict[str, Dict[str, str]],
+) -> str:
+    """
+    Content hash of everything that feeds the cached build artifacts: the
+    collated input, tool and LLM configs, and the mtime/size of every tool
+    file so edits to tool code invalidate the build.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(os.path.abspath(workflow_directory).encode("utf-8"))
+    hasher.update(collated_input.model_dump_json().encode("utf-8"))
+    hasher.update(json.dumps(tool_config, sort_keys=True, default=str).encode("utf-8"))
+    hasher.update(json.dumps(llm_config, sort_keys=True, default=str).encode("utf-8"))
+    for tool_instance in collated_input.tool_instances:
+        tool_file_path = os.path.join(
+            workflow_directory, tool_instance.source_folder_path, tool_instance.python_code_file_name
+        )
+        try:
+            stat = os.stat(tool_file_path)
+            hasher.update(f"{tool_file_path}:{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8"))
+        except OSError:
+            hasher.update(f"{tool_file_path}:missing".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _build_crewai_artifacts(
+    build_key: str,
+    workflow_directory: str,
+    collated_input: input_types.CollatedInput,
+    tool_config: Dict[str, Dict[str, str]],
+    llm_config: Dict[str, Dict[str, str]],
+) -> input_types.CrewAIBuildArtifacts:
+    llm_kwargs = {
+        l_.model_id: get_crewai_llm_kwargs(l_, llm_config.get(l_.model_id, {})) for l_ in collated_input.language_models
+    }
+    tool_factories = {
+        t_.id: get_crewai_tool_factory(t_, tool_config.get(t_.id, {}), workflow_directory)
+        for t_ in collated_input.tool_instances
+    }
+    return input_types.CrewAIBuildArtifacts(
+        build_key=build_key,
+        llm_kwargs=llm_kwargs,
+        tool_factories=tool_factories,
+    )
+
+
+def get_crewai_build_artifacts(
+    workflow_directory: str,
+    collated_input: input_types.CollatedInput,
+    tool_config: Dict[str, Dict[str, str]],
+    llm_config: Dict[str, Dict[str, str]],
+) -> input_types.CrewAIBuildArtifacts:
+    """
+    Return the cached build artifacts for a workflow, building them on a miss.
+    """
+    build_key = compute_crewai_build_key(workflow_directory, collated_input, tool_config, llm_config)
+    with _build_cache_lock:
+        artifacts = _build_cache.get(build_key)
+        if artifacts is not None:
+            _build_cache.move_to_end(build_key)
+            _build_cache_stats["hits"] += 1
+            return artifacts
+        _build_cache_stats["misses"] += 1
+
+    # Build outside the lock; a concurrent miss on the same key only costs a
+    # duplicate build, and the last writer wins.
+    artifacts = _build_crewai_artifacts(build_key, workflow_directory, collated_input, tool_config, llm_config)
+
+    with _build_cache_lock:
+        _build_cache[build_key] = artifacts
+        _build_cache.move_to_end(build_key)
+        while len(_build_cache) > CREWAI_BUILD_CACHE_SIZE:
+            _build_cache.popitem(last=False)
+            _build_cache_stats["evictions"] += 1
+    return artifacts
+
+
+def clear_crewai_build_cache() -> None:
+    with _build_cache_lock:
+        _build_cache.clear()
+
+
+def get_crewai_build_cache_stats() -> Dict[str, int]:
+    with _build_cache_lock:
+        return dict(_build_cache_stats, entries=len(_build_cache))
@@ -5,9 +5,8 @@ from crewai import Crew, Agent
 from crewai.tools import BaseTool
 
 import engine.types as input_types
-from engine.crewai.llms import get_crewai_llm
-from engine.crewai.tools import get_crewai_tool
-from engine.crewai.mcp import get_mcp_tools_for_crewai
+from engine.crewai.build_cache import get_crewai_build_artifacts
+from engine.crewai.mcp_pool import acquire_mcp_tools_for_crewai, release_mcp_objects
 from engine.crewai.agents import get_crewai_agent
 from engine.crewai.wrappers import *
 
@@ -19,57 +18,68 @@ def create_crewai_objects(
     mcp_config: Dict[str, Dict[str, str]],
     llm_config: Dict[str, Dict[str, str]],
 ) -> input_types.CrewAIObjects:
+    # Parsing tool code, generating tool classes and resolving LLM configs is
+    # cached per workflow build; only the objects CrewAI mutates during a run
+    # are instantiated here.
+    build_artifacts = get_crewai_build_artifacts(workflow_directory, collated_input, tool_config, llm_config)
+
     language_models: Dict[str, AgentStudioCrewAILLM] = {}
-    for l_ in collated_input.language_models:
-        language_models[l_.model_id] = get_crewai_llm(l_, llm_config.get(l_.model_id, {}))
+    for model_id, llm_kwargs in build_artifacts.llm_kwargs.items():
+        language_models[model_id] = AgentStudioCrewAILLM(**llm_kwargs)
 
     tools: Dict[str, BaseTool] = {}
-    for t_ in collated_input.tool_instances:
-        tools[t_.id] = get_crewai_tool(t_, tool_config.get(t_.id, {}), workflow_directory)
+    for tool_id, tool_factory in build_artifacts.tool_factories.items():
+        tools[tool_id] = tool_factory()
 
     mcps: Dict[str, input_types.MCPObjects] = {}
-    for m_ in collated_input.mcp_instances:
-        mcps[m_.id] = get_mcp_tools_for_crewai(m_, mcp_config.get(m_.id, {}))
+    try:
+        for m_ in collated_input.mcp_instances:
+            mcps[m_.id] = acquire_mcp_tools_for_crewai(m_, mcp_config.get(m_.id, {}))
 
-    agents: Dict[str, AgentStudioCrewAIAgent] = {}
-    for agent in collated_input.agents:
-        crewai_tools = [tools[tool_id] for tool_id in agent.tool_instance_ids]
-        for mcp_id in agent.mcp_instance_ids:
-            crewai_tools.extend(mcps[mcp_id].tools)
-        model_id = agent.llm_provider_model_id
-        if not model_id:
-            model_id = collated_input.default_language_model_id
-        agents[agent.id] = get_crewai_agent(agent, crewai_tools, language_models[model_id])
+        agents: Dict[str, AgentStudioCrewAIAgent] = {}
+        for agent in collated_input.agents:
+            crewai_tools = [tools[tool_id] for tool_id in agent.tool_instance_ids]
+            for mcp_id in agent.mcp_instance_ids:
+                crewai_tools.extend(mcps[mcp_id].tools)
+            model_id = agent.llm_provider_model_id
+            if not model_id:
+                model_id = collated_input.default_language_model_id
+            agents[agent.id] = get_crewai_agent(agent, crewai_tools, language_models[model_id])
 
-    tasks: Dict[str, AgentStudioCrewAITask] = {}
-    for task_input in collated_input.tasks:
-        agent_for_task: Agent = agents[task_input.assigned_agent_id] if task_input.assigned_agent_id else None
-        tasks[task_input.id] = AgentStudioCrewAITask(
-            agent_studio_id=task_input.id,
-            description=task_input.description,
-            expected_output=task_input.expected_output,
-            agent=agent_for_task,
-            tools=agent_for_task.tools if agent_for_task else None,
-        )
+        tasks: Dict[str, AgentStudioCrewAITask] = {}
+        for task_input in collated_input.tasks:
+            agent_for_task: Agent = agents[task_input.assigned_agent_id] if task_input.assigned_agent_id else None
+            tasks[task_input.id] = AgentStudioCrewAITask(
+                agent_studio_id=task_input.id,
+                description=task_input.description,
+                expected_output=task_input.expected_output,
+                agent=agent_for_task,
+                tools=agent_for_task.tools if agent_for_task else None,
+            )
 
-    workflow_input = collated_input.workflow
-    crew = Crew(
-        name=workflow_input.name,
-        process=workflow_input.crew_ai_process,
-        agents=[agents[agent_id] for agent_id in workflow_input.agent_ids],
-        tasks=[tasks[task_id] for task_id in workflow_input.task_ids],
-        manager_agent=agents[workflow_input.manager_agent_id] if workflow_input.manager_agent_id else None,
-        manager_llm=language_models[workflow_input.llm_provider_model_id]
-        if workflow_input.llm_provider_model_id
-        else None,
-        verbose=False,
-    )
+        workflow_input = collated_input.workflow
+        crew = Crew(
+            name=workflow_input.name,
+            process=workflow_input.crew_ai_process,
+            agents=[agents[agent_id] for agent_id in workflow_input.agent_ids],
+            tasks=[tasks[task_id] for task_id in workflow_input.task_ids],
+            manager_agent=agents[workflow_input.manager_agent_id] if workflow_input.manager_agent_id else None,
+            manager_llm=language_models[workflow_input.llm_provider_model_id]
+            if workflow_input.llm_provider_model_id
+            else None,
+            verbose=False,
+        )
 
-    return input_types.CrewAIObjects(
-        language_models=language_models,
-        tools=tools,
-        mcps=mcps,
-        agents=agents,
-        tasks=tasks,
-        crews={workflow_input.id: crew},
-    )
+        return input_types.CrewAIObjects(
+            language_models=language_models,
+            tools=tools,
+            mcps=mcps,
+            agents=agents,
+            tasks=tasks,
+            crews={workflow_input.id: crew},
+        )
+    except Exception:
+        # Hand back any MCP servers leased before the failure.
+        for mcp_object in mcps.values():
+            release_mcp_objects(mcp_object)
+        raise
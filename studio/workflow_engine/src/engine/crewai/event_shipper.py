@@ -0,0 +1,223 @@
+import atexit
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from engine.ops import get_ops_endpoint, invalidate_ops_endpoint_cache
+
+
+# Back-pressure policies applied when the in-process event queue is full.
+# "drop_oldest" never blocks the CrewAI execution thread and discards the oldest
+# buffered event, while "block" waits for the shipper to make room.
+OVERFLOW_POLICY_DROP_OLDEST = "drop_oldest"
+OVERFLOW_POLICY_BLOCK = "block"
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.5
+DEFAULT_MAX_BATCH_SIZE = 100
+DEFAULT_MAX_QUEUE_SIZE = 10000
+
+
+class EventShipper:
+    """
+    Background shipper for workflow events. Events are buffered in a bounded
+    in-process queue and a single worker thread periodically drains the buffer,
+    coalesces events per trace ID and posts each group to the ops server's
+    /events/batch endpoint over a pooled keep-alive session. This keeps the
+    HTTPS round trip to the ops server off the CrewAI execution thread.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        overflow_policy: str = OVERFLOW_POLICY_DROP_OLDEST,
+    ):
+        if overflow_policy not in (OVERFLOW_POLICY_DROP_OLDEST, OVERFLOW_POLICY_BLOCK):
+            raise ValueError(f"Unsupported event overflow policy: {overflow_policy}")
+
+        self.flush_interval = flush_interval
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_queue_size = max(1, max_queue_size)
+        self.overflow_policy = overflow_policy
+
+        self._buffer: Deque[Tuple[int, str, str]] = deque()
+        self._cond = threading.Condition()
+        self._enqueued_seq = 0
+        self._shipped_seq = 0
+        self._flush_requested = False
+        self._closed = False
+        self._stats = {"enqueued": 0, "shipped": 0, "dropped": 0, "batches": 0, "failed_batches": 0}
+
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        self._worker = threading.Thread(target=self._run, name="agent-studio-event-shipper", daemon=True)
+        self._worker.start()
+
+    def submit(self, trace_id: str, event: Dict[str, Any]) -> None:
+        """
+        Enqueue an event for a trace. Never performs network I/O on the
+        calling thread; may block only under the "block" overflow policy.
+        The event is serialized immediately so later mutation of the objects
+        it references (e.g. LLM message lists) does not leak into the payload.
+        """
+        serialized_event = json.dumps(event)
+        with self._cond:
+            if self._closed:
+                return
+            while len(self._buffer) >= self.max_queue_size:
+                if self.overflow_policy == OVERFLOW_POLICY_BLOCK:
+                    self._flush_requested = True
+                    self._cond.notify_all()
+                    self._cond.wait()
+                    continue
+                self._buffer.popleft()
+                self._stats["dropped"] += 1
+            self._enqueued_seq += 1
+            self._buffer.append((self._enqueued_seq, trace_id, serialized_event))
+            self._stats["enqueued"] += 1
+            if len(self._buffer) >= self.max_batch_size:
+                self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every event submitted before this call has been handed
+        to the ops server (or dropped). Returns False on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            target = self._enqueued_seq
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._shipped_seq < target:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Flush outstanding events and stop the worker thread.
+        """
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join(timeout)
+        self._session.close()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._cond:
+            return dict(self._stats, queued=len(self._buffer))
+
+    def _take_batch(self) -> List[Tuple[int, str, str]]:
+        with self._cond:
+            deadline = time.monotonic() + self.flush_interval
+            while not self._closed and not self._flush_requested and len(self._buffer) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch = []
+            while self._buffer and len(batch) < self.max_batch_size:
+                batch.append(self._buffer.popleft())
+            if not self._buffer:
+                self._flush_requested = False
+            # Wake any submitters blocked on a full queue.
+            self._cond.notify_all()
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if batch:
+                self._ship(batch)
+                with self._cond:
+                    self._shipped_seq = max(self._shipped_seq, batch[-1][0])
+                    self._cond.notify_all()
+            else:
+                with self._cond:
+                    if self._closed and not self._buffer:
+                        return
+
+    def _ship(self, batch: List[Tuple[int, str, str]]) -> None:
+        # Coalesce per trace ID while preserving the original event order.
+        grouped: Dict[str, List[str]] = {}
+        for _, trace_id, event in batch:
+            grouped.setdefault(trace_id, []).append(event)
+
+        for trace_id, events in grouped.items():
+            try:
+                self._post_batch(trace_id, events)
+                shipped = True
+            except requests.exceptions.ConnectionError:
+                # Re-resolve the ops endpoint once in case it moved.
+                invalidate_ops_endpoint_cache()
+                try:
+                    self._post_batch(trace_id, events)
+                    shipped = True
+                except Exception as e:
+                    print(f"Failed to ship {len(events)} events for trace {trace_id}: {e}")
+                    shipped = False
+            except Exception as e:
+                print(f"Failed to ship {len(events)} events for trace {trace_id}: {e}")
+                shipped = False
+
+            with self._cond:
+                self._stats["batches"] += 1
+                if shipped:
+                    self._stats["shipped"] += len(events)
+                else:
+                    self._stats["failed_batches"] += 1
+
+    def _post_batch(self, trace_id: str, events: List[str]) -> None:
+        body = '{"trace_id": %s, "events": [%s]}' % (json.dumps(trace_id), ", ".join(events))
+        response = self._session.post(
+            url=f"{get_ops_endpoint()}/events/batch",
+            headers={
+                "Authorization": f"Bearer {os.getenv('CDSW_APIV2_KEY')}",
+                "Content-Type": "application/json",
+            },
+            data=body.encode("utf-8"),
+            timeout=30,
+        )
+        response.raise_for_status()
+
+
+_shipper: Optional[EventShipper] = None
+_shipper_lock = threading.Lock()
+
+
+def get_event_shipper() -> EventShipper:
+    """
+    Get the process-wide event shipper, creating it on first use. Shipper
+    behavior can be tuned with the following environment variables:
+
+      AGENT_STUDIO_EVENT_FLUSH_INTERVAL   seconds between flushes (default 0.5)
+      AGENT_STUDIO_EVENT_BATCH_SIZE       max events per flush (default 100)
+      AGENT_STUDIO_EVENT_QUEUE_SIZE       max buffered events (default 10000)
+      AGENT_STUDIO_EVENT_OVERFLOW_POLICY  "drop_oldest" (default) or "block"
+    """
+    global _shipper
+    with _shipper_lock:
+        if _shipper is None:
+            _shipper = EventShipper(
+                flush_interval=float(
+                    os.getenv("AGENT_STUDIO_EVENT_FLUSH_INTERVAL", str(DEFAULT_FLUSH_INTERVAL_SECONDS))
+                ),
+                max_batch_size=int(os.getenv("AGENT_STUDIO_EVENT_BATCH_SIZE", str(DEFAULT_MAX_BATCH_SIZE))),
+                max_queue_size=int(os.getenv("AGENT_STUDIO_EVENT_QUEUE_SIZE", str(DEFAULT_MAX_QUEUE_SIZE))),
+                overflow_policy=os.getenv("AGENT_STUDIO_EVENT_OVERFLOW_POLICY", OVERFLOW_POLICY_DROP_OLDEST),
+            )
+            atexit.register(_shipper.close)
+        return _shipper
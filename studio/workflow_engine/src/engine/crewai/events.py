@@ -1,10 +1,9 @@
-import requests
 import os
 
 from crewai.utilities.events import *
 
 from engine.crewai.trace_context import get_trace_id
-from engine.ops import get_ops_endpoint
+from engine.crewai.event_shipper import get_event_shipper
 
 
 # List of event processors. These are lambdas that
@@ -83,6 +82,12 @@ EVENT_PROCESSORS = {
 }
 
 
+# Events that terminate a workflow run. Posting one of these blocks until
+# every buffered event has been shipped to the ops server.
+FLUSH_ON_EVENTS = (CrewKickoffCompletedEvent, CrewKickoffFailedEvent)
+EVENT_FLUSH_TIMEOUT_SECONDS = float(os.getenv("AGENT_STUDIO_EVENT_FLUSH_TIMEOUT", "30"))
+
+
 def process_event(event):
     """
     Process a specific event. Will only add fields
@@ -99,6 +104,7 @@ def post_event(source, event):
     Post a specific event to a specific queue in the Ops & Metrics
     message broker (Kombu). The queu is the trace ID, which is a
     context variable set specifically for the async workflow task.
+    Events are delivered asynchronously in batches by the EventShipper.
     """
     trace_id = get_trace_id()
 
@@ -116,11 +122,14 @@ def post_event(source, event):
     # Process the event given the specific event type
     event_dict.update(process_event(event))
 
-    requests.post(
-        url=f"{get_ops_endpoint()}/events",
-        headers={"Authorization": f"Bearer {os.getenv('CDSW_APIV2_KEY')}"},
-        json={"trace_id": trace_id, "event": event_dict},
-    )
+    # Hand the event to the background shipper so the ops server round trip
+    # stays off the CrewAI execution thread. Terminal kickoff events force a
+    # synchronous flush so the full event stream for the run is delivered
+    # before the crew returns.
+    shipper = get_event_shipper()
+    shipper.submit(trace_id, event_dict)
+    if event.__class__ in FLUSH_ON_EVENTS:
+        shipper.flush(timeout=EVENT_FLUSH_TIMEOUT_SECONDS)
 
 
 # Globalsafety flag to avoid double registration
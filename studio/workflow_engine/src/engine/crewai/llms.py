@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Any, Dict
 
 # No top level studio.db imports allowed to support wokrflow model deployment
 from crewai import LLM as CrewAILLM
@@ -8,10 +8,19 @@ from engine.crewai.wrappers import AgentStudioCrewAILLM
 
 
 def get_crewai_llm(language_model: Input__LanguageModel, llm_config_dict: Dict[str, str]) -> CrewAILLM:
+    return AgentStudioCrewAILLM(**get_crewai_llm_kwargs(language_model, llm_config_dict))
+
+
+def get_crewai_llm_kwargs(language_model: Input__LanguageModel, llm_config_dict: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Resolve the constructor arguments for an AgentStudioCrewAILLM. LLM objects
+    are mutated by the agents that use them, so callers that reuse a
+    configuration across runs should cache these kwargs rather than the LLM.
+    """
     # Either pull model config right from the collated input, or from the input model config dict
     llm_config: Input__LanguageModelConfig = Input__LanguageModelConfig(**llm_config_dict)
     if llm_config.model_type == SupportedModelTypes.OPENAI.value:
-        return AgentStudioCrewAILLM(
+        return dict(
             agent_studio_id=language_model.model_id,
             model="openai/" + llm_config.provider_model,
             api_key=llm_config.api_key,
@@ -20,7 +29,7 @@ def get_crewai_llm(language_model: Input__LanguageModel, llm_config_dict: Dict[s
             seed=0,
         )
     elif llm_config.model_type == SupportedModelTypes.OPENAI_COMPATIBLE.value:
-        return AgentStudioCrewAILLM(
+        return dict(
             agent_studio_id=language_model.model_id,
             model="openai/" + llm_config.provider_model,
             api_key=llm_config.api_key,
@@ -30,7 +39,7 @@ def get_crewai_llm(language_model: Input__LanguageModel, llm_config_dict: Dict[s
             seed=0,
         )
     elif llm_config.model_type == SupportedModelTypes.AZURE_OPENAI.value:
-        return AgentStudioCrewAILLM(
+        return dict(
             agent_studio_id=language_model.model_id,
             model="azure/" + llm_config.provider_model,
             api_key=llm_config.api_key,
@@ -40,7 +49,7 @@ def get_crewai_llm(language_model: Input__LanguageModel, llm_config_dict: Dict[s
             seed=0,
         )
     elif llm_config.model_type == SupportedModelTypes.GEMINI.value:
-        return AgentStudioCrewAILLM(
+        return dict(
             agent_studio_id=language_model.model_id,
             model="gemini/" + llm_config.provider_model,
             api_key=llm_config.api_key,
@@ -48,7 +57,7 @@ def get_crewai_llm(language_model: Input__LanguageModel, llm_config_dict: Dict[s
             max_completion_tokens=language_model.generation_config.get("max_new_tokens"),
         )
     elif llm_config.model_type == SupportedModelTypes.ANTHROPIC.value:
-        return AgentStudioCrewAILLM(
+        return dict(
             agent_studio_id=language_model.model_id,
             model="anthropic/" + llm_config.provider_model,
             api_key=llm_config.api_key,
@@ -56,7 +65,7 @@ def get_crewai_llm(language_model: Input__LanguageModel, llm_config_dict: Dict[s
             max_completion_tokens=language_model.generation_config.get("max_new_tokens"),
         )
     elif llm_config.model_type == "CAII":
-        return AgentStudioCrewAILLM(
+        return dict(
             agent_studio_id=language_model.model_id,
             model="openai/" + llm_config.provider_model,
             api_key=llm_config.api_key,
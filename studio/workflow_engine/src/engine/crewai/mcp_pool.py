@@ -0,0 +1,292 @@
+# No top level studio.db imports allowed to support wokrflow model deployment
+
+import asyncio
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel
+
+import engine.types as input_types
+from engine.crewai.mcp import get_mcp_tools_for_crewai
+
+
+DEFAULT_MCP_POOL_MAX_SESSIONS = 8
+DEFAULT_MCP_POOL_IDLE_TIMEOUT_SECONDS = 900.0
+DEFAULT_MCP_POOL_HEALTH_CHECK_TIMEOUT_SECONDS = 5.0
+
+MCPSessionKey = Tuple[str, str, Tuple[str, ...], str]
+
+
+def is_mcp_pool_enabled() -> bool:
+    return os.getenv("AGENT_STUDIO_MCP_POOL_ENABLED", "true").lower() not in ("false", "0", "no")
+
+
+def get_mcp_session_key(mcp_instance: input_types.Input__MCPInstance, env_vars: Dict[str, str]) -> MCPSessionKey:
+    """
+    Sessions are shared only between runs that would launch an identical
+    server process: same MCP instance, command args and environment.
+    """
+    env_hash = hashlib.sha256(json.dumps(sorted((env_vars or {}).items())).encode("utf-8")).hexdigest()
+    return (mcp_instance.id, mcp_instance.type, tuple(mcp_instance.args), env_hash)
+
+
+class PooledMCPSession:
+    """
+    A running MCP stdio server shared by any number of concurrent workflow
+    runs. Each run leases its own CrewAI tool objects; calls from every lease
+    are funneled through the session's call lock when calls are serialized.
+    """
+
+    def __init__(self, key: MCPSessionKey, mcp_objects: input_types.MCPObjects, pooled: bool, serialize_calls: bool):
+        self.key = key
+        self.mcp_objects = mcp_objects
+        self.pooled = pooled
+        self.serialize_calls = serialize_calls
+        self.leases = 0
+        self.retired = False
+        self.last_used = time.monotonic()
+        self.call_lock = threading.Lock()
+        self._leased_tool_classes: Dict[str, Type[BaseTool]] = {
+            tool.name: self._make_leased_tool_class(tool) for tool in mcp_objects.tools
+        }
+
+    def _make_leased_tool_class(self, pooled_tool: BaseTool) -> Type[BaseTool]:
+        session = self
+
+        class PooledMCPTool(BaseTool):
+            name: str = pooled_tool.name
+            description: str = pooled_tool.description
+            args_schema: Type[BaseModel] = pooled_tool.args_schema
+
+            def _generate_description(self):
+                # The pooled tool's description has already been generated.
+                self.description = pooled_tool.description
+
+            def _run(self, *args, **kwargs):
+                session.last_used = time.monotonic()
+                if session.serialize_calls:
+                    with session.call_lock:
+                        return pooled_tool._run(*args, **kwargs)
+                return pooled_tool._run(*args, **kwargs)
+
+        return PooledMCPTool
+
+    def lease_tools(self, tool_names: Optional[List[str]]) -> List[BaseTool]:
+        return [
+            tool_cls() for name, tool_cls in self._leased_tool_classes.items() if not tool_names or name in tool_names
+        ]
+
+    def is_healthy(self, timeout: float) -> bool:
+        adapter = getattr(self.mcp_objects.local_session, "_adapter", None)
+        if adapter is None:
+            return True
+        thread = getattr(adapter, "thread", None)
+        task = getattr(adapter, "task", None)
+        if thread is None or not thread.is_alive() or task is None or task.done():
+            return False
+        try:
+            for client_session in adapter.sessions:
+                asyncio.run_coroutine_threadsafe(client_session.send_ping(), adapter.loop).result(timeout)
+        except Exception as e:
+            print(f"MCP session {self.key[0]} failed health check: {e}")
+            return False
+        return True
+
+    def stop(self) -> None:
+        try:
+            self.mcp_objects.local_session.stop()
+        except Exception as e:
+            print(f"Error stopping MCP: {e}")
+
+
+class MCPSessionPool:
+    """
+    Keeps MCP stdio servers (uvx/npx) alive across workflow runs so each
+    kickoff does not pay the server cold start. Sessions are health-checked
+    on acquire, evicted after being idle, and capped in number; when the cap
+    is reached and no idle session can be evicted, runs get a private,
+    unpooled session that is stopped when the run finishes.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = DEFAULT_MCP_POOL_MAX_SESSIONS,
+        idle_timeout: float = DEFAULT_MCP_POOL_IDLE_TIMEOUT_SECONDS,
+        health_check_timeout: float = DEFAULT_MCP_POOL_HEALTH_CHECK_TIMEOUT_SECONDS,
+        serialize_calls: bool = True,
+    ):
+        self.max_sessions = max(1, max_sessions)
+        self.idle_timeout = idle_timeout
+        self.health_check_timeout = health_check_timeout
+        self.serialize_calls = serialize_calls
+        self._lock = threading.Lock()
+        self._key_locks: Dict[MCPSessionKey, threading.Lock] = {}
+        self._sessions: Dict[MCPSessionKey, PooledMCPSession] = {}
+        self._stats = {"hits": 0, "misses": 0, "unpooled": 0, "evictions": 0, "unhealthy": 0}
+        self._reaper = threading.Thread(
+            target=self._reap_idle_sessions, name="agent-studio-mcp-pool-reaper", daemon=True
+        )
+        self._reaper.start()
+
+    def acquire(self, mcp_instance: input_types.Input__MCPInstance, env_vars: Dict[str, str]) -> input_types.MCPObjects:
+        key = get_mcp_session_key(mcp_instance, env_vars)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Serialize acquisition per key so concurrent runs of the same
+        # workflow start the server once.
+        with key_lock:
+            session = self._lease_existing(key)
+            if session is not None and not session.is_healthy(self.health_check_timeout):
+                self._retire(session, unhealthy=True)
+                self.release_session(session)
+                session = None
+
+            if session is None:
+                session = self._create(key, mcp_instance, env_vars)
+
+        return input_types.MCPObjects(
+            local_session=session.mcp_objects.local_session,
+            tools=session.lease_tools(mcp_instance.tools),
+            pool_session=session,
+        )
+
+    def release_session(self, session: PooledMCPSession) -> None:
+        with self._lock:
+            session.leases = max(0, session.leases - 1)
+            session.last_used = time.monotonic()
+            should_stop = session.leases == 0 and (session.retired or not session.pooled)
+        if should_stop:
+            session.stop()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(
+                self._stats,
+                sessions=len(self._sessions),
+                leased=sum(1 for s in self._sessions.values() if s.leases > 0),
+            )
+
+    def shutdown(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.stop()
+
+    def _lease_existing(self, key: MCPSessionKey) -> Optional[PooledMCPSession]:
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                return None
+            session.leases += 1
+            session.last_used = time.monotonic()
+            self._stats["hits"] += 1
+            return session
+
+    def _retire(self, session: PooledMCPSession, unhealthy: bool = False) -> None:
+        with self._lock:
+            session.retired = True
+            if self._sessions.get(session.key) is session:
+                del self._sessions[session.key]
+            if unhealthy:
+                self._stats["unhealthy"] += 1
+
+    def _create(
+        self, key: MCPSessionKey, mcp_instance: input_types.Input__MCPInstance, env_vars: Dict[str, str]
+    ) -> PooledMCPSession:
+        evicted: Optional[PooledMCPSession] = None
+        with self._lock:
+            self._stats["misses"] += 1
+            pooled = True
+            if len(self._sessions) >= self.max_sessions:
+                idle = [s for s in self._sessions.values() if s.leases == 0]
+                if idle:
+                    evicted = min(idle, key=lambda s: s.last_used)
+                    del self._sessions[evicted.key]
+                    self._stats["evictions"] += 1
+                else:
+                    pooled = False
+                    self._stats["unpooled"] += 1
+        if evicted is not None:
+            evicted.stop()
+
+        # Start the server without tool filtering; each lease filters its own view.
+        unfiltered_instance = mcp_instance.model_copy(update={"tools": None})
+        mcp_objects = get_mcp_tools_for_crewai(unfiltered_instance, env_vars)
+        session = PooledMCPSession(key, mcp_objects, pooled=pooled, serialize_calls=self.serialize_calls)
+        session.leases = 1
+        if pooled:
+            with self._lock:
+                self._sessions[key] = session
+        return session
+
+    def _reap_idle_sessions(self) -> None:
+        while True:
+            time.sleep(max(1.0, min(self.idle_timeout / 2, 60.0)))
+            now = time.monotonic()
+            with self._lock:
+                idle = [s for s in self._sessions.values() if s.leases == 0 and now - s.last_used > self.idle_timeout]
+                for session in idle:
+                    del self._sessions[session.key]
+                    self._stats["evictions"] += 1
+            for session in idle:
+                session.stop()
+
+
+_pool: Optional[MCPSessionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_mcp_session_pool() -> MCPSessionPool:
+    """
+    Get the process-wide MCP session pool, creating it on first use. Tuned with:
+
+      AGENT_STUDIO_MCP_POOL_MAX_SESSIONS     max pooled server processes (default 8)
+      AGENT_STUDIO_MCP_POOL_IDLE_TIMEOUT     seconds before an unused server is stopped (default 900)
+      AGENT_STUDIO_MCP_POOL_CALL_MODE        "serialize" (default) or "multiplex" concurrent tool calls
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = MCPSessionPool(
+                max_sessions=int(os.getenv("AGENT_STUDIO_MCP_POOL_MAX_SESSIONS", str(DEFAULT_MCP_POOL_MAX_SESSIONS))),
+                idle_timeout=float(
+                    os.getenv("AGENT_STUDIO_MCP_POOL_IDLE_TIMEOUT", str(DEFAULT_MCP_POOL_IDLE_TIMEOUT_SECONDS))
+                ),
+                serialize_calls=os.getenv("AGENT_STUDIO_MCP_POOL_CALL_MODE", "serialize").lower() != "multiplex",
+            )
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def acquire_mcp_tools_for_crewai(
+    mcp_instance: input_types.Input__MCPInstance, env_vars: Dict[str, str]
+) -> input_types.MCPObjects:
+    """
+    Get CrewAI tools for an MCP instance, reusing a pooled server when enabled.
+    Every call must be paired with release_mcp_objects().
+    """
+    if not is_mcp_pool_enabled():
+        return get_mcp_tools_for_crewai(mcp_instance, env_vars)
+    return get_mcp_session_pool().acquire(mcp_instance, env_vars)
+
+
+def release_mcp_objects(mcp_objects: input_types.MCPObjects) -> None:
+    """
+    Return a run's MCP tools to the pool, or stop the server if it was not pooled.
+    """
+    session: Optional[Any] = mcp_objects.pool_session
+    if session is None:
+        try:
+            mcp_objects.local_session.stop()
+        except Exception as e:
+            print(f"Error stopping MCP: {e}")
+        return
+    get_mcp_session_pool().release_session(session)
@@ -7,6 +7,8 @@ from opentelemetry.context import attach, detach
 
 from engine.crewai.trace_context import set_trace_id
 from engine.crewai.crew import create_crewai_objects
+from engine.crewai.mcp_pool import release_mcp_objects
+from engine.crewai.event_shipper import get_event_shipper
 
 
 def run_workflow(
@@ -24,6 +26,7 @@ def run_workflow(
     Intended to be launched either directly or via an executor thread.
     """
     token = attach(parent_context)
+    crewai_objects = None
     try:
         set_trace_id(events_trace_id)
         crewai_objects = create_crewai_objects(
@@ -37,11 +40,13 @@ def run_workflow(
         crew.kickoff(inputs=dict(inputs))
     finally:
         detach(token)
-        for mcp_object in crewai_objects.mcps.values():
-            try:
-                mcp_object.local_session.stop()
-            except Exception as e:
-                print(f"Error stopping MCP: {e}")
+        if crewai_objects is not None:
+            # Pooled MCP servers stay alive for the next run; unpooled ones are stopped.
+            for mcp_object in crewai_objects.mcps.values():
+                try:
+                    release_mcp_objects(mcp_object)
+                except Exception as e:
+                    print(f"Error releasing MCP: {e}")
 
 
 async def run_workflow_async(
@@ -73,3 +78,38 @@ async def run_workflow_async(
         parent_context,
         events_trace_id,
     )
+
+
+async def run_workflow_when_tools_ready(
+    tool_venv_warmup: Any,
+    workflow_directory: str,
+    collated_input: Any,
+    tool_config: Dict[str, Dict[str, str]],
+    mcp_config: Dict[str, Dict[str, str]],
+    llm_config: Dict[str, Dict[str, str]],
+    inputs: Dict[str, Any],
+    parent_context: Any,
+    events_trace_id,
+) -> None:
+    """
+    Run the workflow once its tool virtual environments are prepared. If
+    preparation failed, the crew is not kicked off without its tools'
+    dependencies; a crew_kickoff_failed event carrying each tool's error
+    is posted for the trace instead.
+    """
+    await asyncio.to_thread(tool_venv_warmup.wait)
+    failure = tool_venv_warmup.get_failure()
+    if failure is not None:
+        print(f"Workflow run {events_trace_id} not started: {failure}")
+        get_event_shipper().submit(events_trace_id, {"type": "crew_kickoff_failed", "error": failure})
+        return
+    await run_workflow_async(
+        workflow_directory,
+        collated_input,
+        tool_config,
+        mcp_config,
+        llm_config,
+        inputs,
+        parent_context,
+        events_trace_id,
+    )
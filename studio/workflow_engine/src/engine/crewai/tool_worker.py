@@ -0,0 +1,367 @@
+import atexit
+import hashlib
+import json
+import os
+import select
+import struct
+import subprocess
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+# Location of the child entrypoint executed with each tool's venv interpreter.
+TOOL_WORKER_MAIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tool_worker_main.py")
+
+DEFAULT_IDLE_TIMEOUT_SECONDS = 600.0
+DEFAULT_MAX_REQUESTS = 500
+DEFAULT_STARTUP_TIMEOUT_SECONDS = 120.0
+DEFAULT_CALL_TIMEOUT_SECONDS = 600.0
+
+_HEADER = struct.Struct(">I")
+
+
+class ToolWorkerUnavailable(Exception):
+    """
+    The tool cannot be served by a warm worker (e.g. its module cannot be
+    imported without running its __main__ block). Callers should fall back
+    to the one-shot subprocess path.
+    """
+
+
+class ToolWorkerBusy(ToolWorkerUnavailable):
+    """
+    The tool's worker is serving another call. Rather than queueing behind
+    it, the call falls back to the one-shot subprocess path, as it did
+    before warm workers existed.
+    """
+
+
+class ToolWorkerError(Exception):
+    """
+    The tool ran in a warm worker and failed, or the worker died mid-call.
+    The request may already have run the tool, so callers must not retry
+    it through the subprocess path.
+    """
+
+
+class ToolWorkerProtocolError(ToolWorkerError):
+    """
+    The worker sent a frame that is not valid JSON. The worker is recycled,
+    and the call fails, since the tool may already have run.
+    """
+
+
+def is_tool_worker_enabled() -> bool:
+    """
+    Warm tool workers are used unless AGENT_STUDIO_TOOL_WORKER_MODE is set
+    to "subprocess".
+    """
+    return os.getenv("AGENT_STUDIO_TOOL_WORKER_MODE", "warm").lower() != "subprocess"
+
+
+def _environment_fingerprint(env: Dict[str, str]) -> str:
+    return hashlib.sha256(json.dumps(sorted(env.items())).encode("utf-8")).hexdigest()
+
+
+class ToolWorker:
+    """
+    A long-lived process that imports a tool module once inside the tool's
+    venv and serves run_tool(config, args) requests over its stdin/stdout
+    pipes. A worker serves one call at a time; a call that finds it busy
+    raises ToolWorkerBusy instead of waiting.
+    """
+
+    def __init__(
+        self,
+        python_executable: str,
+        tool_file: str,
+        venv_dir: str,
+        cwd: str,
+        max_requests: int = DEFAULT_MAX_REQUESTS,
+        startup_timeout: float = DEFAULT_STARTUP_TIMEOUT_SECONDS,
+    ):
+        self.python_executable = python_executable
+        self.tool_file = tool_file
+        self.venv_dir = venv_dir
+        self.cwd = cwd
+        self.max_requests = max_requests
+        self.startup_timeout = startup_timeout
+
+        self.lock = threading.Lock()
+        self.process: Optional[subprocess.Popen] = None
+        self.requests_served = 0
+        self.restarts = 0
+        self.last_used = time.monotonic()
+        self._tool_mtime: Optional[float] = None
+        self._env_fingerprint: Optional[str] = None
+        self._next_id = 0
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def _is_stale(self, env_fingerprint: str) -> bool:
+        if self.requests_served >= self.max_requests:
+            return True
+        if self._env_fingerprint != env_fingerprint:
+            return True
+        try:
+            return os.path.getmtime(self.tool_file) != self._tool_mtime
+        except OSError:
+            return True
+
+    def _start(self, env: Dict[str, str], env_fingerprint: str) -> None:
+        try:
+            self.process = subprocess.Popen(
+                [self.python_executable, TOOL_WORKER_MAIN, self.tool_file],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                cwd=self.cwd,
+                env=env,
+            )
+        except OSError as e:
+            raise ToolWorkerUnavailable(f"Could not launch tool worker: {e}")
+        self.requests_served = 0
+        self._tool_mtime = os.path.getmtime(self.tool_file)
+        self._env_fingerprint = env_fingerprint
+        try:
+            ready = self._read_message(self.startup_timeout)
+        except ToolWorkerError as e:
+            self.stop()
+            raise ToolWorkerUnavailable(f"Tool worker failed to start: {e}")
+        if not ready.get("ready"):
+            self.stop()
+            raise ToolWorkerUnavailable(f"Tool module could not be imported: {ready.get('error')}")
+
+    def stop(self) -> None:
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=5)
+        except Exception:
+            self.process.kill()
+            self.process.wait()
+        finally:
+            self.process = None
+
+    def call(self, user_params: Dict[str, Any], tool_params: Dict[str, Any], timeout: float) -> str:
+        env = os.environ.copy()
+        env.update({"VIRTUAL_ENV": self.venv_dir})
+        env_fingerprint = _environment_fingerprint(env)
+
+        if not self.lock.acquire(blocking=False):
+            raise ToolWorkerBusy(f"Tool worker for {self.tool_file} is serving another call")
+        try:
+            return self._call(user_params, tool_params, timeout, env, env_fingerprint)
+        finally:
+            self.lock.release()
+
+    def _call(
+        self,
+        user_params: Dict[str, Any],
+        tool_params: Dict[str, Any],
+        timeout: float,
+        env: Dict[str, str],
+        env_fingerprint: str,
+    ) -> str:
+        self.last_used = time.monotonic()
+        if self.is_alive() and self._is_stale(env_fingerprint):
+            self.stop()
+        if not self.is_alive():
+            if self.process is not None:
+                # The worker crashed since its last call.
+                self.process = None
+                self.restarts += 1
+            self._start(env, env_fingerprint)
+
+        self._next_id += 1
+        request_id = self._next_id
+        try:
+            self._write_message({"id": request_id, "user_params": user_params, "tool_params": tool_params})
+            response = self._read_message(timeout)
+        except ToolWorkerError:
+            # Never reuse a worker whose protocol stream is in an unknown state.
+            self.stop()
+            raise
+        finally:
+            self.requests_served += 1
+            self.last_used = time.monotonic()
+
+        if response.get("id") != request_id:
+            self.stop()
+            raise ToolWorkerError("Tool worker returned an out-of-order response")
+        if not response.get("ok"):
+            raise ToolWorkerError(response.get("error") or "Unknown tool error")
+        return response.get("output", "")
+
+    def _write_message(self, message: Dict[str, Any]) -> None:
+        body = json.dumps(message).encode("utf-8")
+        try:
+            self.process.stdin.write(_HEADER.pack(len(body)) + body)
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise ToolWorkerError(f"Tool worker exited unexpectedly: {e}")
+
+    def _read_exact(self, size: int, deadline: float) -> bytes:
+        fd = self.process.stdout.fileno()
+        data = b""
+        while len(data) < size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ToolWorkerError("Tool worker timed out")
+            readable, _, _ = select.select([fd], [], [], remaining)
+            if not readable:
+                continue
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                raise ToolWorkerError(f"Tool worker exited unexpectedly (exit code {self.process.poll()})")
+            data += chunk
+        return data
+
+    def _read_message(self, timeout: float) -> Dict[str, Any]:
+        deadline = time.monotonic() + timeout
+        header = self._read_exact(_HEADER.size, deadline)
+        body = self._read_exact(_HEADER.unpack(header)[0], deadline)
+        try:
+            return json.loads(body.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ToolWorkerProtocolError(f"Tool worker sent a corrupt message: {e}")
+
+
+class ToolWorkerPool:
+    """
+    Process-wide registry of warm tool workers, one per (interpreter, tool file).
+    Idle workers are reaped by a background thread, and tools that failed to
+    import are remembered (per file mtime) so they go straight to the
+    subprocess fallback. Concurrent calls of a tool whose worker is busy
+    also take the subprocess path, so parallel crews still run the tool
+    in parallel.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+        max_requests: int = DEFAULT_MAX_REQUESTS,
+        call_timeout: float = DEFAULT_CALL_TIMEOUT_SECONDS,
+    ):
+        self.idle_timeout = idle_timeout
+        self.max_requests = max_requests
+        self.call_timeout = call_timeout
+        self._lock = threading.Lock()
+        self._workers: Dict[Tuple[str, str], ToolWorker] = {}
+        self._unavailable: Dict[Tuple[str, str], float] = {}
+        self._stats = {"calls": 0, "fallbacks": 0, "reaped": 0}
+        self._reaper = threading.Thread(
+            target=self._reap_idle_workers, name="agent-studio-tool-worker-reaper", daemon=True
+        )
+        self._reaper.start()
+
+    def run(
+        self,
+        python_executable: str,
+        tool_file: str,
+        venv_dir: str,
+        cwd: str,
+        user_params: Dict[str, Any],
+        tool_params: Dict[str, Any],
+    ) -> str:
+        key = (python_executable, tool_file)
+        with self._lock:
+            unavailable_mtime = self._unavailable.get(key)
+            if unavailable_mtime is not None and unavailable_mtime == _safe_mtime(tool_file):
+                self._stats["fallbacks"] += 1
+                raise ToolWorkerUnavailable(f"Tool {tool_file} cannot run in a warm worker")
+            worker = self._workers.get(key)
+            if worker is None:
+                worker = ToolWorker(python_executable, tool_file, venv_dir, cwd, max_requests=self.max_requests)
+                self._workers[key] = worker
+            self._stats["calls"] += 1
+
+        try:
+            return worker.call(user_params, tool_params, self.call_timeout)
+        except ToolWorkerBusy:
+            with self._lock:
+                self._stats["fallbacks"] += 1
+            raise
+        except ToolWorkerProtocolError:
+            # The worker was stopped; the next call starts a fresh one.
+            with self._lock:
+                if self._workers.get(key) is worker:
+                    self._workers.pop(key)
+            raise
+        except ToolWorkerUnavailable:
+            with self._lock:
+                self._unavailable[key] = _safe_mtime(tool_file)
+                self._workers.pop(key, None)
+                self._stats["fallbacks"] += 1
+            raise
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(
+                self._stats,
+                live_workers=sum(1 for w in self._workers.values() if w.is_alive()),
+                restarts=sum(w.restarts for w in self._workers.values()),
+            )
+
+    def shutdown(self) -> None:
+        with self._lock:
+            workers = list(self._workers.values())
+            self._workers.clear()
+        for worker in workers:
+            with worker.lock:
+                worker.stop()
+
+    def _reap_idle_workers(self) -> None:
+        while True:
+            time.sleep(max(1.0, min(self.idle_timeout / 2, 60.0)))
+            with self._lock:
+                workers = list(self._workers.values())
+            now = time.monotonic()
+            for worker in workers:
+                # Skip workers that are mid-call.
+                if not worker.lock.acquire(blocking=False):
+                    continue
+                try:
+                    if worker.is_alive() and now - worker.last_used > self.idle_timeout:
+                        worker.stop()
+                        with self._lock:
+                            self._stats["reaped"] += 1
+                finally:
+                    worker.lock.release()
+
+
+def _safe_mtime(path: str) -> Optional[float]:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+_pool: Optional[ToolWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_tool_worker_pool() -> ToolWorkerPool:
+    """
+    Get the process-wide tool worker pool, creating it on first use. Tuned with:
+
+      AGENT_STUDIO_TOOL_WORKER_IDLE_TIMEOUT  seconds before an idle worker exits (default 600)
+      AGENT_STUDIO_TOOL_WORKER_MAX_REQUESTS  calls served before a worker is recycled (default 500)
+      AGENT_STUDIO_TOOL_WORKER_CALL_TIMEOUT  seconds allowed per tool call (default 600)
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ToolWorkerPool(
+                idle_timeout=float(
+                    os.getenv("AGENT_STUDIO_TOOL_WORKER_IDLE_TIMEOUT", str(DEFAULT_IDLE_TIMEOUT_SECONDS))
+                ),
+                max_requests=int(os.getenv("AGENT_STUDIO_TOOL_WORKER_MAX_REQUESTS", str(DEFAULT_MAX_REQUESTS))),
+                call_timeout=float(
+                    os.getenv("AGENT_STUDIO_TOOL_WORKER_CALL_TIMEOUT", str(DEFAULT_CALL_TIMEOUT_SECONDS))
+                ),
+            )
+            atexit.register(_pool.shutdown)
+        return _pool
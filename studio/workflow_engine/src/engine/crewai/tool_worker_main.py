@@ -0,0 +1,91 @@
+"""
+Entrypoint for warm tool worker processes. This file is executed with a tool's
+own virtual environment interpreter, so it must only depend on the standard
+library (plus pydantic, which every tool already requires):
+
+    .venv/bin/python tool_worker_main.py /path/to/tool.py
+
+The tool module is imported once and run_tool(config, args) is served for
+every request read from stdin. Messages in both directions are framed as a
+4-byte big-endian length followed by a UTF-8 JSON body.
+"""
+
+import importlib.util
+import json
+import os
+import struct
+import sys
+import traceback
+
+_HEADER = struct.Struct(">I")
+
+
+def _read_exact(stream, size):
+    data = b""
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def read_message(stream):
+    header = _read_exact(stream, _HEADER.size)
+    if header is None:
+        return None
+    body = _read_exact(stream, _HEADER.unpack(header)[0])
+    if body is None:
+        return None
+    return json.loads(body.decode("utf-8"))
+
+
+def write_message(stream, message):
+    body = json.dumps(message).encode("utf-8")
+    stream.write(_HEADER.pack(len(body)) + body)
+    stream.flush()
+
+
+def main():
+    tool_file = os.path.abspath(sys.argv[1])
+
+    # Keep a private handle on the original stdout for the protocol and point
+    # fd 1 at stderr, so anything the tool prints cannot corrupt the framing.
+    proto_in = os.fdopen(os.dup(0), "rb")
+    proto_out = os.fdopen(os.dup(1), "wb")
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+
+    # Mirror the subprocess invocation, where the tool directory is on sys.path.
+    sys.path.insert(0, os.path.dirname(tool_file))
+
+    try:
+        spec = importlib.util.spec_from_file_location("agent_studio_tool", tool_file)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        user_parameters_cls = getattr(module, "UserParameters")
+        tool_parameters_cls = getattr(module, "ToolParameters")
+        run_tool = getattr(module, "run_tool")
+    except BaseException:
+        write_message(proto_out, {"ready": False, "error": traceback.format_exc()})
+        return
+
+    write_message(proto_out, {"ready": True, "pid": os.getpid()})
+
+    while True:
+        request = read_message(proto_in)
+        if request is None:
+            return
+        try:
+            config = user_parameters_cls(**request.get("user_params", {}))
+            args = tool_parameters_cls(**request.get("tool_params", {}))
+            output = run_tool(config, args)
+            response = {"id": request.get("id"), "ok": True, "output": str(output)}
+        except BaseException:
+            response = {"id": request.get("id"), "ok": False, "error": traceback.format_exc()}
+        sys.stderr.flush()
+        write_message(proto_out, response)
+
+
+if __name__ == "__main__":
+    main()
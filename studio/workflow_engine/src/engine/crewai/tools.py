@@ -1,6 +1,6 @@
 # No top level studio.db imports allowed to support wokrflow model deployment
 
-from typing import Dict, Optional, Type
+from typing import Callable, Dict, Optional, Tuple, Type
 from pydantic import BaseModel
 import os
 from crewai.tools import BaseTool
@@ -13,9 +13,19 @@ import threading
 import re
 import shutil
 import venv
+import hashlib
+import time
+from functools import lru_cache
 
 import engine.types as input_types
 from engine.types import *
+from engine.crewai.tool_worker import (
+    ToolWorkerError,
+    ToolWorkerUnavailable,
+    get_tool_worker_pool,
+    is_tool_worker_enabled,
+)
+from engine.crewai.venv_store import get_linked_tool_venv_store, get_tool_venv_store, normalize_requirements
 
 
 def extract_tool_class_name(code: str) -> str:
@@ -190,6 +200,16 @@ def get_tool_instance_proxy(
     """
     Get the tool instance proxy callable for the tool instance.
     """
+    return get_tool_instance_proxy_factory(tool_instance, user_params_kv, workflow_directory)()
+
+
+def get_tool_instance_proxy_factory(
+    tool_instance: Input__ToolInstance, user_params_kv: Dict[str, str], workflow_directory: str
+) -> Callable[[], BaseTool]:
+    """
+    Parse the tool code and generate the proxy tool class once, returning a
+    factory that cheaply instantiates a fresh proxy tool per workflow run.
+    """
 
     tool_file_path = os.path.join(
         workflow_directory, tool_instance.source_folder_path, tool_instance.python_code_file_name
@@ -248,13 +268,16 @@ def get_tool_instance_proxy(
         def _run(self, *args, **kwargs):
             return _tool._run(*args, **kwargs)
 
-    crewai_tool: BaseTool = EmbeddedCrewAITool()
-    print(str(crewai_tool))
+    def factory() -> BaseTool:
+        crewai_tool: BaseTool = EmbeddedCrewAITool()
+        print(str(crewai_tool))
 
-    crewai_tool.name = tool_instance.name
-    crewai_tool._generate_description()
+        crewai_tool.name = tool_instance.name
+        crewai_tool._generate_description()
 
-    return crewai_tool
+        return crewai_tool
+
+    return factory
 
 
 def create_virtual_env(source_folder_path: str, with_: Literal["venv", "uv"]):
@@ -299,9 +322,117 @@ def create_virtual_env(source_folder_path: str, with_: Literal["venv", "uv"]):
         raise RuntimeError(f"COULD NOT CREATE VENV: {error_msg}")
 
 
+# File inside a tool's .venv recording what its requirements were installed
+# from. Installs are skipped while the fingerprint still matches.
+TOOL_VENV_FINGERPRINT_FILE_NAME = ".requirements_fingerprint.json"
+
+
+def is_tool_venv_force_install() -> bool:
+    """
+    Whether to reinstall tool requirements even when the venv's fingerprint matches.
+    """
+    return os.getenv("AGENT_STUDIO_TOOL_VENV_FORCE_INSTALL", "false").lower() in ("true", "1", "yes")
+
+
+def get_uv_cache_dir() -> str:
+    """
+    uv cache shared by every tool install, so packages common to several
+    tools are downloaded and built once.
+    """
+    return (
+        os.getenv("AGENT_STUDIO_TOOL_UV_CACHE_DIR")
+        or os.getenv("UV_CACHE_DIR")
+        or os.path.join(os.path.expanduser("~"), ".cache", "uv")
+    )
+
+
+@lru_cache(maxsize=1)
+def get_uv_version() -> str:
+    uv_bin = shutil.which("uv")
+    if not uv_bin:
+        return "none"
+    try:
+        return subprocess.run([uv_bin, "--version"], capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def _get_venv_interpreter(venv_dir: str) -> str:
+    """
+    Interpreter a venv was created with, as recorded in its pyvenv.cfg.
+    """
+    try:
+        with open(os.path.join(venv_dir, "pyvenv.cfg"), "r") as f:
+            cfg = dict(line.split("=", 1) for line in f.read().splitlines() if "=" in line)
+        cfg = {k.strip(): v.strip() for k, v in cfg.items()}
+        return f"{cfg.get('home', '')}:{cfg.get('version_info') or cfg.get('version', '')}"
+    except OSError:
+        return os.path.realpath(os.path.join(venv_dir, "bin", "python"))
+
+
+def compute_requirements_fingerprint(venv_dir: str, requirements_file_path: str) -> Dict[str, str]:
+    """
+    Fingerprint of everything a requirements install depends on: the
+    requirements file contents, the venv's interpreter and the uv version.
+    A shared environment was built from the store's normalized requirements,
+    so through a store link the requirements are hashed in normalized form.
+    """
+    hasher = hashlib.sha256()
+    try:
+        with open(requirements_file_path, "rb") as f:
+            requirements = f.read()
+        if os.path.islink(venv_dir):
+            normalized = normalize_requirements(requirements.decode("utf-8", errors="replace"))
+            if normalized is not None:
+                requirements = normalized.encode("utf-8")
+    except OSError:
+        requirements = b"missing"
+    hasher.update(requirements)
+    return {
+        "requirements": hasher.hexdigest(),
+        "interpreter": _get_venv_interpreter(venv_dir),
+        "uv": get_uv_version(),
+    }
+
+
+def check_requirements_fingerprint(
+    venv_dir: str, requirements_file_path: str
+) -> Tuple[Dict[str, str], Optional[float]]:
+    """
+    Compute the current fingerprint and compare it with the one stored in the
+    venv. Returns the fingerprint and, if it matches, the duration of the
+    install that produced it (the time a skipped install saves).
+    """
+    fingerprint = compute_requirements_fingerprint(venv_dir, requirements_file_path)
+    try:
+        with open(os.path.join(venv_dir, TOOL_VENV_FINGERPRINT_FILE_NAME), "r") as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        return fingerprint, None
+    if stored.get("fingerprint") != fingerprint:
+        return fingerprint, None
+    return fingerprint, float(stored.get("install_seconds", 0.0))
+
+
+def write_requirements_fingerprint(venv_dir: str, fingerprint: Dict[str, str], install_seconds: float) -> None:
+    with open(os.path.join(venv_dir, TOOL_VENV_FINGERPRINT_FILE_NAME), "w") as f:
+        json.dump({"fingerprint": fingerprint, "install_seconds": install_seconds}, f)
+
+
 def _prepare_virtual_env_for_tool_impl(
-    source_folder_path: str, requirements_file_name: str, with_: Literal["venv", "uv"]
-):
+    source_folder_path: str,
+    requirements_file_name: str,
+    with_: Literal["venv", "uv"],
+    force_install: bool = False,
+    wheelhouse_dir: Optional[str] = None,
+) -> bool:
+    """
+    Create the tool's venv if needed and install its requirements, unless the
+    venv's requirements fingerprint shows they are already installed. Returns
+    whether an install ran. With a `wheelhouse_dir` of pre-built wheels the
+    requirements are installed offline from it first, falling back to the
+    package index if the wheelhouse does not satisfy them.
+    """
     # Create virtual environment if it doesn't exist
     create_virtual_env(source_folder_path, with_)
 
@@ -309,7 +440,12 @@ def _prepare_virtual_env_for_tool_impl(
     uv_bin = shutil.which("uv")
     requirements_file_path = os.path.join(source_folder_path, requirements_file_name)
 
-    # Always install requirements (fast if already up to date)
+    fingerprint, saved_seconds = check_requirements_fingerprint(venv_dir, requirements_file_path)
+    if saved_seconds is not None and not (force_install or is_tool_venv_force_install()):
+        print(f"Requirements unchanged for {source_folder_path}, skipped install (saved ~{saved_seconds:.1f}s)")
+        return False
+
+    install_start = time.monotonic()
     try:
         if with_ == "uv":
             pip_install_command = [uv_bin, "pip", "install", "-r", requirements_file_path]
@@ -324,12 +460,29 @@ def _prepare_virtual_env_for_tool_impl(
                 "-r",
                 requirements_file_path,
             ]
+        install_env = {"VIRTUAL_ENV": venv_dir, "UV_CACHE_DIR": get_uv_cache_dir()} if with_ == "uv" else None
+        if wheelhouse_dir and os.path.isdir(wheelhouse_dir):
+            try:
+                subprocess.run(
+                    pip_install_command + ["--no-index", "--find-links", wheelhouse_dir],
+                    check=True,
+                    text=True,
+                    capture_output=True,
+                    env=install_env,
+                )
+                write_requirements_fingerprint(venv_dir, fingerprint, time.monotonic() - install_start)
+                return True
+            except subprocess.CalledProcessError as e:
+                print(
+                    f"Could not install requirements for {source_folder_path} from wheelhouse {wheelhouse_dir}, "
+                    f"falling back to the package index:\n{e.stderr}"
+                )
         result = subprocess.run(
             pip_install_command,
             check=True,
             text=True,
             capture_output=True,  # Capture stdout/stderr
-            env={"VIRTUAL_ENV": venv_dir} if with_ == "uv" else None,
+            env=install_env,
         )
     except subprocess.CalledProcessError as e:
         # We're not raising error as this will bring down the whole studio, as it's running in a thread
@@ -343,9 +496,59 @@ def _prepare_virtual_env_for_tool_impl(
         print(error_msg)
         raise RuntimeError(f"COULD NOT INSTALL REQUIREMENTS: {error_msg}")
 
+    write_requirements_fingerprint(venv_dir, fingerprint, time.monotonic() - install_start)
+    return True
 
-def prepare_virtual_env_for_tool(source_folder_path: str, requirements_file_name: str):
-    return _prepare_virtual_env_for_tool_impl(source_folder_path, requirements_file_name, "uv")
+
+def prepare_virtual_env_for_tool(
+    source_folder_path: str,
+    requirements_file_name: str,
+    venv_store_dir: Optional[str] = None,
+    force_install: bool = False,
+    wheelhouse_dir: Optional[str] = None,
+):
+    """
+    Prepare a tool's .venv. With a venv store (`venv_store_dir`, or
+    $AGENT_STUDIO_TOOL_VENV_STORE_DIR), tools with identical requirements
+    share one environment built once; otherwise the tool gets its own.
+    Requirements are only installed when they changed since the last install,
+    or when `force_install` (or $AGENT_STUDIO_TOOL_VENV_FORCE_INSTALL) is set,
+    and come from `wheelhouse_dir` when a deployment artifact ships one.
+    A tool whose .venv already links into a store is always prepared through
+    that store.
+    """
+    store = get_tool_venv_store(venv_store_dir) or get_linked_tool_venv_store(source_folder_path)
+    if store is not None:
+        if store.acquire(
+            source_folder_path,
+            requirements_file_name,
+            lambda folder, requirements: _prepare_virtual_env_for_tool_impl(
+                folder, requirements, "uv", force_install, wheelhouse_dir
+            ),
+            rebuild=force_install or is_tool_venv_force_install(),
+        ):
+            return
+        # The requirements cannot be shared; detach the tool from its shared
+        # environment so its private install does not change other tools'.
+        store.release(source_folder_path)
+    return _prepare_virtual_env_for_tool_impl(
+        source_folder_path, requirements_file_name, "uv", force_install, wheelhouse_dir
+    )
+
+
+def remove_virtual_env_for_tool(source_folder_path: str, venv_store_dir: Optional[str] = None) -> None:
+    """
+    Remove a tool's .venv. A shared environment is only detached from the
+    tool, and deleted once no other tool uses it.
+    """
+    venv_dir = os.path.join(source_folder_path, ".venv")
+    store = get_tool_venv_store(venv_store_dir)
+    if store is not None and store.release(source_folder_path):
+        return
+    if os.path.islink(venv_dir):
+        os.unlink(venv_dir)
+    elif os.path.exists(venv_dir):
+        shutil.rmtree(venv_dir)
 
 
 def get_venv_tool_output_key(code: str) -> Optional[str]:
@@ -452,6 +655,17 @@ def get_venv_tool_tool_parameters_type(code: str) -> Type[BaseModel]:
 def get_venv_tool(
     tool_instance: input_types.Input__ToolInstance, user_params_kv: Dict[str, str], workflow_directory: str
 ) -> BaseTool:
+    return get_venv_tool_class(tool_instance, user_params_kv, workflow_directory)()
+
+
+def get_venv_tool_class(
+    tool_instance: input_types.Input__ToolInstance, user_params_kv: Dict[str, str], workflow_directory: str
+) -> Type[BaseTool]:
+    """
+    Parse the venv tool's code (output key, docstring, ToolParameters schema)
+    and build its CrewAI tool class. Instantiating the class is cheap, so the
+    class can be cached and reused across workflow runs.
+    """
     relative_module_dir = os.path.abspath(os.path.join(workflow_directory, tool_instance.source_folder_path))
     with open(os.path.join(relative_module_dir, tool_instance.python_code_file_name), "r") as code_file:
         tool_code = code_file.read()
@@ -470,6 +684,29 @@ def get_venv_tool(
         venv_dir: str = os.path.join(workflow_directory, tool_instance.source_folder_path, ".venv")
 
         def _run(self, *args, **kwargs):
+            # Prefer a warm worker that has already imported the tool module.
+            # Only tools that report their result through OUTPUT_KEY are
+            # eligible, since the worker returns run_tool()'s value directly
+            # rather than whatever the tool's __main__ block prints.
+            if self.output_key and is_tool_worker_enabled():
+                try:
+                    return (
+                        get_tool_worker_pool()
+                        .run(
+                            self.python_executable,
+                            self.python_file,
+                            self.venv_dir,
+                            workflow_directory,
+                            dict(user_params),
+                            dict(kwargs),
+                        )
+                        .strip()
+                    )
+                except ToolWorkerUnavailable as e:
+                    print(f"Falling back to subprocess execution for tool '{self.name}': {e}")
+                except ToolWorkerError as e:
+                    return f"Error: {e}"
+
             try:
                 cmd = [
                     self.python_executable,
@@ -504,9 +741,7 @@ def get_venv_tool(
                 return f"stderr: {result.stderr or 'No error details found'}\n\n\nstdout: {result.stdout}"
             return f"Error running tool - no output"
 
-    tool = AgentStudioCrewAIVenvTool()
-
-    return tool
+    return AgentStudioCrewAIVenvTool
 
 
 def is_venv_tool(tool_code: str) -> bool:
@@ -546,3 +781,19 @@ def get_crewai_tool(
         return get_venv_tool(tool_instance, user_params_kv, workflow_directory)
     else:
         return get_tool_instance_proxy(tool_instance, user_params_kv, workflow_directory)
+
+
+def get_crewai_tool_factory(
+    tool_instance: input_types.Input__ToolInstance, user_params_kv: Dict[str, str], workflow_directory: str
+) -> Callable[[], BaseTool]:
+    """
+    Same as get_crewai_tool(), but returns a factory so the expensive parsing
+    and class generation can be done once and reused across workflow runs.
+    """
+    relative_module_dir = os.path.abspath(os.path.join(workflow_directory, tool_instance.source_folder_path))
+    with open(os.path.join(relative_module_dir, tool_instance.python_code_file_name), "r") as code_file:
+        tool_code = code_file.read()
+    if is_venv_tool(tool_code):
+        return get_venv_tool_class(tool_instance, user_params_kv, workflow_directory)
+    else:
+        return get_tool_instance_proxy_factory(tool_instance, user_params_kv, workflow_directory)
@@ -1,6 +1,9 @@
 import openinference.instrumentation.crewai as crewaiinst
 from openinference.instrumentation.litellm import LiteLLMInstrumentor
 import sys
+import threading
+from collections import Counter
+from typing import Callable, Optional
 
 __import__("pysqlite3")
 sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
@@ -23,3 +26,59 @@ def reset_crewai_instrumentation():
     # Add logic to un-instrument or reset the instrumentors
     crewaiinst.CrewAIInstrumentor().uninstrument()  # Check if this method exists
     LiteLLMInstrumentor().uninstrument()  # Check if this method exists
+
+
+# Global instrumentors (CrewAI, LiteLLM) are process-wide singletons, so
+# concurrent workflow runs within one runner process share a single
+# instrumentation, whose tracer provider reports to the Phoenix project of
+# one workflow. Runs of that workflow share it; a run of another workflow
+# waits until the active runs finish and then re-instruments for its own
+# project, so its spans never land in another workflow's project. While a
+# run of another workflow waits, new runs of the active workflow queue
+# behind it.
+_instrumentation_cond = threading.Condition()
+_active_instrumentation = {"workflow_name": None, "tracer_provider": None, "active_runs": 0}
+# Number of runs waiting to acquire the instrumentation, per workflow name.
+_waiting_runs: Counter = Counter()
+
+
+def _can_acquire_instrumentation(workflow_name: str) -> bool:
+    if _active_instrumentation["active_runs"] == 0:
+        return True
+    others_waiting = sum(_waiting_runs.values()) - _waiting_runs[workflow_name]
+    return _active_instrumentation["workflow_name"] == workflow_name and others_waiting == 0
+
+
+def acquire_crewai_instrumentation(workflow_name: str, on_wait: Optional[Callable[[], None]] = None):
+    """
+    Instrument a workflow run in a way that is safe for concurrent runs.
+    Blocks while runs of a different workflow are in flight, calling
+    on_wait first if it has to block.
+    Must be paired with release_crewai_instrumentation().
+    """
+    with _instrumentation_cond:
+        _waiting_runs[workflow_name] += 1
+        try:
+            if on_wait is not None and not _can_acquire_instrumentation(workflow_name):
+                on_wait()
+            _instrumentation_cond.wait_for(lambda: _can_acquire_instrumentation(workflow_name))
+        finally:
+            _waiting_runs[workflow_name] -= 1
+            if _waiting_runs[workflow_name] <= 0:
+                del _waiting_runs[workflow_name]
+        if _active_instrumentation["active_runs"] == 0:
+            reset_crewai_instrumentation()
+            _active_instrumentation["tracer_provider"] = instrument_crewai_workflow(workflow_name)
+            _active_instrumentation["workflow_name"] = workflow_name
+        _active_instrumentation["active_runs"] += 1
+        return _active_instrumentation["tracer_provider"]
+
+
+def release_crewai_instrumentation():
+    """
+    Mark a workflow run as finished. Instrumentation is left in place
+    and is only reset by the next run that starts on an idle runner.
+    """
+    with _instrumentation_cond:
+        _active_instrumentation["active_runs"] = max(0, _active_instrumentation["active_runs"] - 1)
+        _instrumentation_cond.notify_all()
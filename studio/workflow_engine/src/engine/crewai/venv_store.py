@@ -0,0 +1,295 @@
+# No top level studio.db imports allowed to support wokrflow model deployment
+
+import fcntl
+import hashlib
+import os
+import platform
+import shutil
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+
+# Directory of the shared tool virtual environment store. Unset disables the
+# store and every tool keeps its own private .venv. The studio passes its own
+# location explicitly; deployed workflows and runners opt in with this.
+TOOL_VENV_STORE_DIR_ENV = "AGENT_STUDIO_TOOL_VENV_STORE_DIR"
+
+# Marker written into a shared environment once its requirements installed
+# successfully. Environments without it are rebuilt.
+VENV_STORE_COMPLETE_MARKER = "COMPLETE"
+
+# Requirement lines that depend on files next to the requirements file. Such
+# environments are specific to the tool directory and are never shared.
+_LOCAL_REQUIREMENT_PREFIXES = ("-r", "-c", "-e", "--requirement", "--constraint", "--editable", ".", "/", "file:")
+
+
+def get_tool_venv_store_dir() -> Optional[str]:
+    return os.getenv(TOOL_VENV_STORE_DIR_ENV) or None
+
+
+def normalize_requirements(requirements: str) -> Optional[str]:
+    """
+    Normalize a requirements file so that files differing only in comments,
+    whitespace, blank lines, ordering or duplicates share an environment.
+    Returns None if the requirements reference local files and cannot be shared.
+    """
+    lines = set()
+    for raw_line in requirements.splitlines():
+        line = raw_line.split(" #", 1)[0].strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith(_LOCAL_REQUIREMENT_PREFIXES):
+            return None
+        lines.add(" ".join(line.split()))
+    return "".join(f"{line}\n" for line in sorted(lines))
+
+
+def get_venv_key(normalized_requirements: str) -> str:
+    """
+    Content address of a shared environment: the normalized requirements plus
+    the interpreter and platform the environment is built for.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(
+        f"{sys.implementation.name}-{sys.version_info.major}.{sys.version_info.minor}-{platform.machine()}\n".encode(
+            "utf-8"
+        )
+    )
+    hasher.update(normalized_requirements.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+class ToolVenvStore:
+    """
+    Content-addressed store of tool virtual environments. Tools whose
+    requirements normalize to the same content share one environment, and the
+    tool's .venv becomes a symlink into the store:
+
+        <root>/<key>/requirements.txt   normalized requirements
+        <root>/<key>/.venv/             the shared environment
+        <root>/<key>/refs/<ref>         one file per tool directory using it
+        <root>/.locks/<key>.lock        build/GC lock, held across processes
+
+    A per-key lock ensures concurrent preparations of the same requirements
+    (from studio threads or separate runner processes) build once. Reference
+    files are validated against the tool's symlink during garbage collection,
+    so tool directories deleted without releasing their environment are
+    reclaimed as well.
+    """
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self._locks_lock = threading.Lock()
+        self._thread_locks: Dict[str, threading.Lock] = {}
+        self._stats_lock = threading.Lock()
+        self._stats = {"builds": 0, "reuses": 0, "releases": 0, "collected": 0}
+
+    def _key_dir(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def _venv_dir(self, key: str) -> str:
+        return os.path.join(self._key_dir(key), ".venv")
+
+    def _ref_name(self, source_folder_path: str) -> str:
+        return hashlib.sha1(os.path.abspath(source_folder_path).encode("utf-8")).hexdigest()
+
+    def _count(self, stat: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[stat] += n
+
+    @contextmanager
+    def _key_lock(self, key: str):
+        # The thread lock serializes threads of this process, since flock is
+        # held per open file description rather than per thread.
+        with self._locks_lock:
+            thread_lock = self._thread_locks.setdefault(key, threading.Lock())
+        with thread_lock:
+            locks_dir = os.path.join(self.root, ".locks")
+            os.makedirs(locks_dir, exist_ok=True)
+            with open(os.path.join(locks_dir, f"{key}.lock"), "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _key_of_link(self, source_folder_path: str) -> Optional[str]:
+        """
+        Store key a tool's .venv symlink points to, if it points into this store.
+        """
+        venv_dir = os.path.join(source_folder_path, ".venv")
+        if not os.path.islink(venv_dir):
+            return None
+        target = os.path.abspath(os.path.join(source_folder_path, os.readlink(venv_dir)))
+        key_dir = os.path.dirname(target)
+        if os.path.dirname(key_dir) != self.root or os.path.basename(target) != ".venv":
+            return None
+        return os.path.basename(key_dir)
+
+    def acquire(
+        self,
+        source_folder_path: str,
+        requirements_file_name: str,
+        build: Callable[[str, str], None],
+        rebuild: bool = False,
+    ) -> bool:
+        """
+        Point a tool's .venv at the shared environment for its requirements,
+        building the environment with `build(folder, requirements_file_name)`
+        if it does not exist yet, or again if `rebuild` is set. Returns False,
+        without touching the tool, if the requirements cannot be shared.
+        """
+        requirements_file_path = os.path.join(source_folder_path, requirements_file_name)
+        if not os.path.isfile(requirements_file_path):
+            return False
+        with open(requirements_file_path, "r") as f:
+            normalized = normalize_requirements(f.read())
+        if normalized is None:
+            return False
+
+        key = get_venv_key(normalized)
+        previous_key = self._key_of_link(source_folder_path)
+        with self._key_lock(key):
+            key_dir = self._key_dir(key)
+            if os.path.exists(os.path.join(key_dir, VENV_STORE_COMPLETE_MARKER)):
+                if rebuild:
+                    build(key_dir, "requirements.txt")
+                self._count("reuses")
+            else:
+                # A previous build was interrupted or failed; start clean.
+                if os.path.exists(self._venv_dir(key)):
+                    shutil.rmtree(self._venv_dir(key))
+                os.makedirs(key_dir, exist_ok=True)
+                with open(os.path.join(key_dir, "requirements.txt"), "w") as f:
+                    f.write(normalized)
+                build(key_dir, "requirements.txt")
+                with open(os.path.join(key_dir, VENV_STORE_COMPLETE_MARKER), "w") as f:
+                    f.write(f"{time.time()}\n")
+                self._count("builds")
+
+            self._link(source_folder_path, self._venv_dir(key))
+            refs_dir = os.path.join(key_dir, "refs")
+            os.makedirs(refs_dir, exist_ok=True)
+            with open(os.path.join(refs_dir, self._ref_name(source_folder_path)), "w") as f:
+                f.write(os.path.abspath(source_folder_path))
+
+        if previous_key is not None and previous_key != key:
+            # The tool's requirements changed; drop its reference on the old environment.
+            self._collect(previous_key)
+        return True
+
+    def _link(self, source_folder_path: str, target: str) -> None:
+        venv_dir = os.path.join(source_folder_path, ".venv")
+        if os.path.islink(venv_dir):
+            if os.readlink(venv_dir) == target:
+                return
+        elif os.path.isdir(venv_dir):
+            # Replace a private environment built before the store was enabled.
+            shutil.rmtree(venv_dir)
+        tmp_link = f"{venv_dir}.{os.getpid()}.{threading.get_ident()}.tmp"
+        os.symlink(target, tmp_link)
+        os.replace(tmp_link, venv_dir)
+
+    def release(self, source_folder_path: str) -> bool:
+        """
+        Detach a tool from its shared environment, removing the environment
+        once no other tool uses it. Returns False if the tool's .venv is not
+        a store link.
+        """
+        key = self._key_of_link(source_folder_path)
+        if key is None:
+            return False
+        os.unlink(os.path.join(source_folder_path, ".venv"))
+        self._count("releases")
+        self._collect(key)
+        return True
+
+    def _is_live_ref(self, key: str, ref_path: str) -> bool:
+        try:
+            with open(ref_path, "r") as f:
+                source_folder_path = f.read().strip()
+        except OSError:
+            return False
+        return self._key_of_link(source_folder_path) == key
+
+    def _collect(self, key: str) -> bool:
+        with self._key_lock(key):
+            key_dir = self._key_dir(key)
+            if not os.path.isdir(key_dir):
+                return False
+            refs_dir = os.path.join(key_dir, "refs")
+            live = 0
+            if os.path.isdir(refs_dir):
+                for ref in os.listdir(refs_dir):
+                    ref_path = os.path.join(refs_dir, ref)
+                    if self._is_live_ref(key, ref_path):
+                        live += 1
+                    else:
+                        os.remove(ref_path)
+            if live:
+                return False
+            shutil.rmtree(key_dir)
+        self._count("collected")
+        return True
+
+    def collect_garbage(self) -> int:
+        """
+        Remove every shared environment no tool references anymore. Returns
+        the number of environments removed.
+        """
+        if not os.path.isdir(self.root):
+            return 0
+        return sum(
+            1
+            for key in os.listdir(self.root)
+            if not key.startswith(".") and os.path.isdir(self._key_dir(key)) and self._collect(key)
+        )
+
+    def get_ref_count(self, key: str) -> int:
+        refs_dir = os.path.join(self._key_dir(key), "refs")
+        return len(os.listdir(refs_dir)) if os.path.isdir(refs_dir) else 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return dict(self._stats)
+
+
+_stores: Dict[str, ToolVenvStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_tool_venv_store(root: Optional[str] = None) -> Optional[ToolVenvStore]:
+    """
+    Get the process-wide store rooted at `root`, or at
+    $AGENT_STUDIO_TOOL_VENV_STORE_DIR if no root is given. Returns None if
+    neither is set.
+    """
+    root = root or get_tool_venv_store_dir()
+    if not root:
+        return None
+    root = os.path.abspath(root)
+    with _stores_lock:
+        if root not in _stores:
+            _stores[root] = ToolVenvStore(root)
+        return _stores[root]
+
+
+def get_linked_tool_venv_store(source_folder_path: str) -> Optional[ToolVenvStore]:
+    """
+    Get the store a tool's .venv symlink points into, so callers that were
+    not given the store location (like tool tests on a runner) never install
+    into a shared environment through the link. Returns None if the tool's
+    .venv is not a store link.
+    """
+    venv_dir = os.path.join(source_folder_path, ".venv")
+    if not os.path.islink(venv_dir):
+        return None
+    target = os.path.abspath(os.path.join(source_folder_path, os.readlink(venv_dir)))
+    key_dir = os.path.dirname(target)
+    key = os.path.basename(key_dir)
+    if os.path.basename(target) != ".venv" or len(key) != 64 or any(c not in "0123456789abcdef" for c in key):
+        return None
+    return get_tool_venv_store(os.path.dirname(key_dir))
@@ -8,7 +8,8 @@ import requests
 from datetime import datetime
 from opentelemetry.context import get_current
 import subprocess
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional
 
 # Disable CrewAI telemetry.
 os.environ["CREWAI_DISABLE_TELEMETRY"] = "true"
@@ -29,18 +30,51 @@ sys.path.append(workflow_engine_src_dir)
 # Import CrewAI modules.
 import engine.types as input_types
 from engine.crewai.run import run_workflow
-from engine.crewai.tracing import instrument_crewai_workflow, reset_crewai_instrumentation
+from engine.crewai.tracing import acquire_crewai_instrumentation, release_crewai_instrumentation
 from engine.ops import get_ops_endpoint
 from engine.crewai.events import register_global_handlers
 from engine.tool.run import run_tool_test
 
 app = FastAPI()
 
-# Global asynchronous lock to allow only one workflow at a time.
-global_lock = asyncio.Lock()
+# Number of workflows (or tool tests) a single runner process may execute
+# concurrently. Each execution occupies one slot; when every slot is taken the
+# runner responds with HTTP 409 so callers can try another runner.
+NUM_RUNNER_SLOTS = max(1, int(os.getenv("AGENT_STUDIO_WORKFLOW_RUNNER_CONCURRENCY", "1")))
 
-# Global reference to the running workflow
-running_workflow = None
+# Bounded executor backing the slot pool. Sized to the slot count so a
+# runner never has more blocking crews in flight than it advertises.
+runner_executor = ThreadPoolExecutor(max_workers=NUM_RUNNER_SLOTS, thread_name_prefix="workflow-runner-slot")
+
+# Slot occupancy. A slot is None when free, otherwise a dict describing the
+# execution occupying it. Slots are only claimed, updated and released from
+# the event loop thread, so no additional locking is needed.
+runner_slots: List[Optional[Dict[str, Any]]] = [None] * NUM_RUNNER_SLOTS
+
+# States of an occupied slot. A workflow run is queued while it waits for
+# runs of another workflow to release the shared CrewAI instrumentation.
+SLOT_RUNNING = "running"
+SLOT_QUEUED = "queued"
+
+
+def acquire_runner_slot(occupant: Dict[str, Any]) -> int:
+    """
+    Claim a free slot for an execution, raising HTTP 409 if the runner is full.
+    """
+    for i, slot in enumerate(runner_slots):
+        if slot is None:
+            runner_slots[i] = {**occupant, "state": SLOT_RUNNING, "started_at": datetime.now().isoformat()}
+            return i
+    raise HTTPException(status_code=409, detail="Runner is busy")
+
+
+def set_runner_slot_state(slot_index: int, state: str) -> None:
+    if runner_slots[slot_index] is not None:
+        runner_slots[slot_index]["state"] = state
+
+
+def release_runner_slot(slot_index: int) -> None:
+    runner_slots[slot_index] = None
 
 
 # Pydantic model for the incoming JSON payload.
@@ -70,16 +104,22 @@ class ToolTestPayload(BaseModel):
 register_global_handlers()
 
 
-def run_workflow_task(payload: KickoffPayload) -> None:
-    global running_workflow
-
+def run_workflow_task(payload: KickoffPayload, set_slot_state: Optional[Callable[[str], None]] = None) -> None:
     """
     Task definiton to be ran asynchronously.
     Any exceptions are caught and posted to the ops endpoint.
+    set_slot_state, if given, is told when the run is queued behind runs
+    of another workflow and when it starts running.
     """
+    instrumented = False
     try:
-        reset_crewai_instrumentation()
-        tracer_provider = instrument_crewai_workflow(payload.workflow_name)
+        tracer_provider = acquire_crewai_instrumentation(
+            payload.workflow_name,
+            on_wait=(lambda: set_slot_state(SLOT_QUEUED)) if set_slot_state else None,
+        )
+        instrumented = True
+        if set_slot_state:
+            set_slot_state(SLOT_RUNNING)
         tracer = tracer_provider.get_tracer("opentelemetry.agentstudio.workflow.model")
         current_time = datetime.now()
         formatted_time = current_time.strftime("%b %d, %H:%M:%S.%f")[:-3]
@@ -109,7 +149,6 @@ def run_workflow_task(payload: KickoffPayload) -> None:
 
         print("Workflow finished successfully")
     except Exception as e:
-        running_workflow = None
         print("Workflow failed:", e)
         traceback.print_exc()
         try:
@@ -123,73 +162,95 @@ def run_workflow_task(payload: KickoffPayload) -> None:
             )
         except Exception as post_ex:
             print("Failed to send error event:", post_ex)
+    finally:
+        if instrumented:
+            release_crewai_instrumentation()
 
 
-async def run_workflow_background(payload: KickoffPayload) -> None:
-    global running_workflow
-
+async def run_workflow_background(payload: KickoffPayload, slot_index: int) -> None:
     """
     This asynchronous wrapper schedules the synchronous workflow to run
-    in an executor. When done, it ensures the global lock is released.
+    in the runner's executor. When done, it ensures the slot is released.
     """
     try:
         loop = asyncio.get_running_loop()
+
+        def set_slot_state(state: str) -> None:
+            loop.call_soon_threadsafe(set_runner_slot_state, slot_index, state)
+
         # Running the blocking workflow code in a separate thread.
-        await loop.run_in_executor(None, run_workflow_task, payload)
+        await loop.run_in_executor(runner_executor, run_workflow_task, payload, set_slot_state)
     finally:
-        global_lock.release()
-        running_workflow = None
+        release_runner_slot(slot_index)
 
 
 @app.post("/kickoff")
 async def kickoff(payload: KickoffPayload):
-    global running_workflow
-
     """
     POST endpoint to start a Crew workflow.
 
     It will:
-      - Check if another workflow is already running.
-      - If not, acquire the lock, schedule the workflow to run asynchronously, and respond immediately.
-      - If the lock is already held, return HTTP 409 "Runner is busy".
+      - Claim a free execution slot on this runner.
+      - Schedule the workflow to run asynchronously in that slot, and respond immediately.
+      - If every slot is occupied, return HTTP 409 "Runner is busy".
     """
-    if global_lock.locked():
-        raise HTTPException(status_code=409, detail="Runner is busy")
-
-    # Acquire the lock so that no other workflow starts.
-    await global_lock.acquire()
-    running_workflow = {"name": payload.workflow_name, "id": payload.collated_input["workflow"]["id"]}
+    slot_index = acquire_runner_slot(
+        {
+            "type": "workflow",
+            "name": payload.workflow_name,
+            "id": payload.collated_input["workflow"]["id"],
+            "trace_id": payload.events_trace_id,
+        }
+    )
     # Launch the background workflow process.
-    asyncio.create_task(run_workflow_background(payload))
+    asyncio.create_task(run_workflow_background(payload, slot_index))
     return {"status": "Workflow kickoff started"}
 
 
 @app.get("/status")
 async def status():
-    global running_workflow
-
     """
     GET endpoint to report the runner's busy status.
 
-    It returns a JSON indicating whether a workflow is currently running.
+    The runner is busy when every slot is occupied, whether its execution
+    is running or queued. Per-slot occupancy is reported alongside;
+    "workflow" reports the first running workflow.
     """
-    if global_lock.locked():
-        return {"busy": True, "workflow": running_workflow}
-    else:
-        return {"busy": False}
+    occupied = [slot for slot in runner_slots if slot is not None]
+    running_workflows = [
+        {"name": slot["name"], "id": slot["id"]}
+        for slot in occupied
+        if slot["type"] == "workflow" and slot["state"] == SLOT_RUNNING
+    ]
+    response = {
+        "busy": len(occupied) >= NUM_RUNNER_SLOTS,
+        "slots_total": NUM_RUNNER_SLOTS,
+        "slots_busy": len(occupied),
+        "slots_queued": sum(1 for slot in occupied if slot["state"] == SLOT_QUEUED),
+        "slots": runner_slots,
+    }
+    if running_workflows:
+        response["workflow"] = running_workflows[0]
+    return response
 
 
 @app.post("/test_tool_instance")
 async def test_tool_instance(payload: ToolTestPayload):
-    if global_lock.locked():
-        raise HTTPException(status_code=409, detail="Runner is busy")
-    await global_lock.acquire()
+    slot_index = acquire_runner_slot(
+        {
+            "type": "tool_test",
+            "name": payload.tool_instance_id,
+            "id": payload.tool_instance_id,
+            "trace_id": payload.trace_id,
+        }
+    )
+
     async def run_tool_test_background():
         try:
             loop = asyncio.get_running_loop()
             # Run the blocking tool test in a separate thread
             await loop.run_in_executor(
-                None,
+                runner_executor,
                 run_tool_test,
                 payload.tool_instance_id,
                 payload.tool_directory,
@@ -198,6 +259,7 @@ async def test_tool_instance(payload: ToolTestPayload):
                 payload.trace_id,
             )
         finally:
-            global_lock.release()
+            release_runner_slot(slot_index)
+
     asyncio.create_task(run_tool_test_background())
     return {"status": "Tool test started", "trace_id": payload.trace_id}
@@ -46,8 +46,8 @@ import base64
 
 import engine.types as input_types
 from engine.crewai.mcp import get_mcp_tools_definitions
-from engine.crewai.run import run_workflow_async
-from engine.crewai.artifact import is_crewai_workflow, load_crewai_workflow
+from engine.crewai.run import run_workflow_when_tools_ready
+from engine.crewai.artifact import get_tool_venv_warmup, is_crewai_workflow, load_crewai_workflow
 from engine.artifact import extract_artifact_to_location, get_workflow_name
 from engine.langgraph.artifact import is_langgraph_workflow, load_langgraph_workflow
 
@@ -55,7 +55,7 @@ import cml.models_v1 as cml_models
 
 
 # Extract (or download) our artifact to MODEL_EXECUTION_DIR/workflow/*
-extract_artifact_to_location(WORFKLOW_ARTIFACT, WORKFLOW_DIRECTORY)
+_artifact_extraction = extract_artifact_to_location(WORFKLOW_ARTIFACT, WORKFLOW_DIRECTORY)
 
 LANGGRAPH_CALLABLES = None
 tracer = None  # keep this for CrewAI workflows
@@ -63,7 +63,10 @@ tracer = None  # keep this for CrewAI workflows
 if is_langgraph_workflow(WORKFLOW_DIRECTORY):
     LANGGRAPH_CALLABLES = load_langgraph_workflow(WORKFLOW_DIRECTORY)
 elif is_crewai_workflow(WORKFLOW_DIRECTORY):
-    collated_input, tracer = load_crewai_workflow(WORKFLOW_DIRECTORY)
+    # Tool virtual environments are prepared in the background so the model
+    # can start serving; kickoffs wait for them and callers can poll the
+    # get-readiness action.
+    collated_input, tracer = load_crewai_workflow(WORKFLOW_DIRECTORY, wait_for_tool_venvs=False)
 else:
     raise ValueError("Unsupported workflow artifact type.")
 
@@ -135,7 +138,14 @@ def api_wrapper(args: Union[dict, str]) -> str:
 
         # CrewAI workflow
         else:
-            collated_input_copy = collated_input.model_copy(deep=True)
+            # Reject the kickoff outright if the tools' dependencies are known
+            # to be missing; a kickoff during warm-up waits for it instead.
+            tool_venv_failure = get_tool_venv_warmup().get_failure()
+            if tool_venv_failure is not None:
+                raise RuntimeError(f"Workflow cannot be kicked off. {tool_venv_failure}")
+
+            # The collated input is treated as read-only by the engine, so
+            # it can be shared across runs without a per-request deep copy.
             current_time = datetime.now()
             formatted_time = current_time.strftime("%b %d, %H:%M:%S.%f")[:-3]
             span_name = f"Workflow Run: {formatted_time}"
@@ -146,9 +156,10 @@ def api_wrapper(args: Union[dict, str]) -> str:
                 parent_context = get_current()
 
                 asyncio.create_task(
-                    run_workflow_async(
+                    run_workflow_when_tools_ready(
+                        get_tool_venv_warmup(),
                         WORKFLOW_DIRECTORY,
-                        collated_input_copy,
+                        collated_input,
                         deployment_config.tool_config,
                         deployment_config.mcp_config,
                         deployment_config.llm_config,
@@ -187,5 +198,11 @@ def api_wrapper(args: Union[dict, str]) -> str:
         return {"asset_data": asset_data, "unavailable_assets": unavailable_assets}
     elif serve_workflow_parameters.action_type == input_types.DeployedWorkflowActions.GET_MCP_TOOL_DEFINITIONS.value:
         return {"ready": _mcp_tool_defintions is not None, "mcp_tool_definitions": _mcp_tool_defintions}
+    elif serve_workflow_parameters.action_type == input_types.DeployedWorkflowActions.GET_READINESS.value:
+        if LANGGRAPH_CALLABLES:
+            readiness = {"ready": True, "failed": False, "error": None, "tool_virtual_envs": {}}
+        else:
+            readiness = get_tool_venv_warmup().get_readiness()
+        return {**readiness, "artifact_extraction": _artifact_extraction}
     else:
         raise ValueError("Invalid action type.")
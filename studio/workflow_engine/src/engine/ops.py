@@ -6,22 +6,33 @@ sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
 from engine.utils import get_application_by_name
 from engine.consts import AGENT_STUDIO_OPS_APPLICATION_NAME
 from phoenix.otel import register
+from typing import Any, Dict
 import cmlapi
 import os
+import threading
+import time
 
 
 def get_ops_provider() -> str:
     return os.getenv("AGENT_STUDIO_OPS_PROVIDER", "phoenix")
 
 
-def get_ops_endpoint() -> str:
+# Resolved ops endpoints are cached process-wide so that hot paths (every
+# CrewAI event post, every tool test event) do not issue a full CML
+# application listing per call. The cache is invalidated after the TTL expires
+# or when a caller reports a connection failure against the cached endpoint.
+OPS_ENDPOINT_CACHE_TTL_SECONDS = float(os.getenv("AGENT_STUDIO_OPS_ENDPOINT_CACHE_TTL", "300"))
+
+_ops_endpoint_lock = threading.Lock()
+_ops_endpoint_cache: Dict[str, Any] = {"endpoint": None, "expires_at": 0.0}
+_ops_endpoint_stats: Dict[str, int] = {"hits": 0, "misses": 0, "overrides": 0, "invalidations": 0}
+
+
+def _resolve_ops_endpoint_from_cml() -> str:
     """
-    Get the current operational endpoint of the
-    Agent observability server. This can be overridden
-    by an endpoint specified in an environment variable. If this
-    env variable does not exist, extract the endpoint information
-    from the running ops application directly. This env var override
-    option is to make sure CML models can also reach the ops endpoint.
+    Look up the running ops application through the CML API and
+    build its endpoint. This is the expensive path that the endpoint
+    cache is protecting.
     """
     # Check for required environment variables
     domain = os.getenv("CDSW_DOMAIN")
@@ -48,6 +59,61 @@ def get_ops_endpoint() -> str:
         raise RuntimeError(f"Failed to get ops endpoint: {str(e)}")
 
 
+def get_ops_endpoint() -> str:
+    """
+    Get the current operational endpoint of the
+    Agent observability server. This can be overridden
+    by an endpoint specified in an environment variable. If this
+    env variable does not exist, extract the endpoint information
+    from the running ops application directly. This env var override
+    option is to make sure CML models can also reach the ops endpoint.
+
+    Endpoints resolved through the CML API are cached for
+    OPS_ENDPOINT_CACHE_TTL_SECONDS.
+    """
+    override = os.getenv("AGENT_STUDIO_OPS_ENDPOINT")
+    if override:
+        with _ops_endpoint_lock:
+            _ops_endpoint_stats["overrides"] += 1
+        return override
+
+    with _ops_endpoint_lock:
+        now = time.monotonic()
+        if _ops_endpoint_cache["endpoint"] and now < _ops_endpoint_cache["expires_at"]:
+            _ops_endpoint_stats["hits"] += 1
+            return _ops_endpoint_cache["endpoint"]
+
+        # Resolve while holding the lock so concurrent callers on a cold
+        # cache trigger a single CML API lookup.
+        _ops_endpoint_stats["misses"] += 1
+        endpoint = _resolve_ops_endpoint_from_cml()
+        _ops_endpoint_cache["endpoint"] = endpoint
+        _ops_endpoint_cache["expires_at"] = now + OPS_ENDPOINT_CACHE_TTL_SECONDS
+        return endpoint
+
+
+def invalidate_ops_endpoint_cache() -> None:
+    """
+    Drop the cached ops endpoint. Callers should invoke this when a request
+    to the cached endpoint fails to connect (for example, after the ops
+    application was restarted under a new subdomain).
+    """
+    with _ops_endpoint_lock:
+        if _ops_endpoint_cache["endpoint"] is not None:
+            _ops_endpoint_stats["invalidations"] += 1
+        _ops_endpoint_cache["endpoint"] = None
+        _ops_endpoint_cache["expires_at"] = 0.0
+
+
+def get_ops_endpoint_cache_stats() -> Dict[str, int]:
+    """
+    Return a snapshot of the ops endpoint cache counters. A high hit count
+    relative to misses confirms the CML API is off the event hot path.
+    """
+    with _ops_endpoint_lock:
+        return dict(_ops_endpoint_stats)
+
+
 def get_phoenix_ops_tracer_provider(workflow_name: str):
     """
     Register a tracing provider to route to the phoenix
@@ -38,6 +38,10 @@ class ToolVenvCreationFinishedEvent(BaseModel):
     requirements_file: str = "requirements.txt"
     pip_output: str = ""
     pip_error: str = ""
+    # Set when the requirements fingerprint matched and the install was skipped
+    install_skipped: bool = False
+    install_seconds: float = 0.0
+    time_saved_seconds: float = 0.0
 
 # New event for venv creation failed
 class ToolVenvCreationFailedEvent(BaseModel):
@@ -75,6 +79,9 @@ TOOL_EVENT_PROCESSORS = {
         "requirements_file": x.requirements_file,
         "pip_output": x.pip_output,
         "pip_error": x.pip_error,
+        "install_skipped": x.install_skipped,
+        "install_seconds": x.install_seconds,
+        "time_saved_seconds": x.time_saved_seconds,
     },
     ToolVenvCreationFailedEvent: lambda x: {
         "tool_instance_id": x.tool_instance_id,
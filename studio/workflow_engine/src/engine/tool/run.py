@@ -11,11 +11,20 @@ from engine.tool.events import (
     ToolVenvCreationFailedEvent,
     process_tool_event,
 )
-from engine.ops import get_ops_endpoint
+from engine.ops import get_ops_endpoint, invalidate_ops_endpoint_cache
 import requests
 import shutil
+import time
 import traceback
-from engine.crewai.tools import create_virtual_env
+from engine.crewai.tools import (
+    check_requirements_fingerprint,
+    create_virtual_env,
+    get_uv_cache_dir,
+    is_tool_venv_force_install,
+    prepare_virtual_env_for_tool,
+    write_requirements_fingerprint,
+)
+from engine.crewai.venv_store import get_linked_tool_venv_store
 import ast
 
 # Utility to post tool events
@@ -26,13 +35,19 @@ def post_tool_event(trace_id, event):
         "type": str(event.type),
     }
     event_dict.update(process_tool_event(event))
-    requests.post(
-        url=f"{get_ops_endpoint()}/events",
-        headers={"Authorization": f"Bearer {os.getenv('CDSW_APIV2_KEY')}",},
-        json={"trace_id": trace_id, "event": event_dict},
-    )
+    try:
+        requests.post(
+            url=f"{get_ops_endpoint()}/events",
+            headers={
+                "Authorization": f"Bearer {os.getenv('CDSW_APIV2_KEY')}",
+            },
+            json={"trace_id": trace_id, "event": event_dict},
+        )
+    except requests.exceptions.ConnectionError:
+        invalidate_ops_endpoint_cache()
+        raise
 
-def ensure_venv_and_requirements(tool_dir: str, requirements_file: str = "requirements.txt", trace_id=None, tool_instance_id=None):
+def ensure_venv_and_requirements(tool_dir: str, requirements_file: str = "requirements.txt", trace_id=None, tool_instance_id=None, force_install: bool = False):
     venv_dir = os.path.join(tool_dir, ".venv")
     uv_bin = shutil.which("uv")
     if not uv_bin:
@@ -56,23 +71,79 @@ def ensure_venv_and_requirements(tool_dir: str, requirements_file: str = "requir
             tool_dir=tool_dir,
             requirements_file=requirements_file,
         ))
+    requirements_path = os.path.join(tool_dir, requirements_file)
+    if os.path.exists(requirements_path) and get_linked_tool_venv_store(tool_dir) is not None:
+        # The tool's .venv is shared with every tool of the same requirements,
+        # so never pip install into it. The store links the tool to the
+        # environment of its current requirements, building that if needed.
+        install_start = time.monotonic()
+        try:
+            prepare_virtual_env_for_tool(tool_dir, requirements_file, force_install=force_install)
+        except Exception as e:
+            if trace_id and tool_instance_id:
+                post_tool_event(
+                    trace_id,
+                    ToolVenvCreationFailedEvent(
+                        timestamp=datetime.utcnow(),
+                        tool_instance_id=tool_instance_id,
+                        tool_dir=tool_dir,
+                        requirements_file=requirements_file,
+                        error=str(e),
+                    ),
+                )
+            raise
+        if trace_id and tool_instance_id:
+            post_tool_event(
+                trace_id,
+                ToolVenvCreationFinishedEvent(
+                    timestamp=datetime.utcnow(),
+                    tool_instance_id=tool_instance_id,
+                    tool_dir=tool_dir,
+                    requirements_file=requirements_file,
+                    install_seconds=time.monotonic() - install_start,
+                ),
+            )
+        return
+
     # Create virtual environment if it doesn't exist (using the same logic as crewai/tools.py)
     create_virtual_env(tool_dir, "uv")
 
-    requirements_path = os.path.join(tool_dir, requirements_file)
     pip_output = ""
     pip_error = ""
     pip_install_command = [uv_bin, "pip", "install", "-r", requirements_path]
     try:
-        if os.path.exists(requirements_path):
+        fingerprint, saved_seconds = check_requirements_fingerprint(venv_dir, requirements_path)
+        if (
+            os.path.exists(requirements_path)
+            and saved_seconds is not None
+            and not (force_install or is_tool_venv_force_install())
+        ):
+            # Requirements already installed; skip even the no-op resolve.
+            if trace_id and tool_instance_id:
+                post_tool_event(
+                    trace_id,
+                    ToolVenvCreationFinishedEvent(
+                        timestamp=datetime.utcnow(),
+                        tool_instance_id=tool_instance_id,
+                        tool_dir=tool_dir,
+                        requirements_file=requirements_file,
+                        install_skipped=True,
+                        time_saved_seconds=saved_seconds,
+                    ),
+                )
+        elif os.path.exists(requirements_path):
+            install_start = time.monotonic()
             proc = subprocess.run(
                 pip_install_command,
                 capture_output=True,
                 text=True,
-                env={"VIRTUAL_ENV": venv_dir},
+                env={"VIRTUAL_ENV": venv_dir, "UV_CACHE_DIR": get_uv_cache_dir()},
             )
+            install_seconds = time.monotonic() - install_start
             pip_output = proc.stdout
             pip_error = proc.stderr
+            if proc.returncode == 0:
+                write_requirements_fingerprint(venv_dir, fingerprint, install_seconds)
             # Always post finished event
             if trace_id and tool_instance_id:
                 post_tool_event(trace_id, ToolVenvCreationFinishedEvent(
@@ -82,6 +153,7 @@ def ensure_venv_and_requirements(tool_dir: str, requirements_file: str = "requir
                     requirements_file=requirements_file,
                     pip_output=pip_output,
                     pip_error=pip_error,
+                    install_seconds=install_seconds,
                 ))
             if proc.returncode != 0:
                 if trace_id and tool_instance_id:
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict
-from typing import Optional, List, Literal, Dict
+from typing import Any, Callable, Optional, List, Literal, Dict
 from enum import Enum
 from crewai import Agent, Crew, Task, Process
 from crewai.tools import BaseTool
@@ -45,6 +45,13 @@ class DeploymentConfig(BaseModel):
     All other environment variable overrides to pass to the deployment target environment.
     """
 
+    prebuild_tool_wheels: bool = False
+    """
+    Build wheels for every tool's requirements while packaging and ship them
+    in the artifact, so the deployment installs tools offline and its cold
+    start does not depend on the package index.
+    """
+
 
 class Input__LanguageModelConfig(BaseModel):
     provider_model: str
@@ -131,6 +138,11 @@ class MCPObjects(BaseModel):
 
     local_session: MCPServerAdapter
     tools: List[BaseTool]
+    pool_session: Optional[Any] = None
+    """
+    The engine.crewai.mcp_pool session these tools were leased from, if the
+    MCP server is pooled across workflow runs.
+    """
 
 
 class CrewAIObjects(BaseModel):
@@ -144,11 +156,26 @@ class CrewAIObjects(BaseModel):
     crews: Dict[str, Crew]
 
 
+class CrewAIBuildArtifacts(BaseModel):
+    """
+    Immutable, per-workflow build products that can be reused across
+    workflow runs. Only the objects that CrewAI mutates while running
+    (LLMs, tools, agents, tasks and crews) are instantiated per run.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    build_key: str
+    llm_kwargs: Dict[str, Dict[str, Any]]
+    tool_factories: Dict[str, Callable[[], BaseTool]]
+
+
 class DeployedWorkflowActions(str, Enum):
     KICKOFF = "kickoff"
     GET_CONFIGURATION = "get-configuration"
     GET_ASSET_DATA = "get-asset-data"
     GET_MCP_TOOL_DEFINITIONS = "get-mcp-tool-definitions"
+    GET_READINESS = "get-readiness"
 
 
 class ServeWorkflowParameters(BaseModel):
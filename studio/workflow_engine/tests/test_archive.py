@@ -0,0 +1,95 @@
+import sys
+
+__import__("pysqlite3")
+sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
+
+import hashlib
+import io
+import json
+import os
+import tarfile
+
+import pytest
+
+from engine.archive import (
+    ARTIFACT_MANIFEST_FILE_NAME,
+    build_artifact_manifest,
+    extract_artifact,
+    hash_file,
+    read_artifact_manifest,
+)
+
+
+def _artifact(tmp_path, files, manifest_files=None, extra_members=()):
+    """
+    Write a gzip artifact with the given {arcname: bytes}, led by a manifest
+    unless manifest_files is False.
+    """
+    path = str(tmp_path / "artifact.tar.gz")
+    with tarfile.open(path, "w:gz") as tar:
+
+        def add(name, data):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+        if manifest_files is not False:
+            source = manifest_files if manifest_files is not None else files
+            manifest = build_artifact_manifest(
+                {name: {"sha256": _sha256(data), "size": len(data)} for name, data in source.items()}
+            )
+            add(ARTIFACT_MANIFEST_FILE_NAME, json.dumps(manifest).encode("utf-8"))
+        for name, data in files.items():
+            add(name, data)
+        for member in extra_members:
+            tar.addfile(member)
+    return path
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def test_extract_then_skip_unchanged(tmp_path):
+    artifact = _artifact(tmp_path, {"workflow.yaml": b"type: collated_input\n", "studio-data/a.txt": b"a"})
+    destination = str(tmp_path / "workflow")
+
+    first = extract_artifact(artifact, destination)
+    assert first["skipped"] is False
+    assert first["files"] == 2
+    assert open(os.path.join(destination, "studio-data", "a.txt")).read() == "a"
+    assert read_artifact_manifest(artifact)["files"]["studio-data/a.txt"]["size"] == 1
+
+    assert extract_artifact(artifact, destination)["skipped"] is True
+
+    # A file removed from the destination forces a fresh extraction.
+    os.remove(os.path.join(destination, "studio-data", "a.txt"))
+    assert extract_artifact(artifact, destination)["skipped"] is False
+    assert os.path.exists(os.path.join(destination, "studio-data", "a.txt"))
+
+
+def test_integrity_check_fails_on_mismatch(tmp_path):
+    artifact = _artifact(tmp_path, {"a.txt": b"tampered"}, manifest_files={"a.txt": b"original"})
+    destination = str(tmp_path / "workflow")
+
+    with pytest.raises(RuntimeError, match="integrity check failed"):
+        extract_artifact(artifact, destination)
+    # Never recorded as extracted.
+    assert not os.path.exists(os.path.join(destination, ARTIFACT_MANIFEST_FILE_NAME))
+
+
+def test_unsafe_members_are_skipped(tmp_path):
+    link = tarfile.TarInfo("escape")
+    link.type = tarfile.SYMTYPE
+    link.linkname = "../../outside.txt"
+    artifact = _artifact(
+        tmp_path, {"ok.txt": b"ok", "../evil.txt": b"evil"}, manifest_files=False, extra_members=[link]
+    )
+    destination = str(tmp_path / "workflow")
+
+    result = extract_artifact(artifact, destination)
+    assert result["files"] is None
+    assert os.path.exists(os.path.join(destination, "ok.txt"))
+    assert not os.path.exists(str(tmp_path / "evil.txt"))
+    assert not os.path.lexists(os.path.join(destination, "escape"))
+    assert hash_file(os.path.join(destination, "ok.txt")) == _sha256(b"ok")
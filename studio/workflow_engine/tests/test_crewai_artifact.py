@@ -31,3 +31,111 @@ def test_is_crewai_workflow_missing_file(mock_isfile):
 def test_is_crewai_workflow_yaml_parse_failure(mock_isfile):
     mock_isfile.return_value = True
     assert is_crewai_workflow("/fake/path") is False
+
+
+def _collated_input(tool_count):
+    from engine.types import CollatedInput
+
+    return CollatedInput.model_validate(
+        {
+            "default_language_model_id": "m1",
+            "language_models": [],
+            "tool_instances": [
+                {
+                    "id": f"t{i}",
+                    "name": f"tool {i}",
+                    "python_code_file_name": "tool.py",
+                    "python_requirements_file_name": "requirements.txt",
+                    "source_folder_path": f"tools/t{i}",
+                    "tool_metadata": "{}",
+                }
+                for i in range(tool_count)
+            ],
+            "mcp_instances": [],
+            "agents": [],
+            "tasks": [],
+            "workflow": {
+                "id": "w1",
+                "name": "workflow",
+                "crew_ai_process": "sequential",
+                "agent_ids": [],
+                "task_ids": [],
+                "manager_agent_id": None,
+                "llm_provider_model_id": None,
+                "is_conversational": False,
+            },
+        }
+    )
+
+
+def test_tool_venvs_prepare_in_parallel():
+    import threading
+    from engine.crewai.artifact import TOOL_VENV_READY, ToolVenvWarmup
+
+    barrier = threading.Barrier(3, timeout=5)
+    with patch(
+        "engine.crewai.artifact.prepare_virtual_env_for_tool", side_effect=lambda *args, **kwargs: barrier.wait()
+    ):
+        warmup = ToolVenvWarmup()
+        # Would time out on the barrier if the three tools were prepared serially.
+        warmup.run("/workflow", _collated_input(3), max_workers=3)
+
+    readiness = warmup.get_readiness()
+    assert readiness["ready"] is True
+    assert {status["status"] for status in readiness["tool_virtual_envs"].values()} == {TOOL_VENV_READY}
+    assert all("seconds" in status for status in readiness["tool_virtual_envs"].values())
+
+
+def test_tool_venv_warmup_reports_failures():
+    from engine.crewai.artifact import TOOL_VENV_FAILED, ToolVenvWarmup
+
+    def prepare(folder, requirements_file_name, **kwargs):
+        if folder.endswith("t1"):
+            raise RuntimeError("COULD NOT INSTALL REQUIREMENTS")
+
+    with patch("engine.crewai.artifact.prepare_virtual_env_for_tool", side_effect=prepare):
+        warmup = ToolVenvWarmup()
+        assert warmup.get_readiness()["ready"] is False
+        warmup.start("/workflow", _collated_input(2), max_workers=2)
+        assert warmup.wait(timeout=5)
+
+    readiness = warmup.get_readiness()
+    assert readiness["ready"] is False
+    assert readiness["failed"] is True
+    assert readiness["tool_virtual_envs"]["t1"]["status"] == TOOL_VENV_FAILED
+    assert "COULD NOT INSTALL REQUIREMENTS" in readiness["error"]
+
+
+def test_kickoff_waits_for_tool_venvs_and_does_not_run_after_a_failure():
+    import asyncio
+    from engine.crewai import run as crewai_run
+    from engine.crewai.artifact import ToolVenvWarmup
+
+    def prepare(folder, requirements_file_name, **kwargs):
+        if folder.endswith("t1"):
+            raise RuntimeError("COULD NOT INSTALL REQUIREMENTS")
+
+    def kickoff(warmup, trace_id):
+        asyncio.run(crewai_run.run_workflow_when_tools_ready(warmup, "/workflow", None, {}, {}, {}, {}, None, trace_id))
+
+    with (
+        patch("engine.crewai.artifact.prepare_virtual_env_for_tool", side_effect=prepare),
+        patch.object(crewai_run, "run_workflow_async") as mock_run,
+        patch.object(crewai_run, "get_event_shipper") as mock_shipper,
+    ):
+        warmup = ToolVenvWarmup()
+        warmup.start("/workflow", _collated_input(1))
+        kickoff(warmup, "trace-ok")
+        assert warmup.get_failure() is None
+        mock_run.assert_awaited_once()
+
+        warmup.start("/workflow", _collated_input(2))
+        kickoff(warmup, "trace-failed")
+
+    # The crew is not run without its tools' dependencies.
+    mock_run.assert_awaited_once()
+    trace_id, event = mock_shipper.return_value.submit.call_args.args
+    assert trace_id == "trace-failed"
+    assert event["type"] == "crew_kickoff_failed"
+    assert "tool 1: COULD NOT INSTALL REQUIREMENTS" in event["error"]
+    assert event["error"] == warmup.get_failure()
@@ -0,0 +1,93 @@
+import sys
+
+__import__("pysqlite3")
+sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
+
+import os
+import pytest
+from unittest.mock import patch
+
+import engine.crewai.build_cache as build_cache
+from engine.types import CollatedInput
+
+
+def _collated_input(tool_folder: str) -> CollatedInput:
+    return CollatedInput.model_validate(
+        {
+            "default_language_model_id": "m1",
+            "language_models": [{"model_id": "m1", "model_name": "model", "generation_config": {}}],
+            "tool_instances": [
+                {
+                    "id": "t1",
+                    "name": "tool",
+                    "python_code_file_name": "tool.py",
+                    "python_requirements_file_name": "requirements.txt",
+                    "source_folder_path": tool_folder,
+                    "tool_metadata": "{}",
+                }
+            ],
+            "mcp_instances": [],
+            "agents": [],
+            "tasks": [],
+            "workflow": {
+                "id": "w1",
+                "name": "workflow",
+                "crew_ai_process": "sequential",
+                "is_conversational": False,
+            },
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    build_cache.clear_crewai_build_cache()
+    for key in build_cache._build_cache_stats:
+        build_cache._build_cache_stats[key] = 0
+    yield
+    build_cache.clear_crewai_build_cache()
+
+
+@patch("engine.crewai.build_cache.get_crewai_llm_kwargs", return_value={"agent_studio_id": "m1"})
+@patch("engine.crewai.build_cache.get_crewai_tool_factory")
+def test_build_artifacts_cached(m_get_tool_factory, m_get_llm_kwargs, tmp_path):
+    (tmp_path / "tool").mkdir()
+    (tmp_path / "tool" / "tool.py").write_text("# tool")
+    collated_input = _collated_input("tool")
+
+    first = build_cache.get_crewai_build_artifacts(str(tmp_path), collated_input, {}, {})
+    second = build_cache.get_crewai_build_artifacts(str(tmp_path), collated_input, {}, {})
+
+    assert first is second
+    m_get_tool_factory.assert_called_once()
+    m_get_llm_kwargs.assert_called_once()
+
+
+@patch("engine.crewai.build_cache.get_crewai_llm_kwargs", return_value={"agent_studio_id": "m1"})
+@patch("engine.crewai.build_cache.get_crewai_tool_factory")
+def test_build_artifacts_invalidated_by_tool_edit(m_get_tool_factory, m_get_llm_kwargs, tmp_path):
+    (tmp_path / "tool").mkdir()
+    tool_file = tmp_path / "tool" / "tool.py"
+    tool_file.write_text("# tool")
+    collated_input = _collated_input("tool")
+
+    build_cache.get_crewai_build_artifacts(str(tmp_path), collated_input, {}, {})
+    stat = os.stat(tool_file)
+    os.utime(tool_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    build_cache.get_crewai_build_artifacts(str(tmp_path), collated_input, {}, {})
+
+    assert m_get_tool_factory.call_count == 2
+
+
+@patch("engine.crewai.build_cache.get_crewai_llm_kwargs", return_value={"agent_studio_id": "m1"})
+@patch("engine.crewai.build_cache.get_crewai_tool_factory")
+def test_build_artifacts_keyed_by_config(m_get_tool_factory, m_get_llm_kwargs, tmp_path):
+    (tmp_path / "tool").mkdir()
+    (tmp_path / "tool" / "tool.py").write_text("# tool")
+    collated_input = _collated_input("tool")
+
+    build_cache.get_crewai_build_artifacts(str(tmp_path), collated_input, {"t1": {"key": "a"}}, {})
+    build_cache.get_crewai_build_artifacts(str(tmp_path), collated_input, {"t1": {"key": "b"}}, {})
+
+    assert m_get_tool_factory.call_count == 2
+    assert build_cache.get_crewai_build_cache_stats()["misses"] == 2
@@ -3,12 +3,14 @@ import sys
 __import__("pysqlite3")
 sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
 
-from unittest.mock import patch
+import pytest
+from unittest.mock import MagicMock, patch
 from pydantic import BaseModel
 
-from crewai.utilities.events import CrewKickoffStartedEvent
+from crewai.utilities.events import CrewKickoffStartedEvent, CrewKickoffCompletedEvent
 
 from engine.crewai.events import process_event, post_event, register_global_handlers
+from engine.crewai.event_shipper import EventShipper
 
 
 def test_process_event_type_missing():
@@ -28,13 +30,9 @@ def test_process_event_type_happy_path():
 
 @patch("engine.crewai.events.get_trace_id")
 @patch("engine.crewai.events.process_event")
-@patch("engine.crewai.events.get_ops_endpoint")
-@patch("engine.crewai.events.requests.post")
-@patch("engine.crewai.events.os.getenv")
-def test_post_event_happy_path(m_getenv, m_post, m_get_ops_endpoint, m_process_event, m_get_trace_id):
+@patch("engine.crewai.events.get_event_shipper")
+def test_post_event_happy_path(m_get_event_shipper, m_process_event, m_get_trace_id):
     m_get_trace_id.return_value = "trace_id"
-    m_get_ops_endpoint.return_value = "ops_endpoint"
-    m_getenv.return_value = "api_key"
     m_process_event.return_value = {"extra": "field"}
 
     class CustomSource(BaseModel):
@@ -49,19 +47,61 @@ def test_post_event_happy_path(m_getenv, m_post, m_get_ops_endpoint, m_process_e
         event=CustomEvent(timestamp="timestamp", type="custom_event_type"),
     )
 
-    m_post.assert_called_with(
-        url="ops_endpoint/events",
-        headers={"Authorization": "Bearer api_key"},
-        json={
-            "trace_id": "trace_id",
-            "event": {
-                "agent_studio_id": "agent_studio_id",
-                "timestamp": "timestamp",
-                "type": "custom_event_type",
-                "extra": "field",
-            },
+    m_get_event_shipper.return_value.submit.assert_called_with(
+        "trace_id",
+        {
+            "agent_studio_id": "agent_studio_id",
+            "timestamp": "timestamp",
+            "type": "custom_event_type",
+            "extra": "field",
         },
     )
+    m_get_event_shipper.return_value.flush.assert_not_called()
+
+
+@patch("engine.crewai.events.get_trace_id", return_value="trace_id")
+@patch("engine.crewai.events.process_event", return_value={})
+@patch("engine.crewai.events.get_event_shipper")
+def test_post_event_flushes_on_kickoff_completed(m_get_event_shipper, m_process_event, m_get_trace_id):
+    event = MagicMock()
+    event.__class__ = CrewKickoffCompletedEvent
+
+    post_event(source=None, event=event)
+
+    m_get_event_shipper.return_value.submit.assert_called_once()
+    m_get_event_shipper.return_value.flush.assert_called_once()
+
+
+def test_event_shipper_coalesces_per_trace():
+    shipper = EventShipper(flush_interval=60)
+    with patch.object(shipper, "_post_batch") as m_post_batch:
+        shipper.submit("trace_a", {"type": "a1"})
+        shipper.submit("trace_b", {"type": "b1"})
+        shipper.submit("trace_a", {"type": "a2"})
+        assert shipper.flush(timeout=5)
+
+        m_post_batch.assert_any_call("trace_a", ['{"type": "a1"}', '{"type": "a2"}'])
+        m_post_batch.assert_any_call("trace_b", ['{"type": "b1"}'])
+        assert shipper.get_stats()["shipped"] == 3
+    shipper.close()
+
+
+def test_event_shipper_drop_oldest_on_overflow():
+    shipper = EventShipper(flush_interval=60, max_batch_size=10, max_queue_size=2)
+    with patch.object(shipper, "_post_batch") as m_post_batch:
+        shipper.submit("trace", {"n": 1})
+        shipper.submit("trace", {"n": 2})
+        shipper.submit("trace", {"n": 3})
+        assert shipper.flush(timeout=5)
+
+        m_post_batch.assert_called_once_with("trace", ['{"n": 2}', '{"n": 3}'])
+        assert shipper.get_stats()["dropped"] == 1
+    shipper.close()
+
+
+def test_event_shipper_invalid_overflow_policy():
+    with pytest.raises(ValueError):
+        EventShipper(overflow_policy="unknown")
 
 
 @patch("engine.crewai.events.crewai_event_bus.on")
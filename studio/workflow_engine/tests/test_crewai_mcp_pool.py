@@ -0,0 +1,104 @@
+import sys
+
+__import__("pysqlite3")
+sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
+
+import pytest
+from typing import Type
+from unittest.mock import MagicMock, patch
+from pydantic import BaseModel
+from crewai.tools import BaseTool
+from crewai_tools import MCPServerAdapter
+
+from engine.crewai.mcp_pool import MCPSessionPool
+from engine.types import Input__MCPInstance, MCPObjects
+
+
+class EchoArgs(BaseModel):
+    text: str
+
+
+def _fake_mcp_objects(*args, **kwargs) -> MCPObjects:
+    class EchoTool(BaseTool):
+        name: str = "echo"
+        description: str = "echo tool"
+        args_schema: Type[BaseModel] = EchoArgs
+
+        def _run(self, text: str):
+            return text
+
+    class OtherTool(BaseTool):
+        name: str = "other"
+        description: str = "other tool"
+        args_schema: Type[BaseModel] = EchoArgs
+
+        def _run(self, text: str):
+            return text
+
+    return MCPObjects(local_session=MagicMock(spec=MCPServerAdapter), tools=[EchoTool(), OtherTool()])
+
+
+def _mcp_instance(**overrides) -> Input__MCPInstance:
+    fields = {"id": "mcp-1", "name": "mcp", "type": "PYTHON", "args": ["server"], "env_names": []}
+    fields.update(overrides)
+    return Input__MCPInstance(**fields)
+
+
+@pytest.fixture
+def pool():
+    pool = MCPSessionPool(max_sessions=1, idle_timeout=600)
+    yield pool
+    pool.shutdown()
+
+
+@patch("engine.crewai.mcp_pool.PooledMCPSession.is_healthy", return_value=True)
+@patch("engine.crewai.mcp_pool.get_mcp_tools_for_crewai", side_effect=_fake_mcp_objects)
+def test_session_reused_across_runs(m_get_tools, m_healthy, pool):
+    first = pool.acquire(_mcp_instance(), {"KEY": "value"})
+    pool.release_session(first.pool_session)
+    second = pool.acquire(_mcp_instance(), {"KEY": "value"})
+
+    m_get_tools.assert_called_once()
+    assert first.pool_session is second.pool_session
+    # Each run gets its own tool objects.
+    assert first.tools[0] is not second.tools[0]
+    assert second.tools[0].run(text="hi") == "hi"
+    first.local_session.stop.assert_not_called()
+
+
+@patch("engine.crewai.mcp_pool.PooledMCPSession.is_healthy", return_value=True)
+@patch("engine.crewai.mcp_pool.get_mcp_tools_for_crewai", side_effect=_fake_mcp_objects)
+def test_session_tool_filtering_per_lease(m_get_tools, m_healthy, pool):
+    leased = pool.acquire(_mcp_instance(tools=["echo"]), {})
+    assert [t.name for t in leased.tools] == ["echo"]
+
+
+@patch("engine.crewai.mcp_pool.get_mcp_tools_for_crewai", side_effect=_fake_mcp_objects)
+def test_unhealthy_session_replaced(m_get_tools, pool):
+    first = pool.acquire(_mcp_instance(), {})
+    pool.release_session(first.pool_session)
+
+    with patch("engine.crewai.mcp_pool.PooledMCPSession.is_healthy", return_value=False):
+        second = pool.acquire(_mcp_instance(), {})
+
+    assert m_get_tools.call_count == 2
+    first.local_session.stop.assert_called_once()
+    assert second.pool_session is not first.pool_session
+
+
+@patch("engine.crewai.mcp_pool.PooledMCPSession.is_healthy", return_value=True)
+@patch("engine.crewai.mcp_pool.get_mcp_tools_for_crewai", side_effect=_fake_mcp_objects)
+def test_capacity_evicts_idle_or_goes_unpooled(m_get_tools, m_healthy, pool):
+    busy = pool.acquire(_mcp_instance(id="a"), {})
+    overflow = pool.acquire(_mcp_instance(id="b"), {})
+
+    # The only pooled slot is leased, so the second server is private to its run.
+    assert overflow.pool_session.pooled is False
+    pool.release_session(overflow.pool_session)
+    overflow.local_session.stop.assert_called_once()
+
+    pool.release_session(busy.pool_session)
+    replacement = pool.acquire(_mcp_instance(id="c"), {})
+    busy.local_session.stop.assert_called_once()
+    assert replacement.pool_session.pooled is True
+    assert pool.get_stats()["evictions"] == 1
@@ -19,6 +19,7 @@ from engine.crewai.tools import (
     is_venv_tool,
     get_crewai_tool
 )
+from engine.crewai.tool_worker import ToolWorkerBusy, ToolWorkerProtocolError
 from engine.types import Input__ToolInstance
 
 
@@ -293,6 +294,42 @@ class ToolParameters(BaseModel):
         
         assert result == "Error: Error occurred"
 
+    @patch('builtins.open', new_callable=mock_open)
+    @patch('engine.crewai.tools.os.path.join')
+    @patch('engine.crewai.tools.os.path.abspath')
+    @patch('engine.crewai.tools.subprocess.run')
+    @patch('engine.crewai.tools.get_tool_worker_pool')
+    def test_run_method_worker_protocol_error_does_not_rerun_tool(self, mock_pool, mock_subprocess, mock_abspath, mock_join, mock_file, mock_tool_instance, sample_tool_code):
+        mock_file.return_value.read.return_value = sample_tool_code
+        mock_abspath.return_value = "/abs/path/test_folder"
+        mock_join.side_effect = lambda *args: "/".join(args)
+        # The request reached the worker, so the tool may already have run.
+        mock_pool.return_value.run.side_effect = ToolWorkerProtocolError("corrupt frame")
+
+        tool = get_venv_tool(mock_tool_instance, {}, "/test/workflow")
+        result = tool._run(param1="test")
+
+        assert result == "Error: corrupt frame"
+        mock_subprocess.assert_not_called()
+
+    @patch('builtins.open', new_callable=mock_open)
+    @patch('engine.crewai.tools.os.path.join')
+    @patch('engine.crewai.tools.os.path.abspath')
+    @patch('engine.crewai.tools.subprocess.run')
+    @patch('engine.crewai.tools.get_tool_worker_pool')
+    def test_run_method_busy_worker_falls_back_to_subprocess(self, mock_pool, mock_subprocess, mock_abspath, mock_join, mock_file, mock_tool_instance, sample_tool_code):
+        mock_file.return_value.read.return_value = sample_tool_code
+        mock_abspath.return_value = "/abs/path/test_folder"
+        mock_join.side_effect = lambda *args: "/".join(args)
+        mock_pool.return_value.run.side_effect = ToolWorkerBusy("busy")
+        mock_subprocess.return_value = MagicMock(returncode=0, stdout="RESULT:Success output", stderr="")
+
+        tool = get_venv_tool(mock_tool_instance, {}, "/test/workflow")
+        result = tool._run(param1="test")
+
+        assert result == "Success output"
+        mock_subprocess.assert_called_once()
+
     @patch('builtins.open', new_callable=mock_open)
     @patch('engine.crewai.tools.os.path.join')
     @patch('engine.crewai.tools.os.path.abspath')
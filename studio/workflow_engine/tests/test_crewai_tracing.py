@@ -0,0 +1,45 @@
+import sys
+
+__import__("pysqlite3")
+sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
+
+import threading
+from unittest.mock import patch
+
+from engine.crewai import tracing
+
+
+@patch("engine.crewai.tracing.reset_crewai_instrumentation")
+@patch("engine.crewai.tracing.instrument_crewai_workflow", side_effect=lambda name: f"provider-{name}")
+def test_runs_of_different_workflows_do_not_share_instrumentation(m_instrument, m_reset):
+    assert tracing.acquire_crewai_instrumentation("wf-a") == "provider-wf-a"
+    # Another run of the same workflow shares the active instrumentation.
+    assert tracing.acquire_crewai_instrumentation("wf-a") == "provider-wf-a"
+
+    providers = {}
+
+    def run(name):
+        providers[name] = tracing.acquire_crewai_instrumentation(name)
+
+    other = threading.Thread(target=run, args=("wf-b",))
+    other.start()
+    other.join(timeout=0.2)
+    assert other.is_alive()  # wf-b waits for the wf-a runs to finish
+
+    # While wf-b waits, a new wf-a run queues behind it.
+    late = threading.Thread(target=run, args=("wf-a",))
+    late.start()
+    late.join(timeout=0.2)
+    assert late.is_alive()
+
+    tracing.release_crewai_instrumentation()
+    tracing.release_crewai_instrumentation()
+    other.join(timeout=5)
+    assert providers["wf-b"] == "provider-wf-b"
+    assert late.is_alive()
+
+    tracing.release_crewai_instrumentation()
+    late.join(timeout=5)
+    assert providers["wf-a"] == "provider-wf-a"
+    tracing.release_crewai_instrumentation()
+    assert m_instrument.call_count == 3
@@ -0,0 +1,113 @@
+import sys
+
+__import__("pysqlite3")
+sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from opentelemetry.sdk.trace import TracerProvider
+
+# The runner installs uv into its own environment on import.
+with patch("subprocess.run"):
+    from engine.entry import runner
+
+
+NUM_SLOTS = 2
+
+
+@pytest.fixture
+def client():
+    executor = ThreadPoolExecutor(max_workers=NUM_SLOTS)
+    with (
+        patch.object(runner, "NUM_RUNNER_SLOTS", NUM_SLOTS),
+        patch.object(runner, "runner_slots", [None] * NUM_SLOTS),
+        patch.object(runner, "runner_executor", executor),
+        TestClient(runner.app) as client,
+    ):
+        yield client
+    executor.shutdown(wait=True)
+
+
+def _kickoff_payload(workflow_name, trace_id):
+    return {
+        "workflow_directory": "/workflows/" + workflow_name,
+        "workflow_name": workflow_name,
+        "collated_input": {"workflow": {"id": workflow_name}},
+        "tool_config": {},
+        "mcp_config": {},
+        "llm_config": {},
+        "inputs": {},
+        "events_trace_id": trace_id,
+    }
+
+
+def _wait_for_status(client, predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        status = client.get("/status").json()
+        if predicate(status) or time.monotonic() > deadline:
+            return status
+        time.sleep(0.01)
+
+
+def test_kickoff_returns_409_when_every_slot_is_taken(client):
+    release = threading.Event()
+
+    with patch.object(runner, "run_workflow_task", side_effect=lambda payload, set_slot_state: release.wait(5)):
+        assert client.post("/kickoff", json=_kickoff_payload("wf-a", "t1")).status_code == 200
+        assert client.post("/kickoff", json=_kickoff_payload("wf-a", "t2")).status_code == 200
+
+        response = client.post("/kickoff", json=_kickoff_payload("wf-a", "t3"))
+        assert response.status_code == 409
+        assert response.json()["detail"] == "Runner is busy"
+
+        status = client.get("/status").json()
+        assert status["busy"] is True
+        assert (status["slots_total"], status["slots_busy"], status["slots_queued"]) == (2, 2, 0)
+        assert [slot["trace_id"] for slot in status["slots"]] == ["t1", "t2"]
+        assert status["workflow"] == {"name": "wf-a", "id": "wf-a"}
+
+        release.set()
+        status = _wait_for_status(client, lambda s: s["slots_busy"] == 0)
+    assert status["busy"] is False
+    assert status["slots"] == [None, None]
+    assert "workflow" not in status
+
+
+@patch("engine.crewai.tracing.reset_crewai_instrumentation")
+@patch("engine.crewai.tracing.instrument_crewai_workflow", side_effect=lambda name: TracerProvider())
+def test_run_waiting_on_instrumentation_is_reported_queued(m_instrument, m_reset, client):
+    releases = {"wf-a": threading.Event(), "wf-b": threading.Event()}
+
+    def run_workflow(workflow_directory, *args):
+        releases[workflow_directory.rsplit("/", 1)[-1]].wait(5)
+
+    with (
+        patch.object(runner.input_types.CollatedInput, "model_validate"),
+        patch.object(runner.requests, "post") as m_post,
+        patch.object(runner, "run_workflow", side_effect=run_workflow) as m_run_workflow,
+    ):
+        assert client.post("/kickoff", json=_kickoff_payload("wf-a", "t1")).status_code == 200
+        _wait_for_status(client, lambda s: m_instrument.call_count == 1)
+        assert client.post("/kickoff", json=_kickoff_payload("wf-b", "t2")).status_code == 200
+
+        # wf-b waits for the wf-a run to release the instrumentation.
+        status = _wait_for_status(client, lambda s: s["slots_queued"] == 1)
+        assert [slot["state"] for slot in status["slots"]] == ["running", "queued"]
+        assert status["workflow"] == {"name": "wf-a", "id": "wf-a"}
+
+        releases["wf-a"].set()
+        status = _wait_for_status(client, lambda s: s["slots_busy"] == 1 and s["slots_queued"] == 0)
+        assert status["slots"][1]["state"] == "running"
+        assert status["workflow"] == {"name": "wf-b", "id": "wf-b"}
+
+        releases["wf-b"].set()
+        _wait_for_status(client, lambda s: s["slots_busy"] == 0)
+    assert m_run_workflow.call_count == 2
+    assert m_instrument.call_count == 2
+    m_post.assert_not_called()
@@ -0,0 +1,58 @@
+import sys
+
+__import__("pysqlite3")
+sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
+
+import pytest
+from unittest.mock import patch
+
+import engine.ops as ops
+
+
+@pytest.fixture(autouse=True)
+def reset_ops_endpoint_cache(monkeypatch):
+    monkeypatch.delenv("AGENT_STUDIO_OPS_ENDPOINT", raising=False)
+    ops.invalidate_ops_endpoint_cache()
+    for key in ops._ops_endpoint_stats:
+        ops._ops_endpoint_stats[key] = 0
+    yield
+    ops.invalidate_ops_endpoint_cache()
+
+
+@patch("engine.ops._resolve_ops_endpoint_from_cml")
+def test_get_ops_endpoint_env_override(m_resolve, monkeypatch):
+    monkeypatch.setenv("AGENT_STUDIO_OPS_ENDPOINT", "https://override")
+
+    assert ops.get_ops_endpoint() == "https://override"
+    m_resolve.assert_not_called()
+    assert ops.get_ops_endpoint_cache_stats()["overrides"] == 1
+
+
+@patch("engine.ops._resolve_ops_endpoint_from_cml", return_value="https://ops.domain")
+def test_get_ops_endpoint_cached(m_resolve):
+    assert ops.get_ops_endpoint() == "https://ops.domain"
+    assert ops.get_ops_endpoint() == "https://ops.domain"
+    assert ops.get_ops_endpoint() == "https://ops.domain"
+
+    m_resolve.assert_called_once()
+    stats = ops.get_ops_endpoint_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+
+
+@patch("engine.ops._resolve_ops_endpoint_from_cml", return_value="https://ops.domain")
+def test_get_ops_endpoint_ttl_expiry(m_resolve):
+    with patch("engine.ops.time.monotonic", return_value=1000.0):
+        ops.get_ops_endpoint()
+    with patch("engine.ops.time.monotonic", return_value=1000.0 + ops.OPS_ENDPOINT_CACHE_TTL_SECONDS + 1):
+        ops.get_ops_endpoint()
+
+    assert m_resolve.call_count == 2
+
+
+@patch("engine.ops._resolve_ops_endpoint_from_cml", side_effect=["https://old", "https://new"])
+def test_invalidate_ops_endpoint_cache(m_resolve):
+    assert ops.get_ops_endpoint() == "https://old"
+    ops.invalidate_ops_endpoint_cache()
+    assert ops.get_ops_endpoint() == "https://new"
+    assert ops.get_ops_endpoint_cache_stats()["invalidations"] == 1
@@ -0,0 +1,128 @@
+import sys
+
+__import__("pysqlite3")
+sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
+
+import os
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from engine.crewai.tools import (
+    TOOL_VENV_FINGERPRINT_FILE_NAME,
+    check_requirements_fingerprint,
+    prepare_virtual_env_for_tool,
+)
+from engine.tool.run import run_tool_test
+
+TOOL_CODE = """
+from pydantic import BaseModel
+
+class UserParameters(BaseModel):
+    pass
+
+class ToolParameters(BaseModel):
+    pass
+
+def run_tool(config, args):
+    return "ok"
+
+if __name__ == "__main__":
+    print(run_tool(None, None))
+"""
+
+
+def _tool(tmp_path, name, requirements):
+    tool_dir = tmp_path / "tools" / name
+    tool_dir.mkdir(parents=True)
+    (tool_dir / "requirements.txt").write_text(requirements)
+    (tool_dir / "tool.py").write_text(TOOL_CODE)
+    return str(tool_dir)
+
+
+@pytest.fixture
+def commands():
+    """
+    Fake subprocess.run recording every command: `uv venv` creates the venv,
+    installs and tool runs succeed.
+    """
+    calls = []
+
+    def run(cmd, *args, **kwargs):
+        calls.append((cmd, kwargs.get("env")))
+        if cmd[1] == "venv":
+            os.makedirs(os.path.join(cmd[2], "bin"))
+            open(os.path.join(cmd[2], "bin", "python"), "w").close()
+        return subprocess.CompletedProcess(cmd, 0, stdout="ok", stderr="")
+
+    with (
+        patch("engine.tool.run.subprocess.run", side_effect=run),
+        patch("engine.tool.run.shutil.which", return_value="/usr/bin/uv"),
+        patch("engine.crewai.tools.get_uv_version", return_value="uv 0.5.0"),
+        patch("engine.tool.run.post_tool_event"),
+    ):
+        yield calls
+
+
+def _installs(commands):
+    return [env["VIRTUAL_ENV"] for cmd, env in commands if cmd[1:3] == ["pip", "install"]]
+
+
+def test_tool_test_never_installs_into_a_shared_venv(tmp_path, commands):
+    store_dir = str(tmp_path / "store")
+    tool = _tool(tmp_path, "tool", "requests\n")
+    other = _tool(tmp_path, "other", "requests\n")
+    prepare_virtual_env_for_tool(tool, "requirements.txt", store_dir)
+    prepare_virtual_env_for_tool(other, "requirements.txt", store_dir)
+    shared_venv = os.path.realpath(os.path.join(other, ".venv"))
+    assert os.path.islink(os.path.join(tool, ".venv"))
+    assert _installs(commands) == [shared_venv]
+    commands.clear()
+
+    # The tool's requirements are edited and tested before the studio prepares it.
+    (tmp_path / "tools" / "tool" / "requirements.txt").write_text("requests\npandas\n")
+    res = run_tool_test("ti", tool, {}, {}, "trace")
+
+    assert res["status"] == "Tool test completed"
+    tool_venv = os.path.realpath(os.path.join(tool, ".venv"))
+    assert tool_venv != shared_venv
+    assert os.path.dirname(os.path.dirname(tool_venv)) == os.path.realpath(store_dir)
+    assert _installs(commands) == [tool_venv]
+    assert os.path.realpath(os.path.join(other, ".venv")) == shared_venv
+    assert commands[-1][0][:2] == [os.path.join(tool, ".venv", "bin", "python"), os.path.join(tool, "tool.py")]
+
+
+def test_tool_test_of_unshareable_requirements_detaches_the_shared_venv(tmp_path, commands):
+    store_dir = str(tmp_path / "store")
+    tool = _tool(tmp_path, "tool", "requests\n")
+    other = _tool(tmp_path, "other", "requests\n")
+    prepare_virtual_env_for_tool(tool, "requirements.txt", store_dir)
+    prepare_virtual_env_for_tool(other, "requirements.txt", store_dir)
+    shared_venv = os.path.realpath(os.path.join(other, ".venv"))
+    commands.clear()
+
+    (tmp_path / "tools" / "tool" / "requirements.txt").write_text("-e .\n")
+    assert run_tool_test("ti", tool, {}, {}, "trace")["status"] == "Tool test completed"
+
+    assert not os.path.islink(os.path.join(tool, ".venv"))
+    assert _installs(commands) == [os.path.join(tool, ".venv")]
+    assert os.path.realpath(os.path.join(other, ".venv")) == shared_venv
+
+
+def test_tool_test_matches_the_store_fingerprint_of_unnormalized_requirements(tmp_path, commands):
+    store_dir = str(tmp_path / "store")
+    tool = _tool(tmp_path, "tool", "# HTTP client\nrequests  # pinned below\n\npandas\n")
+    prepare_virtual_env_for_tool(tool, "requirements.txt", store_dir)
+    fingerprint_path = os.path.join(tool, ".venv", TOOL_VENV_FINGERPRINT_FILE_NAME)
+    with open(fingerprint_path) as f:
+        stored_fingerprint = f.read()
+    commands.clear()
+
+    venv_dir = os.path.join(tool, ".venv")
+    assert check_requirements_fingerprint(venv_dir, os.path.join(tool, "requirements.txt"))[1] is not None
+
+    assert run_tool_test("ti", tool, {}, {}, "trace")["status"] == "Tool test completed"
+    assert _installs(commands) == []
+    with open(fingerprint_path) as f:
+        assert f.read() == stored_fingerprint
@@ -0,0 +1,125 @@
+import sys
+
+__import__("pysqlite3")
+sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
+
+import os
+import pytest
+from unittest.mock import patch
+
+from engine.crewai.tool_worker import (
+    ToolWorker,
+    ToolWorkerBusy,
+    ToolWorkerError,
+    ToolWorkerPool,
+    ToolWorkerProtocolError,
+    ToolWorkerUnavailable,
+)
+
+
+TOOL_CODE = """
+import os
+from pydantic import BaseModel
+
+
+class UserParameters(BaseModel):
+    prefix: str = ""
+
+
+class ToolParameters(BaseModel):
+    value: int
+
+
+def run_tool(config: UserParameters, args: ToolParameters):
+    print("tool chatter on stdout")
+    if args.value < 0:
+        raise ValueError("negative value")
+    return f"{config.prefix}{args.value * 2}:{os.getpid()}"
+
+
+OUTPUT_KEY = "tool_output"
+
+
+if __name__ == "__main__":
+    raise SystemExit("main block must not run in a warm worker")
+"""
+
+
+@pytest.fixture
+def tool_file(tmp_path):
+    path = tmp_path / "tool.py"
+    path.write_text(TOOL_CODE)
+    return str(path)
+
+
+@pytest.fixture
+def pool():
+    pool = ToolWorkerPool(idle_timeout=600, max_requests=3)
+    yield pool
+    pool.shutdown()
+
+
+def _run(pool, tool_file, value):
+    tool_dir = os.path.dirname(tool_file)
+    return pool.run(sys.executable, tool_file, tool_dir, tool_dir, {"prefix": "x"}, {"value": value})
+
+
+def test_worker_reuses_process(pool, tool_file):
+    first = _run(pool, tool_file, 2)
+    second = _run(pool, tool_file, 3)
+
+    assert first.startswith("x4:")
+    assert second.startswith("x6:")
+    assert first.split(":")[1] == second.split(":")[1]
+    assert pool.get_stats()["live_workers"] == 1
+
+
+def test_worker_recycles_after_max_requests(pool, tool_file):
+    pids = {_run(pool, tool_file, i).split(":")[1] for i in range(4)}
+    assert len(pids) == 2
+
+
+def test_worker_tool_error(pool, tool_file):
+    with pytest.raises(ToolWorkerError, match="negative value"):
+        _run(pool, tool_file, -1)
+    # The worker survives tool exceptions.
+    assert _run(pool, tool_file, 1).startswith("x2:")
+
+
+def test_worker_unimportable_tool_falls_back(pool, tmp_path):
+    path = tmp_path / "broken.py"
+    path.write_text("raise RuntimeError('cannot import')\n")
+
+    with pytest.raises(ToolWorkerUnavailable):
+        _run(pool, str(path), 1)
+    with pytest.raises(ToolWorkerUnavailable):
+        _run(pool, str(path), 1)
+    assert pool.get_stats()["fallbacks"] == 2
+
+
+def test_worker_corrupt_response_recycles_without_fallback(pool, tool_file):
+    pid = _run(pool, tool_file, 1).split(":")[1]
+
+    with patch.object(ToolWorker, "_read_exact", side_effect=[(3).to_bytes(4, "big"), b"{x}"]):
+        # The tool may already have run, so this is a ToolWorkerError that
+        # callers must not retry through a subprocess.
+        with pytest.raises(ToolWorkerProtocolError) as exc_info:
+            _run(pool, tool_file, 1)
+    assert not isinstance(exc_info.value, ToolWorkerUnavailable)
+    assert pool.get_stats()["fallbacks"] == 0
+
+    # The tool is not blacklisted: the next call starts a fresh worker.
+    assert _run(pool, tool_file, 1).split(":")[1] != pid
+
+
+def test_busy_worker_falls_back_without_waiting(pool, tool_file):
+    pid = _run(pool, tool_file, 1).split(":")[1]
+    worker = next(iter(pool._workers.values()))
+
+    with worker.lock:
+        with pytest.raises(ToolWorkerBusy):
+            _run(pool, tool_file, 1)
+    assert pool.get_stats()["fallbacks"] == 1
+
+    # The tool is not blacklisted, and its worker is kept.
+    assert _run(pool, tool_file, 1).split(":")[1] == pid
@@ -4,9 +4,15 @@ __import__("pysqlite3")
 sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
 
 import pytest
+import subprocess
 from unittest.mock import patch
 
-from engine.crewai.tools import extract_tool_class_name, is_venv_tool, get_crewai_tool
+from engine.crewai.tools import (
+    extract_tool_class_name,
+    is_venv_tool,
+    get_crewai_tool,
+    _prepare_virtual_env_for_tool_impl,
+)
 from engine.types import Input__ToolInstance
 
 
@@ -116,3 +122,75 @@ def test_get_crewai_tool_tool_proxy(
     )
     out = get_crewai_tool(tool_instance, {}, "/fake/workflow/directory")
     mock_get_tool_instance_proxy.assert_called_once()
+
+
+def _tool_dir_with_venv(tmp_path, requirements="requests\n"):
+    (tmp_path / ".venv" / "bin").mkdir(parents=True)
+    (tmp_path / ".venv" / "bin" / "python").touch()
+    (tmp_path / ".venv" / "pyvenv.cfg").write_text("home = /usr/bin\nversion_info = 3.10.13\n")
+    (tmp_path / "requirements.txt").write_text(requirements)
+    return str(tmp_path)
+
+
+@patch("engine.crewai.tools.get_uv_version", return_value="uv 0.5.0")
+@patch("engine.crewai.tools.subprocess.run")
+def test_prepare_venv_skips_install_when_fingerprint_matches(mock_run, _, tmp_path):
+    tool_dir = _tool_dir_with_venv(tmp_path)
+
+    assert _prepare_virtual_env_for_tool_impl(tool_dir, "requirements.txt", "uv") is True
+    assert _prepare_virtual_env_for_tool_impl(tool_dir, "requirements.txt", "uv") is False
+    assert mock_run.call_count == 1
+
+    # Changed requirements, or a forced refresh, install again.
+    (tmp_path / "requirements.txt").write_text("requests\npandas\n")
+    assert _prepare_virtual_env_for_tool_impl(tool_dir, "requirements.txt", "uv") is True
+    assert _prepare_virtual_env_for_tool_impl(tool_dir, "requirements.txt", "uv", force_install=True) is True
+    assert mock_run.call_count == 3
+
+
+@patch("engine.crewai.tools.subprocess.run")
+def test_prepare_venv_reinstalls_after_uv_upgrade(mock_run, tmp_path):
+    tool_dir = _tool_dir_with_venv(tmp_path)
+
+    with patch("engine.crewai.tools.get_uv_version", return_value="uv 0.5.0"):
+        _prepare_virtual_env_for_tool_impl(tool_dir, "requirements.txt", "uv")
+    with patch("engine.crewai.tools.get_uv_version", return_value="uv 0.6.0"):
+        assert _prepare_virtual_env_for_tool_impl(tool_dir, "requirements.txt", "uv") is True
+    assert mock_run.call_count == 2
+
+
+@patch("engine.crewai.tools.get_uv_version", return_value="uv 0.5.0")
+@patch("engine.crewai.tools.subprocess.run", side_effect=subprocess.CalledProcessError(1, "uv"))
+def test_prepare_venv_failed_install_is_not_fingerprinted(mock_run, _, tmp_path):
+    tool_dir = _tool_dir_with_venv(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        _prepare_virtual_env_for_tool_impl(tool_dir, "requirements.txt", "uv")
+    with pytest.raises(RuntimeError):
+        _prepare_virtual_env_for_tool_impl(tool_dir, "requirements.txt", "uv")
+    assert mock_run.call_count == 2
+
+
+@patch("engine.crewai.tools.get_uv_version", return_value="uv 0.5.0")
+@patch("engine.crewai.tools.subprocess.run")
+def test_prepare_venv_installs_offline_from_wheelhouse(mock_run, _, tmp_path):
+    tool_dir = _tool_dir_with_venv(tmp_path / "tool")
+    wheelhouse = tmp_path / "wheelhouse"
+    wheelhouse.mkdir()
+
+    assert _prepare_virtual_env_for_tool_impl(tool_dir, "requirements.txt", "uv", wheelhouse_dir=str(wheelhouse))
+    assert mock_run.call_count == 1
+    assert mock_run.call_args.args[0][-3:] == ["--no-index", "--find-links", str(wheelhouse)]
+
+
+@patch("engine.crewai.tools.get_uv_version", return_value="uv 0.5.0")
+@patch("engine.crewai.tools.subprocess.run")
+def test_prepare_venv_falls_back_to_index_when_wheelhouse_is_incomplete(mock_run, _, tmp_path):
+    tool_dir = _tool_dir_with_venv(tmp_path / "tool")
+    wheelhouse = tmp_path / "wheelhouse"
+    wheelhouse.mkdir()
+    mock_run.side_effect = [subprocess.CalledProcessError(1, "uv", stderr="No solution found"), None]
+
+    assert _prepare_virtual_env_for_tool_impl(tool_dir, "requirements.txt", "uv", wheelhouse_dir=str(wheelhouse))
+    assert mock_run.call_count == 2
+    assert "--no-index" not in mock_run.call_args.args[0]
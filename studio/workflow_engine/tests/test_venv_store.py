@@ -0,0 +1,139 @@
+import sys
+
+__import__("pysqlite3")
+sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
+
+import pytest
+import os
+import shutil
+import threading
+
+from engine.crewai.venv_store import ToolVenvStore, get_venv_key, normalize_requirements
+
+
+def _fake_build(calls):
+    def build(folder, requirements_file_name):
+        calls.append(folder)
+        os.makedirs(os.path.join(folder, ".venv", "bin"), exist_ok=True)
+        open(os.path.join(folder, ".venv", "bin", "python"), "w").close()
+
+    return build
+
+
+def _tool(tmp_path, name, requirements):
+    tool_dir = tmp_path / "tools" / name
+    tool_dir.mkdir(parents=True)
+    (tool_dir / "requirements.txt").write_text(requirements)
+    return str(tool_dir)
+
+
+def test_normalize_requirements():
+    assert normalize_requirements("# deps\nrequests==2.0  # http\n\npandas\nrequests==2.0\n") == (
+        "pandas\nrequests==2.0\n"
+    )
+    assert normalize_requirements("-e .\n") is None
+    assert normalize_requirements("-r base.txt\n") is None
+    assert get_venv_key("a\n") != get_venv_key("b\n")
+
+
+def test_identical_requirements_share_one_environment(tmp_path):
+    store = ToolVenvStore(str(tmp_path / "store"))
+    calls = []
+    first = _tool(tmp_path, "first", "requests\npandas\n")
+    second = _tool(tmp_path, "second", "pandas\n# comment\nrequests\n")
+
+    assert store.acquire(first, "requirements.txt", _fake_build(calls))
+    assert store.acquire(second, "requirements.txt", _fake_build(calls))
+
+    assert len(calls) == 1
+    assert os.path.realpath(os.path.join(first, ".venv")) == os.path.realpath(os.path.join(second, ".venv"))
+    assert os.path.exists(os.path.join(first, ".venv", "bin", "python"))
+    key = os.path.basename(calls[0])
+    assert store.get_ref_count(key) == 2
+    assert store.get_stats()["reuses"] == 1
+
+
+def test_concurrent_preparations_build_once(tmp_path):
+    store = ToolVenvStore(str(tmp_path / "store"))
+    calls = []
+    tools = [_tool(tmp_path, f"tool_{i}", "requests\n") for i in range(8)]
+
+    threads = [
+        threading.Thread(target=store.acquire, args=(tool, "requirements.txt", _fake_build(calls))) for tool in tools
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert store.get_ref_count(os.path.basename(calls[0])) == 8
+
+
+def test_release_removes_environment_after_last_reference(tmp_path):
+    store = ToolVenvStore(str(tmp_path / "store"))
+    calls = []
+    first = _tool(tmp_path, "first", "requests\n")
+    second = _tool(tmp_path, "second", "requests\n")
+    store.acquire(first, "requirements.txt", _fake_build(calls))
+    store.acquire(second, "requirements.txt", _fake_build(calls))
+    key_dir = calls[0]
+
+    assert store.release(first)
+    assert not os.path.lexists(os.path.join(first, ".venv"))
+    assert os.path.isdir(key_dir)
+
+    assert store.release(second)
+    assert not os.path.exists(key_dir)
+
+
+def test_garbage_collection_reclaims_deleted_tools(tmp_path):
+    store = ToolVenvStore(str(tmp_path / "store"))
+    calls = []
+    tool = _tool(tmp_path, "tool", "requests\n")
+    store.acquire(tool, "requirements.txt", _fake_build(calls))
+
+    shutil.rmtree(tool)
+    assert store.collect_garbage() == 1
+    assert not os.path.exists(calls[0])
+
+
+def test_changed_requirements_move_to_new_environment(tmp_path):
+    store = ToolVenvStore(str(tmp_path / "store"))
+    calls = []
+    tool = _tool(tmp_path, "tool", "requests\n")
+    store.acquire(tool, "requirements.txt", _fake_build(calls))
+
+    with open(os.path.join(tool, "requirements.txt"), "w") as f:
+        f.write("requests\npandas\n")
+    store.acquire(tool, "requirements.txt", _fake_build(calls))
+
+    assert len(calls) == 2
+    assert not os.path.exists(calls[0])
+    assert os.path.realpath(os.path.join(tool, ".venv")) == os.path.join(calls[1], ".venv")
+
+
+def test_failed_build_is_retried(tmp_path):
+    store = ToolVenvStore(str(tmp_path / "store"))
+    tool = _tool(tmp_path, "tool", "requests\n")
+
+    def failing_build(folder, requirements_file_name):
+        os.makedirs(os.path.join(folder, ".venv"))
+        raise RuntimeError("COULD NOT INSTALL REQUIREMENTS")
+
+    with pytest.raises(RuntimeError):
+        store.acquire(tool, "requirements.txt", failing_build)
+    assert not os.path.lexists(os.path.join(tool, ".venv"))
+
+    calls = []
+    assert store.acquire(tool, "requirements.txt", _fake_build(calls))
+    assert len(calls) == 1
+
+
+def test_local_requirements_are_not_shared(tmp_path):
+    store = ToolVenvStore(str(tmp_path / "store"))
+    calls = []
+    tool = _tool(tmp_path, "tool", "-e .\n")
+
+    assert not store.acquire(tool, "requirements.txt", _fake_build(calls))
+    assert calls == []
@@ -0,0 +1,26 @@
+import pytest
+from sqlalchemy import event
+
+
+@pytest.fixture
+def count_queries():
+    """
+    Run a function and count the SELECT statements it issues on a DAO's engine:
+
+        result, queries = count_queries(dao, lambda: list_tasks(request, None, dao))
+    """
+
+    def count(dao, fn):
+        statements = []
+
+        def record_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(dao.engine, "before_cursor_execute", record_statement)
+        try:
+            result = fn()
+        finally:
+            event.remove(dao.engine, "before_cursor_execute", record_statement)
+        return result, len([statement for statement in statements if statement.startswith("SELECT")])
+
+    return count
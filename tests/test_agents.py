@@ -0,0 +1,122 @@
+__import__("pysqlite3")
+import sys
+
+sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
+
+from unittest.mock import patch
+
+from studio.db.dao import AgentStudioDao, dispose_engines
+from studio.db import model as db_model
+from studio.api import *
+from studio.agents.agent import list_agents, get_agent
+import studio.tools.utils as tool_utils
+
+
+TOOL_CODE = '''
+"""Looks things up."""
+from pydantic import BaseModel
+
+
+class UserParameters(BaseModel):
+    api_key: str
+
+
+class ToolParameters(BaseModel):
+    query: str
+'''
+
+
+def _populate(dao, tools_dir, workflow_id, num_agents, tools_per_agent):
+    with dao.get_session() as session:
+        if not session.query(db_model.Model).filter_by(model_id="model-1").one_or_none():
+            session.add(
+                db_model.Model(model_id="model-1", model_name="model-1", provider_model="gpt-4o", model_type="OPENAI")
+            )
+        for a in range(num_agents):
+            tool_ids = []
+            for t in range(tools_per_agent):
+                tool_id = f"{workflow_id}-tool-{a}-{t}"
+                tool_dir = tools_dir / tool_id
+                tool_dir.mkdir()
+                (tool_dir / "tool.py").write_text(TOOL_CODE)
+                (tool_dir / "requirements.txt").write_text("requests\n")
+                session.add(
+                    db_model.ToolInstance(
+                        id=tool_id,
+                        workflow_id=workflow_id,
+                        name=tool_id,
+                        python_code_file_name="tool.py",
+                        python_requirements_file_name="requirements.txt",
+                        source_folder_path=str(tool_dir),
+                        tool_image_path="",
+                    )
+                )
+                tool_ids.append(tool_id)
+            session.add(
+                db_model.Agent(
+                    id=f"{workflow_id}-agent-{a}",
+                    workflow_id=workflow_id,
+                    name=f"Agent {a}",
+                    llm_provider_model_id="model-1",
+                    crew_ai_role="role",
+                    crew_ai_backstory="backstory",
+                    crew_ai_goal="goal",
+                    tool_ids=tool_ids,
+                )
+            )
+
+
+def test_list_agents_query_count_is_constant(tmp_path, count_queries):
+    """Agents page queries and tool parses do not grow per agent or per tool"""
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    tool_utils.get_tool_metadata_cache().clear()
+    _populate(dao, tmp_path, "small", num_agents=2, tools_per_agent=3)
+    _populate(dao, tmp_path, "large", num_agents=20, tools_per_agent=3)
+
+    small, small_queries = count_queries(dao, lambda: list_agents(ListAgentsRequest(workflow_id="small"), dao=dao))
+    large, large_queries = count_queries(dao, lambda: list_agents(ListAgentsRequest(workflow_id="large"), dao=dao))
+    _, warm_queries = count_queries(dao, lambda: list_agents(ListAgentsRequest(workflow_id="large"), dao=dao))
+
+    assert len(small.agents) == 2 and len(large.agents) == 20
+    assert all(agent.is_valid for agent in large.agents)
+    assert small_queries == large_queries == warm_queries
+    # Each tool's code and requirements are read once; the warm listing hits the cache.
+    stats = tool_utils.get_tool_metadata_cache().get_stats()
+    assert stats["misses"] == 2 * (2 * 3 + 20 * 3)
+    assert stats["hits"] == 2 * 20 * 3
+
+
+def test_agent_validity(tmp_path):
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    _populate(dao, tmp_path, "wf", num_agents=3, tools_per_agent=1)
+    with dao.get_session() as session:
+        session.query(db_model.Agent).filter_by(id="wf-agent-1").one().llm_provider_model_id = "missing-model"
+        session.query(db_model.Agent).filter_by(id="wf-agent-2").one().tool_ids = ["wf-tool-2-0", "missing-tool"]
+    (tmp_path / "wf-tool-0-0" / "tool.py").write_text(TOOL_CODE + "\nclass UserParameters(:\n")
+
+    validity = {agent.id: agent.is_valid for agent in list_agents(ListAgentsRequest(workflow_id="wf"), dao=dao).agents}
+    assert validity == {"wf-agent-0": False, "wf-agent-1": False, "wf-agent-2": False}
+
+    (tmp_path / "wf-tool-0-0" / "tool.py").write_text(TOOL_CODE)
+    assert get_agent(GetAgentRequest(agent_id="wf-agent-0"), dao=dao).agent.is_valid
+    assert not get_agent(GetAgentRequest(agent_id="wf-agent-1"), dao=dao).agent.is_valid
+
+
+def test_agent_tool_files_are_read_after_the_session_closes(tmp_path):
+    dao = AgentStudioDao(engine_url=f"sqlite:///{tmp_path / 'state.db'}", echo=False)
+    tools_dir = tmp_path / "tools"
+    tools_dir.mkdir()
+    _populate(dao, tools_dir, "wf", num_agents=2, tools_per_agent=1)
+
+    read_tool_instance_metadata = tool_utils.read_tool_instance_metadata
+    checked_out = []
+
+    def read_and_record(tool_instance):
+        checked_out.append(dao.engine.pool.checkedout())
+        return read_tool_instance_metadata(tool_instance)
+
+    with patch("studio.tools.utils.read_tool_instance_metadata", side_effect=read_and_record):
+        assert all(agent.is_valid for agent in list_agents(ListAgentsRequest(workflow_id="wf"), dao=dao).agents)
+        assert get_agent(GetAgentRequest(agent_id="wf-agent-0"), dao=dao).agent.is_valid
+    assert checked_out == [0, 0, 0]
+    dispose_engines()
@@ -0,0 +1,102 @@
+import os
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+__import__("pysqlite3")
+import sys
+
+sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
+
+from studio.db.dao import AgentStudioDao, delete_database, dispose_engines, get_dao
+from studio.db import model as db_model
+
+
+def test_daos_share_one_engine_per_database(tmp_path):
+    url = f"sqlite:///{tmp_path / 'state.db'}"
+    with patch("studio.db.dao.Base.metadata.create_all") as mock_create_all:
+        first = AgentStudioDao(engine_url=url)
+        second = AgentStudioDao(engine_url=url)
+    assert first.engine is second.engine
+    assert mock_create_all.call_count == 1
+    dispose_engines()
+
+
+def test_in_memory_daos_are_isolated():
+    first = AgentStudioDao(engine_url="sqlite:///:memory:")
+    second = AgentStudioDao(engine_url="sqlite:///:memory:")
+    with first.get_session() as session:
+        session.add(db_model.Workflow(id="wf", name="Workflow"))
+    with second.get_session() as session:
+        assert session.query(db_model.Workflow).count() == 0
+
+
+def test_sqlite_pragmas_are_set_on_connect(tmp_path):
+    dao = AgentStudioDao(engine_url=f"sqlite:///{tmp_path / 'state.db'}")
+    with dao.engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 2  # FULL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 30000
+    dispose_engines()
+
+
+@patch.multiple("studio.db.dao", SQLITE_JOURNAL_MODE="WAL", SQLITE_SYNCHRONOUS="NORMAL")
+def test_sqlite_wal_is_opt_in(tmp_path):
+    url = f"sqlite:///{tmp_path / 'state.db'}"
+    with AgentStudioDao(engine_url=url).engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+    dispose_engines()
+
+    # The journal mode is stored in the file; the default switches it back.
+    with patch.multiple("studio.db.dao", SQLITE_JOURNAL_MODE="DELETE", SQLITE_SYNCHRONOUS="FULL"):
+        with AgentStudioDao(engine_url=url).engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+        dispose_engines()
+
+
+@patch.multiple("studio.db.dao", SQLITE_JOURNAL_MODE="WAL", SQLITE_SYNCHRONOUS="NORMAL")
+def test_delete_database_removes_wal_files(tmp_path):
+    state_db = str(tmp_path / "state.db")
+    with patch.dict(os.environ, {"AGENT_STUDIO_SQLITE_DB": state_db}):
+        dao = get_dao()
+        with dao.get_session() as session:
+            session.add(db_model.Workflow(id="wf", name="Workflow"))
+        assert os.path.exists(state_db + "-wal")
+
+        delete_database()
+        assert not any(os.path.exists(state_db + suffix) for suffix in ("", "-wal", "-shm"))
+
+        # A new DAO recreates the database from scratch.
+        with get_dao().get_session() as session:
+            assert session.query(db_model.Workflow).count() == 0
+        dispose_engines()
+
+
+def test_read_only_session_never_writes(tmp_path):
+    dao = AgentStudioDao(engine_url=f"sqlite:///{tmp_path / 'state.db'}")
+    with dao.get_session() as session:
+        session.add(db_model.Workflow(id="wf", name="Workflow"))
+
+    with dao.get_session(read_only=True) as session:
+        workflow = session.query(db_model.Workflow).one()
+        workflow.name = "Changed"
+    # Nothing is committed, and the object stays readable after the session.
+    assert workflow.name == "Changed"
+    with dao.get_session() as session:
+        assert session.query(db_model.Workflow).one().name == "Workflow"
+
+    with pytest.raises(OperationalError, match="readonly"):
+        with dao.get_session(read_only=True) as session:
+            session.add(db_model.Workflow(id="wf2", name="Workflow 2"))
+            session.flush()
+
+    # query_only is cleared before connections return to the pool.
+    with dao.get_session() as session:
+        assert session.execute(text("PRAGMA query_only")).scalar() == 0
+        session.add(db_model.Workflow(id="wf3", name="Workflow 3"))
+    with dao.get_session(read_only=True) as session:
+        assert session.query(db_model.Workflow).count() == 2
+    dispose_engines()
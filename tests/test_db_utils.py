@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+__import__("pysqlite3")
+import sys
+
+sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
+
+from studio.db.dao import AgentStudioDao
+from studio.db import model as db_model
+from studio.db.utils import export_to_dict, import_from_dict
+from studio.consts import DEFAULT_PROJECT_DEFAULTS_LOCATION
+
+
+def test_import_from_dict_upserts_rows():
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    import_from_dict(
+        {
+            "workflows": [
+                {"id": "wf-1", "name": "First", "description": "first workflow", "crew_ai_agents": ["a1"]},
+                {"id": "wf-2", "name": "Second"},
+            ],
+        },
+        dao=dao,
+    )
+
+    # Existing rows only have the imported columns updated.
+    import_from_dict(
+        {
+            "workflows": [
+                {"id": "wf-1", "name": "First, renamed"},
+                {"id": "wf-3", "name": "Third", "crew_ai_agents": ["a1", "a2"]},
+            ],
+        },
+        dao=dao,
+    )
+
+    with dao.get_session(read_only=True) as session:
+        workflows = {w.id: w for w in session.query(db_model.Workflow).all()}
+    assert sorted(workflows) == ["wf-1", "wf-2", "wf-3"]
+    assert workflows["wf-1"].name == "First, renamed"
+    assert workflows["wf-1"].description == "first workflow"
+    assert workflows["wf-1"].crew_ai_agents == ["a1"]
+    assert workflows["wf-3"].crew_ai_agents == ["a1", "a2"]
+
+
+def test_import_from_dict_is_one_transaction():
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    with pytest.raises(ValueError, match="not_a_column"):
+        import_from_dict(
+            {
+                "workflows": [{"id": "wf-1", "name": "First"}],
+                "tasks": [{"id": "task-1", "workflow_id": "wf-1", "not_a_column": 1}],
+            },
+            dao=dao,
+        )
+    with pytest.raises(ValueError, match="not_a_table"):
+        import_from_dict({"workflows": [{"id": "wf-1", "name": "First"}], "not_a_table": []}, dao=dao)
+
+    with dao.get_session(read_only=True) as session:
+        assert session.query(db_model.Workflow).count() == 0
+
+
+def test_import_project_defaults_round_trips():
+    with open(DEFAULT_PROJECT_DEFAULTS_LOCATION) as f:
+        defaults = json.load(f)
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    import_from_dict(defaults, dao=dao)
+    # Importing again updates every row in place.
+    import_from_dict(defaults, dao=dao)
+
+    exported = export_to_dict(dao=dao)
+    for table_name, rows in defaults.items():
+        # A row repeated in the defaults takes the values of its last occurrence.
+        expected = {row["id"]: row for row in rows}
+        assert {row["id"]: row for row in exported[table_name]} == expected
@@ -14,6 +14,7 @@ from studio.db.model import (
 )
 from studio.db import model as db_model
 from sqlalchemy.orm.session import Session
+from studio.tools.utils import ToolCodeMetadata
 import engine.types as input_types
 
 
@@ -26,7 +27,8 @@ from studio.deployments.package.collated_input import (
     get_agents_for_workflow,
     get_language_models,
     get_mcp_instances_for_agents,
-    get_tool_instances_for_agents
+    get_tool_instances_for_agents,
+    get_tool_user_params,
 )
 
 @patch("studio.deployments.package.collated_input.create_input_workflow")
@@ -279,9 +281,8 @@ def test_get_mcp_instances_handles_none_fields():
     
     
     
-@patch("studio.deployments.package.collated_input.extract_user_params_from_code")
-@patch("studio.deployments.package.collated_input.read_tool_instance_code")
-def test_get_tool_instances_success(mock_read_code, mock_extract_params):
+@patch("studio.deployments.package.collated_input.read_tool_instance_metadata")
+def test_get_tool_instances_success(mock_read_metadata):
     session = MagicMock(spec=Session)
 
     mock_tool = db_model.ToolInstance(
@@ -295,8 +296,15 @@ def test_get_tool_instances_success(mock_read_code, mock_extract_params):
     )
     session.query().filter().all.return_value = [mock_tool]
 
-    mock_read_code.return_value = ("def tool_fn(): pass", "")
-    mock_extract_params.return_value = {"param1": {"type": "string"}}
+    mock_read_metadata.return_value = (
+        ToolCodeMetadata(
+            code="def tool_fn(): pass",
+            user_params={"param1": {"type": "string"}},
+            tool_params={},
+            description=None,
+        ),
+        "",
+    )
 
     results = get_tool_instances_for_agents({"tool-1"}, session)
 
@@ -309,9 +317,8 @@ def test_get_tool_instances_success(mock_read_code, mock_extract_params):
     assert tool_input.tool_image_uri == "some/image:latest"
 
 
-@patch("studio.deployments.package.collated_input.extract_user_params_from_code")
-@patch("studio.deployments.package.collated_input.read_tool_instance_code")
-def test_get_tool_instances_metadata_extraction_failure(mock_read_code, mock_extract_params):
+@patch("studio.deployments.package.collated_input.read_tool_instance_metadata")
+def test_get_tool_instances_metadata_extraction_failure(mock_read_metadata):
     session = MagicMock(spec=Session)
 
     mock_tool = db_model.ToolInstance(
@@ -325,8 +332,7 @@ def test_get_tool_instances_metadata_extraction_failure(mock_read_code, mock_ext
     )
     session.query().filter().all.return_value = [mock_tool]
 
-    mock_read_code.side_effect = Exception("read error")
-    mock_extract_params.return_value = {}
+    mock_read_metadata.side_effect = Exception("read error")
 
     results = get_tool_instances_for_agents({"tool-2"}, session)
 
@@ -338,6 +344,21 @@ def test_get_tool_instances_metadata_extraction_failure(mock_read_code, mock_ext
     assert tool_input.tool_image_uri == ""
 
 
+def test_get_tool_user_params_raises_on_unparsable_code(tmp_path):
+    (tmp_path / "tool.py").write_text("class UserParameters(:\n")
+    (tmp_path / "requirements.txt").write_text("")
+    tool = db_model.ToolInstance(
+        id="tool-3",
+        name="BrokenTool",
+        python_code_file_name="tool.py",
+        python_requirements_file_name="requirements.txt",
+        source_folder_path=str(tmp_path),
+        tool_image_path="",
+    )
+
+    with pytest.raises(ValueError, match="Error parsing Python code"):
+        get_tool_user_params(tool)
+
 
 def test_get_tool_instances_missing_tool_raises():
     session = MagicMock(spec=Session)
@@ -1,15 +1,18 @@
 import os
 import json
+import pytest
 import tarfile
+import zipfile
+import subprocess
 import tempfile
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock
 
 __import__('pysqlite3')
 import sys
 sys.modules['sqlite3'] = sys.modules.pop('pysqlite3')
 
-from engine.types import CollatedInput
-from studio.deployments.package import workflows
+from studio.deployments.package import archive, workflows
+from engine.archive import ARTIFACT_MANIFEST_FILE_NAME, open_artifact_archive, read_artifact_manifest
 from studio.db.model import Workflow, DeployedWorkflowInstance
 from studio.deployments.types import (
     DeploymentPayload,
@@ -22,41 +25,33 @@ from studio.deployments.types import (
 )
 
 
-@patch("studio.deployments.package.workflows.create_collated_input")
-@patch("studio.deployments.package.workflows.shutil.copytree")
-@patch("studio.deployments.package.workflows.os.makedirs")
-@patch("studio.deployments.package.workflows.yaml.dump")
-@patch("studio.deployments.package.workflows.json.dump")
-@patch("studio.deployments.package.workflows.tarfile.open")
-@patch("studio.deployments.package.workflows.os.walk")
-@patch("studio.deployments.package.workflows.open", new_callable=mock_open)
-def test_package_workflow_for_deployment(
-    mock_file_open,
-    mock_os_walk,
-    mock_tar_open,
-    mock_json_dump,
-    mock_yaml_dump,
-    mock_os_makedirs,
-    mock_copytree,
-    mock_create_collated_input,
-):
-    # Setup fake tar context
-    mock_tar = MagicMock()
-    mock_tar_open.return_value.__enter__.return_value = mock_tar
-
-    # Simulate a directory structure
-    mock_os_walk.return_value = [
-        ("/tmp/deployment_artifacts/fake-dir", [], ["workflow.yaml", "collated_input.json"]),
-    ]
+@pytest.fixture
+def packaging_env(tmp_path, monkeypatch):
+    """
+    A studio root with one workflow and one tool, and staging directories
+    under tmp_path.
+    """
+    studio_root = tmp_path / "studio"
+    tool_dir = studio_root / "studio-data" / "workflows" / "my_dir" / "tools" / "t1"
+    tool_dir.mkdir(parents=True)
+    (tool_dir / "tool.py").write_text("print('hi')\n")
+    (tool_dir / ".venv").mkdir()
+    (tool_dir / ".venv" / "python").write_text("")
+    (studio_root / "studio-data" / "workflows" / "other_dir").mkdir()
+    (studio_root / "studio-data" / "workflows" / "other_dir" / "secret.txt").write_text("")
+    monkeypatch.chdir(studio_root)
+
+    artifacts_root = str(tmp_path / "deployment_artifacts")
+    monkeypatch.setattr(archive, "DEPLOYMENT_ARTIFACTS_LOCATION", artifacts_root)
+    monkeypatch.setattr(workflows, "DEPLOYMENT_ARTIFACTS_LOCATION", artifacts_root)
+    return studio_root
 
 
-    # Mock return for create_collated_input
+def _package(compression=None):
     mock_collated_input = MagicMock()
     mock_collated_input.language_models = [MagicMock()]
     mock_collated_input.model_dump.return_value = {"mock": "data"}
-    mock_create_collated_input.return_value = mock_collated_input
 
-    # Setup inputs
     workflow = Workflow(id="wf1", name="Test Workflow", directory="my_dir")
     deployment = DeployedWorkflowInstance(id="d1", workflow=workflow)
     payload = DeploymentPayload(
@@ -65,31 +60,116 @@ def test_package_workflow_for_deployment(
         deployment_config=DeploymentConfig(generation_config={"temperature": 0.5}),
     )
     session = MagicMock()
-    cml = MagicMock()
+    with (
+        patch("studio.deployments.package.workflows.create_collated_input", return_value=mock_collated_input),
+        patch.object(archive, "DEPLOYMENT_ARTIFACT_COMPRESSION", compression or "gz"),
+    ):
+        artifact = workflows.package_workflow_for_deployment(payload, deployment, session, MagicMock())
+    mock_collated_input.language_models[0].generation_config.update.assert_called_once_with({"temperature": 0.5})
+    return artifact
+
 
-    artifact = workflows.package_workflow_for_deployment(payload, deployment, session, cml)
+def test_package_workflow_for_deployment(packaging_env):
+    artifact = _package()
 
     assert isinstance(artifact, DeploymentArtifact)
-    assert artifact.project_location.endswith("artifact.tar.gz")
-
-    mock_os_makedirs.assert_called()
-    mock_copytree.assert_called()
-    mock_yaml_dump.assert_called()
-    mock_json_dump.assert_called()
-    mock_create_collated_input.assert_called_once_with(workflow, session)
-
-    added_files = [call[0][0] for call in mock_tar.add.call_args_list]
-    assert any("workflow.yaml" in f for f in added_files)
-    assert any("collated_input.json" in f for f in added_files)
-    assert all("artifact.tar.gz" not in f for f in added_files)
-    
-    
+    assert artifact.project_location.endswith(".tar.gz")
+
+    with tarfile.open(artifact.project_location, "r:gz") as tar:
+        names = set(tar.getnames())
+        assert json.load(tar.extractfile("collated_input.json")) == {"mock": "data"}
+    assert names == {
+        ARTIFACT_MANIFEST_FILE_NAME,
+        "workflow.yaml",
+        "collated_input.json",
+        "studio-data/workflows/my_dir/tools/t1/tool.py",
+    }
+
+    manifest = read_artifact_manifest(artifact.project_location)
+    assert set(manifest["files"]) == names - {ARTIFACT_MANIFEST_FILE_NAME}
+
+    # Staging directories are cleaned up; the artifact is cached with the studio's data.
+    assert os.listdir(archive.DEPLOYMENT_ARTIFACTS_LOCATION) == []
+    assert os.path.dirname(artifact.project_location) == "studio-data/deployment_artifacts_cache"
+
+
+def test_unchanged_redeploy_reuses_artifact(packaging_env):
+    first = _package()
+    first_inode = os.stat(first.project_location).st_ino
+    with patch("studio.deployments.package.archive.write_artifact", wraps=archive.write_artifact) as mock_write:
+        assert _package().project_location == first.project_location
+    # The cached artifact is reused as is, not written again.
+    mock_write.assert_not_called()
+    assert os.stat(first.project_location).st_ino == first_inode
+    with tarfile.open(first.project_location, "r:gz") as tar:
+        assert not any("deployment_artifacts_cache" in name for name in tar.getnames())
+
+    (packaging_env / "studio-data" / "workflows" / "my_dir" / "tools" / "t1" / "tool.py").write_text("print('bye')\n")
+    changed = _package()
+    assert changed.project_location != first.project_location
+
+
+def test_package_workflow_with_zstd(packaging_env):
+    artifact = _package(compression="zstd")
+
+    assert artifact.project_location.endswith(".tar.zst")
+    with open_artifact_archive(artifact.project_location) as tar:
+        assert "studio-data/workflows/my_dir/tools/t1/tool.py" in tar.getnames()
+
+
+def test_artifact_cache_is_reused_across_processes(tmp_path):
+    # Every deployment job packages in a new engine; the cache outlives it.
+    (tmp_path / "tool.py").write_text("print('hi')\n")
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join([repo_root, os.path.join(repo_root, "studio", "workflow_engine", "src")]),
+    )
+    # Load the module on its own; importing its package loads the whole workflow engine.
+    script = (
+        "import importlib.util\n"
+        f"spec = importlib.util.spec_from_file_location('archive', {archive.__file__!r})\n"
+        "archive = importlib.util.module_from_spec(spec)\n"
+        "spec.loader.exec_module(archive)\n"
+        "print(archive.package_artifact([('tool.py', 'tool.py')]))"
+    )
+
+    first, second = (
+        subprocess.run(
+            [sys.executable, "-c", script], cwd=tmp_path, env=env, capture_output=True, text=True, check=True
+        ).stdout.splitlines()
+        for _ in range(2)
+    )
+    assert first[0].startswith("Packaged 1 files")
+    assert second[0] == f"Reusing unchanged deployment artifact {first[-1]}"
+    assert second[-1] == first[-1]
+    assert os.path.dirname(first[-1]) == "studio-data/deployment_artifacts_cache"
+    assert (tmp_path / first[-1]).exists()
+
+
+def test_stale_staging_directories_are_removed(tmp_path):
+    stale = tmp_path / "stale"
+    fresh = tmp_path / "fresh"
+    stale.mkdir()
+    fresh.mkdir()
+    os.utime(stale, (0, 0))
+
+    archive.cleanup_stale_staging_directories(str(tmp_path))
+    assert not stale.exists()
+    assert fresh.exists()
+
+
 def test_ignore_studio_data():
     ignore_fn = workflows.studio_data_workflow_ignore_factory("my-workflow-dir")
-    ignored = ignore_fn("/some/path/studio-data", {"deployable_workflows", "tool_templates", "temp_files", "other"})
+    ignored = ignore_fn(
+        "/some/path/studio-data",
+        {"deployable_workflows", "tool_templates", "temp_files", "tool_venvs", "deployment_artifacts_cache", "other"},
+    )
     assert "deployable_workflows" in ignored
     assert "tool_templates" in ignored
     assert "temp_files" in ignored
+    assert "tool_venvs" in ignored
+    assert "deployment_artifacts_cache" in ignored
     assert "other" not in ignored
 
 def test_ignore_workflows():
@@ -107,57 +187,83 @@ def test_ignore_other_directory():
     assert "README.md" not in ignored
     
     
-@patch("studio.deployments.package.workflows.create_collated_input")
-@patch("studio.deployments.package.workflows.studio_data_workflow_ignore_factory")
-@patch("studio.deployments.package.workflows.shutil.copytree")
-@patch("studio.deployments.package.workflows.os.walk")
-@patch("studio.deployments.package.workflows.tarfile.open")
-@patch("studio.deployments.package.workflows.yaml.dump")
-@patch("studio.deployments.package.workflows.open", create=True)
-@patch("studio.deployments.package.workflows.uuid4")
-def test_package_workflow_skips_self_archive(
-    mock_uuid4,
-    mock_open,
-    mock_yaml_dump,
-    mock_tarfile_open,
-    mock_os_walk,
-    mock_copytree,
-    mock_ignore_factory,
-    mock_create_collated_input,
-):
-    # Patch uuid4 to return a predictable value
-    mock_uuid4.return_value = "some-uuid"
-
-    packaging_dir = "/tmp/deployment_artifacts/some-uuid"
-    archive_path = os.path.join(packaging_dir, "artifact.tar.gz")
-
-    # Simulate os.walk returning the archive file itself
-    mock_os_walk.return_value = [
-        (packaging_dir, [], ["artifact.tar.gz", "some_other_file.txt"])
+@patch("studio.deployments.package.workflows.subprocess.run")
+def test_build_tool_wheelhouse(mock_run, tmp_path):
+    tool_dir = tmp_path / "studio-data" / "workflows" / "wf" / "tools" / "t1"
+    tool_dir.mkdir(parents=True)
+    (tool_dir / "requirements.txt").write_text("requests\n")
+    mock_run.return_value = MagicMock(returncode=0)
+
+    collated_input = MagicMock()
+    collated_input.tool_instances = [
+        MagicMock(
+            source_folder_path="studio-data/workflows/wf/tools/t1", python_requirements_file_name="requirements.txt"
+        ),
+        MagicMock(
+            source_folder_path="studio-data/workflows/wf/tools/missing",
+            python_requirements_file_name="requirements.txt",
+        ),
+    ]
+
+    wheelhouse = workflows.build_tool_wheelhouse(str(tmp_path), collated_input, source_directory=str(tmp_path))
+    assert wheelhouse == "wheelhouse"
+    assert (tmp_path / "wheelhouse").is_dir()
+    assert mock_run.call_count == 1
+    command = mock_run.call_args.args[0]
+    assert command[-4:] == ["-r", str(tool_dir / "requirements.txt"), "-w", str(tmp_path / "wheelhouse")]
+
+
+@patch("studio.deployments.package.workflows.subprocess.run")
+def test_build_tool_wheelhouse_fails_on_build_error(mock_run, tmp_path):
+    tool_dir = tmp_path / "tools" / "t1"
+    tool_dir.mkdir(parents=True)
+    (tool_dir / "requirements.txt").write_text("not-a-real-package\n")
+    mock_run.return_value = MagicMock(returncode=1, stderr="No matching distribution")
+
+    collated_input = MagicMock()
+    collated_input.tool_instances = [
+        MagicMock(source_folder_path="tools/t1", python_requirements_file_name="requirements.txt"),
     ]
 
-    # Patch tarfile object
-    mock_tar = MagicMock()
-    mock_tarfile_open.return_value.__enter__.return_value = mock_tar
+    with pytest.raises(RuntimeError, match="No matching distribution"):
+        workflows.build_tool_wheelhouse(str(tmp_path), collated_input, source_directory=str(tmp_path))
 
-    # Collated input
-    mock_collated_input = MagicMock(spec=CollatedInput)
-    mock_collated_input.language_models = []
-    mock_collated_input.model_dump.return_value = {}
-    mock_create_collated_input.return_value = mock_collated_input
 
-    # Payload and deployment
-    payload = DeploymentPayload(deployment_config=DeploymentConfig())
-    deployment = MagicMock(spec=DeployedWorkflowInstance)
-    deployment.workflow = MagicMock(spec=Workflow)
-    deployment.workflow.directory = "my_workflow"
+def _write_local_wheel(directory) -> str:
+    """
+    Write a minimal pure-Python wheel, so building a wheelhouse from it needs
+    no package index.
+    """
+    name = "agent_studio_demo_tool_dep-0.1-py3-none-any.whl"
+    dist_info = "agent_studio_demo_tool_dep-0.1.dist-info"
+    with zipfile.ZipFile(os.path.join(directory, name), "w") as whl:
+        whl.writestr("agent_studio_demo_tool_dep/__init__.py", "")
+        whl.writestr(f"{dist_info}/METADATA", "Metadata-Version: 2.1\nName: agent-studio-demo-tool-dep\nVersion: 0.1\n")
+        whl.writestr(
+            f"{dist_info}/WHEEL", "Wheel-Version: 1.0\nGenerator: test\nRoot-Is-Purelib: true\nTag: py3-none-any\n"
+        )
+        whl.writestr(f"{dist_info}/RECORD", "")
+    return name
 
-    mock_ignore_factory.return_value = lambda *_: set()
 
-    # Call function under test
-    artifact = workflows.package_workflow_for_deployment(payload, deployment, MagicMock(), MagicMock())
+@pytest.mark.parametrize("interpreter_has_pip", [True, False])
+def test_build_tool_wheelhouse_runs_pip(tmp_path, interpreter_has_pip):
+    tool_dir = tmp_path / "tools" / "t1"
+    tool_dir.mkdir(parents=True)
+    wheel_name = _write_local_wheel(tool_dir)
+    (tool_dir / "requirements.txt").write_text(f"--no-index\n./{wheel_name}\n")
+    collated_input = MagicMock()
+    collated_input.tool_instances = [
+        MagicMock(source_folder_path="tools/t1", python_requirements_file_name="requirements.txt"),
+    ]
+
+    # Without pip in the studio's interpreter, pip runs through uv.
+    find_spec = workflows.importlib.util.find_spec
+    with patch(
+        "studio.deployments.package.workflows.importlib.util.find_spec",
+        side_effect=lambda name: find_spec(name) if interpreter_has_pip or name != "pip" else None,
+    ):
+        assert workflows.get_pip_command()[0] == (sys.executable if interpreter_has_pip else "uv")
+        workflows.build_tool_wheelhouse(str(tmp_path), collated_input, source_directory=str(tmp_path))
 
-    # Confirm the archive itself was skipped
-    added_files = [call.args[0] for call in mock_tar.add.call_args_list]
-    assert archive_path not in added_files
-    assert os.path.join(packaging_dir, "some_other_file.txt") in added_files
\ No newline at end of file
+    assert os.listdir(tmp_path / "wheelhouse") == [wheel_name]
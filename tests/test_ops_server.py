@@ -0,0 +1,177 @@
+import threading
+import time
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from studio.ops_server import events as ops_events
+from studio.ops_server.app import create_ops_app
+
+
+async def _upstream_handler(request: httpx.Request) -> httpx.Response:
+    body = await request.aread()
+    return httpx.Response(
+        201,
+        headers=[("x-upstream-path", request.url.raw_path.decode()), ("set-cookie", "a=1"), ("set-cookie", "b=2")],
+        stream=httpx.ByteStream(b"upstream:" + body),
+    )
+
+
+@pytest.fixture
+def client():
+    upstream = httpx.AsyncClient(base_url="http://phoenix", transport=httpx.MockTransport(_upstream_handler))
+    with TestClient(create_ops_app(upstream_client=upstream)) as test_client:
+        yield test_client
+    ops_events.clear_trace_logs()
+
+
+def test_events_post_and_consume(client):
+    assert client.post("/events", json={"trace_id": "t1", "event": {"type": "a"}}).json() == {"status": "200"}
+    response = client.post("/events/batch", json={"trace_id": "t1", "events": [{"type": "b"}, {"type": "c"}]})
+    assert response.json() == {"status": "200", "accepted": 2}
+
+    assert [e["type"] for e in client.get("/events", params={"trace_id": "t1"}).json()] == ["a", "b", "c"]
+    # Each consumer only sees events once, independently of other consumers.
+    assert client.get("/events", params={"trace_id": "t1"}).json() == []
+    assert len(client.get("/events", params={"trace_id": "t1", "consumer": "sdk"}).json()) == 3
+
+
+def test_events_validation(client):
+    assert client.post("/events", content=b"not json").status_code == 400
+    assert client.post("/events", json={"trace_id": "t1"}).status_code == 400
+    assert client.post("/events/batch", json={"trace_id": "t1", "events": {}}).status_code == 400
+    assert client.get("/events").status_code == 400
+
+
+def test_trace_byte_cap_drops_oldest(client, monkeypatch):
+    monkeypatch.setattr(ops_events, "TRACE_QUEUE_MAX_BYTES", 110)
+    events = [{"type": "e", "i": i, "pad": "x" * 20} for i in range(5)]
+    client.post("/events/batch", json={"trace_id": "t1", "events": events})
+
+    trace_stats = client.get("/events/stats", params={"trace_id": "t1"}).json()["trace"]
+    assert trace_stats["dropped_events"] == 3
+    assert trace_stats["retained_bytes"] <= 110
+    assert [e["i"] for e in client.get("/events", params={"trace_id": "t1"}).json()] == [3, 4]
+
+
+def test_finished_trace_expires(client, monkeypatch):
+    monkeypatch.setattr(ops_events, "TRACE_QUEUE_TTL_SECONDS", 0)
+    client.post("/events/batch", json={"trace_id": "done", "events": [{"type": "crew_kickoff_completed"}]})
+    client.post("/events", json={"trace_id": "running", "event": {"type": "task_started"}})
+
+    ops_events._sweep_expired_traces(force=True)
+
+    stats = client.get("/events/stats").json()
+    assert set(ops_events.trace_logs) == {"running"}
+    assert stats["expired_traces"] == 1
+    assert stats["retained_events"] == 1
+    # Polling an expired trace does not recreate its log.
+    assert client.get("/events", params={"trace_id": "done"}).json() == []
+    assert "done" not in ops_events.trace_logs
+
+
+def test_memory_budget_sheds_finished_traces_first(client, monkeypatch):
+    event = {"type": "e", "pad": "x" * 50}
+    client.post("/events/batch", json={"trace_id": "finished", "events": [event, {"type": "crew_kickoff_failed"}]})
+    client.post("/events", json={"trace_id": "running", "event": event})
+    monkeypatch.setattr(ops_events, "EVENTS_MEMORY_BUDGET_BYTES", 150)
+
+    client.post("/events", json={"trace_id": "new", "event": event})
+
+    stats = client.get("/events/stats").json()
+    assert stats["retained_bytes"] <= 150
+    assert ops_events.trace_logs["finished"].dropped_events == 2
+    assert len(ops_events.trace_logs["running"].events) == 1
+    # The finished trace keeps its status after its events are shed.
+    assert client.get("/events/status", params={"trace_id": "finished"}).json()["status"] == "failed"
+    result = client.get("/events", params={"trace_id": "finished", "cursor": 0}).json()
+    assert result["events"] == [] and result["truncated"] is True
+
+
+def test_spilled_events_remain_readable(client, monkeypatch, tmp_path):
+    monkeypatch.setattr(ops_events, "TRACE_QUEUE_MAX_BYTES", 110)
+    monkeypatch.setattr(ops_events, "EVENTS_SPILL_PATH", str(tmp_path / "events.db"))
+    monkeypatch.setattr(ops_events, "_spill_store", None)
+    events = [{"type": "e", "i": i, "pad": "x" * 20} for i in range(5)]
+    client.post("/events/batch", json={"trace_id": "t1", "events": events})
+
+    trace_stats = client.get("/events/stats", params={"trace_id": "t1"}).json()["trace"]
+    assert trace_stats == dict(trace_stats, retained_events=2, spilled_events=3, dropped_events=0)
+    result = client.get("/events", params={"trace_id": "t1", "cursor": 1}).json()
+    assert [e["i"] for e in result["events"]] == [1, 2, 3, 4]
+    assert result["truncated"] is False
+    ops_events.clear_trace_logs()
+    ops_events._spill_store.close()
+
+
+def test_status_projection(client):
+    assert client.get("/events/status", params={"trace_id": "t1"}).json()["status"] == "unknown"
+    client.post("/events", json={"trace_id": "t1", "event": {"type": "task_started"}})
+    assert client.get("/events/status", params={"trace_id": "t1"}).json()["status"] == "running"
+
+    client.post("/events", json={"trace_id": "t1", "event": {"type": "crew_kickoff_completed", "output": "done"}})
+    status = client.get("/events/status", params={"trace_id": "t1"}).json()
+    assert status == dict(status, status="completed", output="done", event_count=2, last_seq=2)
+
+
+def test_cursor_reads_are_non_destructive(client):
+    client.post("/events/batch", json={"trace_id": "t1", "events": [{"type": "a"}, {"type": "b"}]})
+
+    first = client.get("/events", params={"trace_id": "t1", "cursor": 0}).json()
+    assert first == {"events": [{"type": "a"}, {"type": "b"}], "cursor": 2, "finished": False, "truncated": False}
+    # Another reader (or a retry after a lost response) sees the same events.
+    assert client.get("/events", params={"trace_id": "t1", "cursor": 0}).json() == first
+    assert len(client.get("/events", params={"trace_id": "t1"}).json()) == 2
+
+    client.post("/events", json={"trace_id": "t1", "event": {"type": "crew_kickoff_completed"}})
+    last = client.get("/events", params={"trace_id": "t1", "cursor": 2}).json()
+    assert last["events"] == [{"type": "crew_kickoff_completed"}]
+    assert last["cursor"] == 3 and last["finished"] is True
+    assert client.get("/events/stats", params={"trace_id": "t1"}).json()["trace"]["retained_events"] == 3
+
+
+def test_long_poll_wakes_on_publish(client):
+    timer = threading.Timer(0.2, ops_events.publish_events, args=("t1", [{"type": "late"}]))
+    timer.start()
+    start = time.monotonic()
+    result = client.get("/events", params={"trace_id": "t1", "cursor": 0, "wait": 10}).json()
+
+    assert result["events"] == [{"type": "late"}]
+    assert time.monotonic() - start < 5
+    timer.join()
+
+
+def test_long_poll_times_out_empty(client):
+    result = client.get("/events", params={"trace_id": "t1", "cursor": 0, "wait": 0.1}).json()
+    assert result == {"events": [], "cursor": 0, "finished": False, "truncated": False}
+
+
+def test_event_stream_resumes_from_last_event_id(client):
+    events = [{"type": "a"}, {"type": "b"}, {"type": "crew_kickoff_failed"}]
+    client.post("/events/batch", json={"trace_id": "t1", "events": events})
+
+    response = client.get("/events/stream", params={"trace_id": "t1"}, headers={"Last-Event-ID": "1"})
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == (
+        'id: 2\ndata: {"type": "b"}\n\nid: 3\ndata: {"type": "crew_kickoff_failed"}\n\nevent: end\ndata: {}\n\n'
+    )
+
+
+def test_proxy_forwards_to_upstream(client):
+    response = client.post("/v1/traces?x=1", content=b"spans")
+
+    assert response.status_code == 201
+    assert response.content == b"upstream:spans"
+    assert response.headers["x-upstream-path"] == "/v1/traces?x=1"
+    assert response.headers.get_list("set-cookie") == ["a=1", "b=2"]
+
+
+def test_proxy_upstream_unavailable():
+    def refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    upstream = httpx.AsyncClient(base_url="http://phoenix", transport=httpx.MockTransport(refuse))
+    with TestClient(create_ops_app(upstream_client=upstream)) as test_client:
+        assert test_client.get("/graphql").status_code == 502
@@ -0,0 +1,81 @@
+from sqlalchemy import text
+
+__import__("pysqlite3")
+import sys
+
+sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
+
+from studio.db.dao import AgentStudioDao
+from studio.db import model as db_model
+from studio.api import *
+from studio.task.task import list_tasks
+from studio.task.task_templates import list_task_templates
+
+
+def _add_tasks(dao, workflow_id, num_tasks):
+    with dao.get_session() as session:
+        for i in range(num_tasks):
+            session.add(db_model.Agent(id=f"{workflow_id}-agent-{i}", workflow_id=workflow_id, name=f"Agent {i}"))
+            session.add(
+                db_model.Task(
+                    id=f"{workflow_id}-task-{i}",
+                    workflow_id=workflow_id,
+                    description="Summarize {topic}",
+                    expected_output="summary",
+                    assigned_agent_id=f"{workflow_id}-agent-{i}",
+                )
+            )
+
+
+def test_list_tasks_query_count_is_constant(count_queries):
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    _add_tasks(dao, "small", 2)
+    _add_tasks(dao, "large", 50)
+    _add_tasks(dao, "other", 50)
+
+    small, small_queries = count_queries(dao, lambda: list_tasks(ListTasksRequest(workflow_id="small"), None, dao))
+    large, large_queries = count_queries(dao, lambda: list_tasks(ListTasksRequest(workflow_id="large"), None, dao))
+
+    assert len(small.tasks) == 2 and len(large.tasks) == 50
+    assert all(task.is_valid for task in large.tasks)
+    assert small_queries == large_queries
+    assert len(list_tasks(ListTasksRequest(), None, dao).tasks) == 102
+
+
+def test_list_tasks_validates_assigned_agent():
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    _add_tasks(dao, "wf", 1)
+    with dao.get_session() as session:
+        session.add(db_model.Task(id="unassigned", workflow_id="wf", description="", assigned_agent_id=None))
+        session.add(db_model.Task(id="orphaned", workflow_id="wf", description="", assigned_agent_id="missing"))
+
+    res = list_tasks(ListTasksRequest(workflow_id="wf"), None, dao)
+
+    validity = {task.task_id: task.is_valid for task in res.tasks}
+    assert validity == {"wf-task-0": True, "unassigned": True, "orphaned": False}
+    assert next(task for task in res.tasks if task.task_id == "wf-task-0").inputs == ["topic"]
+
+
+def test_workflow_filters_use_indexes():
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    with dao.engine.connect() as conn:
+        plan = conn.execute(text("EXPLAIN QUERY PLAN SELECT * FROM tasks WHERE workflow_id = 'wf'")).fetchall()
+        assert "ix_tasks_workflow_id" in str(plan)
+        plan = conn.execute(
+            text("EXPLAIN QUERY PLAN SELECT * FROM tool_templates WHERE workflow_template_id = 'wt'")
+        ).fetchall()
+        assert "ix_tool_templates_workflow_template_id" in str(plan)
+
+
+def test_list_task_templates_filters_in_sql(count_queries):
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    with dao.get_session() as session:
+        for i in range(20):
+            session.add(db_model.TaskTemplate(id=f"tt-{i}", workflow_template_id=f"wt-{i % 2}", description=""))
+
+    res, queries = count_queries(
+        dao, lambda: list_task_templates(ListTaskTemplatesRequest(workflow_template_id="wt-0"), dao=dao)
+    )
+
+    assert sorted(t.id for t in res.task_templates) == sorted(f"tt-{i}" for i in range(0, 20, 2))
+    assert queries == 1
@@ -9,8 +9,9 @@ import shutil
 from uuid import UUID
 
 from studio.api import *
-from studio.db.dao import AgentStudioDao
+from studio.db.dao import AgentStudioDao, dispose_engines
 from studio.db import model as db_model
+import studio.tools.utils as tool_utils
 from studio.tools.tool_instance import (
     create_tool_instance,
     remove_tool_instance,
@@ -357,4 +358,35 @@ def test_remove_tool_instance_with_image(mock_thread_pool, mock_exists):
     mock_exists.return_value = True
     
     req = RemoveToolInstanceRequest(tool_instance_id="instance1")
-    res = remove_tool_instance(req, cml=None, dao=test_dao) 
\ No newline at end of file
+    res = remove_tool_instance(req, cml=None, dao=test_dao)
+
+
+def test_tool_instance_files_are_read_after_the_session_closes(tmp_path):
+    test_dao = AgentStudioDao(engine_url=f"sqlite:///{tmp_path / 'state.db'}", echo=False)
+    (tmp_path / "code.py").write_text('"""Looks things up."""\n')
+    (tmp_path / "requirements.txt").write_text("requests\n")
+    with test_dao.get_session() as session:
+        session.add(
+            db_model.ToolInstance(
+                id="instance1",
+                name="Test Instance",
+                workflow_id="workflow1",
+                source_folder_path=str(tmp_path),
+                python_code_file_name="code.py",
+                python_requirements_file_name="requirements.txt",
+                tool_image_path="",
+            )
+        )
+
+    read_tool_instance_metadata = tool_utils.read_tool_instance_metadata
+    checked_out = []
+
+    def read_and_record(tool_instance):
+        checked_out.append(test_dao.engine.pool.checkedout())
+        return read_tool_instance_metadata(tool_instance)
+
+    with patch("studio.tools.utils.read_tool_instance_metadata", side_effect=read_and_record):
+        get_tool_instance(GetToolInstanceRequest(tool_instance_id="instance1"), cml=None, dao=test_dao)
+        list_tool_instances(ListToolInstancesRequest(workflow_id="workflow1"), cml=None, dao=test_dao)
+    assert checked_out == [0, 0]
+    dispose_engines()
@@ -5,9 +5,10 @@ import shutil
 from uuid import UUID
 
 from studio.api import *
-from studio.db.dao import AgentStudioDao
+from studio.db.dao import AgentStudioDao, dispose_engines
 from studio.db import model as db_model
 from studio.tools.tool_template import *
+import studio.tools.utils as tool_utils
 from studio.tools.utils import (
     extract_user_params_from_code
 )
@@ -323,6 +324,62 @@ def test_list_tool_templates_invalid_python(mock_join, mock_open):
     assert len(res.templates) == 1
     assert res.templates[0].tool_description == "Unable to read tool description"
 
+def test_list_tool_templates_filters_by_workflow_template_in_sql(tmp_path, count_queries):
+    test_dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+
+    with test_dao.get_session() as session:
+        session.add(db_model.WorkflowTemplate(id="wt1", name="Workflow Template"))
+        for i in range(10):
+            session.add(
+                db_model.ToolTemplate(
+                    id=f"t{i}",
+                    name=f"template{i}",
+                    source_folder_path=str(tmp_path),
+                    python_code_file_name="code.py",
+                    python_requirements_file_name="requirements.txt",
+                    tool_image_path="",
+                    workflow_template_id="wt1" if i % 2 else None,
+                )
+            )
+        session.commit()
+
+    request = ListToolTemplatesRequest(workflow_template_id="wt1")
+    res, queries = count_queries(test_dao, lambda: list_tool_templates(request, cml=None, dao=test_dao))
+
+    assert sorted(template.id for template in res.templates) == ["t1", "t3", "t5", "t7", "t9"]
+    assert queries == 1
+
+
+def test_tool_template_files_are_read_after_the_session_closes(tmp_path):
+    test_dao = AgentStudioDao(engine_url=f"sqlite:///{tmp_path / 'state.db'}", echo=False)
+    (tmp_path / "code.py").write_text('"""Looks things up."""\n')
+    (tmp_path / "requirements.txt").write_text("requests\n")
+    with test_dao.get_session() as session:
+        session.add(
+            db_model.ToolTemplate(
+                id="t1",
+                name="template1",
+                source_folder_path=str(tmp_path),
+                python_code_file_name="code.py",
+                python_requirements_file_name="requirements.txt",
+                tool_image_path="",
+            )
+        )
+
+    read_tool_file = tool_utils.read_tool_file
+    checked_out = []
+
+    def read_and_record(file_path):
+        checked_out.append(test_dao.engine.pool.checkedout())
+        return read_tool_file(file_path)
+
+    with patch("studio.tools.utils.read_tool_file", side_effect=read_and_record):
+        assert list_tool_templates(ListToolTemplatesRequest(), cml=None, dao=test_dao).templates[0].is_valid
+        get_tool_template(GetToolTemplateRequest(tool_template_id="t1"), cml=None, dao=test_dao)
+    assert checked_out == [0, 0]
+    dispose_engines()
+
+
 @patch("os.path.exists")
 @patch("os.makedirs")
 @patch("shutil.copytree")
@@ -1,5 +1,10 @@
 import pytest
-from studio.tools.utils import extract_user_params_from_code
+import os
+from studio.tools.utils import (
+    ToolMetadataCache,
+    extract_user_params_from_code,
+    parse_tool_code,
+)
 
 def test_extract_user_params_basic():
     """Test basic parameter extraction"""
@@ -113,4 +118,56 @@ class UserParameters(BaseModel):
         "default_param": {"required": False},
         "optional_with_default": {"required": False}
     }
-    assert params == expected 
\ No newline at end of file
+    assert params == expected
+
+
+def test_parse_tool_code():
+    """Test parsing user params, tool params and docstring in one pass"""
+    metadata = parse_tool_code('''"""Looks things up."""
+class UserParameters(BaseModel):
+    api_key: str
+
+class ToolParameters(BaseModel):
+    query: str
+    limit: Optional[int]
+''')
+    assert metadata.is_valid
+    assert metadata.description == "Looks things up."
+    assert metadata.user_params == {"api_key": {"required": True}}
+    assert metadata.tool_params == {"query": {"required": True}, "limit": {"required": False}}
+
+    metadata = parse_tool_code("class UserParameters(:")
+    assert not metadata.is_valid
+    assert "Error parsing Python code" in metadata.error
+    assert metadata.user_params == {}
+
+
+def test_tool_metadata_cache_reuses_unchanged_files(tmp_path):
+    """Test that files are parsed once per version and evicted least recently used first"""
+    cache = ToolMetadataCache(max_entries=2)
+    code_path = tmp_path / "tool.py"
+    code_path.write_text("class UserParameters(BaseModel):\n    param1: str\n")
+
+    first = cache.get_code_metadata(str(code_path))
+    assert cache.get_code_metadata(str(code_path)) is first
+    assert cache.get_stats()["hits"] == 1
+
+    code_path.write_text("class UserParameters(BaseModel):\n    param1: str\n    param2: str\n")
+    assert cache.get_code_metadata(str(code_path)).user_params == {
+        "param1": {"required": True},
+        "param2": {"required": True},
+    }
+
+    (tmp_path / "requirements.txt").write_text("requests\n")
+    (tmp_path / "other.py").write_text("")
+    assert cache.get_text(str(tmp_path / "requirements.txt")) == "requests\n"
+    cache.get_code_metadata(str(tmp_path / "other.py"))
+    stats = cache.get_stats()
+    assert stats == {"hits": 1, "misses": 4, "evictions": 1, "entries": 2, "hit_rate": 0.2}
+
+
+def test_tool_metadata_cache_missing_file(tmp_path):
+    """Test that missing files raise like reading them directly"""
+    cache = ToolMetadataCache(max_entries=2)
+    with pytest.raises(FileNotFoundError):
+        cache.get_code_metadata(os.path.join(str(tmp_path), "missing.py"))
@@ -0,0 +1,95 @@
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+
+from studio.workflow.runners import NoWorkflowRunnersAvailable, WorkflowRunnerRegistry
+
+
+def _response(status_code=200, payload=None):
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.ok = status_code < 400
+    resp.json.return_value = payload or {}
+    return resp
+
+
+def _registry(statuses, post_side_effect=None):
+    registry = WorkflowRunnerRegistry(list(statuses))
+
+    def get(url, timeout):
+        assert timeout is not None
+        status = statuses[url.rsplit("/status", 1)[0]]
+        if isinstance(status, Exception):
+            raise status
+        return _response(payload=status)
+
+    registry._session = MagicMock()
+    registry._session.get.side_effect = get
+    registry._session.post.side_effect = post_side_effect or (lambda url, json, timeout: _response())
+    return registry
+
+
+def test_unreachable_runner_reported_busy():
+    registry = _registry(
+        {
+            "http://a": {"busy": False, "slots_total": 1, "slots_busy": 0},
+            "http://b": requests.exceptions.ConnectTimeout("timed out"),
+        }
+    )
+    runners = {r["endpoint"]: r for r in registry.get_runners()}
+
+    assert runners["http://a"]["busy"] is False
+    assert runners["http://b"]["busy"] is True
+    assert runners["http://b"]["reachable"] is False
+
+
+def test_status_cached_between_calls():
+    registry = _registry({"http://a": {"busy": False, "slots_total": 1, "slots_busy": 0}})
+    registry.get_runners()
+    registry.get_runners()
+    assert registry._session.get.call_count == 1
+
+
+def test_dispatch_spreads_to_least_loaded_runner():
+    registry = _registry(
+        {
+            "http://a": {"busy": False, "slots_total": 3, "slots_busy": 1},
+            "http://b": {"busy": False, "slots_total": 2, "slots_busy": 0},
+        }
+    )
+    registry.dispatch("/kickoff", {})
+    registry.dispatch("/kickoff", {})
+
+    posted = [c.kwargs["url"] for c in registry._session.post.call_args_list]
+    # b is emptier and takes the first execution; that dispatch counts toward
+    # b's load before the next probe, so both runners are used.
+    assert posted[0] == "http://b/kickoff"
+    assert set(posted) == {"http://a/kickoff", "http://b/kickoff"}
+    assert registry.get_stats()["dispatches"] == 2
+
+
+def test_dispatch_retries_next_runner_on_409():
+    def post(url, json, timeout):
+        return _response(409 if url.startswith("http://a") else 200)
+
+    registry = _registry(
+        {
+            "http://a": {"busy": False, "slots_total": 1, "slots_busy": 0},
+            "http://b": {"busy": False, "slots_total": 2, "slots_busy": 1},
+        },
+        post_side_effect=post,
+    )
+    resp = registry.dispatch("/kickoff", {})
+
+    assert resp.status_code == 200
+    assert registry._session.post.call_args.kwargs["url"] == "http://b/kickoff"
+    assert registry.get_stats()["busy_retries"] == 1
+
+
+@patch("studio.workflow.runners.WORKFLOW_RUNNER_DISPATCH_BACKOFF_SECONDS", 0)
+def test_dispatch_raises_when_all_runners_busy():
+    registry = _registry({"http://a": {"busy": True, "slots_total": 1, "slots_busy": 1}})
+
+    with pytest.raises(NoWorkflowRunnersAvailable):
+        registry.dispatch("/kickoff", {})
+    registry._session.post.assert_not_called()
@@ -0,0 +1,117 @@
+import json
+import os
+import zipfile
+from unittest.mock import patch
+
+__import__("pysqlite3")
+import sys
+
+sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
+
+from studio.db.dao import AgentStudioDao
+from studio.db import model as db_model
+from studio.api import *
+from studio.workflow.workflow_templates import export_workflow_template
+
+
+def _add_workflow_template(dao, tool_dir):
+    with dao.get_session() as session:
+        session.add(
+            db_model.ToolTemplate(
+                id="tool-1",
+                name="Tool",
+                source_folder_path=tool_dir,
+                python_code_file_name="tool.py",
+                python_requirements_file_name="requirements.txt",
+                tool_image_path="",
+                pre_built=True,
+                workflow_template_id="wt-1",
+            )
+        )
+        session.add(
+            db_model.MCPTemplate(
+                id="mcp-1",
+                name="MCP",
+                type="PYTHON",
+                args=[],
+                env_names=[],
+                tools=[{"name": "search"}],
+                status="VALID",
+                mcp_image_path="",
+                workflow_template_id="wt-1",
+            )
+        )
+        session.add(
+            db_model.AgentTemplate(
+                id="agent-1",
+                name="Agent",
+                tool_template_ids=["tool-1"],
+                mcp_template_ids=["mcp-1"],
+                pre_packaged=True,
+                workflow_template_id="wt-1",
+            )
+        )
+        session.add(
+            db_model.TaskTemplate(
+                id="task-1", description="Summarize", assigned_agent_template_id="agent-1", workflow_template_id="wt-1"
+            )
+        )
+        session.add(
+            db_model.WorkflowTemplate(
+                id="wt-1",
+                name="Workflow Template",
+                agent_template_ids=["agent-1"],
+                task_template_ids=["task-1"],
+                pre_packaged=True,
+            )
+        )
+
+
+def _snapshot(dao):
+    with dao.get_session(read_only=True) as session:
+        return [
+            row.to_dict()
+            for model in (
+                db_model.WorkflowTemplate,
+                db_model.AgentTemplate,
+                db_model.ToolTemplate,
+                db_model.MCPTemplate,
+                db_model.TaskTemplate,
+            )
+            for row in session.query(model).all()
+        ]
+
+
+def test_export_workflow_template_leaves_rows_unchanged(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    tool_dir = os.path.join("studio-data", "tool_templates", "tool_1")
+    os.makedirs(tool_dir)
+    with open(os.path.join(tool_dir, "tool.py"), "w") as f:
+        f.write("# tool\n")
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    _add_workflow_template(dao, tool_dir)
+    before = _snapshot(dao)
+
+    with patch("studio.workflow.workflow_templates.consts.TEMP_FILES_LOCATION", str(tmp_path / "temp_files")):
+        res = export_workflow_template(ExportWorkflowTemplateRequest(id="wt-1"), dao=dao)
+
+    assert _snapshot(dao) == before
+    with zipfile.ZipFile(res.file_path) as zf:
+        template = json.loads(zf.read("workflow_template.json"))
+        assert f"{tool_dir}/tool.py" in zf.namelist()
+    workflow_template = template["workflow_template"]
+    assert workflow_template["id"] != "wt-1" and not workflow_template["pre_packaged"]
+    agent_template = template["agent_templates"][0]
+    tool_template = template["tool_templates"][0]
+    mcp_template = template["mcp_templates"][0]
+    task_template = template["task_templates"][0]
+    assert workflow_template["agent_template_ids"] == [agent_template["id"]]
+    assert workflow_template["task_template_ids"] == [task_template["id"]]
+    assert agent_template["tool_template_ids"] == [tool_template["id"]]
+    assert agent_template["mcp_template_ids"] == [mcp_template["id"]]
+    assert task_template["assigned_agent_template_id"] == agent_template["id"]
+    assert not tool_template["pre_built"] and not agent_template["pre_packaged"]
+    assert "tools" not in mcp_template and mcp_template["status"] == ""
+    assert {t["workflow_template_id"] for t in (agent_template, tool_template, mcp_template, task_template)} == {
+        workflow_template["id"]
+    }
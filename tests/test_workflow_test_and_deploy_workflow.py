@@ -0,0 +1,60 @@
+import os
+from unittest.mock import MagicMock, patch
+
+from studio.api import *
+from studio.db.dao import AgentStudioDao, dispose_engines
+from studio.db import model as db_model
+from studio.deployments.types import DeploymentStatus
+from studio.workflow.test_and_deploy_workflow import list_deployed_workflows
+
+
+def _response(payload):
+    response = MagicMock(status_code=200)
+    response.json.return_value = payload
+    return response
+
+
+def test_list_deployed_workflows_calls_cml_after_the_session_closes(tmp_path):
+    dao = AgentStudioDao(engine_url=f"sqlite:///{tmp_path / 'state.db'}", echo=False)
+    with dao.get_session() as session:
+        session.add(db_model.Workflow(id="wf", name="Workflow"))
+        session.add(
+            db_model.DeployedWorkflowInstance(
+                id="dw",
+                workflow_id="wf",
+                name="Deployment",
+                cml_deployed_model_id="model-1",
+                status=DeploymentStatus.DEPLOYED,
+            )
+        )
+
+    checked_out = []
+
+    def list_model_builds(project_id, model_id):
+        checked_out.append(dao.engine.pool.checkedout())
+        return MagicMock(model_builds=[MagicMock(id="build-1")])
+
+    cml = MagicMock()
+    cml.list_model_builds.side_effect = list_model_builds
+    cml.list_model_deployments.return_value = MagicMock(model_deployments=[MagicMock(status="Deployed")])
+    applications = [{"name": "Workflow: Deployment", "url": "https://app", "status": "running"}]
+
+    with (
+        patch.dict(
+            os.environ,
+            {"CDSW_DS_API_URL": "https://cml/api/ds", "CDSW_API_KEY": "key", "CDSW_PROJECT_URL": "https://cml/p"},
+        ),
+        patch(
+            "studio.workflow.test_and_deploy_workflow.cc_utils.get_cml_project_number_and_id", return_value=("1", "p")
+        ),
+        patch("studio.workflow.test_and_deploy_workflow.requests.post", return_value=_response([])),
+        patch("studio.workflow.test_and_deploy_workflow.requests.get", return_value=_response(applications)),
+    ):
+        res = list_deployed_workflows(ListDeployedWorkflowsRequest(), cml=cml, dao=dao)
+
+    assert checked_out == [0]
+    deployed_workflow = res.deployed_workflows[0]
+    assert deployed_workflow.workflow_name == "Workflow"
+    assert deployed_workflow.application_url == "https://app"
+    assert deployed_workflow.application_status == "running"
+    dispose_engines()
@@ -0,0 +1,165 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
+from studio.db.dao import AgentStudioDao
+from studio.db import model as db_model
+from studio.workflow.runners import NoWorkflowRunnersAvailable
+from studio.workflow.test_queue import (
+    SUBMISSION_DISPATCHED,
+    SUBMISSION_DISPATCHING,
+    SUBMISSION_FAILED,
+    SUBMISSION_QUEUED,
+    WORKFLOW_TEST_QUEUED_EVENT,
+    WorkflowTestQueue,
+    WorkflowTestQueueFull,
+)
+
+
+@pytest.fixture
+def events():
+    posted = []
+    with (
+        patch("studio.workflow.test_queue.post_trace_event", side_effect=lambda t, e: posted.append((t, e))),
+        patch("studio.workflow.test_queue.get_llm_config_for_workflow", return_value={"m1": {"api_key": "k"}}),
+    ):
+        yield posted
+
+
+def _queue(max_depth=10):
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    with dao.get_session() as session:
+        session.add(db_model.Workflow(id="w1", name="Workflow"))
+    registry = MagicMock()
+    registry.get_runners.return_value = [{"endpoint": "http://a"}]
+    registry.dispatch.return_value = MagicMock(ok=True)
+    return WorkflowTestQueue(dao, registry=registry, max_depth=max_depth)
+
+
+def _status(queue, trace_id):
+    with queue.dao.get_session() as session:
+        return session.get(db_model.WorkflowTestSubmission, trace_id).status
+
+
+def test_dispatch_order_is_priority_then_fifo(events):
+    queue = _queue()
+    first, pos_first = queue.submit("w1", {"inputs": {"n": "1"}})
+    second, pos_second = queue.submit("w1", {"inputs": {"n": "2"}})
+    urgent, pos_urgent = queue.submit("w1", {"inputs": {"n": "3"}}, priority=5)
+
+    assert (pos_first, pos_second, pos_urgent) == (1, 2, 1)
+    assert queue.schedule() == 3
+
+    payloads = [c.args[1] for c in queue.registry.dispatch.call_args_list]
+    assert [p["events_trace_id"] for p in payloads] == [urgent, first, second]
+    # The LLM config is only attached at dispatch, never stored.
+    assert payloads[0]["llm_config"] == {"m1": {"api_key": "k"}}
+    with queue.dao.get_session() as session:
+        submission = session.get(db_model.WorkflowTestSubmission, first)
+        assert submission.status == SUBMISSION_DISPATCHED
+        assert submission.payload is None
+
+
+def test_queue_rejects_submissions_beyond_max_depth(events):
+    queue = _queue(max_depth=2)
+    queue.submit("w1", {})
+    queue.submit("w1", {})
+    with pytest.raises(WorkflowTestQueueFull):
+        queue.submit("w1", {})
+
+
+def test_busy_runners_keep_runs_queued_and_report_positions(events):
+    queue = _queue()
+    queue.registry.dispatch.side_effect = NoWorkflowRunnersAvailable("busy")
+    first, _ = queue.submit("w1", {})
+    second, _ = queue.submit("w1", {})
+
+    assert queue.schedule() == 0
+    assert _status(queue, first) == SUBMISSION_QUEUED
+    assert events == [
+        (first, {"type": WORKFLOW_TEST_QUEUED_EVENT, "position": 1, "queue_depth": 2}),
+        (second, {"type": WORKFLOW_TEST_QUEUED_EVENT, "position": 2, "queue_depth": 2}),
+    ]
+
+    # Unchanged positions are not reported again.
+    queue.schedule()
+    assert len(events) == 2
+
+    queue.registry.dispatch.side_effect = [MagicMock(ok=True), NoWorkflowRunnersAvailable("busy")]
+    assert queue.schedule() == 1
+    assert events[-1] == (second, {"type": WORKFLOW_TEST_QUEUED_EVENT, "position": 1, "queue_depth": 1})
+
+
+def test_cancel_only_applies_to_queued_runs(events):
+    queue = _queue()
+    cancelled, _ = queue.submit("w1", {})
+    kept, _ = queue.submit("w1", {})
+
+    assert queue.cancel(cancelled) is True
+    assert events[-1][0] == cancelled
+    assert events[-1][1]["type"] == "crew_kickoff_failed"
+    assert queue.get_position(kept) == 1
+
+    queue.schedule()
+    assert [c.args[1]["events_trace_id"] for c in queue.registry.dispatch.call_args_list] == [kept]
+    assert queue.cancel(cancelled) is False
+    assert queue.cancel(kept) is False
+
+
+def test_failed_dispatch_ends_the_trace(events):
+    queue = _queue()
+    queue.registry.dispatch.return_value = MagicMock(ok=False, status_code=500, text="boom")
+    trace_id, _ = queue.submit("w1", {})
+
+    queue.schedule()
+    assert _status(queue, trace_id) == SUBMISSION_FAILED
+    assert events[-1][0] == trace_id
+    assert events[-1][1]["type"] == "crew_kickoff_failed"
+
+
+def test_interrupted_dispatch_is_requeued_on_start(events):
+    queue = _queue()
+    trace_id, _ = queue.submit("w1", {})
+    with queue.dao.get_session() as session:
+        session.get(db_model.WorkflowTestSubmission, trace_id).status = SUBMISSION_DISPATCHING
+
+    queue._recover()
+    assert _status(queue, trace_id) == SUBMISSION_QUEUED
+
+
+def test_submit_without_runners_fails(events):
+    queue = _queue()
+    queue.registry.get_runners.return_value = []
+    with pytest.raises(NoWorkflowRunnersAvailable):
+        queue.submit("w1", {})
+
+
+def test_tool_and_mcp_configs_are_never_stored(events):
+    queue = _queue()
+    trace_id, _ = queue.submit(
+        "w1", {"inputs": {}}, tool_config={"t1": {"api_key": "secret"}}, mcp_config={"m1": {"TOKEN": "secret"}}
+    )
+    with queue.dao.engine.connect() as conn:
+        stored = conn.exec_driver_sql("SELECT payload FROM workflow_test_submissions").scalar()
+    assert "secret" not in stored
+
+    queue.schedule()
+    payload = queue.registry.dispatch.call_args.args[1]
+    assert payload["tool_config"] == {"t1": {"api_key": "secret"}}
+    assert payload["mcp_config"] == {"m1": {"TOKEN": "secret"}}
+    assert "has_run_parameters" not in payload
+    assert _status(queue, trace_id) == SUBMISSION_DISPATCHED
+
+
+def test_recovered_run_without_its_configs_fails(events):
+    queue = _queue()
+    with_configs, _ = queue.submit("w1", {}, tool_config={"t1": {"api_key": "secret"}})
+    without_configs, _ = queue.submit("w1", {})
+    # A restarted studio has lost the in-memory configs.
+    queue._run_parameters.clear()
+
+    queue.schedule()
+    assert _status(queue, with_configs) == SUBMISSION_FAILED
+    assert events[0][0] == with_configs and events[0][1]["type"] == "crew_kickoff_failed"
+    assert "run the test again" in events[0][1]["error"]
+    assert _status(queue, without_configs) == SUBMISSION_DISPATCHED
+    assert queue.registry.dispatch.call_args.args[1]["tool_config"] == {}